@@ -0,0 +1,10 @@
+"""
+The entry point of 'python -m jacoco_report'.
+"""
+
+import sys
+
+from jacoco_report.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+A module that contains the ActionConfig class, an immutable snapshot of the parsed action inputs.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from jacoco_report.action_inputs import ActionInputs
+from jacoco_report.model.report_group import ReportGroup
+
+
+@dataclass(frozen=True)
+class GitHubContext:
+    """
+    A class holding the GitHub context of the run: the credentials and the workflow run it belongs to.
+    """
+
+    token: str = field(repr=False)
+    api_url: str
+    event_name: str
+    repository: str
+    run_id: str
+    sha: str
+    branch: str
+    base_ref: str
+    run_started_at: str
+    action_ref: str
+
+
+@dataclass(frozen=True)
+class SourceConfig:
+    """
+    A class holding where the reports, baselines, history and partial results are read from and written to.
+    """
+
+    paths: tuple[str, ...]
+    exclude_paths: tuple[str, ...]
+    baseline_paths: tuple[str, ...]
+    baseline_snapshot_dir: str
+    history_db: str
+    mode: str
+    partial_dir: str
+    max_memory_mb: int
+
+
+@dataclass(frozen=True)
+class ThresholdConfig:
+    """
+    A class holding the global and report-level default thresholds of the primary and the additional metrics.
+    """
+
+    global_overall: float
+    global_changed_files_average: float
+    report_default: tuple[float, float, float]
+    # thresholds of the additional metrics (all but the primary one), as (metric, thresholds) pairs
+    metric_global: tuple[tuple[str, tuple[float, float]], ...] = ()
+    metric_report_default: tuple[tuple[str, tuple[float, float, float]], ...] = ()
+
+    def global_for(self, metric: str) -> tuple[float, float]:
+        """Return the global (overall, changed-files-average) thresholds of a configured metric."""
+        return self._lookup(self.metric_global, metric) or (self.global_overall, self.global_changed_files_average)
+
+    def report_default_for(self, metric: str) -> tuple[float, float, float]:
+        """Return the report-level default thresholds of a configured metric."""
+        return self._lookup(self.metric_report_default, metric) or self.report_default
+
+    @staticmethod
+    def _lookup(pairs: tuple, metric: str) -> Optional[tuple]:
+        for pair_metric, thresholds in pairs:
+            if pair_metric == metric:
+                return thresholds
+        return None
+
+
+@dataclass(frozen=True)
+class CommentConfig:
+    """
+    A class holding how the pull request comment is titled, detailed and marked.
+    """
+
+    title: str
+    comment_level: str
+    update_comment: bool
+    pass_symbol: str
+    fail_symbol: str
+
+
+@dataclass(frozen=True)
+class OutputConfig:
+    """
+    A class holding the API transport and the outputs written besides the comment.
+    """
+
+    api_transport: str
+    api_stats: bool
+    timings: bool
+    profile: str
+    step_summary: bool
+    step_summary_path: str
+    report_path: str
+    check_run: bool
+
+
+@dataclass(frozen=True)
+class ActionConfig:
+    """
+    A class holding every action input the run consumes, read and parsed once.
+
+    The snapshot is built after the inputs are validated and handed to the report, evaluators and generator,
+    so hot loops read attributes instead of re-reading the environment and re-parsing YAML or lists.
+    It is picklable and can be shipped to worker processes as is.
+    """
+
+    github: GitHubContext
+    sources: SourceConfig
+    thresholds: ThresholdConfig
+    comment: CommentConfig
+    outputs: OutputConfig
+
+    # evaluation
+    report_groups: tuple[ReportGroup, ...]
+    global_overall_scope: str
+    metric: str
+    metrics: tuple[str, ...]
+    skip_unchanged: bool
+    evaluate_unchanged: bool
+    fail_on_threshold: frozenset[str]
+
+    @classmethod
+    def from_inputs(cls) -> "ActionConfig":
+        """
+        Read and parse all action inputs once.
+
+        Returns:
+            ActionConfig: The snapshot of the current inputs.
+        """
+        metric = ActionInputs.get_metric()
+        additional_metrics = [m for m in ActionInputs.get_metrics()[1:] if m != metric]
+        return cls(
+            github=GitHubContext(
+                token=ActionInputs.get_token(),
+                api_url=ActionInputs.get_api_url(),
+                event_name=ActionInputs.get_event_name(),
+                repository=ActionInputs.get_repository(),
+                run_id=ActionInputs.get_run_id(),
+                sha=ActionInputs.get_sha(),
+                branch=ActionInputs.get_branch(),
+                base_ref=ActionInputs.get_base_ref(),
+                run_started_at=ActionInputs.get_run_started_at(),
+                action_ref=ActionInputs.get_action_ref(),
+            ),
+            sources=SourceConfig(
+                paths=tuple(ActionInputs.get_paths()),
+                exclude_paths=tuple(ActionInputs.get_exclude_paths()),
+                baseline_paths=tuple(ActionInputs.get_baseline_paths()),
+                baseline_snapshot_dir=ActionInputs.get_baseline_snapshot_dir(),
+                history_db=ActionInputs.get_history_db(),
+                mode=ActionInputs.get_mode(),
+                partial_dir=ActionInputs.get_partial_dir(),
+                max_memory_mb=ActionInputs.get_max_memory_mb(),
+            ),
+            thresholds=ThresholdConfig(
+                global_overall=ActionInputs.get_global_overall_threshold(),
+                global_changed_files_average=ActionInputs.get_global_changed_files_average_threshold(),
+                report_default=ActionInputs.get_report_thresholds_default(),
+                metric_global=tuple((m, ActionInputs.get_global_thresholds_for_metric(m)) for m in additional_metrics),
+                metric_report_default=tuple(
+                    (m, ActionInputs.get_report_thresholds_default_for_metric(m)) for m in additional_metrics
+                ),
+            ),
+            comment=CommentConfig(
+                title=ActionInputs.get_title(),
+                comment_level=ActionInputs.get_comment_level(),
+                update_comment=ActionInputs.get_update_comment(),
+                pass_symbol=ActionInputs.get_pass_symbol(),
+                fail_symbol=ActionInputs.get_fail_symbol(),
+            ),
+            outputs=OutputConfig(
+                api_transport=ActionInputs.get_api_transport(),
+                api_stats=ActionInputs.get_api_stats(),
+                timings=ActionInputs.get_timings(),
+                profile=ActionInputs.get_profile(),
+                step_summary=ActionInputs.get_step_summary(),
+                step_summary_path=ActionInputs.get_step_summary_path(),
+                report_path=ActionInputs.get_report_path(),
+                check_run=ActionInputs.get_check_run(),
+            ),
+            report_groups=tuple(ActionInputs.get_report_groups()),
+            global_overall_scope=ActionInputs.get_global_overall_scope(),
+            metric=metric,
+            metrics=(metric, *additional_metrics),
+            skip_unchanged=ActionInputs.get_skip_unchanged(),
+            evaluate_unchanged=ActionInputs.get_evaluate_unchanged(),
+            fail_on_threshold=frozenset(ActionInputs.get_fail_on_threshold()),
+        )
@@ -3,10 +3,9 @@ A module for handling the inputs provided to the GH action.
 """
 
 import logging
+import os
 import sys
-from typing import Literal, Optional, overload
-
-import yaml
+from typing import Callable, Literal, Optional, overload
 
 from jacoco_report.utils.constants import (
     TOKEN,
@@ -33,28 +32,51 @@ from jacoco_report.utils.constants import (
     METRIC,
     PR_NUMBER,
     BASELINE_PATHS,
+    API_TRANSPORT,
+    API_STATS,
+    TIMINGS,
+    PROFILE,
+    STEP_SUMMARY,
+    REPORT_PATH,
+    CHECK_RUN,
     GITHUB_RUN_ID,
+    GITHUB_SHA,
+    GITHUB_HEAD_REF,
+    GITHUB_BASE_REF,
+    GITHUB_REF_NAME,
     GITHUB_RUN_STARTED_AT,
     GITHUB_ACTION_REF,
+    GITHUB_API_URL,
+    GITHUB_STEP_SUMMARY,
+    DEFAULT_GITHUB_API_URL,
 )
 
 from jacoco_report.model.report_group import ReportGroup
-from jacoco_report.utils.enums import CommentLevelEnum, MetricTypeEnum, FailOnThresholdEnum
+from jacoco_report.storage_inputs import StorageInputs
+from jacoco_report.utils.enums import (
+    ApiTransportEnum,
+    CommentLevelEnum,
+    MetricTypeEnum,
+    FailOnThresholdEnum,
+    ModeEnum,
+    ProfileEnum,
+)
 from jacoco_report.utils.gh_action import get_action_input
 from jacoco_report.utils.github import GitHub
+from jacoco_report.utils.thresholds import (
+    parse_group_thresholds,
+    split_metric_thresholds,
+    thresholds_for_metric,
+    to_threshold_float,
+    validate_global_thresholds,
+    validate_group_thresholds,
+    validate_report_thresholds_default,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def _is_valid_threshold_float(value: str) -> bool:
-    try:
-        f = float(value)
-        return 0.0 <= f < 100.0
-    except ValueError:
-        return False
-
-
-class ActionInputs:
+class ActionInputs(StorageInputs):
     """
     A class representing the inputs provided to the GH action.
     """
@@ -64,6 +86,7 @@ class ActionInputs:
         """
         Get the GitHub token from the action inputs.
         The value is provided by GitHub environment variable and define by GitHub.
+        A 'Bearer ' prefix is dropped.
         """
         token = get_action_input(TOKEN)
         normalized = token.strip()
@@ -115,28 +138,29 @@ class ActionInputs:
     def get_global_thresholds(raw: Literal[False] = ...) -> tuple[float, float]: ...
     @staticmethod
     def get_global_thresholds(raw: bool = False) -> tuple[float, float] | str:
-        """Return the global coverage thresholds as a tuple (overall, changed-files-average)."""
-
-        def safe_float(value: str, label: str) -> float:
-            try:
-                return float(value) if value else 0.0
-            except ValueError:
-                logger.warning("Cannot convert '%s' part ('%s') to float. Defaulting to 0.0.", label, value)
-                return 0.0
+        """Return the global coverage thresholds as a tuple (overall, changed-files-average).
 
+        The thresholds are those of the primary metric; see get_global_thresholds_for_metric.
+        """
         raw_value = get_action_input(GLOBAL_THRESHOLDS, DEFAULT_GLOBAL_THRESHOLDS).strip()
         cleaned = ActionInputs.__clean_from_comment(raw_value)
 
         if raw:
             return cleaned
 
+        return ActionInputs.get_global_thresholds_for_metric(ActionInputs.get_metric())
+
+    @staticmethod
+    def get_global_thresholds_for_metric(metric: str) -> tuple[float, float]:
+        """Return the global coverage thresholds (overall, changed-files-average) of the given metric."""
+        cleaned = thresholds_for_metric(ActionInputs.get_global_thresholds(raw=True), metric, DEFAULT_GLOBAL_THRESHOLDS)
         if "*" not in cleaned:
             logger.warning("'global-thresholds' input is not formatted correctly.")
             cleaned = DEFAULT_GLOBAL_THRESHOLDS
 
         parts = cleaned.split("*")
-        overall = safe_float(parts[0], "overall")
-        changed = safe_float(parts[1], "changed-files-average")
+        overall = to_threshold_float(parts[0], "overall")
+        changed = to_threshold_float(parts[1], "changed-files-average")
 
         return overall, changed
 
@@ -179,7 +203,6 @@ class ActionInputs:
         These are used as field-level fallbacks for per-group thresholds when a group omits a field.
         global-thresholds is a separate evaluation pass and is never in this chain.
         """
-
         return ActionInputs.__get_thresholds_input(
             input_name=REPORT_THRESHOLDS_DEFAULT,
             default_value=DEFAULT_REPORT_THRESHOLDS_DEFAULT,
@@ -188,6 +211,19 @@ class ActionInputs:
             raw=raw,
         )
 
+    @staticmethod
+    def get_report_thresholds_default_for_metric(metric: str) -> tuple[float, float, float]:
+        """Return the report-level default thresholds (overall, avg-changed, per-file) of the given metric."""
+        thresholds = ActionInputs.__get_thresholds_input(
+            input_name=REPORT_THRESHOLDS_DEFAULT,
+            default_value=DEFAULT_REPORT_THRESHOLDS_DEFAULT,
+            warning_input_label="report-thresholds-default",
+            third_component_label="per-changed-file",
+            metric=metric,
+        )
+        assert not isinstance(thresholds, str)
+        return thresholds
+
     @staticmethod
     def __get_thresholds_input(
         input_name: str,
@@ -195,22 +231,19 @@ class ActionInputs:
         warning_input_label: str,
         third_component_label: str,
         raw: bool = False,
+        metric: Optional[str] = None,
     ) -> tuple[float, float, float] | str:
-        """Normalize O*A*P threshold input and parse it into three float components."""
-
-        def safe_float(value: str, label: str) -> float:
-            try:
-                return float(value) if value else 0.0
-            except ValueError:
-                logger.warning("Cannot convert '%s' part ('%s') to float. Defaulting to 0.0.", label, value)
-                return 0.0
+        """Normalize O*A*P threshold input and parse it into three float components.
 
+        A per-metric input is read for the given metric, by default the primary one.
+        """
         raw_value = get_action_input(input_name, default_value).strip()
         cleaned = ActionInputs.__clean_from_comment(raw_value)
 
         if raw:
             return cleaned
 
+        cleaned = thresholds_for_metric(cleaned, metric or ActionInputs.get_metric(), default_value)
         if "*" not in cleaned:
             logger.warning("'%s' input is not formatted correctly.", warning_input_label)
             cleaned = default_value
@@ -224,9 +257,9 @@ class ActionInputs:
             cleaned += "*0.0"
 
         parts = cleaned.split("*")
-        overall = safe_float(parts[0], "overall")
-        changed = safe_float(parts[1], "changed-files-average")
-        per_file = safe_float(parts[2], third_component_label)
+        overall = to_threshold_float(parts[0], "overall")
+        changed = to_threshold_float(parts[1], "changed-files-average")
+        per_file = to_threshold_float(parts[2], third_component_label)
 
         return overall, changed, per_file
 
@@ -265,8 +298,19 @@ class ActionInputs:
     def get_metric() -> str:
         """
         Get the metric from the action inputs.
+        This is the primary metric, the first one listed; it drives the comment tables and outputs.
         """
-        return get_action_input(METRIC, MetricTypeEnum.INSTRUCTION)
+        return ActionInputs.get_metrics()[0]
+
+    @staticmethod
+    def get_metrics() -> list[str]:
+        """Get the metrics to evaluate (comma- or newline-separated); duplicates are dropped, the order is kept."""
+        value = get_action_input(METRIC, MetricTypeEnum.INSTRUCTION)
+        metrics: list[str] = []
+        for item in (v.strip() for line in value.splitlines() for v in line.split(",")):
+            if item and item not in metrics:
+                metrics.append(item)
+        return metrics or [MetricTypeEnum.INSTRUCTION.value]
 
     @staticmethod
     def get_comment_level() -> str:
@@ -302,6 +346,8 @@ class ActionInputs:
         if errors:
             raise ValueError("; ".join(errors))
 
+        import yaml
+
         data = yaml.safe_load(raw_input)
         if not isinstance(data, list):
             # Defensive guard; validate_report_groups already enforces this.
@@ -321,17 +367,17 @@ class ActionInputs:
             baseline_paths_raw = entry["baseline-paths"] if "baseline-paths" in entry else None
             baseline_paths = [p.strip() for p in baseline_paths_raw] if baseline_paths_raw is not None else None
 
-            thresholds_str = entry.get("thresholds", "")
-            overall: Optional[float] = None
-            changed: Optional[float] = None
-            per_file: Optional[float] = None
-            if thresholds_str:
-                parts = str(thresholds_str).split("*")
-                overall = float(parts[0]) if parts[0] else None
-                changed = float(parts[1]) if parts[1] else None
-                per_file = float(parts[2]) if parts[2] else None
+            thresholds_by_metric = {
+                metric: parse_group_thresholds(value)
+                for metric, value in split_metric_thresholds(str(entry.get("thresholds", "") or "")).items()
+            }
+            overall, changed, per_file = thresholds_by_metric.pop("", (None, None, None))
 
-            groups.append(ReportGroup(name, paths, overall, changed, per_file, baseline_paths))
+            groups.append(
+                ReportGroup(
+                    name, paths, overall, changed, per_file, baseline_paths, metric_thresholds=thresholds_by_metric
+                )
+            )
 
         return groups
 
@@ -376,6 +422,47 @@ class ActionInputs:
             display_name="update-comment",
         )
 
+    @staticmethod
+    def get_api_stats() -> bool:
+        """Get whether the GitHub API usage summary should be published as the 'api-stats' action output."""
+        return ActionInputs._get_strict_boolean_input(
+            input_name=API_STATS,
+            default_value="false",
+            display_name="api-stats",
+        )
+
+    @staticmethod
+    def get_timings() -> bool:
+        """Get whether the JSON run profile should be published as the 'timings' action output."""
+        return ActionInputs._get_strict_boolean_input(
+            input_name=TIMINGS,
+            default_value="false",
+            display_name="timings",
+        )
+
+    @staticmethod
+    def get_step_summary() -> bool:
+        """Get whether the full report should be appended to the job summary ($GITHUB_STEP_SUMMARY)."""
+        return ActionInputs._get_strict_boolean_input(
+            input_name=STEP_SUMMARY,
+            default_value="false",
+            display_name="step-summary",
+        )
+
+    @staticmethod
+    def get_report_path() -> str:
+        """Get the directory receiving coverage-report.json and coverage-report.html; empty disables the files."""
+        return get_action_input(REPORT_PATH, "").strip()
+
+    @staticmethod
+    def get_check_run() -> bool:
+        """Get whether a check run with annotations for failing changed files should be published."""
+        return ActionInputs._get_strict_boolean_input(
+            input_name=CHECK_RUN,
+            default_value="false",
+            display_name="check-run",
+        )
+
     @staticmethod
     def get_pass_symbol() -> str:
         """
@@ -429,6 +516,16 @@ class ActionInputs:
             display_name="debug",
         )
 
+    @staticmethod
+    def get_api_transport() -> str:
+        """Get the GitHub API transport ('rest' or 'graphql') used to read pull request data."""
+        return get_action_input(API_TRANSPORT, ApiTransportEnum.REST).strip().lower()
+
+    @staticmethod
+    def get_profile() -> str:
+        """Get the profiling mode of the run: 'none', 'cpu', 'memory' or 'all'."""
+        return get_action_input(PROFILE, ProfileEnum.NONE).strip().lower() or ProfileEnum.NONE
+
     @staticmethod
     def _get_strict_boolean_input(input_name: str, default_value: str, display_name: str) -> bool:
         """Parse a boolean action input and require literal true/false values."""
@@ -465,6 +562,8 @@ class ActionInputs:
         errors: list[str] = []
         if not raw_input:
             return errors
+        import yaml
+
         try:
             data = yaml.safe_load(raw_input)
         except yaml.YAMLError as e:
@@ -497,13 +596,7 @@ class ActionInputs:
                     f"{prefix} 'thresholds' must be a non-empty string in format 'O*A*P' " "(e.g. '80*70*60')."
                 )
             elif isinstance(thresholds_str, str):
-                parts = thresholds_str.split("*")
-                if len(parts) != 3:
-                    errors.append(f"{prefix} 'thresholds' must be in format 'O*A*P' (e.g. '80*70*60').")
-                else:
-                    for label, v in zip(("overall", "changed-files-average", "changed-file"), parts):
-                        if v and not _is_valid_threshold_float(v):
-                            errors.append(f"{prefix} 'thresholds' {label} value '{v}' must be a float in [0, 100).")
+                errors.extend(validate_group_thresholds(prefix, thresholds_str))
             has_baseline_paths = "baseline-paths" in entry
             baseline_paths = entry.get("baseline-paths", [])
             if has_baseline_paths and baseline_paths is None:
@@ -520,13 +613,6 @@ class ActionInputs:
         Validates the inputs provided for the GH action.
         """
 
-        def is_float(value: str) -> bool:
-            try:
-                float(value)
-                return True
-            except ValueError:
-                return False
-
         errors = []
 
         token = ActionInputs.get_token()
@@ -541,64 +627,10 @@ class ActionInputs:
         elif not isinstance(paths, str):
             errors.append("'paths' must be a list of strings.")
 
-        global_thresholds = ActionInputs.get_global_thresholds(raw=True)
-        if not isinstance(global_thresholds, str):
-            errors.append("'global-thresholds' must be a string or not defined.")
-        elif "*" not in global_thresholds:
-            errors.append(
-                "'global-thresholds' must be in the format 'overall*changed-files-average'. "
-                "Where overall is the minimum coverage overall and changed-files-average is the minimum average coverage "
-                "of changed files."
-            )
-        else:
-            parts = global_thresholds.split("*")
-            if len(parts) != 2:
-                errors.append(
-                    "'global-thresholds' must be in the format 'overall*changed-files-average' "
-                    "with exactly two components."
-                )
-            else:
-                if not is_float(parts[0]) or float(parts[0]) < 0 or float(parts[0]) >= 100:
-                    errors.append("'global-thresholds' overall value must be a float between 0 and 100.")
-                if not is_float(parts[1]) or float(parts[1]) < 0 or float(parts[1]) >= 100:
-                    errors.append("'global-thresholds' changed-files-average value must be a float between 0 and 100.")
-
-        report_thresholds_default = ActionInputs.get_report_thresholds_default(raw=True)
-        if not isinstance(report_thresholds_default, str):
-            errors.append("'report-thresholds-default' must be a string or not defined.")
-        elif "*" not in report_thresholds_default:
-            errors.append(
-                "'report-thresholds-default' must be in the format 'overall*changed-files-average*per-changed-file'."
-            )
-        else:
-            if report_thresholds_default.count("*") == 1:
-                logger.warning(
-                    "'report-thresholds-default' should be in the format "
-                    "'overall*changed-files-average*per-changed-file'. "
-                    "Adding default value for per-changed-file threshold."
-                )
-                report_thresholds_default += "*0.0"
-            rtd_parts = report_thresholds_default.split("*")
-            if len(rtd_parts) != 3:
-                errors.append(
-                    "'report-thresholds-default' must be in the format "
-                    "'overall*changed-files-average*per-changed-file' "
-                    "with exactly three components."
-                )
-            else:
-                if not is_float(rtd_parts[0]) or float(rtd_parts[0]) < 0 or float(rtd_parts[0]) >= 100:
-                    errors.append("'report-thresholds-default' overall value must be a float between 0 and 100.")
-                if not is_float(rtd_parts[1]) or float(rtd_parts[1]) < 0 or float(rtd_parts[1]) >= 100:
-                    errors.append(
-                        "'report-thresholds-default' changed-files-average value must be a float between 0 and 100."
-                    )
-                if not is_float(rtd_parts[2]) or float(rtd_parts[2]) < 0 or float(rtd_parts[2]) >= 100:
-                    errors.append(
-                        "'report-thresholds-default' per-changed-file value must be a float between 0 and 100."
-                    )
-
-        metric = ActionInputs.get_metric()
-        if not isinstance(metric, str) or metric not in MetricTypeEnum:
+        errors.extend(validate_global_thresholds(ActionInputs.get_global_thresholds(raw=True)))
+        errors.extend(validate_report_thresholds_default(ActionInputs.get_report_thresholds_default(raw=True)))
+
+        if not all(isinstance(metric, str) and metric in MetricTypeEnum for metric in ActionInputs.get_metrics()):
             errors.append(
                 "'metric' must be a string from these options: 'instruction', "
                 "'line', 'branch', 'complexity', 'method', 'class'."
@@ -613,28 +645,19 @@ class ActionInputs:
 
         errors.extend(ActionInputs.validate_report_groups(report_groups_raw))
 
-        skip_unchanged: Optional[bool] = None
-        try:
-            skip_unchanged = ActionInputs.get_skip_unchanged()
-        except ValueError as e:
-            errors.append(str(e))
-
-        evaluate_unchanged: Optional[bool] = None
-        try:
-            evaluate_unchanged = ActionInputs.get_evaluate_unchanged()
-        except ValueError as e:
-            errors.append(str(e))
+        skip_unchanged = ActionInputs._read_boolean(ActionInputs.get_skip_unchanged, errors)
+        evaluate_unchanged = ActionInputs._read_boolean(ActionInputs.get_evaluate_unchanged, errors)
+        update_comment = ActionInputs._read_boolean(ActionInputs.get_update_comment, errors)
+        debug = ActionInputs._read_boolean(ActionInputs.get_debug, errors)
+        api_stats = ActionInputs._read_boolean(ActionInputs.get_api_stats, errors)
+        step_summary = ActionInputs._read_boolean(ActionInputs.get_step_summary, errors)
+        check_run = ActionInputs._read_boolean(ActionInputs.get_check_run, errors)
+        timings = ActionInputs._read_boolean(ActionInputs.get_timings, errors)
 
         global_overall_scope = ActionInputs.get_global_overall_scope()
         if global_overall_scope not in (GLOBAL_OVERALL_SCOPE_ALL, GLOBAL_OVERALL_SCOPE_GROUPS_ONLY):
             errors.append("'global-overall-scope' must be 'all' or 'groups-only'.")
 
-        update_comment: Optional[bool] = None
-        try:
-            update_comment = ActionInputs.get_update_comment()
-        except ValueError as e:
-            errors.append(str(e))
-
         pass_symbol = ActionInputs.get_pass_symbol()
         if not isinstance(pass_symbol, str) or not pass_symbol.strip() or len(pass_symbol) < 1:
             errors.append("'pass-symbol' must be a non-empty string and have a length from 1.")
@@ -649,12 +672,29 @@ class ActionInputs:
         except ValueError as e:
             errors.append(str(e))
 
-        debug: Optional[bool] = None
+        if ActionInputs.get_api_transport() not in ApiTransportEnum:
+            errors.append("'api-transport' must be 'rest' or 'graphql'.")
+        if ActionInputs.get_profile() not in ProfileEnum:
+            errors.append("'profile' must be 'none', 'cpu', 'memory' or 'all'.")
+        max_memory_mb: Optional[int] = None
         try:
-            debug = ActionInputs.get_debug()
+            max_memory_mb = ActionInputs.get_max_memory_mb()
         except ValueError as e:
             errors.append(str(e))
 
+        if os.path.isfile(ActionInputs.get_report_path()):
+            errors.append("'report-path' must be a directory, not a file.")
+        if os.path.isfile(ActionInputs.get_baseline_snapshot_dir()):
+            errors.append("'baseline-snapshot-dir' must be a directory, not a file.")
+        if os.path.isdir(ActionInputs.get_history_db()):
+            errors.append("'history-db' must be a file, not a directory.")
+        if ActionInputs.get_mode() not in ModeEnum:
+            errors.append("'mode' must be 'single', 'partial' or 'merge'.")
+        elif ActionInputs.get_mode() != ModeEnum.SINGLE and not ActionInputs.get_partial_dir():
+            errors.append("'partial-dir' is required with mode 'partial' or 'merge'.")
+        if os.path.isfile(ActionInputs.get_partial_dir()):
+            errors.append("'partial-dir' must be a directory, not a file.")
+
         ActionInputs._log_configuration(
             report_groups_raw=report_groups_raw,
             skip_unchanged=skip_unchanged,
@@ -662,6 +702,11 @@ class ActionInputs:
             update_comment=update_comment,
             fail_on_threshold=fail_on_threshold,
             debug=debug,
+            api_stats=api_stats,
+            step_summary=step_summary,
+            check_run=check_run,
+            timings=timings,
+            max_memory_mb=max_memory_mb,
         )
 
         # Log errors if any
@@ -672,6 +717,15 @@ class ActionInputs:
 
         logger.info("Action inputs validated successfully.")
 
+    @staticmethod
+    def _read_boolean(getter: Callable[[], bool], errors: list[str]) -> Optional[bool]:
+        """Read a boolean input; a rejected value is added to the errors and read as None."""
+        try:
+            return getter()
+        except ValueError as e:
+            errors.append(str(e))
+            return None
+
     @staticmethod
     def _log_configuration(
         *,
@@ -681,6 +735,11 @@ class ActionInputs:
         update_comment: Optional[bool],
         fail_on_threshold: list[str],
         debug: Optional[bool],
+        api_stats: Optional[bool] = None,
+        step_summary: Optional[bool] = None,
+        check_run: Optional[bool] = None,
+        timings: Optional[bool] = None,
+        max_memory_mb: Optional[int] = None,
     ) -> None:
         """Log all resolved configuration values. Do not add token to this method."""
         # Do not add token here — token must never appear in logs.
@@ -689,6 +748,9 @@ class ActionInputs:
             "Paths: %s\n"
             "Exclude paths: %s\n"
             "Baseline paths: %s\n"
+            "Baseline snapshot dir: %s\n"
+            "History database: %s\n"
+            "Mode: %s, partial dir: %s\n"
             "\n"
             "Global thresholds: overall=%s, avg_changed_files=%s\n"
             "Global overall scope: %s\n"
@@ -705,11 +767,23 @@ class ActionInputs:
             "Update comment: %s\n"
             "Fail on threshold: %s\n"
             "Debug logging enabled: %s\n"
+            "API transport: %s\n"
+            "API stats output: %s\n"
+            "Step summary: %s\n"
+            "Report path: %s\n"
+            "Check run: %s\n"
+            "Timings output: %s\n"
+            "Profile: %s\n"
+            "Max memory (MB): %s\n"
             "Pass symbol: %s\n"
             "Fail symbol: %s",
             ActionInputs.get_paths(),
             ActionInputs.get_exclude_paths(),
             ActionInputs.get_baseline_paths(),
+            ActionInputs.get_baseline_snapshot_dir(),
+            ActionInputs.get_history_db(),
+            ActionInputs.get_mode(),
+            ActionInputs.get_partial_dir(),
             ActionInputs.get_global_overall_threshold(),
             ActionInputs.get_global_changed_files_average_threshold(),
             ActionInputs.get_global_overall_scope(),
@@ -723,6 +797,14 @@ class ActionInputs:
             update_comment,
             fail_on_threshold if fail_on_threshold else [],
             debug,
+            ActionInputs.get_api_transport(),
+            api_stats,
+            step_summary,
+            ActionInputs.get_report_path(),
+            check_run,
+            timings,
+            ActionInputs.get_profile(),
+            max_memory_mb,
             ActionInputs.get_pass_symbol(),
             ActionInputs.get_fail_symbol(),
         )
@@ -735,7 +817,6 @@ class ActionInputs:
         """
         return get_action_input("GITHUB_EVENT_NAME", prefix="")
 
-    # methods for getting the inputs not provided by the user but expected from GitHub
     @staticmethod
     def get_repository() -> str:
         """
@@ -750,6 +831,21 @@ class ActionInputs:
         """
         return get_action_input(GITHUB_RUN_ID, prefix="")
 
+    @staticmethod
+    def get_sha() -> str:
+        """Get the commit SHA that triggered the workflow (GITHUB_SHA)."""
+        return get_action_input(GITHUB_SHA, prefix="")
+
+    @staticmethod
+    def get_branch() -> str:
+        """Get the branch of the run: the head branch of a pull request (GITHUB_HEAD_REF), else GITHUB_REF_NAME."""
+        return get_action_input(GITHUB_HEAD_REF, prefix="") or get_action_input(GITHUB_REF_NAME, prefix="")
+
+    @staticmethod
+    def get_base_ref() -> str:
+        """Get the target branch of a pull request (GITHUB_BASE_REF); empty outside pull requests."""
+        return get_action_input(GITHUB_BASE_REF, prefix="")
+
     @staticmethod
     def get_run_started_at() -> str:
         """
@@ -764,6 +860,16 @@ class ActionInputs:
         """
         return get_action_input(GITHUB_ACTION_REF, prefix="")
 
+    @staticmethod
+    def get_api_url() -> str:
+        """Get the GitHub REST API base URL (GITHUB_API_URL), defaulting to the public api.github.com."""
+        return get_action_input(GITHUB_API_URL, DEFAULT_GITHUB_API_URL, prefix="") or DEFAULT_GITHUB_API_URL
+
+    @staticmethod
+    def get_step_summary_path() -> str:
+        """Get the path of the job summary file provided by the runner (GITHUB_STEP_SUMMARY)."""
+        return get_action_input(GITHUB_STEP_SUMMARY, prefix="")
+
     @staticmethod
     def __parse_paths(paths: str) -> list[str]:
         """
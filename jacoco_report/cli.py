@@ -0,0 +1,333 @@
+"""
+A module providing the command line interface: the scan, parse, evaluate and render pipeline without GitHub.
+
+Usage: python -m jacoco_report --paths "**/jacoco.xml" --git-base origin/main --metric line --format markdown
+       python -m jacoco_report history --db coverage-history.db --branch master --regressions
+
+The flags are mapped onto the action inputs (INPUT_* environment variables) of this process, so they are parsed
+and validated by ActionInputs exactly as in the action. The 'history' command queries the database written by the
+'history-db' input.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+from jacoco_report.action_config import ActionConfig
+from jacoco_report.action_inputs import ActionInputs
+from jacoco_report.generator.html_renderer import markdown_to_html
+from jacoco_report.generator.pr_comment_generator import PRCommentGenerator, sparkline
+from jacoco_report.jacoco_report import CoverageAnalysis, JaCoCoReport
+from jacoco_report.model.coverage_history import KIND_GROUP, KIND_REPORT, CoverageHistory, Regression, TrendPoint
+from jacoco_report.utils.constants import (
+    BASELINE_PATHS,
+    COMMENT_LEVEL,
+    DEFAULT_PATHS,
+    EXCLUDE_PATHS,
+    FAIL_ON_THRESHOLD,
+    GLOBAL_THRESHOLDS,
+    HISTORY_TREND_RUNS,
+    METRIC,
+    MODE,
+    PARTIAL_DIR,
+    PATHS,
+    REPORT_GROUPS,
+    REPORT_THRESHOLDS_DEFAULT,
+    SKIP_UNCHANGED,
+    TITLE,
+    TOKEN,
+)
+from jacoco_report.utils.enums import CommentLevelEnum, FailOnThresholdEnum, MetricTypeEnum, ModeEnum
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ("markdown", "json", "html")
+HISTORY_FORMATS = ("text", "json")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of the command line interface."""
+    parser = argparse.ArgumentParser(
+        prog="python -m jacoco_report",
+        description="Evaluate JaCoCo xml reports against changed files and render the coverage report offline.",
+    )
+    parser.add_argument("--paths", nargs="+", default=[DEFAULT_PATHS], help="Glob patterns of the JaCoCo reports.")
+    parser.add_argument("--exclude-paths", nargs="*", default=[], help="Glob patterns of reports to ignore.")
+    parser.add_argument("--baseline-paths", nargs="*", default=[], help="Glob patterns of the baseline reports.")
+    parser.add_argument("--report-groups", metavar="FILE", help="YAML file with the 'report-groups' definition.")
+    parser.add_argument(
+        "--partial-dir", metavar="DIR", help="Merge the partial results of a matrix build instead of scanning --paths."
+    )
+
+    changed = parser.add_mutually_exclusive_group()
+    changed.add_argument("--changed-files", metavar="FILE", help="File listing the changed files, one per line.")
+    changed.add_argument("--git-base", metavar="REF", help="Take the changed files from 'git diff REF...HEAD'.")
+
+    parser.add_argument("--metric", help="Metric(s) to evaluate, comma-separated; the first one is the primary.")
+    parser.add_argument("--global-thresholds", help="Global thresholds, e.g. '80*70' or 'line:80*70,branch:60*50'.")
+    parser.add_argument("--report-thresholds-default", help="Report-level default thresholds, e.g. '80*70*60'.")
+    parser.add_argument("--fail-on-threshold", help="Threshold levels failing the run (exit code 1).")
+    parser.add_argument("--skip-unchanged", action="store_true", help="Hide reports without changed files.")
+    parser.add_argument("--title", help="Title of the rendered report.")
+    parser.add_argument(
+        "--comment-level", choices=[level.value for level in CommentLevelEnum], help="Rows of the Markdown report."
+    )
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="markdown", help="Output format.")
+    parser.add_argument("--output", metavar="FILE", help="Write the result to FILE instead of stdout.")
+    return parser
+
+
+def build_history_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of the 'history' command."""
+    parser = argparse.ArgumentParser(
+        prog="python -m jacoco_report history",
+        description="Show the coverage trend or the regressions of a branch from the 'history-db' database.",
+    )
+    parser.add_argument("--db", required=True, metavar="FILE", help="The history database.")
+    parser.add_argument("--branch", required=True, help="The branch whose runs outside pull requests are shown.")
+    parser.add_argument("--metric", default=MetricTypeEnum.INSTRUCTION.value, help="The primary metric of the runs.")
+    parser.add_argument("--last", type=int, default=HISTORY_TREND_RUNS, help="The number of latest runs read.")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--report", metavar="NAME", help="Show one report instead of the global numbers.")
+    scope.add_argument("--group", metavar="NAME", help="Show one report group instead of the global numbers.")
+    parser.add_argument(
+        "--regressions", action="store_true", help="List the runs whose overall coverage dropped (exit code 1 if any)."
+    )
+    parser.add_argument("--min-drop", type=float, default=0.0, help="Percentage points a regression must exceed.")
+    parser.add_argument("--format", choices=HISTORY_FORMATS, default="text", help="Output format.")
+    return parser
+
+
+def format_trend(points: Sequence[TrendPoint], output_format: str) -> str:
+    """Render trend points, oldest first, as a sparkline and one line per run, or as JSON."""
+    if output_format == "json":
+        return json.dumps([point._asdict() for point in points], indent=4)
+    if not points:
+        return "No runs recorded."
+    lines = [sparkline([point.overall for point in points])]
+    lines.extend(
+        f"{_format_time(point.created_at)}  {point.sha[:12]:<12}  {point.overall:6.2f}%  {point.changed_files:6.2f}%"
+        for point in points
+    )
+    return "\n".join(lines)
+
+
+def format_regressions(regressions: Sequence[Regression], output_format: str) -> str:
+    """Render regressions, oldest first, as one line per run or as JSON."""
+    if output_format == "json":
+        return json.dumps(
+            [
+                {**regression.point._asdict(), "previous": regression.previous._asdict(), "drop": regression.drop}
+                for regression in regressions
+            ],
+            indent=4,
+        )
+    if not regressions:
+        return "No regressions."
+    return "\n".join(
+        f"{_format_time(r.point.created_at)}  {r.point.sha[:12]:<12}  {r.previous.overall:6.2f}% -> "
+        f"{r.point.overall:6.2f}%  (-{r.drop} pp after {r.previous.sha[:12]})"
+        for r in regressions
+    )
+
+
+def _format_time(created_at: int) -> str:
+    return datetime.fromtimestamp(created_at, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+
+
+def history_main(argv: Sequence[str]) -> int:
+    """
+    Query the coverage history database.
+
+    Parameters:
+        argv (Sequence[str]): The arguments after 'history'.
+
+    Returns:
+        int: The exit code: 1 when the database cannot be read or, with --regressions, a regression is found.
+    """
+    args = build_history_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s", stream=sys.stderr)
+    if not os.path.isfile(args.db):
+        logger.error("History database '%s' not found.", args.db)
+        return 1
+
+    kind = KIND_REPORT if args.report else KIND_GROUP if args.group else None
+    name = args.report or args.group or ""
+    try:
+        history = CoverageHistory(args.db)
+        try:
+            if args.regressions:
+                regressions = history.regressions(args.branch, args.metric, args.last, args.min_drop, kind, name)
+                result = format_regressions(regressions, args.format)
+            else:
+                result = format_trend(history.trend(args.branch, args.metric, args.last, kind, name), args.format)
+        finally:
+            history.close()
+    except sqlite3.Error as e:
+        logger.error("Failed to read the history database '%s': %s", args.db, e)
+        return 1
+
+    sys.stdout.write(result + "\n")
+    return 1 if args.regressions and regressions else 0
+
+
+def inputs_from_args(args: argparse.Namespace) -> dict[str, str]:
+    """
+    Map the parsed flags onto action input names; flags that were not given are left out.
+
+    Parameters:
+        args (argparse.Namespace): The parsed flags.
+
+    Returns:
+        dict[str, str]: The action input values keyed by input name.
+    """
+    inputs: dict[str, str] = {
+        PATHS: "\n".join(args.paths),
+        EXCLUDE_PATHS: "\n".join(args.exclude_paths),
+        BASELINE_PATHS: "\n".join(args.baseline_paths),
+    }
+    if args.report_groups:
+        with open(args.report_groups, encoding="utf-8") as f:
+            inputs[REPORT_GROUPS] = f.read()
+    for name, value in (
+        (METRIC, args.metric),
+        (GLOBAL_THRESHOLDS, args.global_thresholds),
+        (REPORT_THRESHOLDS_DEFAULT, args.report_thresholds_default),
+        (FAIL_ON_THRESHOLD, args.fail_on_threshold),
+        (TITLE, args.title),
+        (COMMENT_LEVEL, args.comment_level),
+    ):
+        if value is not None:
+            inputs[name] = value
+    if args.skip_unchanged:
+        inputs[SKIP_UNCHANGED] = "true"
+    if args.partial_dir:
+        inputs[MODE] = ModeEnum.MERGE.value
+        inputs[PARTIAL_DIR] = args.partial_dir
+    return inputs
+
+
+def read_changed_files(args: argparse.Namespace) -> Optional[list[str]]:
+    """
+    Read the changed files from --changed-files or --git-base; without either no file is changed.
+
+    Returns:
+        Optional[list[str]]: The repository-relative changed files, None when they cannot be read.
+    """
+    if args.changed_files:
+        try:
+            with open(args.changed_files, encoding="utf-8") as f:
+                return [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            logger.error("Failed to read the changed files from '%s': %s", args.changed_files, e)
+            return None
+
+    if args.git_base:
+        try:
+            result = subprocess.run(
+                ["git", "diff", "--name-only", f"{args.git_base}...HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error("Failed to list the changed files against '%s': %s", args.git_base, e)
+            return None
+        return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+    logger.info("No changed files given; only the overall coverage is evaluated.")
+    return []
+
+
+def render(jr: JaCoCoReport, generator: PRCommentGenerator, analysis: CoverageAnalysis, output_format: str) -> str:
+    """
+    Render the evaluated reports in the requested format.
+
+    Parameters:
+        jr (JaCoCoReport): The evaluated report.
+        generator (PRCommentGenerator): The generator of the analysis.
+        analysis (CoverageAnalysis): The evaluated reports.
+        output_format (str): One of OUTPUT_FORMATS.
+
+    Returns:
+        str: The rendered result.
+    """
+    report = jr.build_rendered_report(
+        generator, analysis.evaluated_coverage_reports, analysis.evaluated_coverage_groups
+    )
+    if output_format == "json":
+        return json.dumps(report.data, indent=4)
+    if output_format == "html":
+        return markdown_to_html(report.markdown, report.title)
+    return generator.render_body(jr.config.comment.comment_level)
+
+
+def is_failed(jr: JaCoCoReport) -> bool:
+    """Return whether the run fails: an operational failure or a configured threshold level not reached."""
+    threshold_checks = {
+        FailOnThresholdEnum.OVERALL: jr.reached_threshold_overall,
+        FailOnThresholdEnum.CHANGED_FILES_AVERAGE: jr.reached_threshold_changed_files_average,
+        FailOnThresholdEnum.PER_CHANGED_FILE: jr.reached_threshold_per_change_file,
+        FailOnThresholdEnum.FAIL_UNCHANGED: jr.reached_threshold_fail_unchanged,
+    }
+    thresholds = jr.config.fail_on_threshold
+    return jr.has_operational_failure or any(
+        not passed for threshold, passed in threshold_checks.items() if threshold in thresholds
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the pipeline from the command line.
+
+    Parameters:
+        argv (Optional[Sequence[str]]): The arguments, sys.argv[1:] when None.
+
+    Returns:
+        int: The exit code: 0 on success, 1 on a failed threshold or an operational failure.
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["history"]:
+        return history_main(argv[1:])
+
+    args = build_parser().parse_args(argv)
+    # logs go to stderr so that stdout carries only the result
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s", stream=sys.stderr)
+
+    for name, value in inputs_from_args(args).items():
+        os.environ[f'INPUT_{name.replace("-", "_").upper()}'] = value
+    # the token is required by the action inputs but no GitHub API is called offline
+    os.environ.setdefault(f"INPUT_{TOKEN.upper()}", "offline")
+    ActionInputs.validate_inputs()
+
+    changed_files = read_changed_files(args)
+    if changed_files is None:
+        return 1
+
+    jr = JaCoCoReport(ActionConfig.from_inputs())
+    report_paths = jr.scan_reports()
+    analysis = jr.analyse(report_paths, changed_files) if report_paths is not None else None
+    if analysis is None:
+        for violation in jr.violations:
+            logger.error("%s", violation)
+        if not jr.has_operational_failure:
+            logger.info("All reports filtered out by skip-unchanged. Nothing to render.")
+        return 1 if is_failed(jr) else 0
+
+    result = render(jr, jr.create_generator(analysis), analysis, args.format)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result + "\n")
+        logger.info("Result written to '%s'.", args.output)
+    else:
+        sys.stdout.write(result + "\n")
+
+    for violation in jr.violations:
+        logger.warning("%s", violation)
+    return 1 if is_failed(jr) else 0
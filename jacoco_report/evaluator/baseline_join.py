@@ -0,0 +1,139 @@
+"""
+A module that contains the BaselineJoin class matching evaluated reports and groups with their baseline.
+
+The join is built once after evaluation; every delta column of the PR comment is then a dictionary lookup
+instead of a scan over the baseline reports per rendered row.
+"""
+
+import posixpath
+from typing import Optional
+
+from jacoco_report.evaluator.coverage_evaluator import CoverageEvaluator
+from jacoco_report.model.evaluated_report_coverage import EvaluatedReportCoverage
+
+
+def normalize_source_path(file_key: str) -> str:
+    """Normalize a changed-file key (source path) to a POSIX path without './' segments or leading slash."""
+    return posixpath.normpath(file_key.replace("\\", "/")).lstrip("/")
+
+
+class BaselineJoin:
+    """
+    A class holding the baseline matches of the current reports, groups and changed files.
+
+    Reports match path-first (same directory structure) with a name-based fallback for setups where
+    current and baseline reports live in different directory trees. Changed files match in the matched
+    baseline report first, then in any baseline report by normalized source path.
+    """
+
+    def __init__(self, evaluator: CoverageEvaluator, bs_evaluator: Optional[CoverageEvaluator]):
+        bs_reports = getattr(bs_evaluator, "evaluated_reports_coverage", {}) if bs_evaluator else {}
+        bs_groups = getattr(bs_evaluator, "evaluated_groups_coverage", {}) if bs_evaluator else {}
+        self._bs_reports: dict[str, EvaluatedReportCoverage] = bs_reports if isinstance(bs_reports, dict) else {}
+        bs_groups = bs_groups if isinstance(bs_groups, dict) else {}
+
+        # whether baseline data is available for diff columns
+        self.has_data: bool = bool(self._bs_reports) or bool(bs_groups)
+
+        # row lookups take the first baseline report of a name, aggregates the last one
+        self._bs_by_name: dict[str, EvaluatedReportCoverage] = {}
+        for bs_report in self._bs_reports.values():
+            self._bs_by_name.setdefault(bs_report.name, bs_report)
+        bs_by_last_name = {bs_report.name: bs_report for bs_report in self._bs_reports.values()}
+
+        # file-level index; the baseline reports were parsed against the PR's changed files, so only those are kept
+        self._bs_files: dict[str, float] = {}
+        for bs_report in self._bs_reports.values():
+            for file_key, reached in bs_report.changed_files_coverage_reached.items():
+                self._bs_files.setdefault(normalize_source_path(file_key), reached)
+
+        current = evaluator.evaluated_reports_coverage
+        self.global_diffs: tuple[float, float] = (
+            self._matched_diffs(current, self._bs_reports, bs_by_last_name) if self.has_data else (0.0, 0.0)
+        )
+
+        current_by_group: dict[str, dict[str, EvaluatedReportCoverage]] = {}
+        for path, evaluated_report in current.items():
+            current_by_group.setdefault(evaluated_report.group_name, {})[path] = evaluated_report
+        self._group_diffs: dict[str, tuple[float, float]] = {
+            group_name: self._matched_diffs(current_by_group.get(group_name, {}), self._bs_reports, bs_by_last_name)
+            for group_name in bs_groups
+        }
+
+    def report(self, evaluated_coverage: EvaluatedReportCoverage) -> Optional[EvaluatedReportCoverage]:
+        """
+        Return the baseline report matching a current report, or None.
+
+        Parameters:
+            evaluated_coverage (EvaluatedReportCoverage): The current report.
+
+        Returns:
+            Optional[EvaluatedReportCoverage]: The matching baseline report.
+        """
+        if evaluated_coverage.path and evaluated_coverage.path in self._bs_reports:
+            return self._bs_reports[evaluated_coverage.path]
+        return self._bs_by_name.get(evaluated_coverage.name)
+
+    def report_diffs(self, evaluated_coverage: EvaluatedReportCoverage) -> tuple[float, float]:
+        """Return the (overall, changed files) deltas of one report row; 0.0 without a baseline match."""
+        bs_coverage = self.report(evaluated_coverage)
+        if bs_coverage is None:
+            return 0.0, 0.0
+
+        diff_o = evaluated_coverage.overall_coverage_reached - bs_coverage.overall_coverage_reached
+        diff_ch = evaluated_coverage.avg_changed_files_coverage_reached - bs_coverage.avg_changed_files_coverage_reached
+        return diff_o, diff_ch
+
+    def group_diffs(self, group_name: str) -> tuple[float, float]:
+        """Return the (overall, changed files) deltas of one group row; 0.0 when the group has no baseline."""
+        return self._group_diffs.get(group_name, (0.0, 0.0))
+
+    def changed_file_diff(self, evaluated_coverage: EvaluatedReportCoverage, file_key: str) -> float:
+        """Return the coverage delta of one changed file of a report; 0.0 without a baseline value."""
+        bs_coverage = self.report(evaluated_coverage)
+        bs_reached: Optional[float] = None
+        if bs_coverage is not None:
+            bs_reached = bs_coverage.changed_files_coverage_reached.get(file_key)
+        if bs_reached is None:
+            bs_reached = self._bs_files.get(normalize_source_path(file_key))
+        if bs_reached is None:
+            return 0.0
+        return evaluated_coverage.changed_files_coverage_reached[file_key] - bs_reached
+
+    @staticmethod
+    def _matched_diffs(
+        current: dict[str, EvaluatedReportCoverage],
+        bs_reports: dict[str, EvaluatedReportCoverage],
+        bs_by_name: dict[str, EvaluatedReportCoverage],
+    ) -> tuple[float, float]:
+        """
+        Return (diff_overall, diff_changed) over the current reports matched with the baseline.
+
+        Only matched reports contribute covered counts, so a partial baseline covering fewer reports is not
+        compared against all current reports; the totals are those of all current reports.
+        """
+        matched_paths = current.keys() & bs_reports.keys()
+        if matched_paths:
+            pairs = [(current[path], bs_reports[path]) for path in matched_paths]
+        else:
+            pairs = [(curr, bs_by_name[curr.name]) for curr in current.values() if curr.name in bs_by_name]
+
+        if not pairs:
+            return 0.0, 0.0
+
+        curr_covered_o = bs_covered_o = 0
+        curr_covered_ch = bs_covered_ch = 0
+        for curr, bs in pairs:
+            curr_covered_o += curr.overall_coverage.covered
+            bs_covered_o += bs.overall_coverage.covered
+            curr_covered_ch += curr.avg_changed_files_coverage.covered
+            bs_covered_ch += bs.avg_changed_files_coverage.covered
+
+        total_o = sum(erc.overall_coverage.covered + erc.overall_coverage.missed for erc in current.values())
+        total_ch = sum(
+            erc.avg_changed_files_coverage.covered + erc.avg_changed_files_coverage.missed for erc in current.values()
+        )
+
+        diff_o = round((curr_covered_o - bs_covered_o) / total_o * 100, 2) if total_o > 0 else 0.0
+        diff_ch = round((curr_covered_ch - bs_covered_ch) / total_ch * 100, 2) if total_ch > 0 else 0.0
+        return diff_o, diff_ch
@@ -4,16 +4,22 @@ A module evaluating the coverage of the reports.
 
 import logging
 
+from itertools import islice
 from typing import Optional
 
-from jacoco_report.action_inputs import ActionInputs
+from jacoco_report.evaluator.metric_matrix import MetricMatrix, reached_thresholds
 from jacoco_report.model.counter import Counter
+from jacoco_report.model.file_coverage_store import SpilledFileCoverage
 from jacoco_report.model.report_file_coverage import ReportFileCoverage
 from jacoco_report.model.evaluated_report_coverage import EvaluatedReportCoverage
 from jacoco_report.model.report_group import ReportGroup
+from jacoco_report.utils.enums import MetricTypeEnum
 
 logger = logging.getLogger(__name__)
 
+# Changed files evaluated per metric matrix; a spilled report is read back from its store in batches of this size.
+EVALUATION_BATCH_SIZE = 1000
+
 
 class CoverageEvaluator:
     """
@@ -29,9 +35,12 @@ class CoverageEvaluator:
         global_min_coverage_changed_files: float,
         report_groups: Optional[list[ReportGroup]] = None,
         report_thresholds_default: tuple[float, float, float] = (0.0, 0.0, 0.0),
+        metric: str = MetricTypeEnum.INSTRUCTION.value,
     ):
         # input data stats
         self._report_files_coverage: list[ReportFileCoverage] = report_files_coverage
+        # the evaluated metric; the caller passes the primary metric of the action configuration
+        self.metric: str = metric
 
         # thresholds
         self._global_min_coverage_overall: float = global_min_coverage_overall
@@ -42,24 +51,7 @@ class CoverageEvaluator:
         self._report_groups: list[ReportGroup] = report_groups if report_groups is not None else []
         self.report_group_order: list[str] = [group.name for group in self._report_groups]
         self._group_thresholds_lookup: dict[str, tuple[float, float, float]] = {
-            group.name: (
-                (
-                    group.min_coverage_overall
-                    if group.min_coverage_overall is not None
-                    else self._report_thresholds_default[0]
-                ),
-                (
-                    group.min_coverage_changed_files
-                    if group.min_coverage_changed_files is not None
-                    else self._report_thresholds_default[1]
-                ),
-                (
-                    group.min_coverage_per_changed_file
-                    if group.min_coverage_per_changed_file is not None
-                    else self._report_thresholds_default[2]
-                ),
-            )
-            for group in self._report_groups
+            group.name: self._resolve_group_thresholds(group) for group in self._report_groups
         }
 
         # *** output data for the comment(s) ***
@@ -88,41 +80,67 @@ class CoverageEvaluator:
         Returns:
             None
         """
-        m = ActionInputs.get_metric()
+        m = self.metric
+
+        # evaluation of all report files (report == input xml file) and the sums needed for the global values
+        global_overall, global_changed_files, changed_file_counter, reports_by_group = self._evaluate_reports(m)
+
+        # evaluation of all groups (group == named set of reports with common paths/thresholds)
+        self._evaluate_groups(reports_by_group)
+
+        # evaluate the global coverage values
+        self.total_coverage_overall = global_overall.coverage()
+        self.total_coverage_changed_files = global_changed_files.coverage()
+        self.total_coverage_overall_passed = self.total_coverage_overall >= self._global_min_coverage_overall
+
+        if changed_file_counter == 0:
+            self.total_coverage_changed_files_passed = True
+        else:
+            self.total_coverage_changed_files_passed = (
+                self.total_coverage_changed_files >= self._global_min_coverage_changed_files
+            )
+
+        # review for violations
+        self.review_violations()
+
+    def _evaluate_reports(self, m: str) -> tuple[Counter, Counter, int, dict[str, dict[str, EvaluatedReportCoverage]]]:
+        """
+        Evaluates all report files with the metric matrix: the overall counters of every report are loaded
+        once, the changed files report by report in batches, and coverage percentages, sums and per-file
+        threshold checks are computed column-wise.
+
+        Parameters:
+            m (str): The metric to evaluate.
+
+        Returns:
+            tuple: The global overall sum, the global changed files sum, the number of changed files with
+            metric weight and the evaluated reports bucketed by group name (keyed by report path).
+        """
+        reports = self._report_files_coverage
 
-        # sum variables needed for the evaluation
-        global_overall = Counter(0, 0)
+        # column-wise evaluation of the selected metric over the overall counters of all reports
+        overall_matrix = MetricMatrix.from_coverages(report.overall_coverage for report in reports)
+        overall = overall_matrix.evaluate(m)
         global_changed_files = Counter(0, 0)
-        changed_file_counter = 0
+        weighted_files = 0
 
-        # evaluation of all report files (report == input xml file)
         seen_report_names: set[str] = set()
-        for report in self._report_files_coverage:
+        for index, report in enumerate(reports):
             evaluated_coverage_report: EvaluatedReportCoverage = EvaluatedReportCoverage(report.name, report.group_name)
             evaluated_coverage_report.path = report.path
+            thresholds = self._set_thresholds(report.group_name)
 
-            # get report's overall values
-            mi, co = report.overall_coverage.get_values_by_metric(m)
-            evaluated_coverage_report.overall_coverage_reached = report.overall_coverage.get_coverage_by_metric(m)
-            evaluated_coverage_report.overall_coverage.append(mi, co)
-            global_overall.append(mi, co)
-
-            # get report's changed files values
-            for key, changed_file_coverage in report.changed_files_coverage.items():
-                mi, co = changed_file_coverage.get_values_by_metric(m)
-                # Skip files with zero metric weight (no coverage data for selected metric)
-                has_file_metric_weight = not (mi == 0 and co == 0)
-                if not has_file_metric_weight:
-                    continue
-                changed_file_counter += 1
-                global_changed_files.append(mi, co)  # sum all reports
-                evaluated_coverage_report.changed_files_coverage_reached[key] = (
-                    changed_file_coverage.get_coverage_by_metric(m)
-                )
-                evaluated_coverage_report.avg_changed_files_coverage.append(mi, co)
+            # report's overall values
+            evaluated_coverage_report.overall_coverage = Counter(overall.missed[index], overall.covered[index])
+            evaluated_coverage_report.overall_coverage_reached = overall.reached[index]
+
+            # report's changed files values
+            report_weighted_files = self._evaluate_changed_files(m, report, thresholds[2], evaluated_coverage_report)
+            weighted_files += report_weighted_files
+            global_changed_files.append(evaluated_coverage_report.avg_changed_files_coverage)
 
             # If report had changed files but none were added (all filtered), mark it
-            if report.changed_files_coverage and not evaluated_coverage_report.changed_files_coverage_reached:
+            if report.changed_files_coverage and report_weighted_files == 0:
                 evaluated_coverage_report.had_changed_files_before_filtering = True
 
             # count reached values from raw weights - changed files
@@ -139,28 +157,95 @@ class CoverageEvaluator:
                     report.name,
                 )
             seen_report_names.add(report.name)
-            self.evaluated_reports_coverage[report.path] = self._evaluate_report(report, evaluated_coverage_report)
+            self.evaluated_reports_coverage[report.path] = self._evaluate_report(
+                report, evaluated_coverage_report, thresholds
+            )
 
-        # evaluation of all groups (group == named set of reports with common paths/thresholds)
+        return (
+            Counter(*overall_matrix.totals(m)),
+            global_changed_files,
+            weighted_files,
+            self._bucket_reports_by_group(self.evaluated_reports_coverage),
+        )
+
+    @staticmethod
+    def _evaluate_changed_files(
+        m: str, report: ReportFileCoverage, threshold: float, evaluated_coverage_report: EvaluatedReportCoverage
+    ) -> int:
+        """
+        Evaluates the changed files of one report, EVALUATION_BATCH_SIZE files per metric matrix, and fills in
+        the changed files sum and the per-file results of the evaluated report.
+
+        A report spilled to a FileCoverageStore is read back one batch at a time and keeps the results of its
+        failing files only, so the evaluation stays within the 'max-memory-mb' budget as the parse does.
+
+        Parameters:
+            m (str): The metric to evaluate.
+            report (ReportFileCoverage): The coverage of the report.
+            threshold (float): The per-changed-file threshold of the report.
+            evaluated_coverage_report (EvaluatedReportCoverage): The evaluated coverage of the report.
+
+        Returns:
+            int: The number of changed files with metric weight.
+        """
+        failing_only = isinstance(report.changed_files_coverage, SpilledFileCoverage)
+        weighted_files = 0
+        items = iter(report.changed_files_coverage.items())
+        while batch := list(islice(items, EVALUATION_BATCH_SIZE)):
+            matrix = MetricMatrix.from_coverages(file_coverage for _, file_coverage in batch)
+            # Files with zero metric weight (no coverage data for selected metric) are skipped
+            files = matrix.evaluate(m)
+            file_passed = reached_thresholds(files.reached, [threshold] * matrix.rows)
+            for row, (key, _) in enumerate(batch):
+                if not files.weighted[row]:
+                    continue
+                weighted_files += 1
+                if failing_only and file_passed[row]:
+                    continue
+                evaluated_coverage_report.changed_files_coverage_reached[key] = files.reached[row]
+                evaluated_coverage_report.changed_files_passed[key] = file_passed[row]
+            evaluated_coverage_report.avg_changed_files_coverage.append(Counter(*matrix.totals(m)))
+        return weighted_files
+
+    @staticmethod
+    def _bucket_reports_by_group(
+        evaluated_reports: dict[str, EvaluatedReportCoverage],
+    ) -> dict[str, dict[str, EvaluatedReportCoverage]]:
+        """Index the evaluated reports (keyed by path) by their group name in one pass."""
+        reports_by_group: dict[str, dict[str, EvaluatedReportCoverage]] = {}
+        for path, evaluated_report_coverage in evaluated_reports.items():
+            reports_by_group.setdefault(evaluated_report_coverage.group_name, {})[path] = evaluated_report_coverage
+        return reports_by_group
+
+    def _evaluate_groups(self, reports_by_group: dict[str, dict[str, EvaluatedReportCoverage]]) -> None:
+        """
+        Evaluates all report groups from the reports bucketed by group name during the report pass.
+
+        Parameters:
+            reports_by_group (dict[str, dict[str, EvaluatedReportCoverage]]): The evaluated reports per group.
+
+        Returns:
+            None
+        """
         for group in self._report_groups:
             evaluated_coverage_group: EvaluatedReportCoverage = EvaluatedReportCoverage(
                 group.name, group_name=group.name
             )
 
             # aggregate all reports belonging to this group
-            for evaluated_report_coverage in self.evaluated_reports_coverage.values():
-                if evaluated_report_coverage.group_name == group.name:
-                    evaluated_coverage_group.overall_coverage.append(evaluated_report_coverage.overall_coverage)
-                    evaluated_coverage_group.avg_changed_files_coverage.append(
-                        evaluated_report_coverage.avg_changed_files_coverage
-                    )
-                    evaluated_coverage_group.changed_files_passed.update(evaluated_report_coverage.changed_files_passed)
-                    evaluated_coverage_group.changed_files_coverage_reached.update(
-                        evaluated_report_coverage.changed_files_coverage_reached
-                    )
-                    # Propagate the flag if any report had changed files that were filtered
-                    if evaluated_report_coverage.had_changed_files_before_filtering:
-                        evaluated_coverage_group.had_changed_files_before_filtering = True
+            group_reports = reports_by_group.get(group.name, {})
+            for evaluated_report_coverage in group_reports.values():
+                evaluated_coverage_group.overall_coverage.append(evaluated_report_coverage.overall_coverage)
+                evaluated_coverage_group.avg_changed_files_coverage.append(
+                    evaluated_report_coverage.avg_changed_files_coverage
+                )
+                evaluated_coverage_group.changed_files_passed.update(evaluated_report_coverage.changed_files_passed)
+                evaluated_coverage_group.changed_files_coverage_reached.update(
+                    evaluated_report_coverage.changed_files_coverage_reached
+                )
+                # Propagate the flag if any report had changed files that were filtered
+                if evaluated_report_coverage.had_changed_files_before_filtering:
+                    evaluated_coverage_group.had_changed_files_before_filtering = True
 
             # count reached values from raw weights
             evaluated_coverage_group.overall_coverage_reached = evaluated_coverage_group.overall_coverage.coverage()
@@ -168,31 +253,12 @@ class CoverageEvaluator:
                 evaluated_coverage_group.avg_changed_files_coverage.coverage()
             )
 
-            if (
-                evaluated_coverage_group.overall_coverage.covered == 0
-                and evaluated_coverage_group.overall_coverage.missed == 0
-                and not any(ev.group_name == group.name for ev in self.evaluated_reports_coverage.values())
-            ):
+            if not group_reports:
                 logger.info("Group '%s' has no reports contributing after filtering.", group.name)
 
             # save the evaluated group
             self.evaluated_groups_coverage[group.name] = self.evaluate_group(evaluated_coverage_group, group)
 
-        # evaluate the global coverage values
-        self.total_coverage_overall = global_overall.coverage()
-        self.total_coverage_changed_files = global_changed_files.coverage()
-        self.total_coverage_overall_passed = self.total_coverage_overall >= self._global_min_coverage_overall
-
-        if changed_file_counter == 0:
-            self.total_coverage_changed_files_passed = True
-        else:
-            self.total_coverage_changed_files_passed = (
-                self.total_coverage_changed_files >= self._global_min_coverage_changed_files
-            )
-
-        # review for violations
-        self.review_violations()
-
     def review_violations(self) -> None:
         """
         Reviews the coverage evaluation results and appends violations to the violations list.
@@ -267,19 +333,7 @@ class CoverageEvaluator:
         Uses group-level thresholds when set, otherwise falls back to report-thresholds-default (then 0.0).
         global-thresholds is a separate evaluation pass and is never in this fallback chain.
         """
-        overall_threshold = (
-            group.min_coverage_overall if group.min_coverage_overall is not None else self._report_thresholds_default[0]
-        )
-        changed_files_threshold = (
-            group.min_coverage_changed_files
-            if group.min_coverage_changed_files is not None
-            else self._report_thresholds_default[1]
-        )
-        changed_per_file_threshold = (
-            group.min_coverage_per_changed_file
-            if group.min_coverage_per_changed_file is not None
-            else self._report_thresholds_default[2]
-        )
+        overall_threshold, changed_files_threshold, changed_per_file_threshold = self._resolve_group_thresholds(group)
         evaluated_coverage.overall_coverage_threshold = overall_threshold
         evaluated_coverage.changed_files_threshold = changed_files_threshold
         evaluated_coverage.per_changed_file_threshold = changed_per_file_threshold
@@ -336,25 +390,24 @@ class CoverageEvaluator:
         return evaluated_coverage
 
     def _evaluate_report(
-        self, report_coverage: ReportFileCoverage, evaluated_coverage_report: EvaluatedReportCoverage
+        self,
+        report_coverage: ReportFileCoverage,
+        evaluated_coverage_report: EvaluatedReportCoverage,
+        thresholds: tuple[float, float, float],
     ) -> EvaluatedReportCoverage:
         """
-        Evaluates the coverage of the one report.
-        Evaluation uses group thresholds when set, otherwise falls back to
-        report-thresholds-default (then 0.0). global-thresholds is a separate
-        evaluation pass and is never in this fallback chain.
+        Evaluates the coverage of the one report against its thresholds.
+        The per-file results are already filled in by evaluate() from the metric matrix.
 
         Parameters:
             report_coverage (ReportFileCoverage): The coverage of the report
             evaluated_coverage_report (EvaluatedReportCoverage): The evaluated coverage of the report
+            thresholds (tuple[float, float, float]): The report thresholds (see _set_thresholds)
 
         Returns:
             EvaluatedReportCoverage: The evaluated coverage of the report
         """
-        # get the thresholds for the report
-        overall_threshold, changed_files_threshold, changed_per_file_threshold = self._set_thresholds(
-            report_coverage.group_name
-        )
+        overall_threshold, changed_files_threshold, changed_per_file_threshold = thresholds
         evaluated_coverage_report.overall_coverage_threshold = overall_threshold
         evaluated_coverage_report.changed_files_threshold = changed_files_threshold
         evaluated_coverage_report.per_changed_file_threshold = changed_per_file_threshold
@@ -383,19 +436,6 @@ class CoverageEvaluator:
                 evaluated_coverage_report.avg_changed_files_coverage_reached >= changed_files_threshold
             )
 
-        # Evaluate per-file thresholds only for changed files that have metric weight.
-        # Files with zero coverage data (covered=0, missed=0) for selected metric are
-        # filtered out and NOT included in changed_files_passed — they won't appear in PR comment tables.
-        for key, changed_file_coverage in report_coverage.changed_files_coverage.items():
-            metric = ActionInputs.get_metric()
-            missed, covered = changed_file_coverage.get_values_by_metric(metric)
-            has_file_metric_weight = not (missed == 0 and covered == 0)
-
-            if has_file_metric_weight:
-                evaluated_coverage_report.changed_files_passed[key] = (
-                    changed_file_coverage.get_coverage_by_metric(metric) >= changed_per_file_threshold
-                )
-
         if has_overall_metric_weight:
             logger.info(
                 "Report '%s' reached overall coverage of %.1f%% with threshold set to %.1f%%",
@@ -424,6 +464,28 @@ class CoverageEvaluator:
 
         return evaluated_coverage_report
 
+    def _resolve_group_thresholds(self, group: ReportGroup) -> tuple[float, float, float]:
+        """
+        Returns the thresholds of a group for the evaluated metric using the field-level fallback chain:
+        group field → report-thresholds-default → 0.0.
+        """
+        group_thresholds = group.thresholds_for(self.metric)
+        return (
+            group_thresholds[0] if group_thresholds[0] is not None else self._report_thresholds_default[0],
+            group_thresholds[1] if group_thresholds[1] is not None else self._report_thresholds_default[1],
+            group_thresholds[2] if group_thresholds[2] is not None else self._report_thresholds_default[2],
+        )
+
+    @property
+    def global_min_coverage_overall(self) -> float:
+        """The global overall threshold of the evaluated metric."""
+        return self._global_min_coverage_overall
+
+    @property
+    def global_min_coverage_changed_files(self) -> float:
+        """The global changed-files-average threshold of the evaluated metric."""
+        return self._global_min_coverage_changed_files
+
     def _set_thresholds(self, group_name: str) -> tuple[float, float, float]:
         """
         Returns coverage thresholds for a report using the field-level fallback chain:
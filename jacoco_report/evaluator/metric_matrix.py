@@ -0,0 +1,140 @@
+"""
+A module that contains the MetricMatrix class holding coverage counters of many entities in one flat array.
+
+The counters are laid out as (entities × 6 metrics × 2) signed 64-bit integers in an array('q'), so that
+a metric column is one strided slice and coverage percentages, sums and threshold comparisons run over
+whole columns instead of over Coverage objects.
+"""
+
+import logging
+from array import array
+from itertools import repeat
+from typing import Iterable, NamedTuple
+
+from jacoco_report.model.coverage import COVERAGE_METRICS, Coverage
+
+logger = logging.getLogger(__name__)
+
+# Column order of the metrics in one row; a row is a copy of Coverage.values.
+METRIC_COLUMNS: tuple[str, ...] = COVERAGE_METRICS
+_ROW_WIDTH = 2 * len(METRIC_COLUMNS)
+
+
+class MetricColumn(NamedTuple):
+    """The per-row values of one metric: raw counters, coverage percentages and whether the row has weight."""
+
+    missed: array
+    covered: array
+    reached: list[float]
+    weighted: list[bool]
+
+
+class MetricMatrix:
+    """
+    A class representing the counters of a list of entities (reports or changed files) as one int64 array.
+    """
+
+    def __init__(self, data: array | None = None):
+        self.data: array = data if data is not None else array("q")
+
+    @classmethod
+    def from_coverages(cls, coverages: Iterable[Coverage]) -> "MetricMatrix":
+        """
+        Load the counters of the given coverages, one row per coverage in iteration order.
+
+        Parameters:
+            coverages (Iterable[Coverage]): The coverages to load.
+
+        Returns:
+            MetricMatrix: The loaded matrix.
+        """
+        data = array("q")
+        for coverage in coverages:
+            data.extend(coverage.values)
+        return cls(data)
+
+    @property
+    def rows(self) -> int:
+        """The number of entities in the matrix."""
+        return len(self.data) // _ROW_WIDTH
+
+    def column(self, metric: str) -> tuple[array, array]:
+        """
+        Return the missed and covered columns of one metric.
+
+        Parameters:
+            metric (str): The metric name.
+
+        Returns:
+            tuple[array, array]: The missed and covered values, one item per row.
+        """
+        if metric not in METRIC_COLUMNS:
+            logger.error("Unknown metric type: %s", metric)
+            return array("q", bytes(8 * self.rows)), array("q", bytes(8 * self.rows))
+
+        offset = 2 * METRIC_COLUMNS.index(metric)
+        return self.data[offset::_ROW_WIDTH], self.data[offset + 1 :: _ROW_WIDTH]
+
+    def evaluate(self, metric: str) -> MetricColumn:
+        """
+        Compute the coverage percentage and the weight flag of every row for one metric.
+
+        Parameters:
+            metric (str): The metric name.
+
+        Returns:
+            MetricColumn: The per-row values.
+        """
+        missed, covered = self.column(metric)
+        return MetricColumn(missed, covered, coverage_percentages(missed, covered), has_weight(missed, covered))
+
+    def totals(self, metric: str) -> tuple[int, int]:
+        """Return the missed and covered sums of one metric over all rows."""
+        missed, covered = self.column(metric)
+        return sum(missed), sum(covered)
+
+    def segment_sums(self, metric: str, bounds: list[int]) -> list[tuple[int, int]]:
+        """
+        Sum one metric over consecutive row segments.
+
+        Parameters:
+            metric (str): The metric name.
+            bounds (list[int]): The segment boundaries; segment k covers rows bounds[k] to bounds[k + 1].
+
+        Returns:
+            list[tuple[int, int]]: The missed and covered sums of each segment.
+        """
+        missed, covered = self.column(metric)
+        return [(sum(missed[start:end]), sum(covered[start:end])) for start, end in zip(bounds, bounds[1:])]
+
+
+def coverage_percentages(missed: array, covered: array) -> list[float]:
+    """
+    Compute the coverage percentage of every row, rounded as Counter.coverage() does (0.0 without weight).
+
+    Parameters:
+        missed (array): The missed column.
+        covered (array): The covered column.
+
+    Returns:
+        list[float]: The coverage percentages.
+    """
+    return [round(co / (mi + co) * 100, 2) if mi + co else 0.0 for mi, co in zip(missed, covered)]
+
+
+def has_weight(missed: array, covered: array) -> list[bool]:
+    """Return for every row whether it carries any counter value for the metric."""
+    return [bool(mi or co) for mi, co in zip(missed, covered)]
+
+
+def reached_thresholds(coverages: list[float], thresholds: list[float]) -> list[bool]:
+    """Compare the coverages with their thresholds element-wise (coverage >= threshold)."""
+    return [coverage >= threshold for coverage, threshold in zip(coverages, thresholds)]
+
+
+def expand_per_segment(values: list[float], bounds: list[int]) -> list[float]:
+    """Repeat values[k] for every row of segment k, producing one value per row."""
+    expanded: list[float] = []
+    for value, start, end in zip(values, bounds, bounds[1:]):
+        expanded.extend(repeat(value, end - start))
+    return expanded
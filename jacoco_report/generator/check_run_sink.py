@@ -0,0 +1,131 @@
+"""
+A module that contains the CheckRunSink class publishing the report as a GitHub Check Run.
+
+Failing changed files become file-level annotations. The Checks API accepts at most 50 annotations
+per request, so the first batch is sent with the check run creation and the rest with updates.
+"""
+
+import logging
+from typing import Optional
+
+from jacoco_report.generator.output_sinks import OutputSink, RenderedReport
+from jacoco_report.utils.constants import (
+    CHECK_RUN_ANNOTATIONS_PER_REQUEST,
+    CHECK_RUN_MAX_ANNOTATIONS,
+    CHECK_RUN_RATE_LIMIT_RESERVE,
+    CHECK_RUN_SUMMARY_MAX_LENGTH,
+)
+from jacoco_report.utils.github import GitHub
+
+logger = logging.getLogger(__name__)
+
+
+class CheckRunSink(OutputSink):
+    """
+    A sink creating one completed check run with an annotation per failing changed file.
+
+    Annotations are capped (CHECK_RUN_MAX_ANNOTATIONS) and batches stop early when the remaining
+    rate limit drops below CHECK_RUN_RATE_LIMIT_RESERVE; the summary states how many were omitted.
+    """
+
+    name = "check-run"
+
+    def __init__(self, gh: GitHub, head_sha: str, changed_files: list[str]):
+        self.gh: GitHub = gh
+        self.head_sha: str = head_sha
+        self.changed_files: list[str] = changed_files
+
+    def write(self, report: RenderedReport) -> bool:
+        annotations = self.build_annotations(report.data.get("reports", {}))
+        capped = annotations[:CHECK_RUN_MAX_ANNOTATIONS]
+        batches = [
+            capped[i : i + CHECK_RUN_ANNOTATIONS_PER_REQUEST]
+            for i in range(0, len(capped), CHECK_RUN_ANNOTATIONS_PER_REQUEST)
+        ] or [[]]
+
+        conclusion = "failure" if report.data.get("violations") else "success"
+        title = f"{len(annotations)} changed file(s) below the coverage threshold"
+        summary = self._summary(report.markdown, len(annotations) - len(capped))
+
+        check_run_id = self.gh.create_check_run(
+            report.title, self.head_sha, conclusion, self._output(title, summary, batches[0])
+        )
+        if check_run_id is None:
+            logger.warning("Failed to publish the check run.")
+            return False
+
+        sent = len(batches[0])
+        for batch in batches[1:]:
+            if self._rate_limit_low():
+                break
+            if not self.gh.update_check_run(check_run_id, self._output(title, summary, batch)):
+                break
+            sent += len(batch)
+
+        if sent < len(capped):
+            # Batches stopped early: correct the omitted count announced with the creation.
+            self.gh.update_check_run(
+                check_run_id, self._output(title, self._summary(report.markdown, len(annotations) - sent), [])
+            )
+        if sent < len(annotations):
+            logger.warning("Check run annotations capped: %d of %d sent.", sent, len(annotations))
+
+        logger.info("Check run %d published with %d annotation(s).", check_run_id, sent)
+        return True
+
+    def build_annotations(self, reports: dict) -> list[dict]:
+        """
+        Build one annotation per failing changed file, lowest coverage first.
+
+        Parameters:
+            reports (dict): The evaluated reports (EvaluatedReportCoverage.to_dict() by report path).
+
+        Returns:
+            list[dict]: The Checks API annotation objects.
+        """
+        failing: dict[str, tuple[float, float, str]] = {}
+        for report in reports.values():
+            threshold = report.get("per_changed_file_threshold", 0.0)
+            reached = report.get("changed_files_coverage_reached", {})
+            for file_name, passed in report.get("changed_files_passed", {}).items():
+                if passed:
+                    continue
+                path = self._resolve_path(file_name)
+                coverage = reached.get(file_name, 0.0)
+                if path not in failing or coverage < failing[path][0]:
+                    failing[path] = (coverage, threshold, report.get("name", ""))
+
+        return [
+            {
+                "path": path,
+                "start_line": 1,
+                "end_line": 1,
+                "annotation_level": "failure",
+                "title": "Coverage below threshold",
+                "message": f"Coverage {coverage:.2f}% is below the threshold of {threshold:.2f}% (report: {name}).",
+            }
+            for path, (coverage, threshold, name) in sorted(failing.items(), key=lambda item: (item[1][0], item[0]))
+        ]
+
+    def _resolve_path(self, file_name: str) -> str:
+        """Map a report file key to its repository path in the PR; unmatched keys are returned as they are."""
+        for changed_file in self.changed_files:
+            if changed_file == file_name or changed_file.endswith("/" + file_name):
+                return changed_file
+        return file_name
+
+    def _rate_limit_low(self) -> bool:
+        remaining: Optional[int] = self.gh.api_stats.rate_limit_remaining
+        if remaining is not None and remaining < CHECK_RUN_RATE_LIMIT_RESERVE:
+            logger.warning("GitHub rate limit is low (%d remaining). Stopping check run annotations.", remaining)
+            return True
+        return False
+
+    @staticmethod
+    def _summary(markdown: str, omitted: int) -> str:
+        note = f"\n\n> ⚠️ {omitted} annotation(s) omitted." if omitted > 0 else ""
+        return markdown[: CHECK_RUN_SUMMARY_MAX_LENGTH - len(note)] + note
+
+    @staticmethod
+    def _output(title: str, summary: str, annotations: list[dict]) -> dict:
+        return {"title": title, "summary": summary, "annotations": annotations}
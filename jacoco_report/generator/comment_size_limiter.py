@@ -0,0 +1,145 @@
+"""
+A module that contains the CommentSizeLimiter class keeping PR comments within GitHub's size limit.
+"""
+
+import logging
+from typing import Callable, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Degradation stages, applied in this order until the comment fits.
+STAGE_WORST_FILES = 1  # group and report tables in full, only the worst changed files
+STAGE_COLLAPSE_PASSING = 2  # passing group and report rows collapsed into a compact <details> list
+STAGE_SUMMARY = 3  # group and report rows summarized as counts
+STAGES = (STAGE_WORST_FILES, STAGE_COLLAPSE_PASSING, STAGE_SUMMARY)
+
+
+class ChangedFileRow(NamedTuple):
+    """One rendered changed-files table row with the values used to rank it."""
+
+    line: str
+    passed: bool
+    coverage: float
+
+
+class CommentElision:
+    """
+    A class collecting what was left out of a shortened PR comment, rendered as a note for the reader.
+    """
+
+    def __init__(self, max_length: int, total_files: int = 0):
+        self.max_length: int = max_length
+        self.total_files: int = total_files
+        self.shown_files: int = total_files
+        self.collapsed_rows: int = 0
+        self.summarized_rows: int = 0
+        self.truncated_chars: int = 0
+
+    def note(self) -> str:
+        """Render the elision note appended to the shortened comment."""
+        parts: list[str] = []
+        if self.shown_files < self.total_files:
+            parts.append(
+                f"showing {self.shown_files} of {self.total_files} changed files (failing and lowest coverage first)"
+            )
+        if self.collapsed_rows:
+            parts.append(f"{self.collapsed_rows} passing rows collapsed")
+        if self.summarized_rows:
+            parts.append(f"{self.summarized_rows} group/report rows summarized as counts")
+        if self.truncated_chars:
+            parts.append(f"{self.truncated_chars} characters truncated")
+
+        details = "; ".join(parts) if parts else "no rows omitted"
+        return f"> ⚠️ Comment shortened to fit GitHub's limit of {self.max_length:,} characters: {details}."
+
+
+class CommentSizeLimiter:
+    """
+    A class that shortens a PR comment body progressively until it fits into max_length characters.
+
+    Every stage keeps as many of the worst changed files (failing first, then lowest coverage) as fit;
+    the group and report sections of each stage are rendered by the caller (see STAGES). When even the
+    last stage does not fit, the body is truncated. The result always ends with an elision note.
+    """
+
+    def __init__(self, max_length: int):
+        self.max_length: int = max_length
+
+    def fit(
+        self,
+        head: str,
+        tail: list[str],
+        file_rows: list[ChangedFileRow],
+        file_table_header: Optional[str],
+        render_row_sections: Callable[[int, CommentElision], list[str]],
+    ) -> str:
+        """
+        Build the longest comment body that fits into max_length.
+
+        Parameters:
+            head (str): The title and summary table, always kept.
+            tail (list[str]): The trailing sections (warnings, metadata footer), kept unless truncated.
+            file_rows (list[ChangedFileRow]): All changed-file rows of the full comment.
+            file_table_header (Optional[str]): The changed-files table header, None when the table is not shown.
+            render_row_sections (Callable): Renders the group/report sections for a stage, recording elisions.
+
+        Returns:
+            str: The shortened comment body.
+        """
+        worst_first = sorted(file_rows, key=lambda row: (row.passed, row.coverage, row.line))
+
+        for stage in STAGES:
+            elision = CommentElision(self.max_length, total_files=len(file_rows))
+            row_sections = render_row_sections(stage, elision)
+            body = self._fit_files(head, tail, row_sections, worst_first, file_table_header, elision)
+            if body is not None:
+                logger.info("PR comment shortened at degradation stage %d to %d characters.", stage, len(body))
+                return body
+
+        elision = CommentElision(self.max_length, total_files=len(file_rows))
+        elision.shown_files = 0
+        body = join_body(head, render_row_sections(STAGES[-1], elision), tail)
+        # The note length depends on the truncated count; reserve room for its widest form.
+        elision.truncated_chars = len(body)
+        keep = max(self.max_length - len(elision.note()) - 2, 0)
+        elision.truncated_chars = len(body) - keep
+        logger.warning("PR comment truncated, %d characters dropped.", elision.truncated_chars)
+        return (body[:keep] + "\n\n" + elision.note())[: self.max_length]
+
+    def _fit_files(
+        self,
+        head: str,
+        tail: list[str],
+        row_sections: list[str],
+        worst_first: list[ChangedFileRow],
+        file_table_header: Optional[str],
+        elision: CommentElision,
+    ) -> Optional[str]:
+        """Binary-search the largest number of worst changed files that fits; None when none fits."""
+        best: Optional[str] = None
+        low, high = 0, len(worst_first)
+        while low <= high:
+            shown = (low + high) // 2
+            elision.shown_files = shown
+            sections = list(row_sections)
+            if file_table_header is not None and (shown > 0 or not worst_first):
+                lines = sorted(row.line for row in worst_first[:shown])
+                sections.append(file_table_header + ("".join(lines) if lines else "\n\nNo changed file in reports."))
+            sections.append(elision.note())
+
+            candidate = join_body(head, sections, tail)
+            if len(candidate) <= self.max_length:
+                best = candidate
+                low = shown + 1
+            else:
+                high = shown - 1
+
+        if best is not None:
+            # Leave the counters describing the body that was returned.
+            elision.shown_files = low - 1
+        return best
+
+
+def join_body(head: str, sections: list[str], tail: list[str]) -> str:
+    """Join the comment head, detail sections and trailing sections with blank lines."""
+    return "\n\n".join([head, *sections, *tail])
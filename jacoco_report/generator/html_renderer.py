@@ -0,0 +1,111 @@
+"""
+A module that converts the Markdown produced by PRCommentGenerator into a standalone HTML page.
+
+Only the subset of Markdown the generator emits is supported: pipe tables, bold/italic/code spans,
+inline links, block quotes, bullet lists, horizontal rules and <details>/<summary> blocks.
+"""
+
+import html
+import re
+
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC = re.compile(r"(?<![*\w])\*(?!\s)([^*]+?)\*(?![*\w])")
+_CODE = re.compile(r"`((?:\\`|[^`])+)`")
+_LINK = re.compile(r"\[((?:\\.|[^\]\\])+)\]\(([^)\s]+)\)")
+_CELL_SPLIT = re.compile(r"(?<!\\)\|")
+_TABLE_SEPARATOR = re.compile(r"^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$")
+_MARKDOWN_ESCAPE = re.compile(r"\\([\[\]`|])")
+_ALLOWED_TAGS = ("details", "summary")
+
+_STYLE = """
+body { font-family: -apple-system, "Segoe UI", Helvetica, Arial, sans-serif; margin: 2rem; color: #1f2328; }
+table { border-collapse: collapse; margin: 1rem 0; }
+th, td { border: 1px solid #d0d7de; padding: 4px 10px; text-align: left; }
+th { background: #f6f8fa; }
+code { background: #f6f8fa; padding: 0 4px; border-radius: 4px; }
+blockquote { border-left: 4px solid #d0d7de; margin: 0; padding: 0 1rem; color: #59636e; }
+""".strip()
+
+
+def _inline(text: str) -> str:
+    """Convert inline Markdown of one (already HTML-escaped) text fragment."""
+    text = _LINK.sub(lambda m: f'<a href="{m.group(2)}">{m.group(1)}</a>', text)
+    text = _CODE.sub(r"<code>\1</code>", text)
+    text = _BOLD.sub(r"<strong>\1</strong>", text)
+    text = _ITALIC.sub(r"<em>\1</em>", text)
+    for tag in _ALLOWED_TAGS:
+        text = text.replace(f"&lt;{tag}&gt;", f"<{tag}>").replace(f"&lt;/{tag}&gt;", f"</{tag}>")
+    return _MARKDOWN_ESCAPE.sub(r"\1", text)
+
+
+def _cells(line: str) -> list[str]:
+    """Split one pipe-table row into stripped cell texts."""
+    cells = _CELL_SPLIT.split(line.strip())
+    if cells and not cells[0].strip():
+        cells = cells[1:]
+    if cells and not cells[-1].strip():
+        cells = cells[:-1]
+    return [cell.strip() for cell in cells]
+
+
+def _table(rows: list[str]) -> str:
+    """Render consecutive pipe-table lines as an HTML table."""
+    header, body = rows[0], [row for row in rows[1:] if not _TABLE_SEPARATOR.match(row.strip())]
+    out = ["<table>", "<thead><tr>" + "".join(f"<th>{_inline(c)}</th>" for c in _cells(header)) + "</tr></thead>"]
+    out.append("<tbody>")
+    out.extend("<tr>" + "".join(f"<td>{_inline(c)}</td>" for c in _cells(row)) + "</tr>" for row in body)
+    out.append("</tbody>")
+    out.append("</table>")
+    return "\n".join(out)
+
+
+def markdown_to_html(markdown: str, title: str) -> str:
+    """
+    Convert the generator's Markdown into a standalone HTML document.
+
+    Parameters:
+        markdown (str): The Markdown report.
+        title (str): The document title.
+
+    Returns:
+        str: The HTML document.
+    """
+    blocks: list[str] = []
+    lines = html.escape(markdown, quote=False).splitlines()
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        stripped = line.strip()
+        if stripped.startswith("|"):
+            start = index
+            while index < len(lines) and lines[index].strip().startswith("|"):
+                index += 1
+            blocks.append(_table(lines[start:index]))
+            continue
+        if stripped.startswith("- "):
+            items = []
+            while index < len(lines) and lines[index].strip().startswith("- "):
+                items.append(f"<li>{_inline(lines[index].strip()[2:])}</li>")
+                index += 1
+            blocks.append("<ul>\n" + "\n".join(items) + "\n</ul>")
+            continue
+        if stripped == "---":
+            blocks.append("<hr>")
+        elif stripped.startswith("&gt; "):
+            blocks.append(f"<blockquote><p>{_inline(stripped[5:])}</p></blockquote>")
+        elif stripped.startswith(("&lt;details&gt;", "&lt;/details&gt;")):
+            blocks.append(_inline(stripped))
+        elif stripped:
+            blocks.append(f"<p>{_inline(stripped)}</p>")
+        index += 1
+
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en">\n'
+        "<head>\n"
+        '<meta charset="utf-8">\n'
+        f"<title>{html.escape(title)}</title>\n"
+        f"<style>\n{_STYLE}\n</style>\n"
+        "</head>\n"
+        "<body>\n" + "\n".join(blocks) + "\n</body>\n</html>\n"
+    )
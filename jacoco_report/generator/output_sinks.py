@@ -0,0 +1,114 @@
+"""
+A module that contains the output sinks receiving the full coverage report next to the PR comment.
+
+The report is rendered once (RenderedReport) and every configured sink writes it to its destination.
+"""
+
+import json
+import logging
+import os
+
+from jacoco_report.generator.html_renderer import markdown_to_html
+
+logger = logging.getLogger(__name__)
+
+
+class RenderedReport:
+    """
+    A class representing the full coverage report rendered once and shared by all output sinks.
+    """
+
+    def __init__(self, title: str, markdown: str, data: dict):
+        self.title: str = title
+        self.markdown: str = markdown
+        self.data: dict = data
+
+
+class OutputSink:
+    """
+    A base class for destinations of the full coverage report.
+    """
+
+    name: str = "sink"
+
+    def write(self, report: RenderedReport) -> bool:
+        """
+        Writes the report to the sink.
+
+        Parameters:
+            report (RenderedReport): The rendered report.
+
+        Returns:
+            bool: True if the report was written, False otherwise.
+        """
+        raise NotImplementedError
+
+
+class StepSummarySink(OutputSink):
+    """
+    A sink appending the Markdown report to the job summary file ($GITHUB_STEP_SUMMARY).
+    """
+
+    name = "step-summary"
+
+    def __init__(self, summary_path: str):
+        self.summary_path: str = summary_path
+
+    def write(self, report: RenderedReport) -> bool:
+        try:
+            with open(self.summary_path, "a", encoding="utf-8") as f:
+                f.write(report.markdown + "\n\n")
+        except OSError as e:
+            logger.warning("Failed to append the report to the step summary '%s': %s", self.summary_path, e)
+            return False
+
+        logger.info("Report appended to the step summary.")
+        return True
+
+
+class JsonReportSink(OutputSink):
+    """
+    A sink writing the report data to <directory>/coverage-report.json.
+    """
+
+    name = "json"
+    FILE_NAME = "coverage-report.json"
+
+    def __init__(self, directory: str):
+        self.path: str = os.path.join(directory, self.FILE_NAME)
+
+    def write(self, report: RenderedReport) -> bool:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(report.data, f, indent=4)
+        except OSError as e:
+            logger.warning("Failed to write the JSON report '%s': %s", self.path, e)
+            return False
+
+        logger.info("JSON report written to '%s'.", self.path)
+        return True
+
+
+class HtmlReportSink(OutputSink):
+    """
+    A sink writing the report as a standalone page to <directory>/coverage-report.html.
+    """
+
+    name = "html"
+    FILE_NAME = "coverage-report.html"
+
+    def __init__(self, directory: str):
+        self.path: str = os.path.join(directory, self.FILE_NAME)
+
+    def write(self, report: RenderedReport) -> bool:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(markdown_to_html(report.markdown, report.title))
+        except OSError as e:
+            logger.warning("Failed to write the HTML report '%s': %s", self.path, e)
+            return False
+
+        logger.info("HTML report written to '%s'.", self.path)
+        return True
@@ -6,17 +6,29 @@ import hashlib
 import logging
 import os
 from textwrap import dedent
-from typing import Optional
+from typing import NamedTuple, Optional, Sequence
 
-from jacoco_report.action_inputs import ActionInputs
+from jacoco_report.action_config import ActionConfig
+from jacoco_report.evaluator.baseline_join import BaselineJoin
 from jacoco_report.evaluator.coverage_evaluator import CoverageEvaluator
+from jacoco_report.generator.comment_size_limiter import (
+    STAGE_SUMMARY,
+    STAGE_WORST_FILES,
+    ChangedFileRow,
+    CommentElision,
+    CommentSizeLimiter,
+    join_body,
+)
+from jacoco_report.model.coverage_history import TrendPoint
 from jacoco_report.model.evaluated_report_coverage import EvaluatedReportCoverage
+from jacoco_report.utils.constants import GITHUB_COMMENT_MAX_LENGTH
 from jacoco_report.utils.enums import CommentLevelEnum
-from jacoco_report.utils.github import GitHub
+from jacoco_report.utils.github import GitHub, find_action_comment
 
 logger = logging.getLogger(__name__)
 
 _MD_LINK_TEXT_UNSAFE = str.maketrans({"[": "\\[", "]": "\\]", "`": "\\`", "|": "\\|"})
+_SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
 
 
 def _escape_md_link_text(text: str) -> str:
@@ -24,6 +36,25 @@ def _escape_md_link_text(text: str) -> str:
     return text.translate(_MD_LINK_TEXT_UNSAFE)
 
 
+def sparkline(values: Sequence[float]) -> str:
+    """Render values as block characters scaled between their minimum and maximum; equal values sit mid-height."""
+    low, high = min(values, default=0.0), max(values, default=0.0)
+    if high == low:
+        return _SPARKLINE_BLOCKS[len(_SPARKLINE_BLOCKS) // 2] * len(values)
+    top = len(_SPARKLINE_BLOCKS) - 1
+    return "".join(_SPARKLINE_BLOCKS[round((value - low) / (high - low) * top)] for value in values)
+
+
+class _RenderedComment(NamedTuple):
+    """The parts of one rendered comment body, kept for size limiting."""
+
+    head: str
+    tail: list[str]
+    groups: dict[str, EvaluatedReportCoverage]
+    reports: dict[str, EvaluatedReportCoverage]
+    body: str
+
+
 class PRCommentGenerator:
     """
     A class that represents the PR Comment Generator.
@@ -31,42 +62,86 @@ class PRCommentGenerator:
 
     def __init__(
         self,
-        gh: GitHub,
+        gh: Optional[GitHub],
         evaluator: CoverageEvaluator,
         bs_evaluator: Optional[CoverageEvaluator],
         pr_number: int,
         skip_report_names: frozenset[str] = frozenset(),
         ungrouped_reports: list[str] | None = None,
+        existing_comments: list[dict] | None = None,
+        metric_evaluators: dict[str, CoverageEvaluator] | None = None,
+        *,
+        config: ActionConfig,
+        trend: Optional[Sequence[TrendPoint]] = None,
     ):
-        self.gh: GitHub = gh
-        self.evaluator: CoverageEvaluator = evaluator
-        self.bs_evaluator: Optional[CoverageEvaluator] = bs_evaluator
+        # None for offline rendering (CLI); the comment is then not published
+        self.gh: Optional[GitHub] = gh
+        # the action configuration the comment is rendered with
+        self.config: ActionConfig = config
+        self._baseline_join: Optional[BaselineJoin] = None
+        self.evaluator = evaluator
+        self.bs_evaluator = bs_evaluator
         self.pr_number: int = pr_number
         self.skip_report_names: frozenset[str] = skip_report_names
         self.ungrouped_reports: list[str] = ungrouped_reports or []
-        self.github_repository: str = ActionInputs.get_repository()
+        # Comments already fetched by the GraphQL transport; None means they are listed via REST.
+        self.existing_comments: list[dict] | None = existing_comments
+        # Evaluators of all configured metrics keyed by metric; the per-metric table is shown for two or more.
+        self.metric_evaluators: dict[str, CoverageEvaluator] = metric_evaluators or {}
+        # the last base branch runs of the coverage history, oldest first; shown as a sparkline when not empty
+        self.trend: list[TrendPoint] = list(trend or [])
+        self.max_comment_length: int = GITHUB_COMMENT_MAX_LENGTH
+        self._rendered: dict[str, _RenderedComment] = {}
+
+    @property
+    def evaluator(self) -> CoverageEvaluator:
+        """The evaluator of the current reports."""
+        return self._evaluator
+
+    @evaluator.setter
+    def evaluator(self, evaluator: CoverageEvaluator) -> None:
+        self._evaluator = evaluator
+        self._baseline_join = None
+
+    @property
+    def bs_evaluator(self) -> Optional[CoverageEvaluator]:
+        """The evaluator of the baseline reports, None without a baseline."""
+        return self._bs_evaluator
+
+    @bs_evaluator.setter
+    def bs_evaluator(self, bs_evaluator: Optional[CoverageEvaluator]) -> None:
+        self._bs_evaluator = bs_evaluator
+        self._baseline_join = None
+
+    @property
+    def baseline_join(self) -> BaselineJoin:
+        """The baseline matches of the current reports, built on first use after evaluation."""
+        if self._baseline_join is None:
+            self._baseline_join = BaselineJoin(self.evaluator, self.bs_evaluator)
+        return self._baseline_join
 
     def generate(self) -> None:
         """
         The method that generates the comment for a single generator.
         """
-        comment_level = ActionInputs.get_comment_level()
-        update_comment = ActionInputs.get_update_comment()
+        comment_level = self.config.comment.comment_level
+        update_comment = self.config.comment.update_comment
 
         # No comment operation is needed in this mode, so skip the API read call entirely.
         if comment_level == CommentLevelEnum.NONE and not update_comment:
             return
+        if self.gh is None:
+            logger.warning("No GitHub API available. The PR comment is not published.")
+            return
 
         title, pr_body = self._get_comment_content(comment_level)
         # Get all comments on the pull request
-        comments = self.gh.get_comments(self.pr_number)
+        comments = (
+            self.existing_comments if self.existing_comments is not None else self.gh.get_comments(self.pr_number)
+        )
 
         # Check for existing comment with the same title
-        existing_comment = None
-        for comment in comments:
-            if len(title) > 0 and comment["body"].startswith(title):  # Detects if it starts with the title
-                existing_comment = comment
-                break
+        existing_comment = find_action_comment(comments, title)
 
         if comment_level == CommentLevelEnum.NONE:
             if existing_comment and update_comment:
@@ -79,70 +154,165 @@ class PRCommentGenerator:
             self.gh.add_comment(self.pr_number, pr_body)
 
     def _get_comment_content(self, comment_level: str) -> tuple[str, str]:
-        """Build the PR comment title and body for the selected comment level."""
-        title = body = f"**{ActionInputs.get_title()}**"
+        """Build the PR comment title and body for the selected comment level, within max_comment_length."""
+        title = f"**{self.config.comment.title}**"
 
         if comment_level == CommentLevelEnum.NONE:
-            return title, body
+            return title, title
+
+        parts = self._render(comment_level)
+        if len(parts.body) <= self.max_comment_length:
+            return title, parts.body
 
-        p = ActionInputs.get_pass_symbol()
-        f = ActionInputs.get_fail_symbol()
+        logger.warning(
+            "PR comment body has %d characters, over the limit of %d. Shortening it.",
+            len(parts.body),
+            self.max_comment_length,
+        )
+        p = self.config.comment.pass_symbol
+        f = self.config.comment.fail_symbol
+        return title, CommentSizeLimiter(self.max_comment_length).fit(
+            parts.head,
+            parts.tail,
+            self._get_changed_file_rows(p, f, parts.reports, comment_level) if parts.reports else [],
+            self._changed_files_table_header() if parts.reports else None,
+            lambda stage, elision: self._get_degraded_row_sections(p, f, parts.groups, parts.reports, stage, elision),
+        )
 
-        body += f"\n\n{self.get_basic_table_for_all(p, f)}"
+    def render_body(self, comment_level: str = CommentLevelEnum.FULL) -> str:
+        """
+        Render the complete (never shortened) body for a comment level.
 
+        The rendering is cached per level, so the PR comment and the output sinks share one build of the tables.
+        """
+        if comment_level == CommentLevelEnum.NONE:
+            return f"**{self.config.comment.title}**"
+        return self._render(comment_level).body
+
+    def _render(self, comment_level: str) -> "_RenderedComment":
+        """Render and cache the comment parts for a comment level other than NONE."""
+        if comment_level in self._rendered:
+            return self._rendered[comment_level]
+
+        p = self.config.comment.pass_symbol
+        f = self.config.comment.fail_symbol
+
+        head = f"**{self.config.comment.title}**\n\n{self.get_basic_table_for_all(p, f)}"
+        if len(self.metric_evaluators) > 1:
+            head += f"\n\n{self.get_metrics_table(p, f)}"
+        if self.trend:
+            head += f"\n\n{self.get_trend_line()}"
+        tail = [part for part in (self._get_ungrouped_reports_warning(), self._get_metadata_footer()) if part]
+
+        groups: dict[str, EvaluatedReportCoverage] = {}
+        reports: dict[str, EvaluatedReportCoverage] = {}
+        detail_sections: list[str] = []
         if comment_level != CommentLevelEnum.MINIMAL:
-            filtered_groups = self.evaluator.evaluated_groups_coverage
-            filtered_reports = {
-                k: v for k, v in self.evaluator.evaluated_reports_coverage.items() if k not in self.skip_report_names
-            }
-            if self.skip_report_names:
-                visible_group_names: frozenset[str] = frozenset(
-                    v.group_name
-                    for k, v in self.evaluator.evaluated_reports_coverage.items()
-                    if k not in self.skip_report_names
-                )
-                filtered_groups = {k: v for k, v in filtered_groups.items() if k in visible_group_names}
+            groups, reports = self._get_visible_rows(comment_level)
+            detail_sections = self._get_detail_sections(p, f, groups, reports, comment_level)
+
+        rendered = _RenderedComment(head, tail, groups, reports, join_body(head, detail_sections, tail))
+        self._rendered[comment_level] = rendered
+        return rendered
+
+    def _get_visible_rows(
+        self, comment_level: str
+    ) -> tuple[dict[str, EvaluatedReportCoverage], dict[str, EvaluatedReportCoverage]]:
+        """Return the group and report rows to render for a non-minimal comment level."""
+        filtered_groups = self.evaluator.evaluated_groups_coverage
+        filtered_reports = {
+            k: v for k, v in self.evaluator.evaluated_reports_coverage.items() if k not in self.skip_report_names
+        }
+        if self.skip_report_names:
+            visible_group_names: frozenset[str] = frozenset(
+                v.group_name
+                for k, v in self.evaluator.evaluated_reports_coverage.items()
+                if k not in self.skip_report_names
+            )
+            filtered_groups = {k: v for k, v in filtered_groups.items() if k in visible_group_names}
+
+        # Filter out reports with no changed files where metric weight is zero
+        # This indicates all changed files were filtered due to zero metric weight.
+        # Only hide when: had_changed_files_before_filtering is True
+        filtered_reports = {k: v for k, v in filtered_reports.items() if not v.had_changed_files_before_filtering}
 
-            # Filter out reports with no changed files where metric weight is zero
-            # This indicates all changed files were filtered due to zero metric weight.
-            # Only hide when: had_changed_files_before_filtering is True
-            filtered_reports = {k: v for k, v in filtered_reports.items() if not v.had_changed_files_before_filtering}
+        # Similar logic for groups
+        filtered_groups = {k: v for k, v in filtered_groups.items() if not v.had_changed_files_before_filtering}
 
-            # Similar logic for groups
-            filtered_groups = {k: v for k, v in filtered_groups.items() if not v.had_changed_files_before_filtering}
+        if comment_level != CommentLevelEnum.FULL:
+            filtered_groups = self._filter_evaluated_coverage_rows(filtered_groups, comment_level)
+            filtered_reports = self._filter_evaluated_coverage_rows(filtered_reports, comment_level)
 
-            if comment_level != CommentLevelEnum.FULL:
-                filtered_groups = self._filter_evaluated_coverage_rows(filtered_groups, comment_level)
-                filtered_reports = self._filter_evaluated_coverage_rows(filtered_reports, comment_level)
+        return filtered_groups, filtered_reports
+
+    def _get_detail_sections(
+        self,
+        p: str,
+        f: str,
+        groups: dict[str, EvaluatedReportCoverage],
+        reports: dict[str, EvaluatedReportCoverage],
+        comment_level: str,
+    ) -> list[str]:
+        """Render the groups, reports and changed-files sections in full."""
+        detail_sections: list[str] = []
 
-            detail_sections: list[str] = []
+        groups_table = self.get_groups_table(p, f, groups)
+        if groups_table:
+            detail_sections.append(groups_table)
 
-            groups_table = self.get_groups_table(p, f, filtered_groups)
-            if groups_table:
-                detail_sections.append(groups_table)
+        reports_table = self.get_reports_table(p, f, reports)
+        if reports_table:
+            detail_sections.append(reports_table)
 
-            reports_table = self.get_reports_table(p, f, filtered_reports)
-            if reports_table:
-                detail_sections.append(reports_table)
+        changed_files_table = self._get_changed_files_table(p, f, reports, comment_level)
+        if changed_files_table:
+            detail_sections.append(changed_files_table)
 
-            changed_files_table = self._get_changed_files_table(p, f, filtered_reports, comment_level)
-            if changed_files_table:
-                detail_sections.append(changed_files_table)
+        if not detail_sections and comment_level != CommentLevelEnum.FULL:
+            detail_sections.append("No rows match the selected comment level.")
 
-            if detail_sections:
-                body += "\n\n" + "\n\n".join(detail_sections)
-            elif comment_level != CommentLevelEnum.FULL:
-                body += "\n\nNo rows match the selected comment level."
+        return detail_sections
 
-        ungrouped_warning = self._get_ungrouped_reports_warning()
-        if ungrouped_warning:
-            body += f"\n\n{ungrouped_warning}"
+    def _get_degraded_row_sections(
+        self,
+        p: str,
+        f: str,
+        groups: dict[str, EvaluatedReportCoverage],
+        reports: dict[str, EvaluatedReportCoverage],
+        stage: int,
+        elision: CommentElision,
+    ) -> list[str]:
+        """Render the group and report sections for one degradation stage."""
+        if stage == STAGE_WORST_FILES:
+            tables = (self.get_groups_table(p, f, groups), self.get_reports_table(p, f, reports))
+            return [table for table in tables if table]
+
+        sections: list[str] = []
+        for label, rows, render in (
+            ("groups", groups, self.get_groups_table),
+            ("reports", reports, self.get_reports_table),
+        ):
+            if not rows:
+                continue
+            failing = {k: v for k, v in rows.items() if self._is_failing_coverage(v)}
+            passing = {k: v for k, v in rows.items() if k not in failing}
 
-        metadata = self._get_metadata_footer()
-        if metadata:
-            body += f"\n\n{metadata}"
+            if stage == STAGE_SUMMARY:
+                elision.summarized_rows += len(rows)
+                sections.append(f"**{label.capitalize()}:** {len(passing)} passing {p}, {len(failing)} failing {f}")
+                continue
 
-        return title, body
+            if failing:
+                sections.append(render(p, f, failing))
+            if passing:
+                elision.collapsed_rows += len(passing)
+                compact = ", ".join(
+                    f"`{v.name}` {v.overall_coverage_reached}%" for v in sorted(passing.values(), key=lambda v: v.name)
+                )
+                sections.append(
+                    f"<details><summary>{p} {len(passing)} passing {label}</summary>\n\n{compact}\n\n</details>"
+                )
+        return sections
 
     def _get_ungrouped_reports_warning(self) -> str:
         """Build a warning section for reports not assigned to any group.
@@ -169,15 +339,16 @@ class PRCommentGenerator:
 
     def _get_metadata_footer(self) -> str:
         """Build the metadata footer appended to every non-NONE PR comment."""
-        run_id = ActionInputs.get_run_id()
-        event = ActionInputs.get_event_name()
-        started_at = ActionInputs.get_run_started_at()
-        action_ref = ActionInputs.get_action_ref()
+        config = self.config
+        run_id = config.github.run_id
+        event = config.github.event_name
+        started_at = config.github.run_started_at
+        action_ref = config.github.action_ref
 
         parts: list[str] = []
         if run_id:
-            if self.github_repository:
-                url = f"https://github.com/{self.github_repository}/actions/runs/{run_id}"
+            if config.github.repository:
+                url = f"https://github.com/{config.github.repository}/actions/runs/{run_id}"
                 parts.append(f"Run [{run_id}]({url})")
             else:
                 parts.append(f"Run `{run_id}`")
@@ -240,16 +411,7 @@ class PRCommentGenerator:
 
     def _has_baseline_data(self) -> bool:
         """Return whether baseline evaluator data is available for diff columns."""
-        if not self.bs_evaluator:
-            return False
-
-        reports_coverage = getattr(self.bs_evaluator, "evaluated_reports_coverage", {})
-        groups_coverage = getattr(self.bs_evaluator, "evaluated_groups_coverage", {})
-
-        has_report_baseline = isinstance(reports_coverage, dict) and len(reports_coverage) > 0
-        has_group_baseline = isinstance(groups_coverage, dict) and len(groups_coverage) > 0
-
-        return has_report_baseline or has_group_baseline
+        return self.baseline_join.has_data
 
     def get_basic_table_for_all(self, p: str, f: str) -> str:
         """Render the global summary table, with baseline deltas when available."""
@@ -257,74 +419,59 @@ class PRCommentGenerator:
             return self.get_basic_table(
                 p,
                 f,
-                ActionInputs.get_metric(),
+                self.config.metric,
                 self.evaluator.total_coverage_overall,
                 self.evaluator.total_coverage_overall_passed,
-                ActionInputs.get_global_overall_threshold(),
+                self.config.thresholds.global_overall,
                 self.evaluator.total_coverage_changed_files,
                 self.evaluator.total_coverage_changed_files_passed,
-                ActionInputs.get_global_changed_files_average_threshold(),
+                self.config.thresholds.global_changed_files_average,
             )
 
-        # bs_evaluator is guaranteed non-None here due to _has_baseline_data() check
-        bs_evaluator = self.bs_evaluator
-        assert bs_evaluator is not None
-        # Compute diffs from matched report names only to avoid comparing N current
+        # Diffs come from matched reports only to avoid comparing N current
         # reports against a partial baseline that covers fewer reports.
-        diff_o, diff_ch = self._compute_matched_global_diffs(bs_evaluator)
+        diff_o, diff_ch = self.baseline_join.global_diffs
         return self._render_basic_table_with_delta(
             p,
             f,
-            ActionInputs.get_metric(),
+            self.config.metric,
             self.evaluator.total_coverage_overall,
             self.evaluator.total_coverage_overall_passed,
-            ActionInputs.get_global_overall_threshold(),
+            self.config.thresholds.global_overall,
             self.evaluator.total_coverage_changed_files,
             self.evaluator.total_coverage_changed_files_passed,
-            ActionInputs.get_global_changed_files_average_threshold(),
+            self.config.thresholds.global_changed_files_average,
             diff_o,
             diff_ch,
         )
 
-    def _compute_matched_global_diffs(self, bs_evaluator: "CoverageEvaluator") -> tuple[float, float]:
-        """Return (diff_overall, diff_changed) using reports matched between both evaluators.
-
-        Matching is path-first (same directory structure) with a name-based fallback for setups
-        where current and baseline reports live in different directory trees.
-        """
-        curr_by_path = self.evaluator.evaluated_reports_coverage
-        bs_by_path = bs_evaluator.evaluated_reports_coverage
-
-        matched_paths = set(curr_by_path.keys()) & set(bs_by_path.keys())
-        if matched_paths:
-            pairs = [(curr_by_path[p], bs_by_path[p]) for p in matched_paths]
-        else:
-            bs_by_name = {v.name: v for v in bs_by_path.values()}
-            pairs = [(curr, bs_by_name[curr.name]) for curr in curr_by_path.values() if curr.name in bs_by_name]
-
-        if not pairs:
-            return 0.0, 0.0
-
-        curr_covered_o = bs_covered_o = 0
-        curr_covered_ch = bs_covered_ch = 0
-        for curr, bs in pairs:
-            curr_covered_o += curr.overall_coverage.covered
-            bs_covered_o += bs.overall_coverage.covered
-            curr_covered_ch += curr.avg_changed_files_coverage.covered
-            bs_covered_ch += bs.avg_changed_files_coverage.covered
-
-        global_total_o = sum(
-            erc.overall_coverage.covered + erc.overall_coverage.missed for erc in curr_by_path.values()
-        )
-        global_total_ch = sum(
-            erc.avg_changed_files_coverage.covered + erc.avg_changed_files_coverage.missed
-            for erc in curr_by_path.values()
+    def get_trend_line(self) -> str:
+        """Render the overall coverage of the last base branch runs and of this run as a sparkline."""
+        values = [point.overall for point in self.trend] + [self.evaluator.total_coverage_overall]
+        base_ref = self.config.github.base_ref
+        return (
+            f"**Trend** ({self.config.metric}, last {len(self.trend)} `{base_ref}` runs, then this one): "
+            f"{sparkline(values)} {values[0]}% → {values[-1]}%"
         )
 
-        diff_o = round((curr_covered_o - bs_covered_o) / global_total_o * 100, 2) if global_total_o > 0 else 0.0
-        diff_ch = round((curr_covered_ch - bs_covered_ch) / global_total_ch * 100, 2) if global_total_ch > 0 else 0.0
-
-        return diff_o, diff_ch
+    # | Metric          | Overall | Threshold | Changed Files | Threshold | Status |
+    # |-----------------|---------|-----------|---------------|-----------|--------|
+    # | **line**        | 85.2%   | 80.0%     | 78.4%         | 70.0%     | ✅      |
+    # | **branch**      | 61.0%   | 60.0%     | 48.0%         | 50.0%     | ❌      |
+
+    def get_metrics_table(self, p: str, f: str) -> str:
+        """Render the global totals of every configured metric; the status covers all thresholds of the metric."""
+        rows = [
+            "| Metric | Overall | Threshold | Changed Files | Threshold | Status |",
+            "|--------|---------|-----------|---------------|-----------|--------|",
+        ]
+        for metric, evaluator in self.metric_evaluators.items():
+            rows.append(
+                f"| **{metric}** | {evaluator.total_coverage_overall}% | {evaluator.global_min_coverage_overall}% "
+                f"| {evaluator.total_coverage_changed_files}% | {evaluator.global_min_coverage_changed_files}% "
+                f"| {f if evaluator.violations else p} |"
+            )
+        return "\n".join(rows)
 
     # Full example of the table
     # | Metric (Instruction) | Coverage | Threshold | Δ Coverage | Status |
@@ -577,73 +724,16 @@ class PRCommentGenerator:
         )
 
     def calculate_baseline_group_diffs(self, evaluated_coverage: EvaluatedReportCoverage) -> tuple[float, float]:
-        """Calculate baseline deltas for one rendered group row using path-first, name-fallback matching."""
-        if not self.bs_evaluator or evaluated_coverage.name not in self.bs_evaluator.evaluated_groups_coverage:
-            return 0.0, 0.0
-
-        group_name = evaluated_coverage.name
-        curr_in_group = {
-            path: erc for path, erc in self.evaluator.evaluated_reports_coverage.items() if erc.group_name == group_name
-        }
-
-        bs_reports = getattr(self.bs_evaluator, "evaluated_reports_coverage", {})
-        bs_reports = bs_reports if isinstance(bs_reports, dict) else {}
-
-        matched_paths = set(curr_in_group.keys()) & set(bs_reports.keys())
-        if matched_paths:
-            pairs = [(curr_in_group[p], bs_reports[p]) for p in matched_paths]
-        else:
-            bs_by_name = {v.name: v for v in bs_reports.values()}
-            pairs = [(curr, bs_by_name[curr.name]) for curr in curr_in_group.values() if curr.name in bs_by_name]
-
-        if not pairs:
-            return 0.0, 0.0
-
-        curr_covered_o = bs_covered_o = 0
-        curr_covered_ch = bs_covered_ch = 0
-        for curr, bs in pairs:
-            curr_covered_o += curr.overall_coverage.covered
-            bs_covered_o += bs.overall_coverage.covered
-            curr_covered_ch += curr.avg_changed_files_coverage.covered
-            bs_covered_ch += bs.avg_changed_files_coverage.covered
-
-        group_total_o = sum(
-            erc.overall_coverage.covered + erc.overall_coverage.missed for erc in curr_in_group.values()
-        )
-        group_total_ch = sum(
-            erc.avg_changed_files_coverage.covered + erc.avg_changed_files_coverage.missed
-            for erc in curr_in_group.values()
-        )
-
-        diff_o = round((curr_covered_o - bs_covered_o) / group_total_o * 100, 2) if group_total_o > 0 else 0.0
-        diff_ch = round((curr_covered_ch - bs_covered_ch) / group_total_ch * 100, 2) if group_total_ch > 0 else 0.0
-
-        return diff_o, diff_ch
+        """Return the baseline deltas of one rendered group row (path-first, name-fallback report matching)."""
+        return self.baseline_join.group_diffs(evaluated_coverage.name)
 
     def _find_baseline_report(self, evaluated_coverage: EvaluatedReportCoverage) -> Optional["EvaluatedReportCoverage"]:
-        """Return the matching baseline EvaluatedReportCoverage, or None.
-
-        Tries path-based lookup first (same directory structure), then falls back to name-based
-        matching for setups where current and baseline reports live in different directory trees.
-        """
-        if not self.bs_evaluator:
-            return None
-        bs = getattr(self.bs_evaluator, "evaluated_reports_coverage", {})
-        if not isinstance(bs, dict):
-            return None
-        if evaluated_coverage.path and evaluated_coverage.path in bs:
-            return bs[evaluated_coverage.path]
-        return next((v for v in bs.values() if v.name == evaluated_coverage.name), None)
+        """Return the matching baseline EvaluatedReportCoverage, or None."""
+        return self.baseline_join.report(evaluated_coverage)
 
     def _calculate_baseline_report_diffs(self, evaluated_coverage: EvaluatedReportCoverage) -> tuple[float, float]:
-        """Calculate baseline deltas for one rendered report row."""
-        bs_coverage = self._find_baseline_report(evaluated_coverage)
-        if bs_coverage is None:
-            return 0.0, 0.0
-
-        diff_o = evaluated_coverage.overall_coverage_reached - bs_coverage.overall_coverage_reached
-        diff_ch = evaluated_coverage.avg_changed_files_coverage_reached - bs_coverage.avg_changed_files_coverage_reached
-        return diff_o, diff_ch
+        """Return the baseline deltas of one rendered report row."""
+        return self.baseline_join.report_diffs(evaluated_coverage)
 
     # Full example of the table
     # | File Path                                      | Coverage | Threshold | Δ Coverage | Status |
@@ -658,38 +748,63 @@ class PRCommentGenerator:
         """
         Generate a table with changed files without baseline. The table contains the files from all reports.
         """
-        s = dedent("""
-            | File Path | Coverage | Threshold | Status |
-            |-----------|----------|-----------|--------|
-        """).strip()
-
         if evaluated_reports_coverage is None:
             evaluated_reports_coverage = self.evaluator.evaluated_reports_coverage
 
-        lines = []
+        return self._render_changed_files_table(
+            self._changed_files_table_header(False),
+            self._get_changed_file_rows_without_baseline(p, f, evaluated_reports_coverage),
+        )
+
+    def _get_changed_file_rows_without_baseline(
+        self, p: str, f: str, evaluated_reports_coverage: dict[str, EvaluatedReportCoverage]
+    ) -> list[ChangedFileRow]:
+        """Render one changed-files table row per changed file, without baseline deltas."""
+        rows = []
         for ecr_key in evaluated_reports_coverage.keys():
             for file_key in evaluated_reports_coverage[ecr_key].changed_files_coverage_reached.keys():
-                filename = _escape_md_link_text(os.path.basename(file_key))
-                file_hash = hashlib.sha256(file_key.encode("utf-8")).hexdigest()
-                file_as_link_to_diff = (
-                    f"https://github.com/{self.github_repository}/pull/{self.pr_number}/files#diff-{file_hash}"
-                )
-
+                coverage = evaluated_reports_coverage[ecr_key].changed_files_coverage_reached[file_key]
+                passed = evaluated_reports_coverage[ecr_key].changed_files_passed[file_key]
                 line = (
-                    f"\n| [{filename}]({file_as_link_to_diff})"
-                    f" | {evaluated_reports_coverage[ecr_key].changed_files_coverage_reached[file_key]}%"
+                    f"\n| {self._changed_file_link(file_key)}"
+                    f" | {coverage}%"
                     f" | {evaluated_reports_coverage[ecr_key].per_changed_file_threshold}%"
-                    f" | {p if evaluated_reports_coverage[ecr_key].changed_files_passed[file_key] else f} |"
+                    f" | {p if passed else f} |"
                 )
-                lines.append(line)
+                rows.append(ChangedFileRow(line, passed, coverage))
+
+        return rows
+
+    def _changed_file_link(self, file_key: str) -> str:
+        """Render the file name as a Markdown link to its diff in the pull request."""
+        filename = _escape_md_link_text(os.path.basename(file_key))
+        file_hash = hashlib.sha256(file_key.encode("utf-8")).hexdigest()
+        repository = self.config.github.repository
+        return f"[{filename}](https://github.com/{repository}/pull/{self.pr_number}/files#diff-{file_hash})"
+
+    def _changed_files_table_header(self, with_baseline: Optional[bool] = None) -> str:
+        """Return the changed-files table header, with the Δ column when baseline data is available."""
+        if with_baseline is None:
+            with_baseline = self._has_baseline_data()
+
+        if with_baseline:
+            return dedent("""
+                | File Path | Coverage | Threshold | Δ Coverage | Status |
+                |-----------|----------|-----------|------------|--------|
+            """).strip()
 
-        if len(lines) > 0:
-            lines.sort()
-            s += "".join(lines)
-        else:
-            s += "\n\nNo changed file in reports."
+        return dedent("""
+            | File Path | Coverage | Threshold | Status |
+            |-----------|----------|-----------|--------|
+        """).strip()
 
-        return s
+    @staticmethod
+    def _render_changed_files_table(header: str, rows: list[ChangedFileRow]) -> str:
+        """Render the changed-files table with rows sorted by their rendered line."""
+        if not rows:
+            return header + "\n\nNo changed file in reports."
+
+        return header + "".join(sorted(row.line for row in rows))
 
     def _get_changed_files_table(
         self,
@@ -713,6 +828,22 @@ class PRCommentGenerator:
 
         return self.generate_changed_files_table_with_baseline(p, f, evaluated_reports_coverage)
 
+    def _get_changed_file_rows(
+        self,
+        p: str,
+        f: str,
+        evaluated_reports_coverage: dict[str, EvaluatedReportCoverage],
+        comment_level: str,
+    ) -> list[ChangedFileRow]:
+        """Return the changed-files rows that _get_changed_files_table would render."""
+        if comment_level == CommentLevelEnum.FAILED:
+            evaluated_reports_coverage = self._filter_reports_for_failed_files(evaluated_reports_coverage)
+
+        if not self._has_baseline_data():
+            return self._get_changed_file_rows_without_baseline(p, f, evaluated_reports_coverage)
+
+        return self._get_changed_file_rows_with_baseline(p, f, evaluated_reports_coverage)
+
     def _filter_reports_for_failed_files(
         self,
         evaluated_reports_coverage: dict[str, EvaluatedReportCoverage],
@@ -741,46 +872,32 @@ class PRCommentGenerator:
         self, p: str, f: str, evaluated_reports_coverage: Optional[dict[str, EvaluatedReportCoverage]] = None
     ) -> str:
         """Generate a changed-files table that includes baseline deltas."""
-        s = dedent("""
-            | File Path | Coverage | Threshold | Δ Coverage | Status |
-            |-----------|----------|-----------|------------|--------|
-        """).strip()
-
         if evaluated_reports_coverage is None:
             evaluated_reports_coverage = self.evaluator.evaluated_reports_coverage
 
-        lines = []
+        return self._render_changed_files_table(
+            self._changed_files_table_header(True),
+            self._get_changed_file_rows_with_baseline(p, f, evaluated_reports_coverage),
+        )
+
+    def _get_changed_file_rows_with_baseline(
+        self, p: str, f: str, evaluated_reports_coverage: dict[str, EvaluatedReportCoverage]
+    ) -> list[ChangedFileRow]:
+        """Render one changed-files table row per changed file, with baseline deltas."""
+        rows = []
         for ecr_key in evaluated_reports_coverage.keys():
             curr_erc = evaluated_reports_coverage[ecr_key]
-            bs_erc = self._find_baseline_report(curr_erc)
             for file_key in curr_erc.changed_files_coverage_reached.keys():
-                filename = _escape_md_link_text(os.path.basename(file_key))
-                file_hash = hashlib.sha256(file_key.encode("utf-8")).hexdigest()
-                file_as_link_to_diff = (
-                    f"https://github.com/{self.github_repository}/pull/{self.pr_number}/files#diff-{file_hash}"
-                )
-
-                if bs_erc is None or file_key not in bs_erc.changed_files_coverage_reached:
-                    diff = 0.0
-                else:
-                    diff = (
-                        curr_erc.changed_files_coverage_reached[file_key]
-                        - bs_erc.changed_files_coverage_reached[file_key]
-                    )
-
+                diff = self.baseline_join.changed_file_diff(curr_erc, file_key)
+                coverage = curr_erc.changed_files_coverage_reached[file_key]
+                passed = curr_erc.changed_files_passed[file_key]
                 line = (
-                    f"\n| [{filename}]({file_as_link_to_diff})"
-                    f" | {curr_erc.changed_files_coverage_reached[file_key]}%"
+                    f"\n| {self._changed_file_link(file_key)}"
+                    f" | {coverage}%"
                     f" | {curr_erc.per_changed_file_threshold}%"
                     f" | {'+' if diff > 0.001 else ''}{round(diff, 2)}%"
-                    f" | {p if curr_erc.changed_files_passed[file_key] else f} |"
+                    f" | {p if passed else f} |"
                 )
-                lines.append(line)
+                rows.append(ChangedFileRow(line, passed, coverage))
 
-        if len(lines) > 0:
-            lines.sort()
-            s += "".join(lines)
-        else:
-            s += "\n\nNo changed file in reports."
-
-        return s
+        return rows
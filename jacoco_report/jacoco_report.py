@@ -4,28 +4,60 @@ A module for generating the JaCoCo report.
 
 import json
 import logging
+import os
+import sqlite3
+import time
+from typing import NamedTuple, Optional
 
+from jacoco_report.action_config import ActionConfig
 from jacoco_report.action_inputs import ActionInputs
 from jacoco_report.evaluator.coverage_evaluator import CoverageEvaluator
+from jacoco_report.generator.check_run_sink import CheckRunSink
+from jacoco_report.generator.output_sinks import (
+    HtmlReportSink,
+    JsonReportSink,
+    OutputSink,
+    RenderedReport,
+    StepSummarySink,
+)
 from jacoco_report.generator.pr_comment_generator import PRCommentGenerator
+from jacoco_report.model.coverage_history import CoverageHistory, HistoryRun, TrendPoint
 from jacoco_report.model.report_file_coverage import ReportFileCoverage
 from jacoco_report.model.report_group import ReportGroup
+from jacoco_report.parser.baseline_snapshot import BaselineSnapshot
 from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
+from jacoco_report.parser.partial_result import find_partials, merge_partials, write_partial
 from jacoco_report.scanner.jacoco_report_input_scanner import JaCoCoReportInputScanner
-from jacoco_report.utils.constants import DEFAULT_PATHS, GLOBAL_OVERALL_SCOPE_ALL
-from jacoco_report.utils.enums import FailOnThresholdEnum
-from jacoco_report.utils.github import GitHub
+from jacoco_report.utils.constants import DEFAULT_PATHS, GLOBAL_OVERALL_SCOPE_ALL, HISTORY_TREND_RUNS
+from jacoco_report.utils.enums import ApiTransportEnum, CommentLevelEnum, FailOnThresholdEnum, ModeEnum
+from jacoco_report.utils.github import GitHub, PullRequestContext, find_action_comment
+from jacoco_report.utils.run_state import RunState
 
 logger = logging.getLogger(__name__)
 
 
+class CoverageAnalysis(NamedTuple):
+    """The evaluated reports of one run, ready to be rendered."""
+
+    evaluator: CoverageEvaluator
+    bs_evaluator: Optional[CoverageEvaluator]
+    metric_evaluators: dict[str, CoverageEvaluator]
+    skip_report_names: frozenset[str]
+    ungrouped_reports: list[str]
+    evaluated_coverage_reports: dict
+    evaluated_coverage_groups: dict
+
+
 class JaCoCoReport:
     """
     A class representing the JaCoCo Report.
     A class analyzing the JaCoCo report and generating the comment.
     """
 
-    def __init__(self):
+    def __init__(self, config: ActionConfig):
+        # the parsed action inputs, built once by the entry point
+        self.config: ActionConfig = config
+
         self.total_overall_coverage: float = 0.0
         self.total_changed_files_coverage: float = 0.0
         self.total_overall_coverage_passed: bool = False
@@ -40,19 +72,30 @@ class JaCoCoReport:
         self.reached_threshold_per_change_file = True
         self.reached_threshold_fail_unchanged = True
         self.has_operational_failure = False
+        # per-metric totals, API call statistics and stage timings
+        self.run_state = RunState()
 
     def run(self) -> None:
         """
         The main function to run the JaCoCo GitHub Action adding the JaCoCo coverage report to the pull request.
         """
-        if ActionInputs.get_event_name() != "pull_request":
+        config = self.config
+        if config.sources.mode == ModeEnum.PARTIAL:
+            self.run_partial()
+            return
+        if config.github.event_name != "pull_request" and (
+            config.sources.baseline_snapshot_dir or config.sources.history_db
+        ):
+            self.run_base_branch()
+            return
+        if config.github.event_name != "pull_request":
             logger.error("Not a pull request event. Ending.")
             self.violations.append("Not a pull request event.")
             self._mark_operational_failure()
             return
         logger.info("Event is a pull request.")
 
-        gh = GitHub(ActionInputs.get_token())
+        gh = GitHub(config.github.token, api_url=config.github.api_url, api_stats=self.run_state.api_stats)
         pr_number = ActionInputs.get_pr_number(gh=gh)
         if pr_number is None:
             logger.error("Not a pull request event. Ending run of Jacoco Report.")
@@ -61,21 +104,238 @@ class JaCoCoReport:
             return
         logger.info("Pull request number: %s", pr_number)
 
+        input_report_paths_to_analyse = self.scan_reports()
+        if input_report_paths_to_analyse is None:
+            return
+
+        # get changed files in PR
+        logger.info("Getting changed files in PR.")
+        pr_context: PullRequestContext | None = None
+        with self.run_state.timings.span("changed-files"):
+            if config.outputs.api_transport == ApiTransportEnum.GRAPHQL:
+                pr_context = gh.get_pr_context(pr_number, f"**{config.comment.title}**")
+                if pr_context is None:
+                    logger.warning("GraphQL pull request query failed. Falling back to the REST API.")
+            changed_files_result: list[str] | None = (
+                pr_context.changed_files if pr_context is not None else gh.get_pr_changed_files()
+            )
+        existing_comments: list[dict] | None = pr_context.comments if pr_context is not None else None
+
+        if changed_files_result is None:
+            logger.error("Failed to retrieve changed files from GitHub API. Ending run.")
+            self.violations.append("Failed to retrieve changed files from GitHub API.")
+            self._mark_operational_failure()
+            return
+        all_changed_files_in_pr: list[str] = changed_files_result
+        self.run_state.timings.add("changed-files", files=len(all_changed_files_in_pr))
+
+        baseline_sha: Optional[str] = None
+        if config.sources.baseline_snapshot_dir:
+            baseline_sha = pr_context.base_sha if pr_context is not None and pr_context.base_sha else None
+            baseline_sha = baseline_sha or gh.get_pr_base_sha()
+
+        analysis = self.analyse(input_report_paths_to_analyse, all_changed_files_in_pr, baseline_sha)
+        if analysis is None:
+            if not self.has_operational_failure:
+                self._delete_stale_comment_if_update_enabled(gh=gh, pr_number=pr_number, comments=existing_comments)
+            return
+
+        trend: Optional[list[TrendPoint]] = None
+        if config.sources.history_db:
+            trend = self._update_history(analysis.evaluator, pr_number)
+
+        # generate the comment(s)
+        logger.info("Generating PR comment(s).")
+        generator = self.create_generator(analysis, gh, pr_number, existing_comments, trend)
+        with self.run_state.timings.span("render"):
+            # cached by the generator, so the API write stage below only sends the body
+            generator.render_body(config.comment.comment_level)
+        with self.run_state.timings.span("api-write"):
+            generator.generate()
+        logger.info("PR comment(s) generated successfully.")
+
+        with self.run_state.timings.span("output-sinks"):
+            self._write_output_sinks(
+                generator,
+                analysis.evaluated_coverage_reports,
+                analysis.evaluated_coverage_groups,
+                self._get_check_run_sinks(gh, pr_context, all_changed_files_in_pr),
+            )
+
+    def run_base_branch(self) -> None:
+        """
+        Keep the coverage of a commit outside a pull request: its baseline snapshot for later pull request runs
+        and its numbers in the history database, as configured. No comment is written.
+        """
+        config = self.config
+        if not config.github.sha:
+            logger.error("GITHUB_SHA is not set. The coverage of the commit is not kept.")
+            self.violations.append("No commit SHA found.")
+            self._mark_operational_failure()
+            return
+
+        input_report_paths = self.scan_reports()
+        if input_report_paths is None:
+            return
+
+        logger.info("Analyzing JaCoCo (xml) reports of %s.", config.github.sha)
+        # the snapshot keeps every sourcefile: the changed files of the pull requests are not known yet
+        changed_files: Optional[list[str]] = None if config.sources.baseline_snapshot_dir else []
+        parser = JaCoCoReportParser(changed_files, max_memory_mb=config.sources.max_memory_mb)
+        reports, _ = self._get_current_reports(parser, input_report_paths, changed_files)
+        if not reports:
+            logger.error("No input JaCoCo xml file found. The coverage of the commit is not kept.")
+            self.violations.append("No input JaCoCo xml file found.")
+            self._mark_operational_failure()
+            return
+
+        if config.sources.baseline_snapshot_dir and not self._write_baseline_snapshot(reports):
+            return
+
+        if config.sources.history_db:
+            # the overall coverage only: a commit outside a pull request has no changed files
+            evaluator = CoverageEvaluator(
+                report_files_coverage=[
+                    ReportFileCoverage(r.path, r.name, r.overall_coverage, {}, r.group_name) for r in reports
+                ],
+                global_min_coverage_overall=config.thresholds.global_overall,
+                global_min_coverage_changed_files=config.thresholds.global_changed_files_average,
+                report_groups=list(config.report_groups),
+                report_thresholds_default=config.thresholds.report_default,
+                metric=config.metric,
+            )
+            with self.run_state.timings.span("evaluate"):
+                evaluator.evaluate()
+            self.total_overall_coverage = evaluator.total_coverage_overall
+            self.total_overall_coverage_passed = evaluator.total_coverage_overall_passed
+            if self._update_history(evaluator, None) is None:
+                self.violations.append("Failed to record the coverage history.")
+                self._mark_operational_failure()
+
+    def run_partial(self) -> None:
+        """
+        Parse the reports of one shard of a matrix build into a partial result for the 'merge' run.
+        No GitHub API is used, no comment is written and no threshold is evaluated.
+        """
+        config = self.config
+        input_report_paths = self.scan_reports()
+        if input_report_paths is None:
+            return
+
+        logger.info("Analyzing JaCoCo (xml) reports of the shard.")
+        # every sourcefile is kept: the merge run selects the changed files
+        parser = JaCoCoReportParser(None, max_memory_mb=config.sources.max_memory_mb)
+        reports, _ = self._parse_current_reports(parser, input_report_paths)
+        if not reports:
+            logger.error("No input JaCoCo xml file found. No partial result is written.")
+            self.violations.append("No input JaCoCo xml file found.")
+            self._mark_operational_failure()
+            return
+
+        try:
+            with self.run_state.timings.span("partial"):
+                path = write_partial(config.sources.partial_dir, config.github.sha, reports)
+        except OSError as e:
+            logger.error("Failed to write the partial result: %s", e)
+            self.violations.append("Failed to write the partial result.")
+            self._mark_operational_failure()
+            return
+        self.run_state.timings.add("partial", reports=len(reports), bytes_written=os.path.getsize(path))
+        logger.info("Partial result of %d report(s) written to '%s'.", len(reports), path)
+
+    def _write_baseline_snapshot(self, reports: list[ReportFileCoverage]) -> bool:
+        """Write the baseline snapshot of the commit; a failure is an operational failure."""
+        config = self.config
+        try:
+            with self.run_state.timings.span("baseline-snapshot"):
+                path = BaselineSnapshot.from_reports(config.github.sha, reports).write(
+                    config.sources.baseline_snapshot_dir
+                )
+        except (OSError, ValueError) as e:
+            logger.error("Failed to write the baseline snapshot: %s", e)
+            self.violations.append("Failed to write the baseline snapshot.")
+            self._mark_operational_failure()
+            return False
+        self.run_state.timings.add("baseline-snapshot", reports=len(reports), bytes_written=os.path.getsize(path))
+        logger.info("Baseline snapshot of %s written to '%s'.", config.github.sha, path)
+        return True
+
+    def _update_history(self, evaluator: CoverageEvaluator, pr_number: Optional[int]) -> Optional[list[TrendPoint]]:
+        """
+        Record the numbers of the run in the history database and read the trend of the pull request's base branch.
+
+        Parameters:
+            evaluator (CoverageEvaluator): The evaluated reports of the run.
+            pr_number (Optional[int]): The pull request number, None for a run outside a pull request.
+
+        Returns:
+            Optional[list[TrendPoint]]: The last base branch runs before this one, oldest first (empty outside
+            pull requests), None when the database cannot be used.
+        """
+        config = self.config
+        run = HistoryRun(
+            config.github.sha,
+            config.github.branch,
+            config.github.event_name,
+            pr_number,
+            config.metric,
+            int(time.time()),
+        )
+        try:
+            with self.run_state.timings.span("history"):
+                history = CoverageHistory(config.sources.history_db)
+                try:
+                    trend: list[TrendPoint] = []
+                    if pr_number is not None and config.github.base_ref:
+                        trend = history.trend(config.github.base_ref, config.metric, HISTORY_TREND_RUNS)
+                    history.record(
+                        run,
+                        (evaluator.total_coverage_overall, evaluator.total_coverage_changed_files),
+                        {
+                            v.name: (v.overall_coverage_reached, v.avg_changed_files_coverage_reached)
+                            for v in evaluator.evaluated_reports_coverage.values()
+                        },
+                        {
+                            name: (v.overall_coverage_reached, v.avg_changed_files_coverage_reached)
+                            for name, v in evaluator.evaluated_groups_coverage.items()
+                        },
+                    )
+                finally:
+                    history.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Failed to use the coverage history '%s': %s", config.sources.history_db, e)
+            return None
+        logger.info("Coverage of %s recorded in the history '%s'.", config.github.sha, config.sources.history_db)
+        return trend
+
+    def scan_reports(self) -> Optional[list[str]]:
+        """
+        Scan the top-level paths for JaCoCo xml reports; group paths are scanned when the reports are parsed.
+
+        Returns:
+            Optional[list[str]]: The found report paths, None when no report was found (operational failure).
+        """
+        config = self.config
+        if config.sources.mode == ModeEnum.MERGE:
+            logger.info(
+                "Merge mode: the reports are read from the partial results in '%s'.", config.sources.partial_dir
+            )
+            return []
         # get report groups (if configured)
-        report_groups: list[ReportGroup] = ActionInputs.get_report_groups()
-        global_overall_scope = ActionInputs.get_global_overall_scope()
+        report_groups: list[ReportGroup] = list(config.report_groups)
+        global_overall_scope = config.global_overall_scope
 
         input_report_paths_to_analyse: list[str] = []
         if report_groups:
             logger.info("Report groups configured.")
             if global_overall_scope == GLOBAL_OVERALL_SCOPE_ALL:
-                top_level_paths = ActionInputs.get_paths()
+                top_level_paths = list(config.sources.paths)
                 if top_level_paths:
                     logger.info(
                         "global-overall-scope=all: scanning top-level paths to include all reports in global overall."
                     )
                     input_report_paths_to_analyse = self.scan_jacoco_xml_files(
-                        paths=top_level_paths, exclude_paths=ActionInputs.get_exclude_paths()
+                        paths=top_level_paths, exclude_paths=list(config.sources.exclude_paths)
                     )
                 else:
                     logger.info(
@@ -84,9 +344,9 @@ class JaCoCoReport:
                     )
         else:
             logger.info("Scanning for JaCoCo (xml) reports.")
-            paths = ActionInputs.get_paths() or [DEFAULT_PATHS]
+            paths = list(config.sources.paths) or [DEFAULT_PATHS]
             input_report_paths_to_analyse = self.scan_jacoco_xml_files(
-                paths=paths, exclude_paths=ActionInputs.get_exclude_paths()
+                paths=paths, exclude_paths=list(config.sources.exclude_paths)
             )
 
             # skip when no top-level jacoco xml files found
@@ -94,22 +354,271 @@ class JaCoCoReport:
                 logger.error("No input JaCoCo xml file found. No comment will be generated.")
                 self.violations.append("No input JaCoCo xml file found.")
                 self._mark_operational_failure()
-                return
+                return None
 
-        # get changed files in PR
-        logger.info("Getting changed files in PR.")
-        changed_files_result: list[str] | None = gh.get_pr_changed_files()
-        if changed_files_result is None:
-            logger.error("Failed to retrieve changed files from GitHub API. Ending run.")
-            self.violations.append("Failed to retrieve changed files from GitHub API.")
-            self._mark_operational_failure()
-            return
-        all_changed_files_in_pr: list[str] = changed_files_result
+        return input_report_paths_to_analyse
+
+    def analyse(
+        self, input_report_paths: list[str], changed_files: list[str], baseline_sha: Optional[str] = None
+    ) -> Optional["CoverageAnalysis"]:
+        """
+        Parse, filter and evaluate the reports against the changed files; no GitHub API is used.
+
+        The totals, violations and JSON summaries of this object are set as a side effect.
+
+        Parameters:
+            input_report_paths (list[str]): The reports found by scan_reports.
+            changed_files (list[str]): The changed files of the pull request (repository-relative paths).
+            baseline_sha (Optional[str]): The base commit of the pull request; its baseline snapshot replaces the
+                baseline reports when 'baseline-snapshot-dir' has one.
+
+        Returns:
+            Optional[CoverageAnalysis]: The evaluated reports to render, None when there is nothing to render
+            (no reports, or all reports filtered out by skip-unchanged).
+        """
+        config = self.config
+        report_groups: list[ReportGroup] = list(config.report_groups)
 
         # analyse received xml report files
         logger.info("Analyzing JaCoCo (xml) reports.")
+        parser = JaCoCoReportParser(changed_files, max_memory_mb=config.sources.max_memory_mb)
+        report_files_coverage, ungrouped_reports = self._get_current_reports(parser, input_report_paths, changed_files)
+
+        # grouped flow may skip top-level scan; fail here if no grouped reports matched
+        if len(report_files_coverage) == 0:
+            logger.error("No input JaCoCo xml file found. No comment will be generated.")
+            self.violations.append("No input JaCoCo xml file found.")
+            self._mark_operational_failure()
+            return None
+
+        fail_unchanged_enabled = FailOnThresholdEnum.FAIL_UNCHANGED in config.fail_on_threshold
+        evaluate_filtered_unchanged = config.evaluate_unchanged or fail_unchanged_enabled
+        filtered_unchanged_reports: list[ReportFileCoverage] = []
+
+        # scan-stage filter: remove reports with no changed files before evaluation
+        if config.skip_unchanged:
+            report_files_coverage, filtered_unchanged_reports = self._filter_unchanged_reports(
+                report_files_coverage, evaluate_filtered_unchanged
+            )
+            if not report_files_coverage and not evaluate_filtered_unchanged:
+                logger.info("All reports filtered out by skip-unchanged. No comment will be generated.")
+                self.total_overall_coverage_passed = True
+                self.total_changed_files_coverage_passed = True
+                self.evaluated_coverage_reports = "{}"
+                self.evaluated_coverage_groups = "{}"
+                return None
+            if not report_files_coverage:
+                logger.info(
+                    "All reports filtered out by skip-unchanged. "
+                    "Evaluating unchanged reports for threshold result only."
+                )
+
+        # evaluate the coverage in one pass over all current reports
+        # Always include all reports for overall coverage calculation.
+        # The skip_unchanged filter should only affect comment rows and changed-files evaluation,
+        # not the overall coverage which must aggregate all reports regardless of changes.
+        # Filtered unchanged reports are tagged by path: hidden from comment rows, checked by fail-unchanged.
+        logger.info("Evaluating the coverage of the reports.")
+        reports_for_evaluation = report_files_coverage + filtered_unchanged_reports
+        filtered_unchanged_paths: frozenset[str] = frozenset(r.path for r in filtered_unchanged_reports)
+        evaluator_for_results = self._create_evaluator(reports_for_evaluation, report_groups)
+        with self.run_state.timings.span("evaluate"):
+            evaluator_for_results.evaluate()
+        evaluated_coverage_reports, evaluated_coverage_groups = self._apply_evaluator(evaluator_for_results)
+        with self.run_state.timings.span("evaluate"):
+            metric_evaluators = self._evaluate_metrics(evaluator_for_results, reports_for_evaluation, report_groups)
+        self._apply_metric_evaluators(metric_evaluators)
+        self.reached_threshold_fail_unchanged = not fail_unchanged_enabled or all(
+            evaluated_report.overall_passed
+            for report_path, evaluated_report in evaluator_for_results.evaluated_reports_coverage.items()
+            if report_path in filtered_unchanged_paths
+        )
+
+        # all reports were filtered by skip-unchanged: threshold result only, no comment
+        if not report_files_coverage:
+            return None
+
+        # Always skip display of filtered unchanged reports when skip_unchanged is enabled,
+        # regardless of evaluate_filtered_unchanged setting. These reports are included in
+        # overall coverage but should not appear as rows in the comment.
+        return CoverageAnalysis(
+            evaluator=evaluator_for_results,
+            bs_evaluator=self._evaluate_baseline(parser, report_groups, changed_files, baseline_sha),
+            metric_evaluators=metric_evaluators,
+            skip_report_names=filtered_unchanged_paths if config.skip_unchanged else frozenset(),
+            ungrouped_reports=ungrouped_reports,
+            evaluated_coverage_reports=evaluated_coverage_reports,
+            evaluated_coverage_groups=evaluated_coverage_groups,
+        )
+
+    @staticmethod
+    def _filter_unchanged_reports(
+        reports: list[ReportFileCoverage], evaluate_filtered_unchanged: bool
+    ) -> tuple[list[ReportFileCoverage], list[ReportFileCoverage]]:
+        """
+        Split the reports by skip-unchanged into the reports with changed files and the filtered ones.
+
+        Parameters:
+            reports (list[ReportFileCoverage]): The current reports.
+            evaluate_filtered_unchanged (bool): Whether the filtered reports are still evaluated for the overall
+                thresholds; only the logged reason differs.
+
+        Returns:
+            tuple[list[ReportFileCoverage], list[ReportFileCoverage]]: The kept and the filtered reports.
+        """
+        kept: list[ReportFileCoverage] = []
+        filtered: list[ReportFileCoverage] = []
+        for report in reports:
+            if report.changed_files_coverage:
+                kept.append(report)
+                continue
+            if evaluate_filtered_unchanged:
+                logger.info(
+                    "Filtering report '%s' from comment rows and changed-files evaluation: "
+                    "no changed files (overall threshold checks may still apply).",
+                    report.name,
+                )
+            else:
+                logger.info("Filtering report '%s' from evaluation and comment rows: no changed files.", report.name)
+            filtered.append(report)
+        return kept, filtered
+
+    def _create_evaluator(
+        self, reports: list[ReportFileCoverage], report_groups: list[ReportGroup]
+    ) -> CoverageEvaluator:
+        """Create the evaluator of reports for the primary metric and the configured thresholds."""
+        return CoverageEvaluator(
+            report_files_coverage=reports,
+            global_min_coverage_overall=self.config.thresholds.global_overall,
+            global_min_coverage_changed_files=self.config.thresholds.global_changed_files_average,
+            report_groups=report_groups,
+            report_thresholds_default=self.config.thresholds.report_default,
+            metric=self.config.metric,
+        )
+
+    def _apply_evaluator(self, evaluator: CoverageEvaluator) -> tuple[dict, dict]:
+        """
+        Set the totals, violations, threshold flags and JSON summaries of the run from the primary evaluator.
+
+        Returns:
+            tuple[dict, dict]: The evaluated reports and groups as dictionaries, keyed as in the evaluator.
+        """
+        self.total_overall_coverage = evaluator.total_coverage_overall
+        self.total_overall_coverage_passed = evaluator.total_coverage_overall_passed
+        self.total_changed_files_coverage = evaluator.total_coverage_changed_files
+        self.total_changed_files_coverage_passed = evaluator.total_coverage_changed_files_passed
+
+        evaluated_coverage_reports = {k: v.to_dict() for k, v in evaluator.evaluated_reports_coverage.items()}
+        evaluated_coverage_groups = {k: v.to_dict() for k, v in evaluator.evaluated_groups_coverage.items()}
+
+        self.evaluated_coverage_reports = json.dumps(evaluated_coverage_reports, indent=4)
+        self.evaluated_coverage_groups = json.dumps(evaluated_coverage_groups, indent=4)
+
+        self.violations = evaluator.violations
+        self.reached_threshold_overall = evaluator.reached_threshold_overall
+        self.reached_threshold_changed_files_average = evaluator.reached_threshold_changed_files_average
+        self.reached_threshold_per_change_file = evaluator.reached_threshold_per_change_file
+        return evaluated_coverage_reports, evaluated_coverage_groups
+
+    def _evaluate_baseline(
+        self,
+        parser: JaCoCoReportParser,
+        report_groups: list[ReportGroup],
+        changed_files: list[str],
+        baseline_sha: Optional[str],
+    ) -> Optional[CoverageEvaluator]:
+        """Evaluate the baseline reports for the comparison columns; None when no baseline report is found."""
+        bs_report_files_coverage = self._get_baseline_reports(parser, report_groups, changed_files, baseline_sha)
+        if not bs_report_files_coverage:
+            return None
+        bs_evaluator = self._create_evaluator(bs_report_files_coverage, report_groups)
+        with self.run_state.timings.span("baseline-evaluate"):
+            bs_evaluator.evaluate()
+        return bs_evaluator
+
+    def create_generator(
+        self,
+        analysis: "CoverageAnalysis",
+        gh: Optional[GitHub] = None,
+        pr_number: int = 0,
+        existing_comments: list[dict] | None = None,
+        trend: Optional[list[TrendPoint]] = None,
+    ) -> PRCommentGenerator:
+        """
+        Create the comment generator of an analysis; without GitHub it can only render.
+
+        Parameters:
+            analysis (CoverageAnalysis): The evaluated reports.
+            gh (Optional[GitHub]): The GitHub API, None for offline rendering.
+            pr_number (int): The pull request number used in changed-file links.
+            existing_comments (list[dict] | None): The comments pre-fetched by the GraphQL transport.
+            trend (Optional[list[TrendPoint]]): The last base branch runs of the history, shown as a sparkline.
+
+        Returns:
+            PRCommentGenerator: The generator.
+        """
+        return PRCommentGenerator(
+            gh,
+            analysis.evaluator,
+            analysis.bs_evaluator,
+            pr_number,
+            analysis.skip_report_names,
+            analysis.ungrouped_reports,
+            existing_comments=existing_comments,
+            metric_evaluators=analysis.metric_evaluators,
+            config=self.config,
+            trend=trend,
+        )
+
+    def _get_current_reports(
+        self, parser: JaCoCoReportParser, input_report_paths: list[str], changed_files: Optional[list[str]]
+    ) -> tuple[list[ReportFileCoverage], list[str]]:
+        """Parse the reports of the run, or in 'merge' mode join the reports of the partial results."""
+        if self.config.sources.mode == ModeEnum.MERGE:
+            return self._merge_partial_results(changed_files)
+        return self._parse_current_reports(parser, input_report_paths)
+
+    def _merge_partial_results(self, changed_files: Optional[list[str]]) -> tuple[list[ReportFileCoverage], list[str]]:
+        """
+        Join the reports of the partial results written by the shards of the run.
+
+        Parameters:
+            changed_files (Optional[list[str]]): The changed files of the pull request; None keeps every sourcefile.
+
+        Returns:
+            tuple[list[ReportFileCoverage], list[str]]: The reports and the paths of the reports not assigned to
+            any report group, as _parse_current_reports returns them.
+        """
+        config = self.config
+        with self.run_state.timings.span("merge"):
+            partial_paths = find_partials(config.sources.partial_dir)
+            reports = merge_partials(partial_paths, config.github.sha, changed_files)
+        self.run_state.timings.add("merge", files=len(partial_paths), reports=len(reports))
+        if not partial_paths:
+            logger.error("No partial result found in '%s'.", config.sources.partial_dir)
+
+        # the shards tagged their reports; those outside the configured groups are the ungrouped ones
+        group_names = {group.name for group in config.report_groups}
+        ungrouped_reports = [r.path for r in reports if group_names and r.group_name not in group_names]
+        return reports, ungrouped_reports
+
+    def _parse_current_reports(
+        self, parser: JaCoCoReportParser, input_report_paths: list[str]
+    ) -> tuple[list[ReportFileCoverage], list[str]]:
+        """
+        Parse the reports of the run, per group when report groups are configured.
+
+        Parameters:
+            parser (JaCoCoReportParser): The parser of the run.
+            input_report_paths (list[str]): The reports found by scan_reports.
+
+        Returns:
+            tuple[list[ReportFileCoverage], list[str]]: The parsed reports and the paths of the reports not
+            assigned to any report group (global-overall-scope=all).
+        """
+        config = self.config
+        report_groups: list[ReportGroup] = list(config.report_groups)
         report_files_coverage: list[ReportFileCoverage] = []
-        parser = JaCoCoReportParser(all_changed_files_in_pr)
         seen_report_paths: set[str] = set()
         ungrouped_reports: list[str] = []
         if report_groups:
@@ -117,11 +626,11 @@ class JaCoCoReport:
             # deduplicate by report path to avoid double-counting when groups have overlapping globs
             for group in report_groups:
                 group_paths = self.scan_jacoco_xml_files(
-                    paths=group.paths, exclude_paths=ActionInputs.get_exclude_paths()
+                    paths=group.paths, exclude_paths=list(config.sources.exclude_paths)
                 )
                 for report_path in group_paths:
                     if report_path not in seen_report_paths:
-                        report_files_coverage.append(parser.parse(report_path, group_name=group.name))
+                        report_files_coverage.append(self._parse_report(parser, report_path, group.name))
                         seen_report_paths.add(report_path)
                     else:
                         logger.info(
@@ -132,8 +641,8 @@ class JaCoCoReport:
             # When global-overall-scope=all, include reports found by the top-level scan
             # that were not matched by any group. They contribute to global overall but
             # carry no group_name so they are excluded from per-group threshold evaluation.
-            if global_overall_scope == GLOBAL_OVERALL_SCOPE_ALL:
-                for report_path in input_report_paths_to_analyse:
+            if config.global_overall_scope == GLOBAL_OVERALL_SCOPE_ALL:
+                for report_path in input_report_paths:
                     if report_path not in seen_report_paths:
                         logger.warning(
                             "Report '%s' is not assigned to any report group. "
@@ -141,104 +650,63 @@ class JaCoCoReport:
                             "Set global-overall-scope: groups-only to exclude ungrouped reports.",
                             report_path,
                         )
-                        report_files_coverage.append(parser.parse(report_path))
+                        report_files_coverage.append(self._parse_report(parser, report_path))
                         seen_report_paths.add(report_path)
                         ungrouped_reports.append(report_path)
         else:
-            for report_path in input_report_paths_to_analyse:
-                report_files_coverage.append(parser.parse(report_path))
-
-        # grouped flow may skip top-level scan; fail here if no grouped reports matched
-        if len(report_files_coverage) == 0:
-            logger.error("No input JaCoCo xml file found. No comment will be generated.")
-            self.violations.append("No input JaCoCo xml file found.")
-            self._mark_operational_failure()
-            return
-
-        skip_unchanged = ActionInputs.get_skip_unchanged()
-        evaluate_unchanged = ActionInputs.get_evaluate_unchanged()
-        fail_on_threshold = set(ActionInputs.get_fail_on_threshold())
-        fail_unchanged_enabled = FailOnThresholdEnum.FAIL_UNCHANGED in fail_on_threshold
-        evaluate_filtered_unchanged = evaluate_unchanged or fail_unchanged_enabled
-        filtered_unchanged_reports: list[ReportFileCoverage] = []
-
-        # scan-stage filter: remove reports with no changed files before evaluation
-        if skip_unchanged:
-            for report in report_files_coverage:
-                if not report.changed_files_coverage:
-                    if evaluate_filtered_unchanged:
-                        logger.info(
-                            "Filtering report '%s' from comment rows and changed-files evaluation: "
-                            "no changed files (overall threshold checks may still apply).",
-                            report.name,
-                        )
-                    else:
-                        logger.info(
-                            "Filtering report '%s' from evaluation and comment rows: no changed files.",
-                            report.name,
-                        )
-                    filtered_unchanged_reports.append(report)
-
-            report_files_coverage = [r for r in report_files_coverage if r.changed_files_coverage]
-            if not report_files_coverage and not evaluate_filtered_unchanged:
-                logger.info("All reports filtered out by skip-unchanged. No comment will be generated.")
-                self.total_overall_coverage_passed = True
-                self.total_changed_files_coverage_passed = True
-                self.evaluated_coverage_reports = "{}"
-                self.evaluated_coverage_groups = "{}"
-                self._delete_stale_comment_if_update_enabled(gh=gh, pr_number=pr_number)
-                return
-            if not report_files_coverage and evaluate_filtered_unchanged:
-                logger.info(
-                    "All reports filtered out by skip-unchanged. "
-                    "Evaluating unchanged reports for threshold result only."
-                )
-                report_thresholds_default = ActionInputs.get_report_thresholds_default()
-                filtered_evaluator = CoverageEvaluator(
-                    report_files_coverage=filtered_unchanged_reports,
-                    global_min_coverage_overall=ActionInputs.get_global_overall_threshold(),
-                    global_min_coverage_changed_files=ActionInputs.get_global_changed_files_average_threshold(),
-                    report_groups=report_groups,
-                    report_thresholds_default=report_thresholds_default,
-                )
-                filtered_evaluator.evaluate()
-
-                self.total_overall_coverage = filtered_evaluator.total_coverage_overall
-                self.total_overall_coverage_passed = filtered_evaluator.total_coverage_overall_passed
-                self.total_changed_files_coverage = filtered_evaluator.total_coverage_changed_files
-                self.total_changed_files_coverage_passed = filtered_evaluator.total_coverage_changed_files_passed
+            for report_path in input_report_paths:
+                report_files_coverage.append(self._parse_report(parser, report_path))
+
+        return report_files_coverage, ungrouped_reports
+
+    def _get_baseline_reports(
+        self,
+        parser: JaCoCoReportParser,
+        report_groups: list[ReportGroup],
+        changed_files: list[str],
+        baseline_sha: Optional[str],
+    ) -> list[ReportFileCoverage]:
+        """
+        Return the baseline reports from the snapshot of the base commit, or scan and parse the baseline paths.
 
-                evaluated_coverage_reports = {
-                    k: v.to_dict() for k, v in filtered_evaluator.evaluated_reports_coverage.items()
-                }
-                evaluated_coverage_groups = {
-                    k: v.to_dict() for k, v in filtered_evaluator.evaluated_groups_coverage.items()
-                }
-                self.evaluated_coverage_reports = json.dumps(evaluated_coverage_reports, indent=4)
-                self.evaluated_coverage_groups = json.dumps(evaluated_coverage_groups, indent=4)
-                self.violations = filtered_evaluator.violations
-                self.reached_threshold_overall = filtered_evaluator.reached_threshold_overall
-                self.reached_threshold_changed_files_average = (
-                    filtered_evaluator.reached_threshold_changed_files_average
-                )
-                self.reached_threshold_per_change_file = filtered_evaluator.reached_threshold_per_change_file
+        Parameters:
+            parser (JaCoCoReportParser): The parser of the run.
+            report_groups (list[ReportGroup]): The configured report groups.
+            changed_files (list[str]): The changed files of the pull request.
+            baseline_sha (Optional[str]): The base commit of the pull request.
 
-                if fail_unchanged_enabled:
-                    self.reached_threshold_fail_unchanged = all(
-                        evaluated_report.overall_passed
-                        for evaluated_report in filtered_evaluator.evaluated_reports_coverage.values()
-                    )
-                else:
-                    self.reached_threshold_fail_unchanged = True
+        Returns:
+            list[ReportFileCoverage]: The baseline reports.
+        """
+        snapshot_dir = self.config.sources.baseline_snapshot_dir
+        if snapshot_dir and baseline_sha:
+            with self.run_state.timings.span("baseline-snapshot"):
+                snapshot = BaselineSnapshot.load(snapshot_dir, baseline_sha)
+                reports = snapshot.to_reports(changed_files) if snapshot is not None else None
+            if reports is not None:
+                self.run_state.timings.add("baseline-snapshot", reports=len(reports))
+                return reports
+            logger.info("No baseline snapshot of %s in '%s'. Using 'baseline-paths'.", baseline_sha, snapshot_dir)
+
+        return self._parse_baseline_reports(parser, report_groups)
+
+    def _parse_baseline_reports(
+        self, parser: JaCoCoReportParser, report_groups: list[ReportGroup]
+    ) -> list[ReportFileCoverage]:
+        """
+        Scan and parse the baseline reports, per group when report groups are configured.
 
-                self._delete_stale_comment_if_update_enabled(gh=gh, pr_number=pr_number)
-                return
+        Parameters:
+            parser (JaCoCoReportParser): The parser of the current run.
+            report_groups (list[ReportGroup]): The configured report groups.
 
-        # get baseline files for comparison
+        Returns:
+            list[ReportFileCoverage]: The parsed baseline reports.
+        """
         logger.info("Scanning for JaCoCo (xml) baseline reports.")
         bs_report_files_coverage: list[ReportFileCoverage] = []
         if report_groups:
-            global_baseline_paths = ActionInputs.get_baseline_paths()
+            global_baseline_paths = list(self.config.sources.baseline_paths)
             baseline_scan_cache: dict[tuple[str, ...], list[str]] = {}
             seen_baseline_report_paths: set[str] = set()
             groups_inheriting_global = [
@@ -294,10 +762,12 @@ class JaCoCoReport:
                                 report_path,
                             )
                             continue
-                        bs_report_files_coverage.append(parser.parse(report_path, group_name=group.name))
+                        bs_report_files_coverage.append(
+                            self._parse_report(parser, report_path, group.name, stage="baseline-parse")
+                        )
                         seen_baseline_report_paths.add(report_path)
         else:
-            baseline_paths = ActionInputs.get_baseline_paths()
+            baseline_paths = list(self.config.sources.baseline_paths)
             if baseline_paths:
                 baseline_report_paths_to_analyse = self.scan_jacoco_xml_files(paths=baseline_paths, exclude_paths=[])
                 if len(baseline_report_paths_to_analyse) == 0:
@@ -305,96 +775,168 @@ class JaCoCoReport:
                 else:
                     logger.info("Analyzing baseline JaCoCo (xml) reports.")
                     for report_path in baseline_report_paths_to_analyse:
-                        bs_report_files_coverage.append(parser.parse(report_path))
-
-        # evaluate the coverage
-        logger.info("Evaluating the coverage of the reports.")
-        report_thresholds_default = ActionInputs.get_report_thresholds_default()
-        # Always include all reports for overall coverage calculation.
-        # The skip_unchanged filter should only affect comment rows and changed-files evaluation,
-        # not the overall coverage which must aggregate all reports regardless of changes.
-        reports_for_evaluation = report_files_coverage + filtered_unchanged_reports
-        evaluator_for_results: CoverageEvaluator = CoverageEvaluator(
-            report_files_coverage=reports_for_evaluation,
-            global_min_coverage_overall=ActionInputs.get_global_overall_threshold(),
-            global_min_coverage_changed_files=ActionInputs.get_global_changed_files_average_threshold(),
-            report_groups=report_groups,
-            report_thresholds_default=report_thresholds_default,
-        )
-        evaluator_for_results.evaluate()
+                        bs_report_files_coverage.append(self._parse_report(parser, report_path, stage="baseline-parse"))
+
+        return bs_report_files_coverage
+
+    def _write_output_sinks(
+        self,
+        generator: PRCommentGenerator,
+        evaluated_coverage_reports: dict,
+        evaluated_coverage_groups: dict,
+        extra_sinks: "list[OutputSink] | None" = None,
+    ) -> None:
+        """Write the full report, rendered once, to the step summary, report files and check run when configured."""
+        # the sinks and the HTML renderer load only at this stage
+        sinks: "list[OutputSink]" = []
+        config = self.config
+        if config.outputs.step_summary:
+            summary_path = config.outputs.step_summary_path
+            if summary_path:
+                sinks.append(StepSummarySink(summary_path))
+            else:
+                logger.warning("'step-summary' is enabled but GITHUB_STEP_SUMMARY is not set. Skipping it.")
+
+        report_path = config.outputs.report_path
+        if report_path:
+            sinks.extend([JsonReportSink(report_path), HtmlReportSink(report_path)])
+        sinks.extend(extra_sinks or [])
+
+        if not sinks:
+            return
 
-        bs_evaluator: CoverageEvaluator = CoverageEvaluator(
-            report_files_coverage=bs_report_files_coverage,
-            global_min_coverage_overall=ActionInputs.get_global_overall_threshold(),
-            global_min_coverage_changed_files=ActionInputs.get_global_changed_files_average_threshold(),
-            report_groups=report_groups,
-            report_thresholds_default=report_thresholds_default,
+        report = self.build_rendered_report(generator, evaluated_coverage_reports, evaluated_coverage_groups)
+        for sink in sinks:
+            sink.write(report)
+
+    def build_rendered_report(
+        self, generator: PRCommentGenerator, evaluated_coverage_reports: dict, evaluated_coverage_groups: dict
+    ) -> RenderedReport:
+        """Render the full report (Markdown and JSON data) shared by the output sinks and the CLI."""
+        return RenderedReport(
+            title=self.config.comment.title,
+            markdown=generator.render_body(CommentLevelEnum.FULL),
+            data={
+                "title": self.config.comment.title,
+                "metric": self.config.metric,
+                "coverage_overall": self.total_overall_coverage,
+                "coverage_overall_passed": self.total_overall_coverage_passed,
+                "coverage_changed_files": self.total_changed_files_coverage,
+                "coverage_changed_files_passed": self.total_changed_files_coverage_passed,
+                "reports": evaluated_coverage_reports,
+                "groups": evaluated_coverage_groups,
+                "violations": list(self.violations),
+                "metrics": json.loads(self.run_state.metrics_coverage),
+            },
         )
 
-        if bs_report_files_coverage:
-            bs_evaluator.evaluate()
-
-        self.total_overall_coverage = evaluator_for_results.total_coverage_overall
-        self.total_overall_coverage_passed = evaluator_for_results.total_coverage_overall_passed
-        self.total_changed_files_coverage = evaluator_for_results.total_coverage_changed_files
-        self.total_changed_files_coverage_passed = evaluator_for_results.total_coverage_changed_files_passed
-
-        evaluated_coverage_reports = {
-            k: v.to_dict() for k, v in evaluator_for_results.evaluated_reports_coverage.items()
-        }
-        evaluated_coverage_groups = {k: v.to_dict() for k, v in evaluator_for_results.evaluated_groups_coverage.items()}
-
-        self.evaluated_coverage_reports = json.dumps(evaluated_coverage_reports, indent=4)
-        self.evaluated_coverage_groups = json.dumps(evaluated_coverage_groups, indent=4)
+    def _evaluate_metrics(
+        self,
+        primary_evaluator: CoverageEvaluator,
+        reports: list[ReportFileCoverage],
+        report_groups: list[ReportGroup],
+    ) -> dict[str, CoverageEvaluator]:
+        """
+        Evaluate every additional metric from 'metric' over the already parsed reports.
 
-        self.violations = evaluator_for_results.violations
-        self.reached_threshold_overall = evaluator_for_results.reached_threshold_overall
-        self.reached_threshold_changed_files_average = evaluator_for_results.reached_threshold_changed_files_average
-        self.reached_threshold_per_change_file = evaluator_for_results.reached_threshold_per_change_file
-
-        if fail_unchanged_enabled and filtered_unchanged_reports:
-            filtered_unchanged_report_names = {report.path for report in filtered_unchanged_reports}
-            self.reached_threshold_fail_unchanged = all(
-                evaluated_report.overall_passed
-                for report_name, evaluated_report in evaluator_for_results.evaluated_reports_coverage.items()
-                if report_name in filtered_unchanged_report_names
+        Returns:
+            dict[str, CoverageEvaluator]: The evaluators keyed by metric, the primary one first.
+        """
+        evaluators: dict[str, CoverageEvaluator] = {primary_evaluator.metric: primary_evaluator}
+        for metric in self.config.metrics[1:]:
+            if metric in evaluators:
+                continue
+            global_overall, global_changed_files = self.config.thresholds.global_for(metric)
+            evaluator = CoverageEvaluator(
+                report_files_coverage=reports,
+                global_min_coverage_overall=global_overall,
+                global_min_coverage_changed_files=global_changed_files,
+                report_groups=report_groups,
+                report_thresholds_default=self.config.thresholds.report_default_for(metric),
+                metric=metric,
             )
-        else:
-            self.reached_threshold_fail_unchanged = True
-
-        # generate the comment(s)
-        logger.info("Generating PR comment(s).")
-        # Always skip display of filtered unchanged reports when skip_unchanged is enabled,
-        # regardless of evaluate_filtered_unchanged setting. These reports are included in
-        # overall coverage but should not appear as rows in the comment.
-        skip_report_names: frozenset[str] = (
-            frozenset(r.path for r in filtered_unchanged_reports)
-            if skip_unchanged and filtered_unchanged_reports
-            else frozenset()
-        )
-        generator = PRCommentGenerator(
-            gh, evaluator_for_results, bs_evaluator, pr_number, skip_report_names, ungrouped_reports
+            logger.info("Evaluating the coverage for metric '%s'.", metric)
+            evaluator.evaluate()
+            evaluators[metric] = evaluator
+        return evaluators
+
+    def _apply_metric_evaluators(self, evaluators: dict[str, CoverageEvaluator]) -> None:
+        """Merge the additional metrics' violations and threshold flags and build the per-metric summary."""
+        primary_metric = next(iter(evaluators))
+        violations = list(self.violations)
+        for metric, evaluator in evaluators.items():
+            if metric == primary_metric:
+                continue
+            violations.extend(f"[{metric}] {violation}" for violation in evaluator.violations)
+            self.reached_threshold_overall &= evaluator.reached_threshold_overall
+            self.reached_threshold_changed_files_average &= evaluator.reached_threshold_changed_files_average
+            self.reached_threshold_per_change_file &= evaluator.reached_threshold_per_change_file
+        self.violations = violations
+
+        self.run_state.metrics_coverage = json.dumps(
+            {
+                metric: {
+                    "coverage_overall": evaluator.total_coverage_overall,
+                    "coverage_overall_passed": evaluator.total_coverage_overall_passed,
+                    "coverage_changed_files": evaluator.total_coverage_changed_files,
+                    "coverage_changed_files_passed": evaluator.total_coverage_changed_files_passed,
+                    "passed": not evaluator.violations,
+                }
+                for metric, evaluator in evaluators.items()
+            },
+            indent=4,
         )
-        generator.generate()
-        logger.info("PR comment(s) generated successfully.")
+
+    def _get_check_run_sinks(
+        self, gh: GitHub, pr_context: PullRequestContext | None, changed_files: list[str]
+    ) -> "list[OutputSink]":
+        """Return the check run sink when enabled and the PR head commit is known."""
+        if not self.config.outputs.check_run:
+            return []
+
+        head_sha = pr_context.head_sha if pr_context is not None and pr_context.head_sha else gh.get_pr_head_sha()
+        if not head_sha:
+            logger.warning("'check-run' is enabled but the PR head commit is unknown. Skipping it.")
+            return []
+        return [CheckRunSink(gh, head_sha, changed_files)]
 
     def scan_jacoco_xml_files(self, paths: list[str], exclude_paths: list[str]) -> list[str]:
-        # get files jacoco xml files for analysis
-        paths_to_analyse: list[str] = JaCoCoReportInputScanner(paths=paths, exclude_paths=exclude_paths).scan()
+        """Scan the paths for JaCoCo xml reports within the 'scan' timing span."""
+        with self.run_state.timings.span("scan"):
+            paths_to_analyse: list[str] = JaCoCoReportInputScanner(paths=paths, exclude_paths=exclude_paths).scan()
+        self.run_state.timings.add("scan", reports=len(paths_to_analyse))
         logger.info("Found %s JaCoCo reports.", len(paths_to_analyse))
         return paths_to_analyse
 
-    def _delete_stale_comment_if_update_enabled(self, gh: GitHub, pr_number: int) -> None:
-        """Delete the previous JaCoCo PR comment when update-comment is enabled."""
-        if not ActionInputs.get_update_comment():
+    def _parse_report(
+        self, parser: JaCoCoReportParser, report_path: str, group_name: Optional[str] = None, stage: str = "parse"
+    ) -> ReportFileCoverage:
+        """Parse one report within a timing span counting the reports and the bytes read."""
+        with self.run_state.timings.span(stage):
+            report = parser.parse(report_path, group_name=group_name)
+        try:
+            size = os.path.getsize(report_path)
+        except OSError:
+            size = 0
+        self.run_state.timings.add(stage, reports=1, bytes_read=size)
+        return report
+
+    def _delete_stale_comment_if_update_enabled(
+        self, gh: GitHub, pr_number: int, comments: list[dict] | None = None
+    ) -> None:
+        """Delete the previous JaCoCo PR comment when update-comment is enabled.
+
+        Pre-fetched comments (GraphQL transport) are used instead of listing the PR comments again.
+        """
+        if not self.config.comment.update_comment:
             return
 
-        title = f"**{ActionInputs.get_title()}**"
-        for comment in gh.get_comments(pr_number):
-            if comment["body"].startswith(title):
-                gh.delete_comment(comment["id"])
-                logger.info("Deleted stale comment from previous run.")
-                break
+        stale = find_action_comment(
+            comments if comments is not None else gh.get_comments(pr_number), f"**{self.config.comment.title}**"
+        )
+        if stale is not None:
+            gh.delete_comment(stale["id"])
+            logger.info("Deleted stale comment from previous run.")
 
     def _mark_operational_failure(self) -> None:
         """Mark operational failure so action fails regardless of selected threshold list."""
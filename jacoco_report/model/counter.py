@@ -10,6 +10,8 @@ class Counter:
     A class that represents a counter
     """
 
+    __slots__ = ("missed", "covered")
+
     def __init__(self, missed: int, covered: int):
         """
         A constructor for the Counter class
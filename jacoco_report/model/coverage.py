@@ -3,18 +3,81 @@ A module that contains the Coverage class
 """
 
 import logging
+from array import array
+from typing import Iterable
 
 from jacoco_report.model.counter import Counter
 from jacoco_report.utils.enums import MetricTypeEnum
 
 logger = logging.getLogger(__name__)
 
+# Order of the metrics in Coverage.values; every metric occupies a (missed, covered) pair.
+COVERAGE_METRICS: tuple[str, ...] = tuple(metric.value for metric in MetricTypeEnum)
+_METRIC_INDEX: dict[str, int] = {metric: 2 * index for index, metric in enumerate(COVERAGE_METRICS)}
+
+
+class _CounterView(Counter):
+    """
+    A Counter reading and writing one (missed, covered) pair of a Coverage.values array in place.
+    """
+
+    __slots__ = ("_values", "_offset")
+
+    def __init__(self, values: array, offset: int):
+        self._values: array = values
+        self._offset: int = offset
+        super().__init__(values[offset], values[offset + 1])
+
+    @property
+    def missed(self) -> int:
+        """The missed count, stored in the coverage."""
+        return self._values[self._offset]
+
+    @missed.setter
+    def missed(self, value: int) -> None:
+        self._values[self._offset] = value
+
+    @property
+    def covered(self) -> int:
+        """The covered count, stored in the coverage."""
+        return self._values[self._offset + 1]
+
+    @covered.setter
+    def covered(self, value: int) -> None:
+        self._values[self._offset + 1] = value
+
+
+def _counter_property(metric: str) -> property:
+    """Expose one (missed, covered) pair of Coverage.values as a Counter attribute."""
+    offset = _METRIC_INDEX[metric]
+
+    def getter(self: "Coverage") -> Counter:
+        return _CounterView(self.values, offset)
+
+    def setter(self: "Coverage", counter: Counter) -> None:
+        self.values[offset] = counter.missed
+        self.values[offset + 1] = counter.covered
+
+    return property(getter, setter, doc=f"The {metric} counter, a live view: changing it changes the coverage.")
+
 
 class Coverage:
     """
     A class that represents the coverage of a file
+
+    The six counters are stored as twelve int64 values in one array (see COVERAGE_METRICS for the order),
+    so a coverage costs a single allocation instead of six Counter objects.
     """
 
+    __slots__ = ("values",)
+
+    instruction = _counter_property(MetricTypeEnum.INSTRUCTION.value)
+    branch = _counter_property(MetricTypeEnum.BRANCH.value)
+    line = _counter_property(MetricTypeEnum.LINE.value)
+    complexity = _counter_property(MetricTypeEnum.COMPLEXITY.value)
+    method = _counter_property(MetricTypeEnum.METHOD.value)
+    clazz = _counter_property(MetricTypeEnum.CLASS.value)
+
     def __init__(
         self, instruction: Counter, branch: Counter, line: Counter, complexity: Counter, method: Counter, clazz: Counter
     ):
@@ -29,12 +92,33 @@ class Coverage:
             method (Counter): The method counter
             clazz (Counter): The class counter
         """
-        self.instruction: Counter = instruction
-        self.branch: Counter = branch
-        self.line: Counter = line
-        self.complexity: Counter = complexity
-        self.method: Counter = method
-        self.clazz: Counter = clazz
+        counters = {
+            MetricTypeEnum.INSTRUCTION.value: instruction,
+            MetricTypeEnum.BRANCH.value: branch,
+            MetricTypeEnum.LINE.value: line,
+            MetricTypeEnum.COMPLEXITY.value: complexity,
+            MetricTypeEnum.METHOD.value: method,
+            MetricTypeEnum.CLASS.value: clazz,
+        }
+        self.values: array = array("q")
+        for metric in COVERAGE_METRICS:
+            self.values.append(counters[metric].missed)
+            self.values.append(counters[metric].covered)
+
+    @classmethod
+    def from_values(cls, values: Iterable[int]) -> "Coverage":
+        """
+        Create a coverage from its twelve counter values in COVERAGE_METRICS order.
+
+        Parameters:
+            values (Iterable[int]): The (missed, covered) values of every metric.
+
+        Returns:
+            Coverage: The coverage.
+        """
+        coverage = cls.__new__(cls)
+        coverage.values = array("q", values)
+        return coverage
 
     def get_coverage_by_metric(self, metric_type: str) -> float:
         """
@@ -46,22 +130,8 @@ class Coverage:
         Returns:
             Counter: The coverage of the given counter
         """
-        match metric_type:
-            case MetricTypeEnum.INSTRUCTION.value:
-                return self.instruction.coverage()
-            case MetricTypeEnum.BRANCH.value:
-                return self.branch.coverage()
-            case MetricTypeEnum.LINE.value:
-                return self.line.coverage()
-            case MetricTypeEnum.COMPLEXITY.value:
-                return self.complexity.coverage()
-            case MetricTypeEnum.METHOD.value:
-                return self.method.coverage()
-            case MetricTypeEnum.CLASS.value:
-                return self.clazz.coverage()
-            case _:
-                logger.error("Unknown metric type: %s", metric_type)
-                return Counter(0, 0).coverage()
+        missed, covered = self.get_values_by_metric(metric_type)
+        return Counter(missed, covered).coverage()
 
     def get_values_by_metric(self, metric_type: str) -> tuple[int, int]:
         """
@@ -73,21 +143,12 @@ class Coverage:
         Returns:
             Counter: The values of the given counter
         """
-        if metric_type == MetricTypeEnum.INSTRUCTION.value:
-            return self.instruction.missed, self.instruction.covered
-        if metric_type == MetricTypeEnum.BRANCH.value:
-            return self.branch.missed, self.branch.covered
-        if metric_type == MetricTypeEnum.LINE.value:
-            return self.line.missed, self.line.covered
-        if metric_type == MetricTypeEnum.COMPLEXITY.value:
-            return self.complexity.missed, self.complexity.covered
-        if metric_type == MetricTypeEnum.METHOD.value:
-            return self.method.missed, self.method.covered
-        if metric_type == MetricTypeEnum.CLASS.value:
-            return self.clazz.missed, self.clazz.covered
-
-        logger.error("Unknown metric type: %s", metric_type)
-        return 0, 0
+        offset = _METRIC_INDEX.get(metric_type)
+        if offset is None:
+            logger.error("Unknown metric type: %s", metric_type)
+            return 0, 0
+
+        return self.values[offset], self.values[offset + 1]
 
     def __str__(self):
         """
@@ -0,0 +1,278 @@
+"""
+A module that contains the CoverageHistory class: the coverage numbers of past runs in a local SQLite database.
+
+Every run adds one row with its global numbers, indexed by commit, branch and time, and one row per report and per
+report group. Report and group names are stored once in a name table and referenced by ID, and the per-name rows
+live in a WITHOUT ROWID table clustered by run, so a run with hundreds of reports stays a few KiB. Trend queries
+read the last N runs of a branch through a partial index holding only the runs outside pull requests, so they
+touch N rows however many runs are stored.
+"""
+
+import logging
+import os
+import sqlite3
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+# the kind of a name: the report name or the report group name
+KIND_REPORT = 0
+KIND_GROUP = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run (
+    id INTEGER PRIMARY KEY,
+    created_at INTEGER NOT NULL,
+    sha TEXT NOT NULL,
+    branch TEXT NOT NULL,
+    event TEXT NOT NULL,
+    pr_number INTEGER,
+    metric TEXT NOT NULL,
+    overall REAL NOT NULL,
+    changed_files REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS run_branch_trend ON run (branch, metric, created_at) WHERE pr_number IS NULL;
+CREATE INDEX IF NOT EXISTS run_sha ON run (sha);
+CREATE TABLE IF NOT EXISTS name (
+    id INTEGER PRIMARY KEY,
+    kind INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (kind, name)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    run_id INTEGER NOT NULL REFERENCES run (id) ON DELETE CASCADE,
+    name_id INTEGER NOT NULL REFERENCES name (id),
+    overall REAL NOT NULL,
+    changed_files REAL NOT NULL,
+    PRIMARY KEY (run_id, name_id)
+) WITHOUT ROWID;
+"""
+
+# the last runs of a branch outside pull requests, newest first; served by run_branch_trend
+LAST_RUNS_QUERY = """
+SELECT id, created_at, sha, overall, changed_files FROM run
+WHERE branch = ? AND metric = ? AND pr_number IS NULL
+ORDER BY created_at DESC, id DESC LIMIT ?
+"""
+# every run of a commit, oldest first; served by run_sha
+COMMIT_RUNS_QUERY = """
+SELECT sha, branch, event, pr_number, metric, created_at, overall, changed_files FROM run
+WHERE sha = ? ORDER BY created_at, id
+"""
+
+
+class HistoryRun(NamedTuple):
+    """The identity of one recorded run."""
+
+    sha: str
+    branch: str
+    event: str
+    pr_number: Optional[int]
+    metric: str
+    created_at: int
+
+
+class TrendPoint(NamedTuple):
+    """The coverage of one past run, globally or of one report or group."""
+
+    created_at: int
+    sha: str
+    overall: float
+    changed_files: float
+
+
+class RunCoverage(NamedTuple):
+    """The numbers of one run to record."""
+
+    run: HistoryRun
+    # the global overall and changed-files coverage
+    totals: tuple[float, float]
+    # the overall and changed-files coverage by report name and by report group name
+    reports: dict[str, tuple[float, float]]
+    groups: dict[str, tuple[float, float]]
+
+
+class Regression(NamedTuple):
+    """A run whose overall coverage dropped against the run before it on the same branch."""
+
+    point: TrendPoint
+    previous: TrendPoint
+
+    @property
+    def drop(self) -> float:
+        """The overall coverage lost, in percentage points."""
+        return round(self.previous.overall - self.point.overall, 2)
+
+
+class CoverageHistory:
+    """
+    A class storing the coverage numbers of runs in a SQLite database file and querying their trends.
+    """
+
+    def __init__(self, path: str):
+        """
+        Parameters:
+            path (str): The database file; it and its directory are created when missing.
+
+        Raises:
+            sqlite3.Error: If the file is not a database or has a newer schema.
+            OSError: If the directory cannot be created.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path: str = path
+        self._connection: sqlite3.Connection = sqlite3.connect(path)
+        try:
+            version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+            if version > SCHEMA_VERSION:
+                raise sqlite3.DatabaseError(f"history schema version {version} is newer than {SCHEMA_VERSION}")
+            self._connection.execute("PRAGMA foreign_keys = ON")
+            with self._connection:
+                self._connection.executescript(_SCHEMA)
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.Error:
+            self._connection.close()
+            raise
+        self._name_ids: dict[tuple[int, str], int] = {}
+
+    def record(
+        self,
+        run: HistoryRun,
+        totals: tuple[float, float],
+        reports: dict[str, tuple[float, float]],
+        groups: dict[str, tuple[float, float]],
+    ) -> int:
+        """
+        Add the numbers of one run.
+
+        Parameters:
+            run (HistoryRun): The run.
+            totals (tuple[float, float]): The global overall and changed-files coverage.
+            reports (dict[str, tuple[float, float]]): The overall and changed-files coverage by report name.
+            groups (dict[str, tuple[float, float]]): The overall and changed-files coverage by report group name.
+
+        Returns:
+            int: The ID of the recorded run.
+        """
+        return self.record_many([RunCoverage(run, totals, reports, groups)])[0]
+
+    def record_many(self, runs: Iterable[RunCoverage]) -> list[int]:
+        """
+        Add the numbers of several runs in one transaction, e.g. to import a history kept elsewhere.
+
+        Parameters:
+            runs (Iterable[RunCoverage]): The runs with their numbers, in the order they are recorded.
+
+        Returns:
+            list[int]: The IDs of the recorded runs.
+        """
+        run_ids: list[int] = []
+        rows: list[tuple[int, int, float, float]] = []
+        try:
+            with self._connection:
+                for run, totals, reports, groups in runs:
+                    cursor = self._connection.execute(
+                        "INSERT INTO run (created_at, sha, branch, event, pr_number, metric, overall, changed_files) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (run.created_at, run.sha, run.branch, run.event, run.pr_number, run.metric, *totals),
+                    )
+                    run_id = int(cursor.lastrowid or 0)
+                    run_ids.append(run_id)
+                    rows.extend(
+                        (run_id, self._name_id(kind, name), overall, changed_files)
+                        for kind, numbers in ((KIND_REPORT, reports), (KIND_GROUP, groups))
+                        for name, (overall, changed_files) in numbers.items()
+                    )
+                # a name repeated in one run (two reports with the same title) keeps its last numbers
+                self._connection.executemany("INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            # the names added in the rolled back transaction are gone
+            self._name_ids.clear()
+            raise
+        return run_ids
+
+    def trend(
+        self, branch: str, metric: str, last: int, kind: Optional[int] = None, name: str = ""
+    ) -> list[TrendPoint]:
+        """
+        Return the coverage of the last runs of a branch outside pull requests, oldest first.
+
+        Parameters:
+            branch (str): The branch, e.g. 'master'.
+            metric (str): The primary metric of the runs.
+            last (int): The number of runs.
+            kind (Optional[int]): KIND_REPORT or KIND_GROUP for the numbers of one report or group, None for the
+                global numbers.
+            name (str): The report or group name when kind is given.
+
+        Returns:
+            list[TrendPoint]: The points; runs without the report or group are left out.
+        """
+        if kind is None:
+            rows = self._connection.execute(LAST_RUNS_QUERY, (branch, metric, last)).fetchall()
+            return [TrendPoint(*row[1:]) for row in reversed(rows)]
+
+        name_id = self._find_name_id(kind, name)
+        if name_id is None:
+            return []
+        rows = self._connection.execute(
+            f"SELECT r.created_at, r.sha, c.overall, c.changed_files FROM ({LAST_RUNS_QUERY}) AS r "
+            "JOIN coverage AS c ON c.run_id = r.id AND c.name_id = ? ORDER BY r.created_at DESC, r.id DESC",
+            (branch, metric, last, name_id),
+        ).fetchall()
+        return [TrendPoint(*row) for row in reversed(rows)]
+
+    def regressions(
+        self, branch: str, metric: str, last: int, min_drop: float = 0.0, kind: Optional[int] = None, name: str = ""
+    ) -> list[Regression]:
+        """
+        Return the runs among the last runs of a branch whose overall coverage dropped by more than min_drop.
+
+        Parameters:
+            branch (str): The branch, e.g. 'master'.
+            metric (str): The primary metric of the runs.
+            last (int): The number of runs searched.
+            min_drop (float): The drop in percentage points a regression must exceed.
+            kind (Optional[int]): KIND_REPORT or KIND_GROUP for one report or group, None for the global numbers.
+            name (str): The report or group name when kind is given.
+
+        Returns:
+            list[Regression]: The regressions, oldest first.
+        """
+        points = self.trend(branch, metric, last, kind, name)
+        return [
+            Regression(point, previous)
+            for previous, point in zip(points, points[1:])
+            if previous.overall - point.overall > min_drop
+        ]
+
+    def runs_of_commit(self, sha: str) -> list[tuple[HistoryRun, TrendPoint]]:
+        """Return every run recorded for a commit with its global numbers, oldest first."""
+        rows = self._connection.execute(COMMIT_RUNS_QUERY, (sha,)).fetchall()
+        return [(HistoryRun(*row[:6]), TrendPoint(row[5], row[0], row[6], row[7])) for row in rows]
+
+    def query_plan(self, sql: str, parameters: Sequence = ()) -> str:
+        """Return the SQLite query plan of a statement on this database, its steps joined by spaces."""
+        rows = self._connection.execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        return " ".join(row[3] for row in rows)
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def _find_name_id(self, kind: int, name: str) -> Optional[int]:
+        row = self._connection.execute("SELECT id FROM name WHERE kind = ? AND name = ?", (kind, name)).fetchone()
+        return row[0] if row is not None else None
+
+    def _name_id(self, kind: int, name: str) -> int:
+        """Return the ID of a report or group name, added on first use."""
+        key = (kind, name)
+        if key not in self._name_ids:
+            name_id = self._find_name_id(kind, name)
+            if name_id is None:
+                cursor = self._connection.execute("INSERT INTO name (kind, name) VALUES (?, ?)", key)
+                name_id = int(cursor.lastrowid or 0)
+            self._name_ids[key] = name_id
+        return self._name_ids[key]
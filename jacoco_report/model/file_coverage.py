@@ -2,6 +2,9 @@
 A module that contains the FileCoverage class
 """
 
+from array import array
+from typing import Iterable
+
 from jacoco_report.model.counter import Counter
 from jacoco_report.model.coverage import Coverage
 
@@ -11,6 +14,8 @@ class FileCoverage(Coverage):
     A class that represents the coverage of a file
     """
 
+    __slots__ = ("file_name", "file_path")
+
     def __init__(
         self,
         file_name: str,
@@ -39,6 +44,25 @@ class FileCoverage(Coverage):
         self.file_name = file_name
         self.file_path = file_path
 
+    @classmethod
+    def from_counter_values(cls, file_name: str, file_path: str, values: Iterable[int]) -> "FileCoverage":
+        """
+        Create a file coverage from its twelve counter values in COVERAGE_METRICS order.
+
+        Parameters:
+            file_name (str): The name of the file
+            file_path (str): The path of the file
+            values (Iterable[int]): The (missed, covered) values of every metric
+
+        Returns:
+            FileCoverage: The file coverage
+        """
+        file_coverage = cls.__new__(cls)
+        file_coverage.values = array("q", values)
+        file_coverage.file_name = file_name
+        file_coverage.file_path = file_path
+        return file_coverage
+
     def __str__(self):
         """
         Returns the string representation of the FileCoverage class
@@ -0,0 +1,184 @@
+"""
+A module that contains the FileCoverageStore class keeping changed-file coverage in a temporary SQLite database
+and the SpilledFileCoverage mapping reading the changed files of one report back from it.
+
+The parser moves changed-file coverage into the store once the 'max-memory-mb' budget is exceeded. A spilled
+report behaves like the dict[str, FileCoverage] of an in-memory one, in insertion order; the evaluator reads
+its rows back in batches and keeps only the failing files instead of holding them all. The counters are stored
+as one packed int64 blob per file (the layout of Coverage.values).
+"""
+
+import logging
+import sqlite3
+import weakref
+from array import array
+from typing import ItemsView, Iterable, Iterator, Mapping, Optional, ValuesView
+
+from jacoco_report.model.file_coverage import FileCoverage
+
+logger = logging.getLogger(__name__)
+
+# database pages kept in memory (KiB); the rest stays in the temporary file
+CACHE_SIZE_KIB = 8192
+
+_SCHEMA = """
+CREATE TABLE file_coverage (
+    report INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    counters BLOB NOT NULL,
+    PRIMARY KEY (report, key)
+)
+"""
+# a key seen again replaces its counters but keeps its position, like assigning to a dict key
+_UPSERT = """
+INSERT INTO file_coverage (report, key, file_path, file_name, counters) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (report, key) DO UPDATE SET
+    file_path = excluded.file_path, file_name = excluded.file_name, counters = excluded.counters
+"""
+
+
+def _to_file_coverage(file_path: str, file_name: str, counters: bytes) -> FileCoverage:
+    values = array("q")
+    values.frombytes(counters)
+    return FileCoverage.from_counter_values(file_name, file_path, values)
+
+
+class FileCoverageStore:
+    """
+    A class keeping the changed-file coverage of many reports in a private temporary SQLite database.
+
+    The database file is created in the system temporary directory and deleted when the store is closed
+    or garbage collected.
+    """
+
+    def __init__(self, cache_size_kib: int = CACHE_SIZE_KIB):
+        """
+        Parameters:
+            cache_size_kib (int): The database pages kept in memory, in KiB.
+        """
+        # an empty file name opens a private on-disk database deleted when the connection closes
+        self._connection: sqlite3.Connection = sqlite3.connect("")
+        self._connection.execute(f"PRAGMA cache_size = -{int(cache_size_kib)}")
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute(_SCHEMA)
+        # spilled reports keep the store alive; the database goes away with the last of them
+        self._finalizer = weakref.finalize(self, self._connection.close)
+        self._reports: int = 0
+        self.files: int = 0
+        logger.info("Changed-file coverage exceeds the memory budget; spilling it to a temporary SQLite database.")
+
+    def new_report(self) -> "SpilledFileCoverage":
+        """Return an empty mapping for the changed files of one more report."""
+        self._reports += 1
+        return SpilledFileCoverage(self, self._reports)
+
+    def put(self, report: int, items: Iterable[tuple[str, FileCoverage]]) -> None:
+        """
+        Store the changed files of a report.
+
+        Parameters:
+            report (int): The report ID from new_report.
+            items (Iterable[tuple[str, FileCoverage]]): The changed files by key.
+
+        Returns:
+            None
+        """
+        rows = [(report, key, fc.file_path, fc.file_name, fc.values.tobytes()) for key, fc in items]
+        with self._connection:
+            self._connection.executemany(_UPSERT, rows)
+        self.files += len(rows)
+
+    def count(self, report: int) -> int:
+        """Return the number of changed files of a report."""
+        return self._connection.execute("SELECT COUNT(*) FROM file_coverage WHERE report = ?", (report,)).fetchone()[0]
+
+    def get(self, report: int, key: str) -> Optional[FileCoverage]:
+        """Return the coverage of one changed file of a report, None if the report does not have it."""
+        row = self._connection.execute(
+            "SELECT file_path, file_name, counters FROM file_coverage WHERE report = ? AND key = ?", (report, key)
+        ).fetchone()
+        return _to_file_coverage(*row) if row is not None else None
+
+    def keys(self, report: int) -> Iterator[str]:
+        """Yield the changed file keys of a report in insertion order."""
+        for (key,) in self._connection.execute(
+            "SELECT key FROM file_coverage WHERE report = ? ORDER BY rowid", (report,)
+        ):
+            yield key
+
+    def items(self, report: int) -> Iterator[tuple[str, FileCoverage]]:
+        """Yield the changed files of a report by key in insertion order, one database row at a time."""
+        for key, file_path, file_name, counters in self._connection.execute(
+            "SELECT key, file_path, file_name, counters FROM file_coverage WHERE report = ? ORDER BY rowid", (report,)
+        ):
+            yield key, _to_file_coverage(file_path, file_name, counters)
+
+    def close(self) -> None:
+        """Close the database, which deletes its temporary file."""
+        self._finalizer()
+
+
+class SpilledFileCoverage(Mapping[str, FileCoverage]):
+    """
+    A mapping of the changed files of one report kept in a FileCoverageStore; only the parser adds to it.
+    """
+
+    __slots__ = ("_store", "_report")
+
+    def __init__(self, store: FileCoverageStore, report: int):
+        self._store = store
+        self._report = report
+
+    def extend(self, items: Iterable[tuple[str, FileCoverage]]) -> None:
+        """Add changed files to the report; a key already present keeps its position."""
+        self._store.put(self._report, items)
+
+    def __getitem__(self, key: str) -> FileCoverage:
+        file_coverage = self._store.get(self._report, key)
+        if file_coverage is None:
+            raise KeyError(key)
+        return file_coverage
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._store.get(self._report, key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return self._store.keys(self._report)
+
+    def __len__(self) -> int:
+        return self._store.count(self._report)
+
+    def values(self) -> ValuesView[FileCoverage]:
+        return _SpilledValuesView(self)
+
+    def items(self) -> ItemsView[str, FileCoverage]:
+        return _SpilledItemsView(self)
+
+    def stored_items(self) -> Iterator[tuple[str, FileCoverage]]:
+        """Yield the (key, coverage) pairs in insertion order with a single query."""
+        return self._store.items(self._report)
+
+
+class _SpilledValuesView(ValuesView[FileCoverage]):
+    """The coverages of a SpilledFileCoverage, read with one query instead of one per key."""
+
+    def __init__(self, mapping: SpilledFileCoverage):
+        super().__init__(mapping)
+        self._spilled = mapping
+
+    def __iter__(self) -> Iterator[FileCoverage]:
+        return (file_coverage for _, file_coverage in self._spilled.stored_items())
+
+
+class _SpilledItemsView(ItemsView[str, FileCoverage]):
+    """The (key, coverage) pairs of a SpilledFileCoverage, read with one query instead of one per key."""
+
+    def __init__(self, mapping: SpilledFileCoverage):
+        super().__init__(mapping)
+        self._spilled = mapping
+
+    def __iter__(self) -> Iterator[tuple[str, FileCoverage]]:
+        return self._spilled.stored_items()
@@ -2,7 +2,7 @@
 This module contains the ReportFileCoverage class
 """
 
-from typing import Optional
+from typing import Mapping, Optional
 
 from jacoco_report.model.coverage import Coverage
 from jacoco_report.model.file_coverage import FileCoverage
@@ -14,12 +14,14 @@ class ReportFileCoverage:
     Class variables are filled with data from the XML report file.
     """
 
+    __slots__ = ("path", "name", "group_name", "overall_coverage", "changed_files_coverage")
+
     def __init__(
         self,
         path: str,
         name: str,
         overall_coverage: Coverage,
-        changed_files_coverage: dict[str, FileCoverage],
+        changed_files_coverage: Mapping[str, FileCoverage],
         group_name: Optional[str] = None,
     ):
         self.path = path
@@ -30,5 +32,6 @@ class ReportFileCoverage:
         self.overall_coverage: Coverage = overall_coverage
 
         # Represents the coverage of the changed files only.
-        # Does not include all files in the report.
-        self.changed_files_coverage: dict[str, FileCoverage] = changed_files_coverage
+        # Does not include all files in the report. A dict, or a SpilledFileCoverage read back from disk when
+        # the changed files exceed the 'max-memory-mb' budget.
+        self.changed_files_coverage: Mapping[str, FileCoverage] = changed_files_coverage
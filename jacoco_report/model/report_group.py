@@ -19,6 +19,7 @@ class ReportGroup:
         min_coverage_changed_files: Optional[float] = None,
         min_coverage_per_changed_file: Optional[float] = None,
         baseline_paths: Optional[list[str]] = None,
+        metric_thresholds: Optional[dict[str, tuple[Optional[float], Optional[float], Optional[float]]]] = None,
     ):
         self.name = name
         self.paths = paths
@@ -29,3 +30,13 @@ class ReportGroup:
         # field was explicitly provided in report-groups YAML.
         self.baseline_paths_configured = baseline_paths is not None
         self.baseline_paths = baseline_paths or []
+        # Per-metric (overall, changed-files-average, per-changed-file) overrides from 'metric:O*A*P' entries.
+        self.metric_thresholds = metric_thresholds or {}
+
+    def thresholds_for(self, metric: str) -> tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        Return the group thresholds of a metric: its own entry when configured, otherwise the unprefixed one.
+        """
+        return self.metric_thresholds.get(
+            metric, (self.min_coverage_overall, self.min_coverage_changed_files, self.min_coverage_per_changed_file)
+        )
@@ -0,0 +1,214 @@
+"""
+A module that contains the BaselineSnapshot class: the parsed baseline reports of one commit, stored by its SHA.
+
+A run on the base branch writes the snapshot of its commit once; pull request runs whose base is that commit
+load it instead of scanning and parsing baseline JaCoCo XML. The snapshot keeps the raw counters of every
+report and of every sourcefile (keyed by repository path), so it does not depend on a metric, on thresholds
+or on the changed files of a pull request: the changed files are selected from it when it is loaded.
+
+The file is gzip-compressed JSON, '<directory>/<sha>.json.gz', with the sourcefiles of a report in columns.
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+from typing import Optional, Sequence
+
+from jacoco_report.model.coverage import COVERAGE_METRICS, Coverage
+from jacoco_report.model.file_coverage import FileCoverage
+from jacoco_report.model.report_file_coverage import ReportFileCoverage
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".json.gz"
+# a commit SHA is also the file name, so nothing else is accepted
+_SHA_PATTERN = re.compile(r"^[0-9a-fA-F]{7,64}$")
+_ROW_WIDTH = 2 * len(COVERAGE_METRICS)
+
+
+class BaselineSnapshot:
+    """
+    A class representing the parsed baseline reports of one commit.
+    """
+
+    def __init__(self, sha: str, reports: list[dict]):
+        """
+        Parameters:
+            sha (str): The commit SHA of the baseline.
+            reports (list[dict]): The reports in the snapshot format (see from_reports).
+        """
+        self.sha: str = sha
+        self.reports: list[dict] = reports
+
+    @staticmethod
+    def path(directory: str, sha: str) -> Optional[str]:
+        """Return the snapshot file of a commit in a directory, None when sha is not a commit SHA."""
+        if not _SHA_PATTERN.match(sha):
+            logger.warning("'%s' is not a commit SHA. No baseline snapshot is used.", sha)
+            return None
+        return os.path.join(directory, f"{sha.lower()}{SNAPSHOT_SUFFIX}")
+
+    @classmethod
+    def from_reports(cls, sha: str, reports: Sequence[ReportFileCoverage]) -> "BaselineSnapshot":
+        """
+        Create the snapshot of reports parsed with every sourcefile kept (JaCoCoReportParser(None)).
+
+        Parameters:
+            sha (str): The commit SHA the reports were built from.
+            reports (Sequence[ReportFileCoverage]): The parsed reports.
+
+        Returns:
+            BaselineSnapshot: The snapshot.
+        """
+        snapshot_reports: list[dict] = []
+        for report in reports:
+            keys: list[str] = []
+            file_paths: list[str] = []
+            file_names: list[str] = []
+            counters: list[int] = []
+            for key, file_coverage in report.changed_files_coverage.items():
+                keys.append(key)
+                file_paths.append(file_coverage.file_path)
+                file_names.append(file_coverage.file_name)
+                counters.extend(file_coverage.values)
+            snapshot_reports.append(
+                {
+                    "path": report.path,
+                    "name": report.name,
+                    "group_name": report.group_name,
+                    "overall": list(report.overall_coverage.values),
+                    "files": {"keys": keys, "file_paths": file_paths, "file_names": file_names, "counters": counters},
+                }
+            )
+        return cls(sha, snapshot_reports)
+
+    @classmethod
+    def load(cls, directory: str, sha: str) -> Optional["BaselineSnapshot"]:
+        """
+        Read the snapshot of a commit.
+
+        Parameters:
+            directory (str): The snapshot directory.
+            sha (str): The commit SHA of the baseline.
+
+        Returns:
+            Optional[BaselineSnapshot]: The snapshot, None when there is none for the commit or it cannot be read.
+        """
+        path = cls.path(directory, sha)
+        if path is None or not os.path.isfile(path):
+            return None
+
+        snapshot = cls.read(path)
+        if snapshot is not None:
+            logger.info("Loaded the baseline snapshot of %s with %d report(s).", sha, len(snapshot.reports))
+        return snapshot
+
+    @classmethod
+    def read(cls, path: str) -> Optional["BaselineSnapshot"]:
+        """
+        Read a snapshot file.
+
+        Parameters:
+            path (str): The snapshot file.
+
+        Returns:
+            Optional[BaselineSnapshot]: The snapshot, None when the file cannot be read or has another format.
+        """
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != SNAPSHOT_VERSION:
+                logger.warning(
+                    "Snapshot '%s' has version %s, expected %s. It is ignored.",
+                    path,
+                    data.get("version"),
+                    SNAPSHOT_VERSION,
+                )
+                return None
+            snapshot = cls(data["sha"], data["reports"])
+            for report in snapshot.reports:
+                files = report["files"]
+                if len(report["overall"]) != _ROW_WIDTH or len(files["counters"]) != _ROW_WIDTH * len(files["keys"]):
+                    raise ValueError(f"report '{report['path']}' has malformed counters")
+        except (OSError, EOFError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Failed to read the snapshot '%s': %s. It is ignored.", path, e)
+            return None
+        return snapshot
+
+    def write(self, directory: str) -> str:
+        """
+        Write the snapshot into a directory, which is created if missing.
+
+        Parameters:
+            directory (str): The snapshot directory.
+
+        Returns:
+            str: The path of the written file.
+
+        Raises:
+            ValueError: If the SHA of the snapshot is not a commit SHA.
+            OSError: If the file cannot be written.
+        """
+        path = self.path(directory, self.sha)
+        if path is None:
+            raise ValueError(f"'{self.sha}' is not a commit SHA.")
+        return self.write_file(path)
+
+    def write_file(self, path: str) -> str:
+        """
+        Write the snapshot into a file; its directory is created if missing.
+
+        Parameters:
+            path (str): The snapshot file.
+
+        Returns:
+            str: The path of the written file.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # written next to the target and renamed, so a concurrent reader never sees a partial snapshot
+        partial_path = f"{path}.partial"
+        with gzip.open(partial_path, "wt", encoding="utf-8") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "sha": self.sha, "reports": self.reports}, f, separators=(",", ":"))
+        os.replace(partial_path, path)
+        return path
+
+    def to_reports(self, changed_files: Optional[list[str]]) -> list[ReportFileCoverage]:
+        """
+        Return the baseline reports with the changed files of a pull request, as the parser would build them.
+
+        Parameters:
+            changed_files (Optional[list[str]]): The changed files of the pull request; None keeps every sourcefile.
+
+        Returns:
+            list[ReportFileCoverage]: The baseline reports.
+        """
+        reports: list[ReportFileCoverage] = []
+        for report in self.reports:
+            files = report["files"]
+            changed_files_coverage: dict[str, FileCoverage] = {}
+            for row, key in enumerate(files["keys"]):
+                # the parser's rule: a sourcefile is changed when its path is part of a changed file path
+                if changed_files is None or any(key in changed_file for changed_file in changed_files):
+                    changed_files_coverage[key] = FileCoverage.from_counter_values(
+                        files["file_names"][row],
+                        files["file_paths"][row],
+                        files["counters"][row * _ROW_WIDTH : (row + 1) * _ROW_WIDTH],
+                    )
+            reports.append(
+                ReportFileCoverage(
+                    report["path"],
+                    report["name"],
+                    Coverage.from_values(report["overall"]),
+                    changed_files_coverage,
+                    report["group_name"],
+                )
+            )
+        return reports
@@ -5,23 +5,49 @@ A module for parsing JaCoCo XML reports and creating CoverageReport instances.
 import logging
 import os
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import Iterator, Mapping, Optional
 
 from jacoco_report.model.counter import Counter
 from jacoco_report.model.coverage import Coverage
 from jacoco_report.model.report_file_coverage import ReportFileCoverage
 from jacoco_report.model.file_coverage import FileCoverage
+from jacoco_report.model.file_coverage_store import FileCoverageStore, SpilledFileCoverage
+from jacoco_report.parser.source_file_index import SourceFileIndex
 
 logger = logging.getLogger(__name__)
 
+# Estimated memory of one changed file held in memory (its key, FileCoverage and dict slot), in bytes.
+FILE_COVERAGE_BYTES = 640
+# Share of the 'max-memory-mb' budget the in-memory changed files may use; the rest is left to the streamed
+# parse and the evaluation.
+CHANGED_FILES_BUDGET_SHARE = 0.5
+# Changed files written to the store at once while a report spills.
+SPILL_BATCH_SIZE = 1000
+
 
 class JaCoCoReportParser:
     """
     A class for parsing JaCoCo XML reports and creating CoverageReport instances.
     """
 
-    def __init__(self, changed_files: list[str]):
-        self._changed_files: list[str] = changed_files
+    def __init__(self, changed_files: Optional[list[str]], max_memory_mb: int = 0):
+        """
+        Parameters:
+            changed_files (Optional[list[str]]): The changed files of the pull request; None keeps every
+                sourcefile, as a baseline snapshot needs.
+            max_memory_mb (int): The memory budget in MiB; 0 keeps all changed-file coverage in memory.
+        """
+        self._changed_files: Optional[list[str]] = changed_files
+        # the files of the working directory, indexed once on first use and shared by all parsed reports
+        self._source_index: Optional[SourceFileIndex] = None
+        # changed files the parsed reports may hold in memory before new ones spill to disk (None: no budget)
+        self._spill_after: Optional[int] = (
+            int(max_memory_mb * 1024 * 1024 * CHANGED_FILES_BUDGET_SHARE) // FILE_COVERAGE_BYTES
+            if max_memory_mb > 0
+            else None
+        )
+        self._held_files: int = 0
+        self._store: Optional[FileCoverageStore] = None
 
     def parse(self, report_path: str, group_name: Optional[str] = None) -> ReportFileCoverage:
         """
@@ -35,21 +61,36 @@ class JaCoCoReportParser:
             A ReportFileCoverage instance.
         """
         logger.debug("Parsing JaCoCo XML report: %s", report_path)
-        tree: ET.ElementTree[ET.Element] = ET.parse(report_path)
-        root: Optional[ET.Element] = tree.getroot()
+        events = ET.iterparse(report_path, events=("start", "end"))
+        _, root = next(events)
+        changed_files_stats: dict[str, FileCoverage] = {}
+        spilled: Optional[SpilledFileCoverage] = None
+
+        for package, src_file in self._iter_sourcefiles(root, events):
+            self._extract_changed_file_stats(package, src_file, changed_files_stats)
+            if spilled is None and self._is_over_budget(len(changed_files_stats)):
+                spilled = self._get_store().new_report()
+            if spilled is not None and len(changed_files_stats) >= SPILL_BATCH_SIZE:
+                spilled.extend(changed_files_stats.items())
+                changed_files_stats.clear()
 
         # check name attribute exists
-        if root is not None and "name" not in root.attrib:
+        if "name" not in root.attrib:
             logger.error("Failed to find name attribute in JaCoCo report: %s", {report_path})
             name = report_path
         else:
-            name = root.attrib["name"] if root is not None else report_path
+            name = root.attrib["name"]
 
-        # Extract overall stats and changed files stats from the XML
+        # only the report's own counters are left below the root once the stream is consumed
         overall_stats: Coverage = self._extract_overall_stats(root)
-        changed_files_stats: dict[str, FileCoverage] = self._extract_changed_files_stats(root)
+        changed_files: Mapping[str, FileCoverage] = changed_files_stats
+        if spilled is not None:
+            spilled.extend(changed_files_stats.items())
+            changed_files = spilled
+        else:
+            self._held_files += len(changed_files_stats)
 
-        return ReportFileCoverage(report_path, name, overall_stats, changed_files_stats, group_name)
+        return ReportFileCoverage(report_path, name, overall_stats, changed_files, group_name)
 
     def _extract_overall_stats(self, root: Optional[ET.Element]) -> Coverage:
         """
@@ -117,82 +158,113 @@ class JaCoCoReportParser:
             logger.error("Failed to parse %s counter from JaCoCo report.", counter_type)
             return 0
 
-    def _extract_changed_files_stats(self, root: Optional[ET.Element]) -> dict[str, FileCoverage]:
+    @staticmethod
+    def _iter_sourcefiles(
+        root: ET.Element, events: Iterator[tuple[str, ET.Element]]
+    ) -> Iterator[tuple[str, ET.Element]]:
         """
-        Extracts changed files coverage statistics from the XML root.
+        Yields the sourcefiles of the top-level packages from the start and end events following the root.
+
+        Every finished element is dropped once it has been yielded or skipped, so memory stays bounded by
+        one sourcefile instead of the whole XML tree. Only the report's own counters are kept below the root.
 
         Paramaters:
-            root: The root of the XML tree
+            root: The root element of the report, already started
+            events: The remaining iterparse events of the report
 
         Returns:
-            A dictionary containing the changed files coverage statistics
+            An iterator of (package name, sourcefile element) pairs
         """
+        package: Optional[str] = None
+        depth = 1
+        for event, element in events:
+            if event == "start":
+                if depth == 1 and element.tag == "package":
+                    package = element.attrib["name"]
+                    logger.debug("Package: %s", package)
+                depth += 1
+                continue
 
-        def find_file(root_dir: str, relative_path: str) -> list[str]:
-            paths: list[str] = []
-            for dirpath, *_ in os.walk(root_dir):
-                full_path = os.path.join(dirpath, relative_path)
-                if os.path.isfile(full_path):
-                    paths.append(os.path.relpath(full_path, root_dir))
-            return paths
+            depth -= 1
+            if depth == 2 and package is not None and element.tag == "sourcefile":
+                yield package, element
+            if depth == 1:
+                package = None
+                if element.tag != "counter":
+                    root.remove(element)
+            elif depth >= 2 and element.tag != "counter":
+                element.clear()
 
-        logger.debug("Extracting changed files coverage statistics from JaCoCo report.")
-        changed_files_stats = dict[str, FileCoverage]()
+    def _find_source_files(self, relative_path: str) -> list[str]:
+        """Return the paths (relative to the working directory) of the files ending with relative_path."""
+        cwd = os.getcwd()
+        if self._source_index is None or self._source_index.root != cwd:
+            self._source_index = SourceFileIndex(cwd)
+        return self._source_index.find(relative_path)
 
-        if root is None:
-            logger.error("Root element is None. Cannot extract changed files stats.")
-            return changed_files_stats
-
-        for pck in root.findall("package"):
-            logger.debug("Package: %s", pck.attrib["name"])
-            for src_file in pck.findall("sourcefile"):
-                file_path = pck.attrib["name"]
-                file_name = src_file.attrib["name"]
-
-                keys: list[str] = find_file(os.getcwd(), f"{file_path}/{file_name}")
-                if len(keys) == 0:
-                    logger.debug(
-                        "File '%s/%s' not found in the repository. Working directory: %s",
-                        file_path,
-                        file_name,
-                        os.getcwd(),
-                    )
-                    keys.append(f"{file_path}/{file_name}")
-
-                for key in keys:
-                    if any(key in changed_file for changed_file in self._changed_files):
-                        logger.debug("File '%s' is in the list of changed files.", key)
-                        file_coverage = FileCoverage(
-                            file_path=file_path,
-                            file_name=file_name,
-                            instruction=Counter(
-                                missed=self.__get_int(src_file, "INSTRUCTION", "missed"),
-                                covered=self.__get_int(src_file, "INSTRUCTION", "covered"),
-                            ),
-                            branch=Counter(
-                                missed=self.__get_int(src_file, "BRANCH", "missed"),
-                                covered=self.__get_int(src_file, "BRANCH", "covered"),
-                            ),
-                            line=Counter(
-                                missed=self.__get_int(src_file, "LINE", "missed"),
-                                covered=self.__get_int(src_file, "LINE", "covered"),
-                            ),
-                            complexity=Counter(
-                                missed=self.__get_int(src_file, "COMPLEXITY", "missed"),
-                                covered=self.__get_int(src_file, "COMPLEXITY", "covered"),
-                            ),
-                            method=Counter(
-                                missed=self.__get_int(src_file, "METHOD", "missed"),
-                                covered=self.__get_int(src_file, "METHOD", "covered"),
-                            ),
-                            clazz=Counter(
-                                missed=self.__get_int(src_file, "CLASS", "missed"),
-                                covered=self.__get_int(src_file, "CLASS", "covered"),
-                            ),
-                        )
-
-                        changed_files_stats[key] = file_coverage
-                    else:
-                        logger.debug("File '%s' is not in the list of changed files.", key)
-
-        return changed_files_stats
+    def _extract_changed_file_stats(
+        self, file_path: str, src_file: ET.Element, changed_files_stats: dict[str, FileCoverage]
+    ) -> None:
+        """
+        Adds the coverage of one sourcefile to the changed files statistics if it is a changed file.
+
+        Paramaters:
+            file_path: The package path of the sourcefile
+            src_file: The sourcefile element
+            changed_files_stats: The changed files coverage statistics, keyed by repository path
+        """
+        file_name = src_file.attrib["name"]
+
+        keys: list[str] = self._find_source_files(f"{file_path}/{file_name}")
+        if len(keys) == 0:
+            logger.debug(
+                "File '%s/%s' not found in the repository. Working directory: %s",
+                file_path,
+                file_name,
+                os.getcwd(),
+            )
+            keys.append(f"{file_path}/{file_name}")
+
+        for key in keys:
+            if self._changed_files is None or any(key in changed_file for changed_file in self._changed_files):
+                logger.debug("File '%s' is in the list of changed files.", key)
+                changed_files_stats[key] = FileCoverage(
+                    file_path=file_path,
+                    file_name=file_name,
+                    instruction=Counter(
+                        missed=self.__get_int(src_file, "INSTRUCTION", "missed"),
+                        covered=self.__get_int(src_file, "INSTRUCTION", "covered"),
+                    ),
+                    branch=Counter(
+                        missed=self.__get_int(src_file, "BRANCH", "missed"),
+                        covered=self.__get_int(src_file, "BRANCH", "covered"),
+                    ),
+                    line=Counter(
+                        missed=self.__get_int(src_file, "LINE", "missed"),
+                        covered=self.__get_int(src_file, "LINE", "covered"),
+                    ),
+                    complexity=Counter(
+                        missed=self.__get_int(src_file, "COMPLEXITY", "missed"),
+                        covered=self.__get_int(src_file, "COMPLEXITY", "covered"),
+                    ),
+                    method=Counter(
+                        missed=self.__get_int(src_file, "METHOD", "missed"),
+                        covered=self.__get_int(src_file, "METHOD", "covered"),
+                    ),
+                    clazz=Counter(
+                        missed=self.__get_int(src_file, "CLASS", "missed"),
+                        covered=self.__get_int(src_file, "CLASS", "covered"),
+                    ),
+                )
+            else:
+                logger.debug("File '%s' is not in the list of changed files.", key)
+
+    def _is_over_budget(self, pending_files: int) -> bool:
+        """Return whether the changed files held in memory, with the pending ones, exceed the memory budget."""
+        return self._spill_after is not None and self._held_files + pending_files > self._spill_after
+
+    def _get_store(self) -> FileCoverageStore:
+        """Return the store receiving spilled changed files, created on the first spill."""
+        if self._store is None:
+            self._store = FileCoverageStore()
+        return self._store
@@ -0,0 +1,148 @@
+"""
+A module that contains the functions writing and merging partial results: the parsed reports of one shard of a
+matrix build.
+
+A 'partial' run parses the reports of its shard and writes them in the baseline snapshot format, with the raw
+counters of every sourcefile, to '<partial-dir>/partial-<random>.json.gz': the file names of the shards never
+collide, so their artifacts can be downloaded into one directory. A 'merge' run reads all partials of its commit
+and joins their reports; the changed files are selected and the reports evaluated only there, where every shard
+is known.
+
+A report found in several partials (the same module tested by several shards) is merged sourcefile by
+sourcefile. JaCoCo XML does not tell which lines each shard covered, so every counter keeps its highest covered
+count: a lower bound of the combined coverage, exact when one shard covers everything the others do in each
+file. Shards splitting the modules keep their reports apart and merge exactly.
+"""
+
+import glob
+import logging
+import os
+import uuid
+from typing import Optional, Sequence
+
+from jacoco_report.model.report_file_coverage import ReportFileCoverage
+from jacoco_report.parser.baseline_snapshot import SNAPSHOT_SUFFIX, BaselineSnapshot
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_PREFIX = "partial-"
+
+
+def write_partial(directory: str, sha: str, reports: Sequence[ReportFileCoverage]) -> str:
+    """
+    Write the partial result of a shard under a new unique name.
+
+    Parameters:
+        directory (str): The partial directory; it is created if missing.
+        sha (str): The commit SHA of the run.
+        reports (Sequence[ReportFileCoverage]): The reports parsed with every sourcefile kept.
+
+    Returns:
+        str: The path of the written file.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path = os.path.join(directory, f"{PARTIAL_PREFIX}{uuid.uuid4().hex}{SNAPSHOT_SUFFIX}")
+    return BaselineSnapshot.from_reports(sha, reports).write_file(path)
+
+
+def find_partials(directory: str) -> list[str]:
+    """Return the partial result files in a directory and its subdirectories (one per downloaded artifact)."""
+    pattern = os.path.join(glob.escape(directory), "**", f"{PARTIAL_PREFIX}*{SNAPSHOT_SUFFIX}")
+    return sorted(glob.glob(pattern, recursive=True))
+
+
+def merge_partials(paths: Sequence[str], sha: str, changed_files: Optional[list[str]]) -> list[ReportFileCoverage]:
+    """
+    Read partial results and join their reports.
+
+    Parameters:
+        paths (Sequence[str]): The partial result files.
+        sha (str): The commit SHA of the run; partials of another commit are ignored. Empty accepts any commit.
+        changed_files (Optional[list[str]]): The changed files of the pull request; None keeps every sourcefile.
+
+    Returns:
+        list[ReportFileCoverage]: The reports, in the order their partials and reports were read.
+    """
+    merged: dict[str, dict] = {}
+    read = 0
+    shared: set[str] = set()
+    for path in paths:
+        snapshot = BaselineSnapshot.read(path)
+        if snapshot is None:
+            continue
+        if sha and snapshot.sha != sha:
+            logger.warning("Partial result '%s' is of commit %s, not %s. It is ignored.", path, snapshot.sha, sha)
+            continue
+        read += 1
+        for report in snapshot.reports:
+            current = merged.get(report["path"])
+            if current is None:
+                merged[report["path"]] = report
+                continue
+            # only the reports of several shards are converted to rows; the others stay as read
+            if report["path"] not in shared:
+                current = merged[report["path"]] = _to_rows(current)
+                shared.add(report["path"])
+            _merge_rows(current, _to_rows(report))
+
+    if shared:
+        logger.warning(
+            "%d report(s) are in several partial results and keep the highest covered counts, a lower bound of "
+            "their combined coverage: %s",
+            len(shared),
+            ", ".join(sorted(shared)),
+        )
+    logger.info("Merged %d report(s) from %d of %d partial result(s).", len(merged), read, len(paths))
+    reports = [_to_columns(report) if path in shared else report for path, report in merged.items()]
+    return BaselineSnapshot(sha, reports).to_reports(changed_files)
+
+
+def _merge_counters(values: list[int], other: list[int]) -> list[int]:
+    """Merge two counter rows of one sourcefile or report: per metric the larger total and covered count."""
+    merged: list[int] = []
+    for offset in range(0, len(values), 2):
+        total = max(values[offset] + values[offset + 1], other[offset] + other[offset + 1])
+        covered = max(values[offset + 1], other[offset + 1])
+        merged.extend((total - covered, covered))
+    return merged
+
+
+def _to_rows(report: dict) -> dict:
+    """Return a snapshot report with its sourcefiles as rows keyed by file key, ready to be merged."""
+    files = report["files"]
+    width = len(report["overall"])
+    rows = {
+        key: (files["file_paths"][row], files["file_names"][row], files["counters"][row * width : (row + 1) * width])
+        for row, key in enumerate(files["keys"])
+    }
+    return {**report, "files": rows}
+
+
+def _merge_rows(report: dict, other: dict) -> None:
+    """Merge the counters and sourcefiles of another partial's copy of a report into a report in rows."""
+    report["overall"] = _merge_counters(report["overall"], other["overall"])
+    files = report["files"]
+    for key, (file_path, file_name, counters) in other["files"].items():
+        current = files.get(key)
+        files[key] = (file_path, file_name, counters if current is None else _merge_counters(current[2], counters))
+
+
+def _to_columns(report: dict) -> dict:
+    """Return a merged report in rows in the snapshot format again."""
+    rows = report["files"]
+    counters: list[int] = []
+    file_totals = [0] * len(report["overall"])
+    for _, _, values in rows.values():
+        counters.extend(values)
+        file_totals = [total + value for total, value in zip(file_totals, values)]
+    # the sourcefiles merged one by one cover at least as much as the report counters merged as a whole
+    overall = _merge_counters(report["overall"], file_totals)
+    files = {
+        "keys": list(rows),
+        "file_paths": [file_path for file_path, _, _ in rows.values()],
+        "file_names": [file_name for _, file_name, _ in rows.values()],
+        "counters": counters,
+    }
+    return {**report, "overall": overall, "files": files}
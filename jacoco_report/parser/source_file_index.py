@@ -0,0 +1,58 @@
+"""
+A module that contains the SourceFileIndex class locating JaCoCo sourcefiles in the working tree.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class SourceFileIndex:
+    """
+    A class indexing the files below a root directory by file name, built with a single os.walk.
+
+    JaCoCo reports name a sourcefile by its package path ('com/example/Foo.java'), while changed files are
+    repository-relative ('module/src/main/java/com/example/Foo.java'). Walking the tree once per sourcefile
+    made parsing quadratic in the size of the repository; the index answers each lookup from a dict.
+    """
+
+    def __init__(self, root: str):
+        """
+        Parameters:
+            root (str): The directory to index, usually the working directory.
+        """
+        self.root: str = root
+        # walk position of every directory, to return matches in os.walk order
+        self._dir_order: dict[str, int] = {}
+        # file name -> paths relative to root
+        self._paths_by_name: dict[str, list[str]] = {}
+
+        files = 0
+        for order, (dirpath, _, filenames) in enumerate(os.walk(root)):
+            rel_dir = os.path.relpath(dirpath, root)
+            self._dir_order[rel_dir] = order
+            for name in filenames:
+                self._paths_by_name.setdefault(name, []).append(os.path.normpath(os.path.join(rel_dir, name)))
+                files += 1
+        logger.debug("Indexed %d files in %d directories below '%s'.", files, len(self._dir_order), root)
+
+    def find(self, relative_path: str) -> list[str]:
+        """
+        Find every file whose path ends with relative_path, i.e. '<some directory>/<relative_path>'.
+
+        Parameters:
+            relative_path (str): The path to look for, e.g. 'com/example/Foo.java'.
+
+        Returns:
+            list[str]: The matching paths relative to the root, in os.walk order of the directory they are under.
+        """
+        wanted = os.path.normpath(relative_path)
+        suffix = os.sep + wanted
+        matches: list[tuple[int, str]] = []
+        for path in self._paths_by_name.get(os.path.basename(wanted), []):
+            if path == wanted:
+                matches.append((self._dir_order["."], path))
+            elif path.endswith(suffix):
+                matches.append((self._dir_order.get(path[: -len(suffix)], len(self._dir_order)), path))
+        return [path for _, path in sorted(matches)]
@@ -0,0 +1,42 @@
+"""
+A module for handling the action inputs of the data kept outside a run: the baseline snapshots, the coverage
+history, the partial results of a matrix build and the memory budget of the parsed coverage data.
+"""
+
+from jacoco_report.utils.constants import BASELINE_SNAPSHOT_DIR, HISTORY_DB, MAX_MEMORY_MB, MODE, PARTIAL_DIR
+from jacoco_report.utils.enums import ModeEnum
+from jacoco_report.utils.gh_action import get_action_input
+
+
+class StorageInputs:
+    """
+    A class representing the storage inputs provided to the GH action. ActionInputs extends it and validates them.
+    """
+
+    @staticmethod
+    def get_baseline_snapshot_dir() -> str:
+        """Get the directory of the baseline snapshots keyed by commit SHA; empty disables the snapshots."""
+        return get_action_input(BASELINE_SNAPSHOT_DIR, "").strip()
+
+    @staticmethod
+    def get_history_db() -> str:
+        """Get the SQLite file recording the coverage of every run; empty disables the history."""
+        return get_action_input(HISTORY_DB, "").strip()
+
+    @staticmethod
+    def get_mode() -> str:
+        """Get the run mode: 'single', or 'partial' and 'merge' for the shards and the merge job of a matrix build."""
+        return get_action_input(MODE, ModeEnum.SINGLE).strip().lower() or ModeEnum.SINGLE
+
+    @staticmethod
+    def get_partial_dir() -> str:
+        """Get the directory the partial results are written to ('partial' mode) and merged from ('merge' mode)."""
+        return get_action_input(PARTIAL_DIR, "").strip()
+
+    @staticmethod
+    def get_max_memory_mb() -> int:
+        """Get the memory budget (MiB) of the parsed coverage data; 0 keeps all coverage data in memory."""
+        raw_value = get_action_input(MAX_MEMORY_MB, "0").strip() or "0"
+        if not raw_value.isdigit():
+            raise ValueError("'max-memory-mb' must be a whole number of megabytes, 0 for no limit.")
+        return int(raw_value)
@@ -0,0 +1,169 @@
+"""
+This module contains the accounting of GitHub API calls made during one action run.
+"""
+
+import json
+import re
+from typing import Optional
+from urllib.parse import urlparse
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket collects everything slower.
+LATENCY_BUCKETS_MS: tuple[int, ...] = (50, 100, 250, 500, 1000, 2500, 5000)
+
+_REPO_SEGMENT = re.compile(r"^/repos/[^/]+/[^/]+")
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """
+    Collapses a concrete request into its endpoint template, e.g. 'GET /repos/{owner}/{repo}/pulls/{n}/files'.
+
+    Parameters:
+        method (str): The HTTP method.
+        url (str): The requested URL (query string is ignored).
+
+    Returns:
+        str: The endpoint template used as the accounting key.
+    """
+    path = urlparse(url).path or "/"
+    path = _REPO_SEGMENT.sub("/repos/{owner}/{repo}", path)
+    path = _NUMERIC_SEGMENT.sub("/{n}", path)
+    return f"{method.upper()} {path}"
+
+
+class EndpointStats:
+    """
+    A class representing the accumulated statistics of one endpoint template.
+    """
+
+    def __init__(self):
+        self.calls: int = 0
+        self.statuses: dict[str, int] = {}
+        self.bytes_received: int = 0
+        self.total_latency_ms: float = 0.0
+        self.max_latency_ms: float = 0.0
+        self.latency_histogram: list[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, status: str, bytes_received: int, latency_ms: float) -> None:
+        """
+        Adds one call to the statistics.
+
+        Parameters:
+            status (str): The HTTP status code, or 'error' when no response was received.
+            bytes_received (int): The size of the response body.
+            latency_ms (float): The wall time of the call in milliseconds.
+
+        Returns:
+            None
+        """
+        self.calls += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes_received += bytes_received
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if latency_ms <= bound), len(LATENCY_BUCKETS_MS))
+        self.latency_histogram[bucket] += 1
+
+    def to_dict(self) -> dict:
+        """
+        Converts the statistics to a JSON-serializable dictionary.
+
+        Returns:
+            dict: The statistics with the histogram keyed by bucket label ('<=50ms', ..., '>5000ms').
+        """
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "calls": self.calls,
+            "statuses": dict(sorted(self.statuses.items())),
+            "bytes_received": self.bytes_received,
+            "total_latency_ms": round(self.total_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "latency_histogram": dict(zip(labels, self.latency_histogram)),
+        }
+
+
+class ApiCallStats:
+    """
+    A class representing the GitHub API usage of one run: per-endpoint counts, statuses, bytes and latencies,
+    and the rate limit reported by the last response.
+    """
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.rate_limit_remaining: Optional[int] = None
+        self.rate_limit_limit: Optional[int] = None
+
+    @property
+    def total_calls(self) -> int:
+        """The number of recorded calls across all endpoints."""
+        return sum(endpoint.calls for endpoint in self.endpoints.values())
+
+    @property
+    def total_bytes(self) -> int:
+        """The number of response bytes received across all endpoints."""
+        return sum(endpoint.bytes_received for endpoint in self.endpoints.values())
+
+    @property
+    def total_latency_ms(self) -> float:
+        """The summed wall time of all calls in milliseconds."""
+        return sum(endpoint.total_latency_ms for endpoint in self.endpoints.values())
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        status: Optional[int],
+        bytes_received: int,
+        latency_ms: float,
+        rate_limit_remaining: Optional[int] = None,
+        rate_limit_limit: Optional[int] = None,
+    ) -> None:
+        """
+        Records one API call.
+
+        Parameters:
+            method (str): The HTTP method.
+            url (str): The requested URL.
+            status (Optional[int]): The HTTP status code, None when the request failed without a response.
+            bytes_received (int): The size of the response body.
+            latency_ms (float): The wall time of the call in milliseconds.
+            rate_limit_remaining (Optional[int]): The X-RateLimit-Remaining header, when present.
+            rate_limit_limit (Optional[int]): The X-RateLimit-Limit header, when present.
+
+        Returns:
+            None
+        """
+        key = endpoint_template(method, url)
+        if key not in self.endpoints:
+            self.endpoints[key] = EndpointStats()
+        self.endpoints[key].record(str(status) if status is not None else "error", bytes_received, latency_ms)
+
+        if rate_limit_remaining is not None:
+            self.rate_limit_remaining = rate_limit_remaining
+        if rate_limit_limit is not None:
+            self.rate_limit_limit = rate_limit_limit
+
+    def to_dict(self) -> dict:
+        """
+        Converts the run totals and per-endpoint statistics to a JSON-serializable dictionary.
+
+        Returns:
+            dict: The API usage summary.
+        """
+        return {
+            "total_calls": self.total_calls,
+            "total_bytes_received": self.total_bytes,
+            "total_latency_ms": round(self.total_latency_ms, 1),
+            "rate_limit_remaining": self.rate_limit_remaining,
+            "rate_limit_limit": self.rate_limit_limit,
+            "endpoints": {key: self.endpoints[key].to_dict() for key in sorted(self.endpoints)},
+        }
+
+    def to_json(self) -> str:
+        """
+        Serializes the summary to a single-line JSON string.
+
+        Returns:
+            str: The JSON summary.
+        """
+        return json.dumps(self.to_dict())
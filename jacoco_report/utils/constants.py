@@ -35,6 +35,33 @@ FAIL_ON_THRESHOLD = "fail-on-threshold"
 DEBUG = "debug"
 
 BASELINE_PATHS = "baseline-paths"
+BASELINE_SNAPSHOT_DIR = "baseline-snapshot-dir"
+HISTORY_DB = "history-db"
+# base branch runs shown in the trend sparkline of the comment
+HISTORY_TREND_RUNS = 20
+MODE = "mode"
+PARTIAL_DIR = "partial-dir"
+
+API_TRANSPORT = "api-transport"
+API_STATS = "api-stats"
+TIMINGS = "timings"
+PROFILE = "profile"
+# directory receiving the profiling results when 'report-path' is not set
+DEFAULT_PROFILE_PATH = "jacoco-report-profile"
+MAX_MEMORY_MB = "max-memory-mb"
+
+STEP_SUMMARY = "step-summary"
+REPORT_PATH = "report-path"
+CHECK_RUN = "check-run"
+
+# GitHub rejects issue comment bodies longer than this (in characters)
+GITHUB_COMMENT_MAX_LENGTH = 65536
+
+# Checks API limits for the check-run sink
+CHECK_RUN_ANNOTATIONS_PER_REQUEST = 50
+CHECK_RUN_MAX_ANNOTATIONS = 500
+CHECK_RUN_RATE_LIMIT_RESERVE = 100
+CHECK_RUN_SUMMARY_MAX_LENGTH = 65535
 
 # fail-on-threshold values
 OVERALL = "overall"
@@ -43,5 +70,12 @@ CHANGED_FILE = "changed-file"
 
 # GitHub-injected metadata environment variables (no INPUT_ prefix)
 GITHUB_RUN_ID = "GITHUB_RUN_ID"
+GITHUB_SHA = "GITHUB_SHA"
+GITHUB_HEAD_REF = "GITHUB_HEAD_REF"
+GITHUB_BASE_REF = "GITHUB_BASE_REF"
+GITHUB_REF_NAME = "GITHUB_REF_NAME"
 GITHUB_RUN_STARTED_AT = "GITHUB_RUN_STARTED_AT"
 GITHUB_ACTION_REF = "GITHUB_ACTION_REF"
+GITHUB_API_URL = "GITHUB_API_URL"
+GITHUB_STEP_SUMMARY = "GITHUB_STEP_SUMMARY"
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
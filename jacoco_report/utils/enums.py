@@ -40,3 +40,33 @@ class FailOnThresholdEnum(StrEnum):
     CHANGED_FILES_AVERAGE = "changed-files-average"
     PER_CHANGED_FILE = "per-changed-file"
     FAIL_UNCHANGED = "fail-unchanged"
+
+
+class ApiTransportEnum(StrEnum):
+    """
+    A class representing the GitHub API transport enum.
+    """
+
+    REST = "rest"
+    GRAPHQL = "graphql"
+
+
+class ProfileEnum(StrEnum):
+    """
+    A class representing the run profiling mode enum.
+    """
+
+    NONE = "none"
+    CPU = "cpu"
+    MEMORY = "memory"
+    ALL = "all"
+
+
+class ModeEnum(StrEnum):
+    """
+    A class representing the run mode enum: one job, or the shards and the merge job of a matrix build.
+    """
+
+    SINGLE = "single"
+    PARTIAL = "partial"
+    MERGE = "merge"
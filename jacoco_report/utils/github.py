@@ -6,45 +6,119 @@ import json
 import logging
 import os
 import re
+import time
 
-from typing import Optional
-import requests
-from requests import Session
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from jacoco_report.utils.api_stats import ApiCallStats
+from jacoco_report.utils.constants import DEFAULT_GITHUB_API_URL
+
+if TYPE_CHECKING:
+    # 'requests' is imported when the first API request is sent; early-exit runs never load it
+    import requests
 
 logger = logging.getLogger(__name__)
 
+# One query returns changed files, the action's comments and the base/head SHAs. Connections that are already
+# exhausted are skipped on follow-up pages via the @include directives.
+_PR_CONTEXT_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $filesCursor: String, $commentsCursor: String,
+      $withFiles: Boolean!, $withComments: Boolean!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      baseRefOid
+      headRefOid
+      files(first: 100, after: $filesCursor) @include(if: $withFiles) {
+        pageInfo { hasNextPage endCursor }
+        nodes { path }
+      }
+      comments(first: 100, after: $commentsCursor) @include(if: $withComments) {
+        pageInfo { hasNextPage endCursor }
+        nodes { databaseId body }
+      }
+    }
+  }
+}
+"""
+
+
+def _int_header(response: "requests.Response", name: str) -> Optional[int]:
+    """
+    Reads an integer response header.
+
+    Parameters:
+        response (requests.Response): The response.
+        name (str): The header name.
+
+    Returns:
+        Optional[int]: The header value, or None when it is missing or not an integer.
+    """
+    value = response.headers.get(name)
+    return int(value) if isinstance(value, str) and value.isdigit() else None
+
+
+def is_action_comment(comment: dict, comment_marker: str) -> bool:
+    """
+    Return whether a comment is the action's: its body starts with the marker (the bold title).
+
+    Both API transports select comments by this rule, so a pull request updates the same comment whichever
+    transport read it.
+    """
+    return bool(comment_marker) and (comment.get("body") or "").startswith(comment_marker)
+
+
+def find_action_comment(comments: Iterable[dict], comment_marker: str) -> Optional[dict]:
+    """Return the first comment of the action (see is_action_comment), None when there is none."""
+    return next((comment for comment in comments if is_action_comment(comment, comment_marker)), None)
+
+
+class PullRequestContext:
+    """
+    A class representing the pull request data fetched in one batched GraphQL query.
+    """
+
+    def __init__(self, changed_files: list[str], comments: list[dict], base_sha: str, head_sha: str):
+        self.changed_files: list[str] = changed_files
+        # REST-shaped ({"id", "body"}) comments starting with the marker, in pull request order.
+        self.comments: list[dict] = comments
+        self.base_sha: str = base_sha
+        self.head_sha: str = head_sha
+
 
 class GitHub:
     """
     A class representing the GitHub API.
     """
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, api_url: str = DEFAULT_GITHUB_API_URL, api_stats: Optional[ApiCallStats] = None):
         """
         Initializes the GitHub API object.
 
         Parameters:
             token (str): The GitHub token.
+            api_url (str): The base URL of the GitHub REST API (GITHUB_API_URL on runners).
+            api_stats (Optional[ApiCallStats]): The accounting of sent requests; a new one is created when omitted.
 
         Returns:
             None
         """
         self.__token = token
-        self.__session: Optional[Session] = None
-        self.__gh_url = "https://api.github.com"
+        self.__session: Optional["requests.Session"] = None
+        self.__gh_url = (api_url or DEFAULT_GITHUB_API_URL).rstrip("/")
+        self.api_stats: ApiCallStats = api_stats if api_stats is not None else ApiCallStats()
 
-    def __initialize_request_session(self) -> requests.Session:
+    def __initialize_request_session(self) -> "requests.Session":
         """
         Initializes the request Session and updates the headers.
 
         Returns:
             requests.Session: The initialized request Session.
         """
+        import requests
 
         self.__session = requests.Session()
         headers = {
             "Authorization": f"Bearer {self.__token}",
-            "Host": "api.github.com",
         }
         self.__session.headers.update(headers)
 
@@ -104,9 +178,80 @@ class GitHub:
         logger.info("List of changed files in PR: %s", file_list)
         return file_list
 
+    def get_pr_context(self, pr_number: int, comment_marker: str) -> Optional[PullRequestContext]:
+        """
+        Gets changed files, the action's existing comments and the base/head SHAs in one GraphQL query.
+
+        Parameters:
+            pr_number (int): The PR number.
+            comment_marker (str): The prefix identifying the action's comment (the bold title).
+
+        Returns:
+            Optional[PullRequestContext]: The pull request context, or None when the query fails.
+        """
+        repo = os.getenv("GITHUB_REPOSITORY") or ""
+        owner, _, name = repo.partition("/")
+        if not owner or not name:
+            logger.error("GitHub - Cannot run GraphQL query, invalid repository: '%s'.", repo)
+            return None
+
+        api_url = f"{self.__gh_url}/graphql"
+        variables: dict = {
+            "owner": owner,
+            "name": name,
+            "number": pr_number,
+            "filesCursor": None,
+            "commentsCursor": None,
+            "withFiles": True,
+            "withComments": True,
+        }
+        file_list: list[str] = []
+        comments: list[dict] = []
+        base_sha = head_sha = ""
+        page = 1
+
+        while variables["withFiles"] or variables["withComments"]:
+            logger.debug("GitHub - GraphQL URL: %s, Page: %d", api_url, page)
+            response = self.send_request("POST", api_url, data={"query": _PR_CONTEXT_QUERY, "variables": variables})
+            if response is None:
+                logger.error("Failed to get the pull request context via GraphQL.")
+                return None
+
+            payload = response.json()
+            pull_request = ((payload.get("data") or {}).get("repository") or {}).get("pullRequest")
+            if payload.get("errors") or pull_request is None:
+                logger.error("GraphQL query for the pull request context failed: %s", payload.get("errors"))
+                return None
+
+            base_sha = pull_request.get("baseRefOid") or base_sha
+            head_sha = pull_request.get("headRefOid") or head_sha
+
+            if variables["withFiles"]:
+                files = pull_request["files"]
+                file_list.extend(node["path"] for node in files["nodes"] if node.get("path"))
+                variables["withFiles"] = files["pageInfo"]["hasNextPage"]
+                variables["filesCursor"] = files["pageInfo"]["endCursor"]
+
+            if variables["withComments"]:
+                page_comments = pull_request["comments"]
+                comments.extend(
+                    {"id": node["databaseId"], "body": node["body"]}
+                    for node in page_comments["nodes"]
+                    if is_action_comment(node, comment_marker)
+                )
+                variables["withComments"] = page_comments["pageInfo"]["hasNextPage"]
+                variables["commentsCursor"] = page_comments["pageInfo"]["endCursor"]
+
+            page += 1
+
+        logger.info("List of changed files in PR: %s", file_list)
+        logger.info("Retrieved %d matching comments from the PR in %d GraphQL page(s).", len(comments), page - 1)
+        logger.debug("GitHub - base SHA: %s, head SHA: %s", base_sha, head_sha)
+        return PullRequestContext(file_list, comments, base_sha, head_sha)
+
     def send_request(
         self, method: str, url: str, data: Optional[dict] = None, params: Optional[dict] = None
-    ) -> Optional[requests.Response]:
+    ) -> Optional["requests.Response"]:
         """
         Sends a request to the GitHub API.
 
@@ -119,6 +264,9 @@ class GitHub:
         Returns:
             Optional[requests.Response]: The response from the API.
         """
+        import requests
+
+        started = time.perf_counter()
         try:
             if self.__session is None:
                 self.__session = self.__initialize_request_session()
@@ -128,19 +276,18 @@ class GitHub:
             # Fetch the response from the API
             if method == "GET":
                 response = session.get(url, params=params)
-                response.raise_for_status()
             elif method == "POST":
                 response = session.post(url, params=params, json=data)
-                response.raise_for_status()
             elif method == "PATCH":
                 response = session.patch(url, params=params, json=data)
-                response.raise_for_status()
             elif method == "DELETE":
                 response = session.delete(url, params=params, json=data)
-                response.raise_for_status()
             else:
                 logger.error("Unsupported HTTP method: %s.", method)
+                return None
 
+            self.__record_call(method, url, response, started)
+            response.raise_for_status()
             return response
 
         # Specific error handling for HTTP errors
@@ -148,10 +295,41 @@ class GitHub:
             logger.error("HTTP error occurred: %s.", http_err, exc_info=True)
 
         except requests.RequestException as req_err:
+            self.__record_call(method, url, None, started)
             logger.error("An error occurred: %s.", req_err, exc_info=True)
 
         return None
 
+    def __record_call(self, method: str, url: str, response: Optional["requests.Response"], started: float) -> None:
+        """
+        Adds one sent request to the API call statistics.
+
+        Parameters:
+            method (str): The HTTP method used.
+            url (str): The URL of the API endpoint.
+            response (Optional[requests.Response]): The received response, None when the request failed.
+            started (float): The perf_counter value taken before sending the request.
+
+        Returns:
+            None
+        """
+        latency_ms = (time.perf_counter() - started) * 1000
+        if response is None:
+            self.api_stats.record(method, url, None, 0, latency_ms)
+            return
+
+        status = response.status_code if isinstance(response.status_code, int) else None
+        content = response.content if isinstance(response.content, bytes) else b""
+        self.api_stats.record(
+            method,
+            url,
+            status,
+            len(content),
+            latency_ms,
+            rate_limit_remaining=_int_header(response, "X-RateLimit-Remaining"),
+            rate_limit_limit=_int_header(response, "X-RateLimit-Limit"),
+        )
+
     def get_pr_number(self) -> Optional[int]:
         """
         Gets the PR number from the environment variables.
@@ -318,3 +496,100 @@ class GitHub:
 
         logger.info("Successfully deleted the comment with ID %d.", comment_id)
         return True
+
+    def get_pr_head_sha(self) -> Optional[str]:
+        """
+        Gets the head commit SHA of the pull request from the GitHub event payload file.
+
+        Returns:
+            Optional[str]: The head SHA, or None when the payload is missing or not a pull request event.
+        """
+        return self._get_pr_event_sha("head")
+
+    def get_pr_base_sha(self) -> Optional[str]:
+        """
+        Gets the base commit SHA of the pull request from the GitHub event payload file.
+
+        Returns:
+            Optional[str]: The base SHA, or None when the payload is missing or not a pull request event.
+        """
+        return self._get_pr_event_sha("base")
+
+    @staticmethod
+    def _get_pr_event_sha(ref: str) -> Optional[str]:
+        """Read pull_request.<ref>.sha from the GitHub event payload file."""
+        event_path = os.getenv("GITHUB_EVENT_PATH")
+        if event_path is None:
+            logger.error("GITHUB_EVENT_PATH environment variable is not set.")
+            return None
+
+        try:
+            with open(event_path, "r", encoding="utf-8") as f:
+                event_data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error("Failed to read the GitHub event payload: %s", e)
+            return None
+
+        sha = ((event_data.get("pull_request") or {}).get(ref) or {}).get("sha")
+        if not sha:
+            logger.error("Pull request %s SHA not found in the event payload.", ref)
+            return None
+
+        return str(sha)
+
+    def create_check_run(self, name: str, head_sha: str, conclusion: str, output: dict) -> Optional[int]:
+        """
+        Creates a completed check run on the commit.
+
+        Parameters:
+            name (str): The check run name.
+            head_sha (str): The commit SHA the check run belongs to.
+            conclusion (str): The check run conclusion (success, failure, neutral, ...).
+            output (dict): The check run output (title, summary and up to 50 annotations).
+
+        Returns:
+            Optional[int]: The ID of the created check run, or None on failure.
+        """
+        repo = os.getenv("GITHUB_REPOSITORY")
+
+        api_url = f"{self.__gh_url}/repos/{repo}/check-runs"
+        logger.debug("GitHub - Create Check Run URL: %s", api_url)
+
+        payload = {
+            "name": name,
+            "head_sha": head_sha,
+            "status": "completed",
+            "conclusion": conclusion,
+            "output": output,
+        }
+        response = self.send_request("POST", api_url, data=payload)
+        if response is None:
+            logger.error("Failed to create the check run.")
+            return None
+
+        check_run_id = response.json().get("id")
+        logger.info("Check run %s created.", check_run_id)
+        return int(check_run_id) if check_run_id is not None else None
+
+    def update_check_run(self, check_run_id: int, output: dict) -> bool:
+        """
+        Updates the output of a check run; annotations in the output are appended to the existing ones.
+
+        Parameters:
+            check_run_id (int): The ID of the check run.
+            output (dict): The check run output (title, summary and up to 50 annotations).
+
+        Returns:
+            bool: True if the check run was updated successfully, False otherwise.
+        """
+        repo = os.getenv("GITHUB_REPOSITORY")
+
+        api_url = f"{self.__gh_url}/repos/{repo}/check-runs/{check_run_id}"
+        logger.debug("GitHub - Update Check Run URL: %s", api_url)
+
+        response = self.send_request("PATCH", api_url, data={"output": output})
+        if response is None:
+            logger.error("Failed to update the check run with ID %d.", check_run_id)
+            return False
+
+        return True
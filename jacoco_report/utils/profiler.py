@@ -0,0 +1,133 @@
+"""
+This module contains the opt-in profiling of one action run: a cProfile CPU profile and the top tracemalloc allocations.
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import tracemalloc
+from typing import Callable, Optional
+
+from jacoco_report.utils.enums import ProfileEnum
+
+logger = logging.getLogger(__name__)
+
+CPU_PROFILE_FILE_NAME = "profile.pstats"
+MEMORY_PROFILE_FILE_NAME = "memory-profile.txt"
+# number of allocation sites listed in the memory profile and of functions logged from the CPU profile
+TOP_ENTRIES = 25
+# tracemalloc frames kept per allocation
+TRACEMALLOC_FRAMES = 5
+# only allocations made in this package are listed in the memory profile
+_PACKAGE_FILTER = os.path.join("*", "jacoco_report", "*")
+
+
+class RunProfiler:
+    """
+    A class capturing the CPU profile and/or the memory allocations of the code run within it.
+
+    Usage:
+        with RunProfiler(mode, directory):
+            jr.run()
+
+    The profilers are started only when enabled, so 'none' costs nothing.
+    """
+
+    def __init__(self, mode: str, directory: str):
+        """
+        Parameters:
+            mode (str): The profiling mode: 'none', 'cpu', 'memory' or 'all'.
+            directory (str): The directory receiving the profile files; created when missing.
+        """
+        self.mode: str = mode
+        self.directory: str = directory
+        self.written_paths: list[str] = []
+        self._cpu_profiler: Optional[cProfile.Profile] = None
+
+    @property
+    def cpu(self) -> bool:
+        """Whether the CPU profile is captured."""
+        return self.mode in (ProfileEnum.CPU, ProfileEnum.ALL)
+
+    @property
+    def memory(self) -> bool:
+        """Whether the memory allocations are captured."""
+        return self.mode in (ProfileEnum.MEMORY, ProfileEnum.ALL)
+
+    def __enter__(self) -> "RunProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Starts the enabled profilers.
+
+        Returns:
+            None
+        """
+        if self.memory:
+            logger.info("Memory profiling enabled (tracemalloc).")
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        if self.cpu:
+            logger.info("CPU profiling enabled (cProfile).")
+            self._cpu_profiler = cProfile.Profile()
+            self._cpu_profiler.enable()
+
+    def stop(self) -> list[str]:
+        """
+        Stops the enabled profilers and writes their results; a write failure is logged as a warning.
+
+        Returns:
+            list[str]: The paths of the written profile files.
+        """
+        cpu_profiler = self._cpu_profiler
+        if cpu_profiler is not None:
+            cpu_profiler.disable()
+            self._write(CPU_PROFILE_FILE_NAME, lambda path: self._write_cpu_profile(cpu_profiler, path))
+            self._cpu_profiler = None
+        if self.memory:
+            if tracemalloc.is_tracing():
+                self._write(MEMORY_PROFILE_FILE_NAME, self._write_memory_profile)
+                tracemalloc.stop()
+        return self.written_paths
+
+    def _write(self, file_name: str, writer: Callable[[str], None]) -> None:
+        path = os.path.join(self.directory, file_name)
+        try:
+            os.makedirs(self.directory or ".", exist_ok=True)
+            writer(path)
+        except OSError as e:
+            logger.warning("Failed to write the profile '%s': %s", path, e)
+            return
+
+        self.written_paths.append(path)
+        logger.info("Profile written to '%s'.", path)
+
+    @staticmethod
+    def _write_cpu_profile(cpu_profiler: cProfile.Profile, path: str) -> None:
+        cpu_profiler.dump_stats(path)
+        if logger.isEnabledFor(logging.DEBUG):
+            stream = io.StringIO()
+            pstats.Stats(cpu_profiler, stream=stream).sort_stats("cumulative").print_stats(TOP_ENTRIES)
+            logger.debug("CPU profile, top %d functions by cumulative time:\n%s", TOP_ENTRIES, stream.getvalue())
+
+    @staticmethod
+    def _write_memory_profile(path: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, _PACKAGE_FILTER)])
+        lines = [
+            f"Traced memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB",
+            "",
+            "Allocations by jacoco_report module:",
+            *(f"  {stat}" for stat in snapshot.statistics("filename")[:TOP_ENTRIES]),
+            "",
+            f"Top {TOP_ENTRIES} allocation sites:",
+            *(f"  {stat}" for stat in snapshot.statistics("lineno")[:TOP_ENTRIES]),
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
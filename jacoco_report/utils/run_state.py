@@ -0,0 +1,20 @@
+"""
+This module contains the RunState class, the measurements of one action run published besides its coverage results.
+"""
+
+from jacoco_report.utils.api_stats import ApiCallStats
+from jacoco_report.utils.timing import StageTimings
+
+
+class RunState:
+    """
+    A class holding what a run measures besides the coverage of its primary metric: the per-metric totals, the
+    GitHub API call statistics and the stage timings. main.py publishes each as an action output.
+    """
+
+    def __init__(self):
+        # per-metric totals as JSON keyed by metric (the primary metric included)
+        self.metrics_coverage: str = "{}"
+        self.api_stats: ApiCallStats = ApiCallStats()
+        # wall time, counts and bytes read per stage of the run
+        self.timings: StageTimings = StageTimings()
@@ -0,0 +1,145 @@
+"""
+This module contains the parsing and validation of the threshold inputs: 'global-thresholds',
+'report-thresholds-default' and the 'thresholds' of the report groups, each optionally given per metric.
+"""
+
+import logging
+from typing import Optional
+
+from jacoco_report.utils.enums import MetricTypeEnum
+
+logger = logging.getLogger(__name__)
+
+
+def split_metric_thresholds(value: str) -> dict[str, str]:
+    """
+    Split a thresholds value into threshold strings keyed by metric.
+
+    The value is either one 'O*A[*P]' string applying to every metric, or comma- or newline-separated
+    'metric:O*A[*P]' entries. An entry without a metric prefix is stored under '' and applies to the
+    metrics without their own entry.
+    """
+    entries: dict[str, str] = {}
+    for item in (v.strip() for line in value.splitlines() for v in line.split(",")):
+        if not item:
+            continue
+        metric, separator, thresholds = item.rpartition(":")
+        entries[metric.strip().lower() if separator else ""] = thresholds.strip()
+    return entries
+
+
+def thresholds_for_metric(value: str, metric: str, default_value: str) -> str:
+    """Return the threshold string of one metric from a (possibly per-metric) thresholds value."""
+    entries = split_metric_thresholds(value)
+    if not entries:
+        return value
+    return entries.get(metric, entries.get("", default_value))
+
+
+def to_threshold_float(value: str, label: str) -> float:
+    """Convert one threshold component to float; an empty or invalid component is 0.0."""
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        logger.warning("Cannot convert '%s' part ('%s') to float. Defaulting to 0.0.", label, value)
+        return 0.0
+
+
+def parse_group_thresholds(value: str) -> tuple[Optional[float], Optional[float], Optional[float]]:
+    """Parse one group 'O*A*P' entry; empty fields are None (inherited from report-thresholds-default)."""
+    parts = value.split("*")
+    overall = float(parts[0]) if parts[0] else None
+    changed = float(parts[1]) if parts[1] else None
+    per_file = float(parts[2]) if parts[2] else None
+    return overall, changed, per_file
+
+
+def is_valid_threshold_float(value: str) -> bool:
+    """Return whether a threshold component is a float in [0, 100)."""
+    try:
+        f = float(value)
+        return 0.0 <= f < 100.0
+    except ValueError:
+        return False
+
+
+def validate_threshold_metric(label: str, metric: str) -> list[str]:
+    """Validate the metric prefix of one per-metric thresholds entry ('' is the unprefixed default)."""
+    if metric and metric not in MetricTypeEnum:
+        return [
+            f"{label} uses unknown metric '{metric}'; use one of: 'instruction', "
+            "'line', 'branch', 'complexity', 'method', 'class'."
+        ]
+    return []
+
+
+def validate_group_thresholds(prefix: str, thresholds: str) -> list[str]:
+    """Validate the 'thresholds' value of one report group, one O*A*P entry per metric."""
+    errors: list[str] = []
+    for metric, value in split_metric_thresholds(thresholds).items():
+        label = f"{prefix} 'thresholds'" + (f" for '{metric}'" if metric else "")
+        errors.extend(validate_threshold_metric(label, metric))
+        parts = value.split("*")
+        if len(parts) != 3:
+            errors.append(f"{label} must be in format 'O*A*P' (e.g. '80*70*60').")
+            continue
+        for component, v in zip(("overall", "changed-files-average", "changed-file"), parts):
+            if v and not is_valid_threshold_float(v):
+                errors.append(f"{label} {component} value '{v}' must be a float in [0, 100).")
+    return errors
+
+
+def validate_global_thresholds(global_thresholds: str) -> list[str]:
+    """Validate the 'global-thresholds' input, one O*A entry per metric."""
+    if not isinstance(global_thresholds, str):
+        return ["'global-thresholds' must be a string or not defined."]
+    if "*" not in global_thresholds:
+        return [
+            "'global-thresholds' must be in the format 'overall*changed-files-average'. "
+            "Where overall is the minimum coverage overall and changed-files-average is the minimum average "
+            "coverage of changed files."
+        ]
+
+    errors: list[str] = []
+    for metric, value in split_metric_thresholds(global_thresholds).items():
+        label = "'global-thresholds'" + (f" for '{metric}'" if metric else "")
+        errors.extend(validate_threshold_metric(label, metric))
+        parts = value.split("*")
+        if len(parts) != 2:
+            errors.append(f"{label} must be in the format 'overall*changed-files-average' with exactly two components.")
+            continue
+        for component, part in zip(("overall", "changed-files-average"), parts):
+            if not is_valid_threshold_float(part):
+                errors.append(f"{label} {component} value must be a float between 0 and 100.")
+    return errors
+
+
+def validate_report_thresholds_default(report_thresholds_default: str) -> list[str]:
+    """Validate the 'report-thresholds-default' input, one O*A*P entry per metric."""
+    if not isinstance(report_thresholds_default, str):
+        return ["'report-thresholds-default' must be a string or not defined."]
+    if "*" not in report_thresholds_default:
+        return ["'report-thresholds-default' must be in the format 'overall*changed-files-average*per-changed-file'."]
+
+    errors: list[str] = []
+    for metric, value in split_metric_thresholds(report_thresholds_default).items():
+        label = "'report-thresholds-default'" + (f" for '{metric}'" if metric else "")
+        errors.extend(validate_threshold_metric(label, metric))
+        if value.count("*") == 1:
+            logger.warning(
+                "%s should be in the format 'overall*changed-files-average*per-changed-file'. "
+                "Adding default value for per-changed-file threshold.",
+                label,
+            )
+            value += "*0.0"
+        parts = value.split("*")
+        if len(parts) != 3:
+            errors.append(
+                f"{label} must be in the format 'overall*changed-files-average*per-changed-file' "
+                "with exactly three components."
+            )
+            continue
+        for component, part in zip(("overall", "changed-files-average", "per-changed-file"), parts):
+            if not is_valid_threshold_float(part):
+                errors.append(f"{label} {component} value must be a float between 0 and 100.")
+    return errors
@@ -0,0 +1,164 @@
+"""
+This module contains the stage timings of one action run: wall time, call counts and bytes read per stage.
+"""
+
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+# the run profile file written into the 'report-path' directory
+RUN_PROFILE_FILE_NAME = "run-profile.json"
+
+
+class StageStats:
+    """
+    A class representing the accumulated statistics of one stage.
+    """
+
+    def __init__(self):
+        self.calls: int = 0
+        self.total_ms: float = 0.0
+        self.max_ms: float = 0.0
+        self.counters: dict[str, int] = {}
+
+    def record(self, duration_ms: float) -> None:
+        """
+        Adds one execution of the stage.
+
+        Parameters:
+            duration_ms (float): The wall time of the execution in milliseconds.
+
+        Returns:
+            None
+        """
+        self.calls += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the statistics to a JSON-serializable dictionary.
+
+        Returns:
+            dict: The calls, total and max duration and the counters of the stage.
+        """
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            **dict(sorted(self.counters.items())),
+        }
+
+
+class StageTimings:
+    """
+    A class representing the run profile: the stages in the order they first ran, with their durations and counters.
+    """
+
+    def __init__(self):
+        self.stages: dict[str, StageStats] = {}
+
+    @property
+    def total_ms(self) -> float:
+        """The summed wall time of all stages in milliseconds."""
+        return sum(stage.total_ms for stage in self.stages.values())
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[StageStats]:
+        """
+        Times one execution of a stage; the duration is recorded also when the stage raises.
+
+        Parameters:
+            name (str): The stage name, e.g. 'parse'.
+
+        Returns:
+            Iterator[StageStats]: The statistics of the stage.
+        """
+        stage = self._stage(name)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.record((time.perf_counter() - start) * 1000)
+
+    def add(self, name: str, **counters: int) -> None:
+        """
+        Adds to the counters of a stage, e.g. add('parse', reports=1, bytes_read=2048).
+
+        Parameters:
+            name (str): The stage name.
+            counters (int): The increments keyed by counter name.
+
+        Returns:
+            None
+        """
+        stage = self._stage(name)
+        for counter, value in counters.items():
+            stage.counters[counter] = stage.counters.get(counter, 0) + value
+
+    def to_dict(self) -> dict:
+        """
+        Converts the run profile to a JSON-serializable dictionary.
+
+        Returns:
+            dict: The total wall time and the per-stage statistics.
+        """
+        return {
+            "total_ms": round(self.total_ms, 1),
+            "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+        }
+
+    def to_json(self) -> str:
+        """
+        Serializes the run profile to a single-line JSON string.
+
+        Returns:
+            str: The JSON run profile.
+        """
+        return json.dumps(self.to_dict())
+
+    def write(self, path: str) -> bool:
+        """
+        Writes the run profile as indented JSON; a failure is logged as a warning.
+
+        Parameters:
+            path (str): The file path; missing directories are created.
+
+        Returns:
+            bool: True when the file was written.
+        """
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=4)
+        except OSError as e:
+            logger.warning("Failed to write the run profile '%s': %s", path, e)
+            return False
+
+        logger.info("Run profile written to '%s'.", path)
+        return True
+
+    def summary(self) -> str:
+        """
+        Formats the run profile as a human-readable breakdown, one stage per line.
+
+        Returns:
+            str: The breakdown.
+        """
+        lines = [f"Run profile: {self.total_ms:.1f} ms in {len(self.stages)} stage(s)"]
+        for name, stage in self.stages.items():
+            counters = "".join(f", {counter}={value}" for counter, value in sorted(stage.counters.items()))
+            lines.append(
+                f"  {name:<16} {stage.total_ms:>10.1f} ms  calls={stage.calls}, max={stage.max_ms:.1f} ms{counters}"
+            )
+        return "\n".join(lines)
+
+    def _stage(self, name: str) -> StageStats:
+        if name not in self.stages:
+            self.stages[name] = StageStats()
+        return self.stages[name]
@@ -3,13 +3,18 @@ The main module to run the JaCoCo GitHub Action adding the Json report to the pu
 """
 
 import logging
+import os
 import sys
 
+from jacoco_report.action_config import ActionConfig
 from jacoco_report.action_inputs import ActionInputs
 from jacoco_report.jacoco_report import JaCoCoReport
+from jacoco_report.utils.constants import DEFAULT_PROFILE_PATH
 from jacoco_report.utils.enums import FailOnThresholdEnum
 from jacoco_report.utils.gh_action import set_action_output, set_action_failed, set_action_output_text
 from jacoco_report.utils.logging_config import setup_logging
+from jacoco_report.utils.profiler import RunProfiler
+from jacoco_report.utils.timing import RUN_PROFILE_FILE_NAME
 
 
 def run() -> None:
@@ -25,12 +30,16 @@ def run() -> None:
 
     # Validate the action inputs
     ActionInputs().validate_inputs()
+    # Parse the validated inputs once; every subsystem reads this snapshot
+    config = ActionConfig.from_inputs()
 
     logger.info("Starting JaCoCo Report GitHub Action.")
 
     # Generate the Living documentation
-    jr = JaCoCoReport()
-    jr.run()
+    jr = JaCoCoReport(config)
+    # profile files go next to the report files so one upload-artifact step collects both
+    with RunProfiler(config.outputs.profile, config.outputs.report_path or DEFAULT_PROFILE_PATH):
+        jr.run()
 
     # Set the output for the GitHub Action
     set_action_output("coverage-overall", str(jr.total_overall_coverage))
@@ -39,6 +48,7 @@ def run() -> None:
     set_action_output("coverage-changed-files-passed", str(jr.total_changed_files_coverage_passed))
     set_action_output_text("reports-coverage", jr.evaluated_coverage_reports)
     set_action_output_text("groups-coverage", jr.evaluated_coverage_groups)
+    set_action_output_text("metrics-coverage", jr.run_state.metrics_coverage)
 
     logger.debug("Action output 'coverage-overall' set to: %s", jr.total_overall_coverage)
     logger.debug("Action output 'coverage-changed-files' set to: %s", jr.total_changed_files_coverage)
@@ -46,9 +56,24 @@ def run() -> None:
     logger.debug("Action output 'coverage-changed-files-passed' set to: %s", jr.total_changed_files_coverage_passed)
     logger.debug("Action output 'reports-coverage' set to: %s", jr.evaluated_coverage_reports)
     logger.debug("Action output 'groups-coverage' set to: %s", jr.evaluated_coverage_groups)
+    logger.debug("Action output 'metrics-coverage' set to: %s", jr.run_state.metrics_coverage)
+
+    api_stats = jr.run_state.api_stats.to_json()
+    logger.info("GitHub API usage summary: %s", api_stats)
+    if config.outputs.api_stats:
+        set_action_output_text("api-stats", api_stats)
+        logger.debug("Action output 'api-stats' set to: %s", api_stats)
+
+    logger.debug("%s", jr.run_state.timings.summary())
+    if config.outputs.timings:
+        timings = jr.run_state.timings.to_json()
+        set_action_output_text("timings", timings)
+        logger.debug("Action output 'timings' set to: %s", timings)
+    if config.outputs.report_path:
+        jr.run_state.timings.write(os.path.join(config.outputs.report_path, RUN_PROFILE_FILE_NAME))
 
     if len(jr.violations) > 0:
-        thresholds = ActionInputs.get_fail_on_threshold()
+        thresholds = config.fail_on_threshold
 
         # Map enum values to the corresponding evaluation flags
         threshold_checks = {
@@ -0,0 +1,183 @@
+"""
+Scaling benchmarks of the scan, parse, evaluate and render stages over synthetic workspaces.
+
+Usage: python -m tests.benchmarks.bench --sizes small medium --repeat 3 --output benchmark-results.json
+
+Every stage runs 'repeat' times for the wall time (best and median) and once more under tracemalloc
+for its peak traced memory. The stages run in the workspace directory, as the action does in a checkout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Optional, Sequence, TypeVar
+from unittest import mock
+
+from jacoco_report.action_config import ActionConfig
+from jacoco_report.evaluator.coverage_evaluator import CoverageEvaluator
+from jacoco_report.jacoco_report import JaCoCoReport
+from jacoco_report.model.report_file_coverage import ReportFileCoverage
+from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
+from jacoco_report.scanner.jacoco_report_input_scanner import JaCoCoReportInputScanner
+from jacoco_report.utils.enums import CommentLevelEnum
+from tests.benchmarks.synthetic import REPORT_GLOB, SIZES, SyntheticWorkspace, generate_workspace
+
+STAGES: tuple[str, ...] = ("scan", "parse", "evaluate", "render")
+
+T = TypeVar("T")
+
+
+def benchmark_config() -> ActionConfig:
+    """Return the action configuration of the benchmarks: full comment, instruction metric, no thresholds."""
+    env = {
+        "INPUT_TOKEN": "benchmark",
+        "INPUT_PATHS": REPORT_GLOB,
+        "INPUT_COMMENT_LEVEL": CommentLevelEnum.FULL,
+        "GITHUB_REPOSITORY": "owner/repo",
+        "GITHUB_EVENT_NAME": "pull_request",
+    }
+    with mock.patch.dict(os.environ, env):
+        return ActionConfig.from_inputs()
+
+
+def measure(stage: Callable[[], T], repeat: int) -> tuple[T, dict]:
+    """
+    Run a stage 'repeat' times for its wall time and once under tracemalloc for its peak memory.
+
+    Returns:
+        tuple[T, dict]: The result of the stage and its best_ms, median_ms and peak_kib.
+    """
+    durations: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = stage()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, {
+        "best_ms": round(min(durations), 3),
+        "median_ms": round(statistics.median(durations), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def benchmark_workspace(workspace: SyntheticWorkspace, repeat: int = 3) -> dict:
+    """
+    Benchmark every stage over one workspace.
+
+    Parameters:
+        workspace (SyntheticWorkspace): The generated workspace.
+        repeat (int): The number of timed runs per stage.
+
+    Returns:
+        dict: The workspace shape and the statistics per stage.
+    """
+    config = benchmark_config()
+    stages: dict[str, dict] = {}
+    with contextlib.chdir(workspace.root):
+        report_paths, stages["scan"] = measure(lambda: JaCoCoReportInputScanner([REPORT_GLOB], []).scan(), repeat)
+
+        def parse() -> list[ReportFileCoverage]:
+            # a new parser per run, so every run pays for indexing the source tree as the action does
+            parser = JaCoCoReportParser(workspace.changed_files)
+            return [parser.parse(path) for path in sorted(report_paths)]
+
+        reports, stages["parse"] = measure(parse, repeat)
+
+        def evaluate() -> CoverageEvaluator:
+            evaluator = CoverageEvaluator(
+                report_files_coverage=reports,
+                global_min_coverage_overall=config.thresholds.global_overall,
+                global_min_coverage_changed_files=config.thresholds.global_changed_files_average,
+                report_thresholds_default=config.thresholds.report_default,
+                metric=config.metric,
+            )
+            evaluator.evaluate()
+            return evaluator
+
+        _, stages["evaluate"] = measure(evaluate, repeat)
+
+        jr = JaCoCoReport(config)
+        analysis = jr.analyse(sorted(report_paths), workspace.changed_files)
+        if analysis is None:
+            raise RuntimeError(f"The workspace '{workspace.root}' has no report to render.")
+        _, stages["render"] = measure(lambda: jr.create_generator(analysis).render_body(config.comment.comment_level), repeat)
+
+    return {
+        "modules": workspace.size.modules,
+        "packages": workspace.size.packages,
+        "files": workspace.size.files,
+        "sourcefiles": workspace.size.sourcefiles,
+        "changed_files": len(workspace.changed_files),
+        "report_bytes": workspace.report_bytes,
+        "stages": stages,
+    }
+
+
+def run_benchmarks(sizes: Sequence[str], repeat: int = 3, seed: int = 0, workdir: Optional[str] = None) -> dict:
+    """
+    Generate a workspace per size and benchmark it.
+
+    Parameters:
+        sizes (Sequence[str]): Names from SIZES.
+        repeat (int): The number of timed runs per stage.
+        seed (int): The seed of the synthetic workspaces.
+        workdir (Optional[str]): The directory receiving the workspaces; a temporary one when None.
+
+    Returns:
+        dict: The environment and the results keyed by size.
+    """
+    results: dict = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "sizes": {},
+    }
+    with tempfile.TemporaryDirectory(dir=workdir) as directory:
+        for name in sizes:
+            workspace = generate_workspace(Path(directory) / name, SIZES[name], seed=seed)
+            results["sizes"][name] = benchmark_workspace(workspace, repeat)
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmarks from the command line and save the results as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks.bench", description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"])
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", help="Directory for the generated workspaces (default: system temp).")
+    parser.add_argument("--output", default="benchmark-results.json", help="JSON results file.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    results = run_benchmarks(args.sizes, args.repeat, args.seed, args.workdir)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    for name, result in results["sizes"].items():
+        timings = ", ".join(f"{stage}={stats['best_ms']:.1f} ms" for stage, stats in result["stages"].items())
+        print(f"{name} ({result['sourcefiles']} sourcefiles): {timings}")
+    print(f"Results written to '{args.output}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
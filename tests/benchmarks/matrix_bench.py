@@ -0,0 +1,129 @@
+"""
+Benchmark of the changed-file evaluation: one Coverage object at a time versus whole MetricMatrix columns.
+
+Usage: python -m tests.benchmarks.matrix_bench --files 50000 --reports 10 --repeat 5
+
+The 'objects' path evaluates every changed file through Coverage.get_coverage_by_metric and
+get_values_by_metric, as CoverageEvaluator did before the matrix. The 'matrix' path loads the same files
+into a MetricMatrix and computes the percentages, threshold checks and per-report sums column-wise.
+Both return the same values.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Callable, Optional, Sequence
+
+from jacoco_report.evaluator.metric_matrix import MetricMatrix, reached_thresholds
+from jacoco_report.model.counter import Counter
+from jacoco_report.model.file_coverage import FileCoverage
+
+# per-file coverage, per-file threshold check and per-report (missed, covered) sums
+Evaluation = tuple[list[float], list[bool], list[tuple[int, int]]]
+THRESHOLD = 50.0
+METRIC = "instruction"
+
+
+def changed_files(files: int, reports: int, seed: int = 0) -> list[list[FileCoverage]]:
+    """Return 'files' changed files with seeded counters, split evenly over 'reports' reports."""
+    rnd = random.Random(seed)
+
+    def counter() -> Counter:
+        return Counter(rnd.randint(0, 50), rnd.randint(0, 50))
+
+    per_report = files // reports
+    return [
+        [
+            FileCoverage(f"F{i}.java", f"m{r}/F{i}.java", counter(), counter(), counter(), counter(), counter(), counter())
+            for i in range(per_report)
+        ]
+        for r in range(reports)
+    ]
+
+
+def evaluate_objects(reports: list[list[FileCoverage]]) -> Evaluation:
+    """Evaluate the changed files one Coverage object at a time."""
+    coverages: list[float] = []
+    passed: list[bool] = []
+    sums: list[tuple[int, int]] = []
+    for files in reports:
+        missed_sum = covered_sum = 0
+        for file_coverage in files:
+            coverage = file_coverage.get_coverage_by_metric(METRIC)
+            coverages.append(coverage)
+            passed.append(coverage >= THRESHOLD)
+            missed, covered = file_coverage.get_values_by_metric(METRIC)
+            missed_sum += missed
+            covered_sum += covered
+        sums.append((missed_sum, covered_sum))
+    return coverages, passed, sums
+
+
+def evaluate_matrix(reports: list[list[FileCoverage]]) -> Evaluation:
+    """Evaluate the changed files column-wise from one MetricMatrix."""
+    bounds = [0]
+    for files in reports:
+        bounds.append(bounds[-1] + len(files))
+    matrix = MetricMatrix.from_coverages(file_coverage for files in reports for file_coverage in files)
+    column = matrix.evaluate(METRIC)
+    passed = reached_thresholds(column.reached, [THRESHOLD] * matrix.rows)
+    return column.reached, passed, matrix.segment_sums(METRIC, bounds)
+
+
+def best_ms(stage: Callable[[], Evaluation], repeat: int) -> tuple[Evaluation, float]:
+    """Run a stage 'repeat' times and return its result and best wall time in milliseconds."""
+    best = float("inf")
+    result: Optional[Evaluation] = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = stage()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    assert result is not None
+    return result, round(best, 3)
+
+
+def run_benchmark(files: int, reports: int, repeat: int = 5, seed: int = 0) -> dict:
+    """
+    Evaluate the same changed files by both paths.
+
+    Returns:
+        dict: The best milliseconds of each path and the speed-up of the matrix.
+
+    Raises:
+        AssertionError: If the paths disagree.
+    """
+    data = changed_files(files, reports, seed)
+    objects, objects_ms = best_ms(lambda: evaluate_objects(data), repeat)
+    matrix, matrix_ms = best_ms(lambda: evaluate_matrix(data), repeat)
+    assert objects == matrix, "the matrix and the per-object evaluation disagree"
+    return {
+        "files": files - files % reports,
+        "reports": reports,
+        "objects_ms": objects_ms,
+        "matrix_ms": matrix_ms,
+        "speedup": round(objects_ms / matrix_ms, 2) if matrix_ms else 0.0,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmark from the command line and print both timings."""
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks.matrix_bench", description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=50_000, help="Changed files in total.")
+    parser.add_argument("--reports", type=int, default=10, help="Reports the changed files are split over.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.files, args.reports, args.repeat, args.seed)
+    print(
+        f"{result['files']} changed files in {result['reports']} reports: objects={result['objects_ms']:.1f} ms, "
+        f"matrix={result['matrix_ms']:.1f} ms ({result['speedup']}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
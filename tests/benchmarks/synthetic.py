@@ -0,0 +1,197 @@
+"""
+Deterministic synthetic JaCoCo workspaces for the benchmarks.
+
+A workspace has N modules x P packages x F sourcefiles. Every module has a JaCoCo xml report
+(<module>/target/site/jacoco/jacoco.xml) and a matching source tree (<module>/src/main/java/<package>/<file>),
+so the parser finds the sourcefiles on disk exactly as in a Maven/Gradle checkout. The counters and the
+changed-file set are drawn from a seeded random generator: the same size and seed always produce the same
+workspace, byte for byte.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from xml.sax.saxutils import quoteattr
+
+# JaCoCo counter types in report order
+COUNTER_TYPES: tuple[str, ...] = ("INSTRUCTION", "BRANCH", "LINE", "COMPLEXITY", "METHOD", "CLASS")
+REPORT_GLOB = "**/target/site/jacoco/jacoco.xml"
+# changed files outside the reports (build scripts, docs); they never match a sourcefile
+NON_SOURCE_CHANGES: tuple[str, ...] = ("README.md", "build.gradle", ".github/workflows/build.yml")
+
+
+@dataclass(frozen=True)
+class WorkspaceSize:
+    """The shape of a synthetic workspace."""
+
+    modules: int
+    packages: int
+    files: int
+
+    @property
+    def sourcefiles(self) -> int:
+        """The number of sourcefiles across all reports."""
+        return self.modules * self.packages * self.files
+
+
+# Benchmark sizes, from a unit-test sized project up to monorepo scale.
+SIZES: dict[str, WorkspaceSize] = {
+    "tiny": WorkspaceSize(modules=1, packages=2, files=3),
+    "small": WorkspaceSize(modules=3, packages=5, files=10),
+    "medium": WorkspaceSize(modules=10, packages=20, files=20),
+    "large": WorkspaceSize(modules=40, packages=25, files=25),
+    "monorepo": WorkspaceSize(modules=150, packages=30, files=25),
+}
+
+
+@dataclass
+class SyntheticWorkspace:
+    """A generated workspace: its root, the report paths and the repository-relative changed files."""
+
+    root: Path
+    size: WorkspaceSize
+    report_paths: list[str] = field(default_factory=list)
+    source_files: list[str] = field(default_factory=list)
+    changed_files: list[str] = field(default_factory=list)
+    report_bytes: int = 0
+
+
+def module_name(module: int) -> str:
+    """Return the directory and report name of a module."""
+    return f"module-{module:03d}"
+
+
+def package_name(module: int, package: int) -> str:
+    """Return the JaCoCo package path of a package of a module."""
+    return f"com/example/m{module:03d}/p{package:03d}"
+
+
+def file_name(file: int) -> str:
+    """Return the sourcefile name of a file of a package."""
+    return f"Class{file:03d}.java"
+
+
+def generate_workspace(
+    root: Path,
+    size: WorkspaceSize,
+    changed_ratio: float = 0.01,
+    changed_count: Optional[int] = None,
+    seed: int = 0,
+) -> SyntheticWorkspace:
+    """
+    Write a synthetic workspace into root.
+
+    Parameters:
+        root (Path): The workspace directory; created when missing.
+        size (WorkspaceSize): The number of modules, packages per module and files per package.
+        changed_ratio (float): The share of sourcefiles in the changed-file set (at least one file).
+        changed_count (Optional[int]): The exact number of changed sourcefiles, overrides changed_ratio.
+        seed (int): The seed of the counters and of the changed-file selection.
+
+    Returns:
+        SyntheticWorkspace: The generated workspace.
+    """
+    rng = random.Random(seed)
+    workspace = SyntheticWorkspace(root=root, size=size)
+    for module in range(size.modules):
+        module_dir = root / module_name(module)
+        report_path = module_dir / "target" / "site" / "jacoco" / "jacoco.xml"
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        xml = _report_xml(rng, module, size)
+        report_path.write_text(xml, encoding="utf-8")
+        workspace.report_paths.append(str(report_path))
+        workspace.report_bytes += len(xml.encode("utf-8"))
+
+        for package in range(size.packages):
+            package_dir = module_dir / "src" / "main" / "java" / package_name(module, package)
+            package_dir.mkdir(parents=True, exist_ok=True)
+            for file in range(size.files):
+                class_name = file_name(file)[: -len(".java")]
+                (package_dir / file_name(file)).write_text(
+                    f"package {package_name(module, package).replace('/', '.')};\n\npublic class {class_name} {{}}\n",
+                    encoding="utf-8",
+                )
+                workspace.source_files.append(
+                    f"{module_name(module)}/src/main/java/{package_name(module, package)}/{file_name(file)}"
+                )
+
+    count = changed_count if changed_count is not None else max(1, round(size.sourcefiles * changed_ratio))
+    changed = rng.sample(workspace.source_files, min(count, len(workspace.source_files)))
+    workspace.changed_files = sorted(changed) + list(NON_SOURCE_CHANGES)
+    return workspace
+
+
+def _report_xml(rng: random.Random, module: int, size: WorkspaceSize) -> str:
+    """Return the JaCoCo xml report of one module; package and report counters are the sums of their files."""
+    report_totals = [0] * (2 * len(COUNTER_TYPES))
+    packages: list[str] = []
+    for package in range(size.packages):
+        package_totals = [0] * len(report_totals)
+        classes: list[str] = []
+        sourcefiles: list[str] = []
+        for file in range(size.files):
+            values = _sourcefile_values(rng)
+            package_totals = [a + b for a, b in zip(package_totals, values)]
+            class_name = f"{package_name(module, package)}/{file_name(file)[: -len('.java')]}"
+            classes.append(
+                f"<class name={quoteattr(class_name)} sourcefilename={quoteattr(file_name(file))}>"
+                f'<method name="run" desc="()V" line="3">{_counters(values)}</method>{_counters(values)}</class>'
+            )
+            lines = "".join(
+                f'<line nr="{nr}" mi="{rng.randint(0, 2)}" ci="{rng.randint(0, 6)}" mb="0" cb="0"/>'
+                for nr in range(3, 3 + values[5] + values[4])
+            )
+            sourcefiles.append(f"<sourcefile name={quoteattr(file_name(file))}>{lines}{_counters(values)}</sourcefile>")
+        report_totals = [a + b for a, b in zip(report_totals, package_totals)]
+        packages.append(
+            f"<package name={quoteattr(package_name(module, package))}>"
+            f"{''.join(classes)}{''.join(sourcefiles)}{_counters(package_totals)}</package>"
+        )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<!DOCTYPE report PUBLIC "-//JACOCO//DTD Report 1.1//EN" "report.dtd">'
+        f"<report name={quoteattr(module_name(module))}>"
+        '<sessioninfo id="synthetic" start="0" dump="0"/>'
+        f"{''.join(packages)}{_counters(report_totals)}</report>\n"
+    )
+
+
+def _sourcefile_values(rng: random.Random) -> list[int]:
+    """Return (missed, covered) pairs in COUNTER_TYPES order for one sourcefile with one class."""
+    lines = rng.randint(5, 60)
+    lines_missed = rng.randint(0, lines)
+    branches = 2 * rng.randint(0, 10)
+    branches_missed = rng.randint(0, branches)
+    methods = rng.randint(1, 8)
+    methods_missed = rng.randint(0, methods)
+    instructions = lines * rng.randint(3, 6)
+    instructions_missed = instructions * lines_missed // lines
+    complexity = methods + branches // 2
+    complexity_missed = methods_missed + branches_missed // 2
+    class_missed = 1 if methods_missed == methods else 0
+    return [
+        instructions_missed,
+        instructions - instructions_missed,
+        branches_missed,
+        branches - branches_missed,
+        lines_missed,
+        lines - lines_missed,
+        complexity_missed,
+        complexity - complexity_missed,
+        methods_missed,
+        methods - methods_missed,
+        class_missed,
+        1 - class_missed,
+    ]
+
+
+def _counters(values: list[int]) -> str:
+    return "".join(
+        f'<counter type="{counter}" missed="{values[2 * i]}" covered="{values[2 * i + 1]}"/>'
+        for i, counter in enumerate(COUNTER_TYPES)
+        if values[2 * i] or values[2 * i + 1]
+    )
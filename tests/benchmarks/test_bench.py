@@ -0,0 +1,24 @@
+import json
+
+from tests.benchmarks.bench import STAGES, main, run_benchmarks
+
+
+def test_run_benchmarks_reports_every_stage(tmp_path):
+    results = run_benchmarks(["tiny"], repeat=1, workdir=str(tmp_path))
+
+    tiny = results["sizes"]["tiny"]
+    assert tiny["sourcefiles"] == 6
+    assert tiny["report_bytes"] > 0
+    assert list(tiny["stages"]) == list(STAGES)
+    for stats in tiny["stages"].values():
+        assert stats["best_ms"] <= stats["median_ms"]
+        assert stats["peak_kib"] >= 0
+
+
+def test_main_saves_results_as_json(tmp_path, capsys):
+    output = tmp_path / "results.json"
+
+    assert main(["--sizes", "tiny", "--repeat", "1", "--workdir", str(tmp_path), "--output", str(output)]) == 0
+
+    assert list(json.loads(output.read_text(encoding="utf-8"))["sizes"]) == ["tiny"]
+    assert "tiny (6 sourcefiles)" in capsys.readouterr().out
@@ -0,0 +1,21 @@
+from tests.benchmarks.matrix_bench import changed_files, evaluate_matrix, evaluate_objects, main, run_benchmark
+
+
+def test_matrix_and_object_evaluation_agree():
+    reports = changed_files(60, 3, seed=7)
+
+    assert evaluate_matrix(reports) == evaluate_objects(reports)
+
+
+def test_run_benchmark_reports_both_paths():
+    result = run_benchmark(100, 4, repeat=1)
+
+    assert result["files"] == 100
+    assert result["objects_ms"] > 0
+    assert result["matrix_ms"] > 0
+
+
+def test_main_prints_both_timings(capsys):
+    assert main(["--files", "40", "--reports", "2", "--repeat", "1"]) == 0
+
+    assert "40 changed files in 2 reports: objects=" in capsys.readouterr().out
@@ -0,0 +1,43 @@
+import os
+
+from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
+from tests.benchmarks.synthetic import NON_SOURCE_CHANGES, SIZES, WorkspaceSize, generate_workspace
+
+
+def test_workspace_has_a_report_and_source_tree_per_module(tmp_path):
+    size = WorkspaceSize(modules=2, packages=3, files=4)
+
+    workspace = generate_workspace(tmp_path, size, changed_count=5)
+
+    assert len(workspace.report_paths) == 2
+    assert len(workspace.source_files) == size.sourcefiles == 24
+    assert all((tmp_path / path).is_file() for path in workspace.source_files)
+    assert workspace.changed_files[-len(NON_SOURCE_CHANGES) :] == list(NON_SOURCE_CHANGES)
+    assert len(workspace.changed_files) == 5 + len(NON_SOURCE_CHANGES)
+    assert workspace.report_bytes == sum(os.path.getsize(path) for path in workspace.report_paths)
+
+
+def test_workspace_is_deterministic_per_seed(tmp_path):
+    first = generate_workspace(tmp_path / "a", SIZES["tiny"], seed=7)
+    second = generate_workspace(tmp_path / "b", SIZES["tiny"], seed=7)
+    other = generate_workspace(tmp_path / "c", SIZES["tiny"], seed=8)
+
+    def read(workspace):
+        with open(workspace.report_paths[0], encoding="utf-8") as f:
+            return f.read()
+
+    assert read(first) == read(second)
+    assert first.changed_files == second.changed_files
+    assert read(first) != read(other)
+
+
+def test_reports_parse_with_totals_matching_the_sourcefiles(tmp_path, monkeypatch):
+    workspace = generate_workspace(tmp_path, SIZES["tiny"], changed_ratio=1.0)
+    monkeypatch.chdir(tmp_path)
+
+    report = JaCoCoReportParser(workspace.changed_files).parse(workspace.report_paths[0])
+
+    assert len(report.changed_files_coverage) == SIZES["tiny"].sourcefiles
+    totals = [sum(column) for column in zip(*(f.values for f in report.changed_files_coverage.values()))]
+    assert totals == list(report.overall_coverage.values)
+    assert sorted(report.changed_files_coverage) == workspace.source_files
@@ -3,6 +3,7 @@ from typing import Callable, Optional
 
 from pytest_mock import MockerFixture
 
+from jacoco_report.action_config import ActionConfig
 from jacoco_report.jacoco_report import JaCoCoReport
 from jacoco_report.model.counter import Counter
 from jacoco_report.model.coverage import Coverage
@@ -24,9 +25,20 @@ def github(mocker: MockerFixture) -> GitHub:
     return GitHub("fake_token")
 
 
+class InputsJaCoCoReport(JaCoCoReport):
+    """A JaCoCoReport reading its configuration when it runs, as main.py does, after the test patched the inputs."""
+
+    def __init__(self):
+        super().__init__(ActionConfig.from_inputs())
+
+    def run(self) -> None:
+        self.config = ActionConfig.from_inputs()
+        super().run()
+
+
 @pytest.fixture
 def jacoco_report() -> JaCoCoReport:
-    return JaCoCoReport()
+    return InputsJaCoCoReport()
 
 
 @pytest.fixture
@@ -0,0 +1,422 @@
+"""
+Offline stand-in for the subset of the GitHub API used by jacoco_report.utils.github.GitHub.
+
+FakeGitHubServer runs a real HTTP server on 127.0.0.1 in a background thread so
+that the full action pipeline (including the requests session) can be exercised
+and benchmarked without network access or a token.
+
+Served endpoints:
+- GET    /repos/{owner}/{repo}/pulls/{number}/files
+- GET    /repos/{owner}/{repo}/issues/{number}/comments
+- POST   /repos/{owner}/{repo}/issues/{number}/comments
+- PATCH  /repos/{owner}/{repo}/issues/comments/{id}
+- DELETE /repos/{owner}/{repo}/issues/comments/{id}
+- POST   /repos/{owner}/{repo}/check-runs
+- PATCH  /repos/{owner}/{repo}/check-runs/{id} (annotations are appended, as on GitHub)
+- POST   /graphql (the pull request context query only)
+
+Knobs:
+- latency: seconds slept before answering every request
+- max_per_page: server-side cap applied to the requested per_page / first
+- rate_limit: starting X-RateLimit-Remaining; when exhausted every request gets 403
+- inject_failure(): answer matching requests with a given status (e.g. 403, 502)
+
+Usage:
+    with FakeGitHubServer() as server:
+        server.set_changed_files(1, ["com/example/Foo.java"])
+        result = capture_run(make_env_base(**server.env(pr_number=1)))
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+_FILES_PATH = re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)/files$")
+_ISSUE_COMMENTS_PATH = re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/issues/(?P<number>\d+)/comments$")
+_COMMENT_PATH = re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/issues/comments/(?P<comment_id>\d+)$")
+_CHECK_RUNS_PATH = re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/check-runs(?:/(?P<check_run_id>\d+))?$")
+_MAX_ANNOTATIONS_PER_REQUEST = 50
+
+_STATUS_MESSAGES = {
+    403: "Resource not accessible by integration",
+    404: "Not Found",
+    422: "Validation Failed",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+}
+
+
+@dataclass
+class RecordedRequest:
+    """One request observed by the server."""
+
+    method: str
+    path: str
+    status: int
+    duration: float
+
+
+@dataclass
+class _Failure:
+    method: str
+    pattern: re.Pattern
+    status: int
+    remaining: Optional[int]
+
+
+@dataclass
+class _Comment:
+    comment_id: int
+    body: str
+
+
+@dataclass
+class CheckRun:
+    """One check run created through the API."""
+
+    check_run_id: int
+    name: str
+    head_sha: str
+    conclusion: str
+    title: str = ""
+    summary: str = ""
+    annotations: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class _State:
+    repository: str
+    max_per_page: int
+    rate_limit: int
+    latency: float
+    changed_files: dict[int, list[str]] = field(default_factory=dict)
+    comments: dict[int, list[_Comment]] = field(default_factory=dict)
+    failures: list[_Failure] = field(default_factory=list)
+    requests: list[RecordedRequest] = field(default_factory=list)
+    check_runs: list[CheckRun] = field(default_factory=list)
+    rate_limit_remaining: int = 0
+    next_comment_id: int = 1000
+
+
+class FakeGitHubServer:
+    """Thread-backed local HTTP server imitating the GitHub endpoints used by the action."""
+
+    def __init__(
+        self,
+        repository: str = "owner/repo",
+        latency: float = 0.0,
+        max_per_page: int = 100,
+        rate_limit: int = 5000,
+    ) -> None:
+        self._state = _State(repository=repository, max_per_page=max_per_page, rate_limit=rate_limit, latency=latency)
+        self._state.rate_limit_remaining = rate_limit
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # lifecycle
+
+    def start(self) -> "FakeGitHubServer":
+        """Bind an ephemeral port and serve in a daemon thread."""
+        handler = type("_BoundHandler", (_Handler,), {"server_ref": self})
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.01}, name="fake-github", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down and release the port."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeGitHubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as GITHUB_API_URL."""
+        assert self._httpd is not None, "server is not started"
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def env(self, pr_number: int = 1) -> dict[str, str]:
+        """Environment overrides pointing the action at this server for the given PR."""
+        return {
+            "GITHUB_API_URL": self.url,
+            "GITHUB_REPOSITORY": self._state.repository,
+            "GITHUB_REF": f"refs/pull/{pr_number}/merge",
+            "INPUT_PR_NUMBER": str(pr_number),
+        }
+
+    # configuration
+
+    @property
+    def latency(self) -> float:
+        """Seconds slept before answering each request."""
+        return self._state.latency
+
+    @latency.setter
+    def latency(self, value: float) -> None:
+        self._state.latency = value
+
+    def set_changed_files(self, pr_number: int, files: list[str]) -> None:
+        """Set the files returned for the pull request."""
+        with self._lock:
+            self._state.changed_files[pr_number] = list(files)
+
+    def add_existing_comment(self, pr_number: int, body: str) -> int:
+        """Seed a comment on the pull request and return its ID."""
+        with self._lock:
+            return self._create_comment(pr_number, body).comment_id
+
+    def inject_failure(self, method: str, path_pattern: str, status: int, times: Optional[int] = 1) -> None:
+        """
+        Answer requests matching method and path regex with status.
+
+        times=None keeps failing forever; otherwise the rule is dropped after `times` matches.
+        """
+        with self._lock:
+            self._state.failures.append(_Failure(method.upper(), re.compile(path_pattern), status, times))
+
+    # inspection
+
+    def comments(self, pr_number: int = 1) -> list[str]:
+        """Bodies of the comments currently on the pull request."""
+        with self._lock:
+            return [comment.body for comment in self._state.comments.get(pr_number, [])]
+
+    def check_runs(self) -> list[CheckRun]:
+        """Check runs created so far, with their accumulated annotations."""
+        with self._lock:
+            return list(self._state.check_runs)
+
+    @property
+    def requests(self) -> list[RecordedRequest]:
+        """Snapshot of the requests served so far."""
+        with self._lock:
+            return list(self._state.requests)
+
+    def request_count(self, method: Optional[str] = None, path_contains: str = "") -> int:
+        """Count served requests, optionally filtered by method and a path substring."""
+        return sum(
+            1
+            for request in self.requests
+            if (method is None or request.method == method) and path_contains in request.path
+        )
+
+    # request handling (called from handler threads)
+
+    def _create_comment(self, pr_number: int, body: str) -> _Comment:
+        comment = _Comment(self._state.next_comment_id, body)
+        self._state.next_comment_id += 1
+        self._state.comments.setdefault(pr_number, []).append(comment)
+        return comment
+
+    def _find_comment(self, comment_id: int) -> Optional[tuple[int, _Comment]]:
+        for pr_number, comments in self._state.comments.items():
+            for comment in comments:
+                if comment.comment_id == comment_id:
+                    return pr_number, comment
+        return None
+
+    def _take_failure(self, method: str, path: str) -> Optional[int]:
+        for failure in self._state.failures:
+            if failure.method == method and failure.pattern.search(path):
+                if failure.remaining is not None:
+                    failure.remaining -= 1
+                    if failure.remaining <= 0:
+                        self._state.failures.remove(failure)
+                return failure.status
+        return None
+
+    def _rate_limit_headers(self, resource: str) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self._state.rate_limit),
+            "X-RateLimit-Remaining": str(self._state.rate_limit_remaining),
+            "X-RateLimit-Used": str(self._state.rate_limit - self._state.rate_limit_remaining),
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            "X-RateLimit-Resource": resource,
+        }
+
+    def _dispatch(self, method: str, raw_path: str, body: Optional[dict]) -> tuple[int, Any, dict[str, str]]:
+        parsed = urlparse(raw_path)
+        path = parsed.path
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        resource = "graphql" if path == "/graphql" else "core"
+
+        with self._lock:
+            if self._state.rate_limit_remaining <= 0:
+                return 403, {"message": "API rate limit exceeded"}, self._rate_limit_headers(resource)
+            self._state.rate_limit_remaining -= 1
+            headers = self._rate_limit_headers(resource)
+
+            status = self._take_failure(method, path)
+            if status is not None:
+                return status, {"message": _STATUS_MESSAGES.get(status, "Injected failure")}, headers
+
+            status, payload = self._route(method, path, query, body or {})
+            return status, payload, headers
+
+    def _route(self, method: str, path: str, query: dict[str, str], body: dict) -> tuple[int, Any]:
+        # pylint: disable=too-many-return-statements
+        if method == "POST" and path == "/graphql":
+            return self._graphql(body)
+
+        match = _FILES_PATH.match(path)
+        if match and method == "GET" and match["repo"] == self._state.repository:
+            files = self._state.changed_files.get(int(match["number"]), [])
+            return 200, [{"filename": name, "status": "modified"} for name in self._page(files, query)]
+
+        match = _ISSUE_COMMENTS_PATH.match(path)
+        if match and match["repo"] == self._state.repository:
+            pr_number = int(match["number"])
+            if method == "GET":
+                page = self._page(self._state.comments.get(pr_number, []), query)
+                return 200, [{"id": comment.comment_id, "body": comment.body} for comment in page]
+            if method == "POST":
+                comment = self._create_comment(pr_number, body.get("body", ""))
+                return 201, {"id": comment.comment_id, "body": comment.body}
+
+        match = _COMMENT_PATH.match(path)
+        if match and match["repo"] == self._state.repository:
+            found = self._find_comment(int(match["comment_id"]))
+            if found is None:
+                return 404, {"message": "Not Found"}
+            pr_number, comment = found
+            if method == "PATCH":
+                comment.body = body.get("body", comment.body)
+                return 200, {"id": comment.comment_id, "body": comment.body}
+            if method == "DELETE":
+                self._state.comments[pr_number].remove(comment)
+                return 204, None
+
+        match = _CHECK_RUNS_PATH.match(path)
+        if match and match["repo"] == self._state.repository:
+            return self._check_run(method, match["check_run_id"], body)
+
+        return 404, {"message": "Not Found"}
+
+    def _check_run(self, method: str, check_run_id: Optional[str], body: dict) -> tuple[int, Any]:
+        output = body.get("output") or {}
+        if len(output.get("annotations") or []) > _MAX_ANNOTATIONS_PER_REQUEST:
+            return 422, {"message": "Validation Failed"}
+
+        if method == "POST" and check_run_id is None:
+            check_run = CheckRun(
+                self._state.next_comment_id, body.get("name", ""), body.get("head_sha", ""), body.get("conclusion", "")
+            )
+            self._state.next_comment_id += 1
+            self._state.check_runs.append(check_run)
+        elif method == "PATCH" and check_run_id is not None:
+            found = [run for run in self._state.check_runs if run.check_run_id == int(check_run_id)]
+            if not found:
+                return 404, {"message": "Not Found"}
+            check_run = found[0]
+        else:
+            return 404, {"message": "Not Found"}
+
+        check_run.title = output.get("title", check_run.title)
+        check_run.summary = output.get("summary", check_run.summary)
+        check_run.annotations.extend(output.get("annotations") or [])
+        return (201 if method == "POST" else 200), {"id": check_run.check_run_id, "name": check_run.name}
+
+    def _page(self, items: list, query: dict[str, str]) -> list:
+        per_page = min(int(query.get("per_page", "30")), self._state.max_per_page)
+        page = max(int(query.get("page", "1")), 1)
+        return items[(page - 1) * per_page : page * per_page]
+
+    def _connection(self, items: list, first: int, after: Optional[str]) -> tuple[list, dict]:
+        first = min(first, self._state.max_per_page)
+        start = int(after) if after else 0
+        end = start + first
+        return items[start:end], {"hasNextPage": end < len(items), "endCursor": str(min(end, len(items)))}
+
+    def _graphql(self, body: dict) -> tuple[int, Any]:
+        variables = body.get("variables") or {}
+        if f"{variables.get('owner')}/{variables.get('name')}" != self._state.repository:
+            return 200, {"data": {"repository": None}, "errors": [{"message": "Could not resolve to a Repository"}]}
+
+        pr_number = int(variables.get("number", 0))
+        pull_request: dict[str, Any] = {"baseRefOid": "b" * 40, "headRefOid": "h" * 40}
+        if variables.get("withFiles", True):
+            nodes, page_info = self._connection(
+                self._state.changed_files.get(pr_number, []), 100, variables.get("filesCursor")
+            )
+            pull_request["files"] = {"pageInfo": page_info, "nodes": [{"path": name} for name in nodes]}
+        if variables.get("withComments", True):
+            nodes, page_info = self._connection(
+                self._state.comments.get(pr_number, []), 100, variables.get("commentsCursor")
+            )
+            pull_request["comments"] = {
+                "pageInfo": page_info,
+                "nodes": [
+                    {"databaseId": c.comment_id, "body": c.body} for c in nodes
+                ],
+            }
+        return 200, {"data": {"repository": {"pullRequest": pull_request}}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler delegating to the owning FakeGitHubServer (bound via server_ref)."""
+
+    server_ref: FakeGitHubServer
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self) -> None:
+        started = time.perf_counter()
+        if self.server_ref.latency > 0:
+            time.sleep(self.server_ref.latency)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except json.JSONDecodeError:
+            body = None
+
+        status, payload, headers = self.server_ref._dispatch(  # pylint: disable=protected-access
+            self.command, self.path, body
+        )
+        encoded = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        # Record before answering so callers inspecting requests right after a run see every call.
+        with self.server_ref._lock:  # pylint: disable=protected-access
+            self.server_ref._state.requests.append(  # pylint: disable=protected-access
+                RecordedRequest(self.command, urlparse(self.path).path, status, time.perf_counter() - started)
+            )
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(encoded)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if encoded:
+            self.wfile.write(encoded)
+
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PATCH = _handle
+    do_DELETE = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """Keep the captured action output free of access-log lines."""
@@ -0,0 +1,229 @@
+"""
+End-to-end tests running the full action against the offline GitHub stand-in server.
+
+No GitHub client method is mocked here: requests travel through the real
+requests session to FakeGitHubServer on 127.0.0.1.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Generator
+
+import pytest
+import requests
+
+from tests.integration.fake_github import FakeGitHubServer
+from tests.integration.helpers import capture_run, make_env_base
+
+_CHANGED_FILES = [
+    "com/example/module_large/MidClass.java",
+    "com/example/module_large/BigClass.java",
+]
+_TITLE = "**JaCoCo Coverage Report**"
+
+
+@pytest.fixture
+def server() -> Generator[FakeGitHubServer, None, None]:
+    with FakeGitHubServer() as fake:
+        fake.set_changed_files(1, _CHANGED_FILES)
+        yield fake
+
+
+def test_full_run_posts_comment_over_http(server: FakeGitHubServer) -> None:
+    result = capture_run(make_env_base(**server.env(pr_number=1)))
+
+    assert result.exit_code == 0, result.stdout
+    bodies = server.comments(1)
+    assert len(bodies) == 1
+    assert bodies[0].startswith(_TITLE)
+    assert "MidClass.java" in bodies[0]
+    assert server.request_count("GET", "/pulls/1/files") == 1
+    assert server.request_count("POST", "/issues/1/comments") == 1
+
+
+def test_api_stats_output_counts_calls_against_server(server: FakeGitHubServer) -> None:
+    output: dict[str, str] = {}
+
+    def _capture_output(name: str, value: str, default_output_path: str = "default_output.txt") -> None:
+        del default_output_path
+        output[name] = value
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("main.set_action_output_text", _capture_output)
+        result = capture_run(make_env_base(INPUT_API_STATS="true", **server.env(pr_number=1)))
+
+    assert result.exit_code == 0, result.stdout
+    stats = json.loads(output["api-stats"])
+    assert stats["total_calls"] == len(server.requests)
+    assert stats["endpoints"]["GET /repos/{owner}/{repo}/pulls/{n}/files"]["statuses"] == {"200": 1}
+    assert stats["rate_limit_remaining"] == 5000 - len(server.requests)
+    assert "GitHub API usage summary" in result.stdout
+
+
+def test_output_sinks_receive_full_report_while_comment_stays_minimal(server: FakeGitHubServer, tmp_path) -> None:
+    summary = tmp_path / "step-summary.md"
+    report_dir = tmp_path / "coverage"
+
+    result = capture_run(
+        make_env_base(
+            INPUT_COMMENT_LEVEL="minimal",
+            INPUT_STEP_SUMMARY="true",
+            INPUT_REPORT_PATH=str(report_dir),
+            GITHUB_STEP_SUMMARY=str(summary),
+            **server.env(pr_number=1),
+        )
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "MidClass.java" not in server.comments(1)[0]
+    assert "MidClass.java" in summary.read_text(encoding="utf-8")
+    data = json.loads((report_dir / "coverage-report.json").read_text(encoding="utf-8"))
+    assert data["metric"] == "instruction"
+    assert data["reports"]
+    assert "MidClass.java</a>" in (report_dir / "coverage-report.html").read_text(encoding="utf-8")
+
+
+def test_update_comment_patches_existing_comment(server: FakeGitHubServer) -> None:
+    server.add_existing_comment(1, f"{_TITLE}\n\nold body")
+
+    result = capture_run(make_env_base(INPUT_UPDATE_COMMENT="true", **server.env(pr_number=1)))
+
+    assert result.exit_code == 0, result.stdout
+    bodies = server.comments(1)
+    assert len(bodies) == 1
+    assert "old body" not in bodies[0]
+    assert server.request_count("PATCH") == 1
+    assert server.request_count("POST") == 0
+
+
+def test_changed_files_are_paginated(server: FakeGitHubServer) -> None:
+    server.set_changed_files(1, _CHANGED_FILES + [f"com/example/generated/Gen{i}.java" for i in range(248)])
+
+    result = capture_run(make_env_base(**server.env(pr_number=1)))
+
+    assert result.exit_code == 0, result.stdout
+    assert server.request_count("GET", "/pulls/1/files") == 3
+
+
+def test_graphql_transport_reads_context_in_one_query(server: FakeGitHubServer) -> None:
+    result = capture_run(make_env_base(INPUT_API_TRANSPORT="graphql", **server.env(pr_number=1)))
+
+    assert result.exit_code == 0, result.stdout
+    assert server.request_count("POST", "/graphql") == 1
+    assert server.request_count("GET") == 0
+    assert len(server.comments(1)) == 1
+
+
+def test_injected_502_on_changed_files_fails_the_run(server: FakeGitHubServer) -> None:
+    server.inject_failure("GET", r"/pulls/\d+/files$", 502)
+
+    result = capture_run(make_env_base(**server.env(pr_number=1)))
+
+    assert result.exit_code == 1
+    assert "502" in result.stdout
+    assert not server.comments(1)
+
+
+def test_injected_403_on_comment_post_leaves_pr_untouched(server: FakeGitHubServer) -> None:
+    server.inject_failure("POST", r"/issues/\d+/comments$", 403, times=None)
+
+    result = capture_run(make_env_base(**server.env(pr_number=1)))
+
+    assert "403" in result.stdout
+    assert not server.comments(1)
+
+
+def test_rate_limit_headers_and_exhaustion() -> None:
+    with FakeGitHubServer(rate_limit=2) as fake:
+        url = f"{fake.url}/repos/owner/repo/pulls/1/files"
+        first = requests.get(url, timeout=5)
+        second = requests.get(url, timeout=5)
+        third = requests.get(url, timeout=5)
+
+    assert first.headers["X-RateLimit-Limit"] == "2"
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    assert second.headers["X-RateLimit-Remaining"] == "0"
+    assert third.status_code == 403
+    assert third.json()["message"] == "API rate limit exceeded"
+
+
+def test_latency_is_applied_per_request(server: FakeGitHubServer) -> None:
+    server.latency = 0.05
+
+    started = time.perf_counter()
+    result = capture_run(make_env_base(**server.env(pr_number=1)))
+    elapsed = time.perf_counter() - started
+
+    assert result.exit_code == 0, result.stdout
+    assert len(server.requests) >= 2
+    assert all(request.duration >= 0.05 for request in server.requests)
+    assert elapsed >= 0.05 * len(server.requests)
+
+
+def test_max_per_page_caps_comment_pages() -> None:
+    with FakeGitHubServer(max_per_page=2) as fake:
+        for index in range(5):
+            fake.add_existing_comment(1, f"comment {index}")
+        url = f"{fake.url}/repos/owner/repo/issues/1/comments"
+        page = requests.get(url, params={"per_page": 100, "page": 2}, timeout=5).json()
+
+    assert [comment["body"] for comment in page] == ["comment 2", "comment 3"]
+
+
+def test_check_run_annotates_failing_changed_files(server: FakeGitHubServer, tmp_path) -> None:
+    event = tmp_path / "event.json"
+    event.write_text(json.dumps({"pull_request": {"head": {"sha": "a" * 40}}}), encoding="utf-8")
+
+    result = capture_run(
+        make_env_base(
+            INPUT_CHECK_RUN="true",
+            INPUT_REPORT_THRESHOLDS_DEFAULT="0.0*0.0*99.9",
+            GITHUB_EVENT_PATH=str(event),
+            **server.env(pr_number=1),
+        )
+    )
+
+    assert result.exit_code == 1, result.stdout
+    check_runs = server.check_runs()
+    assert len(check_runs) == 1
+    assert check_runs[0].head_sha == "a" * 40
+    assert check_runs[0].conclusion == "failure"
+    assert {a["path"] for a in check_runs[0].annotations} == set(_CHANGED_FILES)
+    assert server.request_count("POST", "/check-runs") == 1
+
+
+def test_check_run_uses_graphql_head_sha(server: FakeGitHubServer) -> None:
+    result = capture_run(
+        make_env_base(INPUT_CHECK_RUN="true", INPUT_API_TRANSPORT="graphql", **server.env(pr_number=1))
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert [run.head_sha for run in server.check_runs()] == ["h" * 40]
+
+
+def test_several_metrics_are_evaluated_in_one_run(server: FakeGitHubServer) -> None:
+    output: dict[str, str] = {}
+
+    def _capture_output(name: str, value: str, default_output_path: str = "default_output.txt") -> None:
+        del default_output_path
+        output[name] = value
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("main.set_action_output_text", _capture_output)
+        result = capture_run(
+            make_env_base(
+                INPUT_METRIC="instruction,branch",
+                INPUT_GLOBAL_THRESHOLDS="0*0,branch:99.9*0",
+                **server.env(pr_number=1),
+            )
+        )
+
+    assert result.exit_code == 1, result.stdout
+    metrics = json.loads(output["metrics-coverage"])
+    assert list(metrics) == ["instruction", "branch"]
+    assert metrics["instruction"]["passed"] is True
+    assert metrics["branch"]["coverage_overall_passed"] is False
+    assert "[branch] " in result.stdout
+    assert "| **branch** |" in server.comments(1)[0]
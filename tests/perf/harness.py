@@ -0,0 +1,279 @@
+"""
+Performance regression gate: the benchmark stages compared against committed reference numbers.
+
+Usage:
+    python -m tests.perf.harness            # compare against tests/perf/reference.json, exit 1 on a regression
+    python -m tests.perf.harness --update   # re-record the reference after an intended change
+
+Wall times differ between machines, so every stage time is divided by the time of a fixed calibration
+workload measured in the same process; the reference stores these machine-normalized times. Peak traced
+memory does not depend on the machine speed and is compared in KiB. A stage regresses when it exceeds
+its reference by more than the tolerance band of the reference file in every one of up to GATE_ROUNDS
+measurements, so a single noisy round does not fail the gate.
+
+A tracer (coverage, a debugger) slows the measured code but hardly the calibration workload, which runs
+mostly in C, so the times are only gated without one (see is_traced).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import NamedTuple, Optional, Sequence
+
+from tests.benchmarks.bench import run_benchmarks
+
+REFERENCE_PATH = Path(__file__).parent / "reference.json"
+REFERENCE_SIZES: tuple[str, ...] = ("small", "medium")
+# measurements of the reference sizes before a stage over its tolerance band counts as a regression
+GATE_ROUNDS = 3
+DEFAULT_TOLERANCE: dict[str, float] = {
+    # a stage may take up to this multiple of its normalized reference time
+    "time": 2.0,
+    # and allocate up to this multiple of its reference peak memory
+    "memory": 1.3,
+    # stages faster than this (ms) are too noisy to gate on time
+    "min_ms": 5.0,
+    # memory growth below this (KiB) is ignored
+    "min_kib": 256.0,
+}
+
+_CALIBRATION_XML = "<r>" + "".join(f'<c type="LINE" missed="{i}" covered="{2 * i}"/>' for i in range(20000)) + "</r>"
+
+
+class Comparison(NamedTuple):
+    """One gated value: a stage's normalized time or peak memory against its reference."""
+
+    size: str
+    stage: str
+    metric: str
+    reference: float
+    current: float
+    limit: float
+    regressed: bool
+
+
+def calibrate(rounds: int = 5) -> float:
+    """
+    Time a fixed workload mixing interpreted code and XML parsing, like the stages do.
+
+    Returns:
+        float: The best wall time of the workload in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        totals: dict[str, int] = {}
+        for element in ET.fromstring(_CALIBRATION_XML).iter("c"):
+            key = f"{element.attrib['type']}/{int(element.attrib['missed']) % 97}"
+            totals[key] = totals.get(key, 0) + int(element.attrib["covered"])
+        sorted(totals.items(), key=lambda item: item[1])
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def is_traced() -> bool:
+    """Return whether a tracer such as coverage runs, which makes the normalized times meaningless."""
+    return sys.gettrace() is not None or sys.monitoring.get_tool(sys.monitoring.COVERAGE_ID) is not None
+
+
+def measure(sizes: Sequence[str] = REFERENCE_SIZES, repeat: int = 3) -> dict:
+    """
+    Run the benchmarks and normalize the stage times by the calibration workload.
+
+    Returns:
+        dict: The calibration time and, per size and stage, the normalized time, the best time and the peak memory.
+    """
+    calibration_ms = calibrate()
+    results = run_benchmarks(sizes, repeat)
+    calibration_ms = min(calibration_ms, calibrate())
+    return {
+        "calibration_ms": round(calibration_ms, 3),
+        "sizes": {
+            name: {
+                "sourcefiles": result["sourcefiles"],
+                "stages": {
+                    stage: {
+                        "time": round(stats["best_ms"] / calibration_ms, 3),
+                        "best_ms": stats["best_ms"],
+                        "peak_kib": stats["peak_kib"],
+                    }
+                    for stage, stats in result["stages"].items()
+                },
+            }
+            for name, result in results["sizes"].items()
+        },
+    }
+
+
+def best_of(results: Sequence[dict]) -> dict:
+    """
+    Combine the results of several measure() calls, keeping the lowest time and peak memory of every stage.
+
+    Returns:
+        dict: A result in the format of measure().
+    """
+    best: dict = json.loads(json.dumps(results[0]))
+    for result in results[1:]:
+        best["calibration_ms"] = min(best["calibration_ms"], result["calibration_ms"])
+        for name, size in result["sizes"].items():
+            for stage, stats in size["stages"].items():
+                kept = best["sizes"][name]["stages"][stage]
+                for key in ("time", "best_ms", "peak_kib"):
+                    kept[key] = min(kept[key], stats[key])
+    return best
+
+
+def gate(
+    reference: dict, repeat: int = 3, rounds: int = GATE_ROUNDS, metrics: Sequence[str] = ("time", "peak_kib")
+) -> tuple[dict, list[Comparison]]:
+    """
+    Measure the reference sizes and compare them with the reference; while a stage regresses, measure again,
+    up to 'rounds' times, and compare the best value of every stage over all rounds.
+
+    Parameters:
+        reference (dict): The reference file content.
+        repeat (int): Timed runs per stage and round.
+        rounds (int): The most measurements taken.
+        metrics (Sequence[str]): The gated metrics; a regression of another one does not trigger a new round.
+
+    Returns:
+        tuple[dict, list[Comparison]]: The best results and their comparison with the reference.
+    """
+    sizes = list(reference["sizes"])
+    results = [measure(sizes, repeat)]
+    comparisons = compare(results[0], reference)
+
+    def regressed() -> bool:
+        return any(c.regressed and c.metric in metrics for c in comparisons)
+
+    while regressed() and len(results) < rounds:
+        results.append(measure(sizes, repeat))
+        comparisons = compare(best_of(results), reference)
+    return best_of(results), comparisons
+
+
+def compare(current: dict, reference: dict) -> list[Comparison]:
+    """
+    Compare measured stages with the reference; stages missing from the current results are skipped.
+
+    Parameters:
+        current (dict): The output of measure().
+        reference (dict): The reference file content.
+
+    Returns:
+        list[Comparison]: The time and memory comparison of every reference stage.
+    """
+    tolerance = {**DEFAULT_TOLERANCE, **reference.get("tolerance", {})}
+    comparisons: list[Comparison] = []
+    for size, reference_size in reference["sizes"].items():
+        for stage, expected in reference_size["stages"].items():
+            measured = current["sizes"].get(size, {}).get("stages", {}).get(stage)
+            if measured is None:
+                continue
+            time_limit = expected["time"] * tolerance["time"]
+            comparisons.append(
+                Comparison(
+                    size,
+                    stage,
+                    "time",
+                    expected["time"],
+                    measured["time"],
+                    time_limit,
+                    measured["time"] > time_limit and measured["best_ms"] >= tolerance["min_ms"],
+                )
+            )
+            memory_limit = max(expected["peak_kib"] * tolerance["memory"], expected["peak_kib"] + tolerance["min_kib"])
+            comparisons.append(
+                Comparison(
+                    size,
+                    stage,
+                    "peak_kib",
+                    expected["peak_kib"],
+                    measured["peak_kib"],
+                    memory_limit,
+                    measured["peak_kib"] > memory_limit,
+                )
+            )
+    return comparisons
+
+
+def format_report(comparisons: Sequence[Comparison]) -> str:
+    """
+    Format the comparisons as a table; regressed rows are marked.
+
+    Returns:
+        str: One line per comparison with the reference, current and limit values and the relative change.
+    """
+    header = f"{'size':<8} {'stage':<10} {'metric':<9} {'reference':>11} {'current':>11} {'limit':>11} {'change':>8}"
+    lines = [header, "-" * len(header)]
+    for c in comparisons:
+        change = (c.current / c.reference - 1) * 100 if c.reference else 0.0
+        lines.append(
+            f"{c.size:<8} {c.stage:<10} {c.metric:<9} {c.reference:>11.2f} {c.current:>11.2f} {c.limit:>11.2f} "
+            f"{change:>+7.0f}%{'  REGRESSED' if c.regressed else ''}"
+        )
+    return "\n".join(lines)
+
+
+def to_reference(current: dict, tolerance: Optional[dict] = None) -> dict:
+    """Turn measured results into a reference file content, keeping the given tolerance bands."""
+    return {
+        "calibration_ms": current["calibration_ms"],
+        "tolerance": tolerance if tolerance is not None else dict(DEFAULT_TOLERANCE),
+        "sizes": {
+            name: {
+                "sourcefiles": result["sourcefiles"],
+                "stages": {
+                    stage: {"time": stats["time"], "best_ms": stats["best_ms"], "peak_kib": stats["peak_kib"]}
+                    for stage, stats in result["stages"].items()
+                },
+            }
+            for name, result in current["sizes"].items()
+        },
+    }
+
+
+def load_reference(path: Path = REFERENCE_PATH) -> dict:
+    """Read the committed reference numbers."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Compare the benchmarks with the reference, or re-record it with --update."""
+    parser = argparse.ArgumentParser(prog="python -m tests.perf.harness", description=__doc__.splitlines()[1])
+    parser.add_argument("--update", action="store_true", help="Re-record the reference file.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage.")
+    parser.add_argument("--reference", type=Path, default=REFERENCE_PATH)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    reference = load_reference(args.reference) if args.reference.exists() else None
+    if args.update:
+        sizes = list(reference["sizes"]) if reference is not None else list(REFERENCE_SIZES)
+        current = measure(sizes, args.repeat)
+        tolerance = reference.get("tolerance") if reference is not None else None
+        with open(args.reference, "w", encoding="utf-8") as f:
+            json.dump(to_reference(current, tolerance), f, indent=4)
+            f.write("\n")
+        print(f"Reference written to '{args.reference}' (calibration {current['calibration_ms']:.2f} ms).")
+        return 0
+
+    if reference is None:
+        print(f"No reference file '{args.reference}'. Record one with --update.")
+        return 1
+    _, comparisons = gate(reference, args.repeat)
+    print(format_report(comparisons))
+    regressed = [c for c in comparisons if c.regressed]
+    print(f"\n{len(regressed)} regression(s) in {len(comparisons)} comparison(s).")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from jacoco_report.model.coverage_history import KIND_REPORT, CoverageHistory, HistoryRun, RunCoverage
+from tests.perf.harness import calibrate
+
+RUNS = 100_000
+REPORTS = 5
+# trend and regression queries of the comment and the CLI must stay interactive on a large history: at most
+# this share of the calibration workload of tests/perf/harness.py (10 ms on the machine of reference.json)
+QUERY_BUDGET = 0.15
+
+
+@pytest.fixture(scope="module")
+def history(tmp_path_factory):
+    history = CoverageHistory(str(tmp_path_factory.mktemp("history") / "history.db"))
+    # 1 in 5 runs is a base branch run, the others are pull request runs of 300 feature branches
+    history.record_many(
+        RunCoverage(
+            HistoryRun(
+                f"{run_id:040x}",
+                "master" if run_id % 5 == 0 else f"feature/{run_id % 300}",
+                "push" if run_id % 5 == 0 else "pull_request",
+                None if run_id % 5 == 0 else run_id,
+                "instruction",
+                1_600_000_000 + run_id * 60,
+            ),
+            (70.0 + run_id % 17, 60.0),
+            {f"module-{i}": (70.0 + run_id % 17, 60.0) for i in range(REPORTS)},
+            {"core": (70.0 + run_id % 17, 60.0)},
+        )
+        for run_id in range(1, RUNS + 1)
+    )
+    yield history
+    history.close()
+
+
+@pytest.fixture(scope="module")
+def calibration_ms():
+    return calibrate()
+
+
+def _best_ms(query, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        query()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+@pytest.mark.parametrize(
+    "name, query",
+    [
+        ("trend", lambda h: h.trend("master", "instruction", 20)),
+        ("report trend", lambda h: h.trend("master", "instruction", 20, KIND_REPORT, "module-3")),
+        ("regressions", lambda h: h.regressions("master", "instruction", 500, 1.0)),
+        ("commit", lambda h: h.runs_of_commit(f"{RUNS // 2:040x}")),
+    ],
+)
+def test_history_queries_stay_fast_with_100k_runs(history, calibration_ms, name, query):
+    assert query(history)
+
+    best_ms = _best_ms(lambda: query(history))
+
+    # SQLite runs the queries in C, which a tracer such as coverage slows no more than the calibration workload
+    budget_ms = QUERY_BUDGET * calibration_ms
+    assert best_ms < budget_ms, f"{name} took {best_ms:.2f} ms, budget {budget_ms:.2f} ms"
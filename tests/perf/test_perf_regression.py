@@ -0,0 +1,123 @@
+import pytest
+
+from tests.perf import harness
+from tests.perf.harness import Comparison, best_of, compare, format_report, gate, is_traced, load_reference
+
+# a tracer slows the measured code but hardly the calibration workload, so only the memory is gated under one
+GATED_METRICS = ("peak_kib",) if is_traced() else ("time", "peak_kib")
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return load_reference()
+
+
+@pytest.fixture(scope="module")
+def gated(reference):
+    return gate(reference, repeat=3, metrics=GATED_METRICS)
+
+
+@pytest.fixture(scope="module")
+def current(gated):
+    return gated[0]
+
+
+@pytest.mark.skipif(is_traced(), reason="times measured under a tracer (e.g. coverage) are not comparable")
+def test_no_stage_time_regresses_against_reference(gated):
+    comparisons = [c for c in gated[1] if c.metric == "time"]
+
+    assert comparisons
+    assert not [c for c in comparisons if c.regressed], "Performance regression:\n" + format_report(gated[1])
+
+
+def test_no_stage_memory_regresses_against_reference(gated):
+    comparisons = [c for c in gated[1] if c.metric == "peak_kib"]
+
+    assert comparisons
+    assert not [c for c in comparisons if c.regressed], "Memory regression:\n" + format_report(gated[1])
+
+
+def test_parse_scales_linearly_with_the_sourcefiles(current):
+    # machine independent: a lookup walking the whole tree per sourcefile makes the per-file cost grow with the tree
+    small, medium = current["sizes"]["small"], current["sizes"]["medium"]
+    per_file_small = small["stages"]["parse"]["best_ms"] / small["sourcefiles"]
+    per_file_medium = medium["stages"]["parse"]["best_ms"] / medium["sourcefiles"]
+
+    assert per_file_medium < 3 * per_file_small, f"{per_file_small:.3f} ms -> {per_file_medium:.3f} ms per sourcefile"
+
+
+def _results(time: float, best_ms: float, peak_kib: float) -> dict:
+    return {"sizes": {"small": {"stages": {"parse": {"time": time, "best_ms": best_ms, "peak_kib": peak_kib}}}}}
+
+
+def test_compare_flags_stages_beyond_the_tolerance_band():
+    reference = {"tolerance": {"time": 2.0, "memory": 1.3, "min_ms": 5.0, "min_kib": 10.0}, **_results(1.0, 40.0, 1000.0)}
+
+    comparisons = compare(_results(2.5, 100.0, 1400.0), reference)
+
+    assert comparisons == [
+        Comparison("small", "parse", "time", 1.0, 2.5, 2.0, True),
+        Comparison("small", "parse", "peak_kib", 1000.0, 1400.0, 1300.0, True),
+    ]
+    report = format_report(comparisons)
+    assert "small    parse      time" in report
+    assert report.count("REGRESSED") == 2
+    assert "+150%" in report
+
+
+def test_compare_tolerates_noise_and_fast_stages():
+    reference = {"tolerance": {"time": 2.0, "memory": 1.3, "min_ms": 5.0, "min_kib": 256.0}, **_results(0.1, 1.0, 10.0)}
+
+    # 5x slower but below min_ms, and 200 KiB more but below min_kib
+    comparisons = compare(_results(0.5, 4.0, 210.0), reference)
+
+    assert not [c for c in comparisons if c.regressed]
+
+
+def test_compare_skips_stages_not_measured():
+    assert compare({"sizes": {}}, _results(1.0, 10.0, 10.0)) == []
+
+
+def _measured(time: float, peak_kib: float, calibration_ms: float = 50.0) -> dict:
+    return {"calibration_ms": calibration_ms, **_results(time, time * calibration_ms, peak_kib)}
+
+
+def test_best_of_keeps_the_lowest_value_of_every_stage():
+    best = best_of([_measured(2.0, 900.0, 40.0), _measured(1.0, 1000.0, 60.0)])
+
+    assert best == {
+        "calibration_ms": 40.0,
+        "sizes": {"small": {"stages": {"parse": {"time": 1.0, "best_ms": 60.0, "peak_kib": 900.0}}}},
+    }
+
+
+def test_gate_measures_again_while_a_stage_regresses(monkeypatch):
+    rounds = iter([_measured(3.0, 100.0), _measured(1.5, 100.0), _measured(1.0, 100.0)])
+    monkeypatch.setattr(harness, "measure", lambda sizes, repeat: next(rounds))
+    reference = {"tolerance": {"time": 2.0, "memory": 1.3, "min_ms": 5.0, "min_kib": 256.0}, **_results(1.0, 50.0, 100.0)}
+
+    current, comparisons = gate(reference)
+
+    # the second round is within the band, so the third one is never taken
+    assert current["sizes"]["small"]["stages"]["parse"]["time"] == 1.5
+    assert not [c for c in comparisons if c.regressed]
+    assert next(rounds)["sizes"]["small"]["stages"]["parse"]["time"] == 1.0
+
+
+def test_gate_reports_a_regression_of_every_round(monkeypatch):
+    monkeypatch.setattr(harness, "measure", lambda sizes, repeat: _measured(3.0, 100.0))
+    reference = {"tolerance": {"time": 2.0, "memory": 1.3, "min_ms": 5.0, "min_kib": 256.0}, **_results(1.0, 50.0, 100.0)}
+
+    _, comparisons = gate(reference, rounds=2)
+
+    assert [c.metric for c in comparisons if c.regressed] == ["time"]
+
+
+def test_gate_ignores_regressions_of_metrics_not_gated(monkeypatch):
+    calls = []
+    monkeypatch.setattr(harness, "measure", lambda sizes, repeat: calls.append(sizes) or _measured(3.0, 100.0))
+    reference = {"tolerance": {"time": 2.0, "memory": 1.3, "min_ms": 5.0, "min_kib": 256.0}, **_results(1.0, 50.0, 100.0)}
+
+    gate(reference, metrics=("peak_kib",))
+
+    assert calls == [["small"]]
@@ -0,0 +1,82 @@
+from jacoco_report.evaluator.baseline_join import BaselineJoin, normalize_source_path
+from jacoco_report.model.counter import Counter
+from jacoco_report.model.evaluated_report_coverage import EvaluatedReportCoverage
+
+
+def _erc(name, path="", group_name="Unknown", overall=(0, 0), changed=(0, 0), files=None):
+    erc = EvaluatedReportCoverage(name, group_name)
+    erc.path = path
+    erc.overall_coverage = Counter(*overall)
+    erc.overall_coverage_reached = erc.overall_coverage.coverage()
+    erc.avg_changed_files_coverage = Counter(*changed)
+    erc.avg_changed_files_coverage_reached = erc.avg_changed_files_coverage.coverage()
+    erc.changed_files_coverage_reached = files or {}
+    return erc
+
+
+def _evaluator(mocker, reports, groups=None):
+    evaluator = mocker.Mock()
+    evaluator.evaluated_reports_coverage = reports
+    evaluator.evaluated_groups_coverage = groups or {}
+    return evaluator
+
+
+def test_without_baseline_has_no_data(mocker):
+    join = BaselineJoin(_evaluator(mocker, {"a.xml": _erc("a", "a.xml", overall=(0, 10))}), None)
+
+    assert join.has_data is False
+    assert join.global_diffs == (0.0, 0.0)
+    assert join.report(_erc("a", "a.xml")) is None
+
+
+def test_report_matches_by_path_then_first_name(mocker):
+    by_path = _erc("a", "a.xml", overall=(5, 5))
+    first = _erc("b", "base/b.xml", overall=(8, 2))
+    second = _erc("b", "other/b.xml", overall=(0, 10))
+    join = BaselineJoin(
+        _evaluator(mocker, {}),
+        _evaluator(mocker, {"a.xml": by_path, "base/b.xml": first, "other/b.xml": second}),
+    )
+
+    assert join.report(_erc("x", "a.xml")) is by_path
+    assert join.report(_erc("b", "b.xml")) is first
+    assert join.report(_erc("c", "c.xml")) is None
+    assert join.report_diffs(_erc("b", "b.xml", overall=(6, 4))) == (20.0, 0.0)
+
+
+def test_global_and_group_diffs_use_matched_reports_only(mocker):
+    current = {
+        "a.xml": _erc("a", "a.xml", group_name="g1", overall=(2, 8), changed=(1, 9)),
+        "b.xml": _erc("b", "b.xml", group_name="g2", overall=(0, 10)),
+    }
+    baseline = {"a.xml": _erc("a", "a.xml", group_name="g1", overall=(4, 6), changed=(5, 5))}
+    join = BaselineJoin(
+        _evaluator(mocker, current),
+        _evaluator(mocker, baseline, {"g1": EvaluatedReportCoverage("g1")}),
+    )
+
+    assert join.global_diffs == (10.0, 40.0)
+    assert join.group_diffs("g1") == (20.0, 40.0)
+    assert join.group_diffs("g2") == (0.0, 0.0)
+
+
+def test_changed_file_diff(mocker):
+    bs = _erc("a", "a.xml", files={"Foo.java": 50.0})
+    join = BaselineJoin(_evaluator(mocker, {}), _evaluator(mocker, {"a.xml": bs}))
+    current = _erc("a", "a.xml", files={"Foo.java": 75.0, "Bar.java": 10.0})
+
+    assert join.changed_file_diff(current, "Foo.java") == 25.0
+    assert join.changed_file_diff(current, "Bar.java") == 0.0
+
+
+def test_changed_file_diff_falls_back_to_normalized_source_path(mocker):
+    bs = _erc("renamed", "old/a.xml", files={"module/src/com/Foo.java": 40.0})
+    join = BaselineJoin(_evaluator(mocker, {}), _evaluator(mocker, {"old/a.xml": bs}))
+    current = _erc("a", "a.xml", files={"./module\\src/com/Foo.java": 70.0})
+
+    assert join.changed_file_diff(current, "./module\\src/com/Foo.java") == 30.0
+
+
+def test_normalize_source_path():
+    assert normalize_source_path("./src//com/../com/Foo.java") == "src/com/Foo.java"
+    assert normalize_source_path("src\\com\\Foo.java") == "src/com/Foo.java"
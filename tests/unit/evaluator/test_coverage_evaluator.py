@@ -6,6 +6,7 @@ from jacoco_report.evaluator.coverage_evaluator import CoverageEvaluator
 from jacoco_report.model.counter import Counter
 from jacoco_report.model.evaluated_report_coverage import EvaluatedReportCoverage
 from jacoco_report.model.file_coverage import FileCoverage
+from jacoco_report.model.file_coverage_store import FileCoverageStore
 from jacoco_report.model.report_file_coverage import ReportFileCoverage
 from jacoco_report.model.coverage import Coverage
 from jacoco_report.model.report_group import ReportGroup
@@ -57,6 +58,43 @@ def test_evaluate_changed_files_coverage(evaluator):
     assert evaluator.total_coverage_changed_files == pytest.approx(90.0, 0.01)
     assert evaluator.total_coverage_changed_files_passed is True
 
+def test_evaluate_spilled_changed_files_keeps_only_the_failing_ones(monkeypatch):
+    # five batches of two files: every third file is below the per-file threshold of 50 %
+    monkeypatch.setattr("jacoco_report.evaluator.coverage_evaluator.EVALUATION_BATCH_SIZE", 2)
+    changed_files = {
+        f"com/example/F{i}.java": FileCoverage.from_counter_values(
+            f"F{i}.java", "com/example", ([8, 2] if i % 3 == 0 else [2, 8]) + [0] * 10
+        )
+        for i in range(10)
+    }
+    store = FileCoverageStore()
+    spilled = store.new_report()
+    spilled.extend(changed_files.items())
+    overall = Coverage.from_values([5, 10] + [0] * 10)
+    evaluators = [
+        CoverageEvaluator(
+            report_files_coverage=[ReportFileCoverage("r.xml", "r", overall, coverage)],
+            global_min_coverage_overall=50.0,
+            global_min_coverage_changed_files=50.0,
+            report_thresholds_default=(0.0, 0.0, 50.0),
+        )
+        for coverage in (changed_files, spilled)
+    ]
+    for evaluator in evaluators:
+        evaluator.evaluate()
+
+    in_memory, from_disk = (e.evaluated_reports_coverage["r.xml"] for e in evaluators)
+    failing = {key: reached for key, reached in in_memory.changed_files_coverage_reached.items() if reached < 50.0}
+    assert list(failing) == [f"com/example/F{i}.java" for i in (0, 3, 6, 9)]
+    assert from_disk.changed_files_coverage_reached == failing
+    assert from_disk.changed_files_passed == dict.fromkeys(failing, False)
+    assert from_disk.avg_changed_files_coverage == in_memory.avg_changed_files_coverage
+    assert from_disk.avg_changed_files_coverage_reached == in_memory.avg_changed_files_coverage_reached
+    assert evaluators[1].total_coverage_changed_files == evaluators[0].total_coverage_changed_files
+    assert evaluators[1].violations == evaluators[0].violations
+    assert evaluators[1].changed_files_count() == 10
+    store.close()
+
 def test_evaluate_with_low_thresholds(sample_report_file_coverage):
     evaluator = CoverageEvaluator(
         report_files_coverage=[sample_report_file_coverage],
@@ -583,7 +621,6 @@ def test_report_overall_coverage_logged_as_na_when_no_metric_weight(mocker: Mock
 
 
 def test_report_changed_files_coverage_logged_as_na_when_no_metric_weight(mocker: MockerFixture, caplog):
-    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_metric", return_value="branch")
     overall = Coverage(
         instruction=Counter(missed=0, covered=10),
         branch=Counter(missed=0, covered=10),
@@ -615,6 +652,7 @@ def test_report_changed_files_coverage_logged_as_na_when_no_metric_weight(mocker
         global_min_coverage_overall=0.0,
         global_min_coverage_changed_files=50.0,
         report_thresholds_default=(0.0, 80.0, 0.0),
+        metric="branch",
     )
 
     with caplog.at_level(logging.INFO, logger="jacoco_report.evaluator.coverage_evaluator"):
@@ -686,7 +724,6 @@ def test_group_changed_files_coverage_logged_when_metric_has_zero_weight(
     mocker: MockerFixture,
     caplog,
 ):
-    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_metric", return_value="branch")
     overall = Coverage(
         instruction=Counter(missed=0, covered=10),
         branch=Counter(missed=0, covered=10),
@@ -725,6 +762,7 @@ def test_group_changed_files_coverage_logged_when_metric_has_zero_weight(
         global_min_coverage_overall=50.0,
         global_min_coverage_changed_files=50.0,
         report_groups=[group],
+        metric="branch",
     )
     with caplog.at_level(logging.INFO, logger="jacoco_report.evaluator.coverage_evaluator"):
         evaluator.evaluate()
@@ -923,11 +961,11 @@ def test_metric_line_fails_when_instruction_would_pass(mocker):
         changed_files_coverage={},
     )
 
-    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_metric", return_value="line")
     ev_line = CoverageEvaluator(
         report_files_coverage=[report],
         global_min_coverage_overall=80.0,
         global_min_coverage_changed_files=0.0,
+        metric="line",
     )
     ev_line.evaluate()
     assert ev_line.total_coverage_overall_passed is False
@@ -1181,4 +1219,65 @@ def test_changed_file_with_zero_metric_weight_but_data_in_other_metric(
     assert "com/example/Main.scala" not in report_ev.changed_files_coverage_reached
     # Aggregate should also be zero for selected metric
     assert report_ev.avg_changed_files_coverage.covered == 0
-    assert report_ev.avg_changed_files_coverage.missed == 0
\ No newline at end of file
+    assert report_ev.avg_changed_files_coverage.missed == 0
+
+def test_evaluate_explicit_metric_ignores_action_input(sample_report_file_coverage, mocker: MockerFixture):
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_metric", return_value="instruction")
+    evaluator = CoverageEvaluator(
+        report_files_coverage=[sample_report_file_coverage],
+        global_min_coverage_overall=75.0,
+        global_min_coverage_changed_files=50.0,
+        metric="branch",
+    )
+    evaluator.evaluate()
+    assert evaluator.metric == "branch"
+    assert evaluator.total_coverage_overall == 70.0
+    assert evaluator.total_coverage_changed_files == 100.0
+    assert evaluator.total_coverage_overall_passed is False
+
+
+def test_threshold_uses_group_metric_entry(mocker: MockerFixture):
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_metric", return_value="instruction")
+    group = ReportGroup(name="team-a", paths=["**"], min_coverage_overall=70.0,
+                        metric_thresholds={"line": (90.0, None, 40.0)})
+    report = _make_minimal_report("report-a", "team-a")
+    evaluator = CoverageEvaluator(
+        report_files_coverage=[report],
+        global_min_coverage_overall=0.0,
+        global_min_coverage_changed_files=0.0,
+        report_groups=[group],
+        report_thresholds_default=(55.0, 45.0, 35.0),
+        metric="line",
+    )
+    evaluator.evaluate()
+    ev = evaluator.evaluated_reports_coverage["report-a.xml"]
+    assert ev.overall_coverage_threshold == 90.0
+    assert ev.changed_files_threshold == 45.0
+    assert ev.per_changed_file_threshold == 40.0
+
+
+def test_groups_aggregate_only_their_reports_and_log_empty_groups(mocker: MockerFixture, caplog):
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_metric", return_value="instruction")
+    groups = [ReportGroup(name=name, paths=["**"]) for name in ("team-a", "team-b", "team-c")]
+    reports = [
+        _make_minimal_report("report-a1", "team-a"),
+        _make_minimal_report("report-a2", "team-a"),
+        _make_minimal_report("report-b", "team-b"),
+        _make_minimal_report("report-x", "unknown-group"),
+    ]
+    evaluator = CoverageEvaluator(
+        report_files_coverage=reports,
+        global_min_coverage_overall=0.0,
+        global_min_coverage_changed_files=0.0,
+        report_groups=groups,
+    )
+
+    with caplog.at_level(logging.INFO, logger="jacoco_report.evaluator.coverage_evaluator"):
+        evaluator.evaluate()
+
+    assert evaluator.evaluated_groups_coverage["team-a"].overall_coverage.covered == 20
+    assert evaluator.evaluated_groups_coverage["team-b"].overall_coverage.covered == 10
+    assert evaluator.evaluated_groups_coverage["team-c"].overall_coverage.covered == 0
+    messages = [r.message for r in caplog.records]
+    assert "Group 'team-c' has no reports contributing after filtering." in messages
+    assert not any("Group 'team-a' has no reports" in m for m in messages)
@@ -0,0 +1,83 @@
+from array import array
+
+from jacoco_report.evaluator.metric_matrix import (
+    METRIC_COLUMNS,
+    MetricMatrix,
+    coverage_percentages,
+    expand_per_segment,
+    has_weight,
+    reached_thresholds,
+)
+from jacoco_report.model.counter import Counter
+from jacoco_report.model.coverage import Coverage
+
+
+def _coverage(base: int) -> Coverage:
+    return Coverage(
+        Counter(base, base + 1),  # instruction
+        Counter(base + 2, base + 3),  # branch
+        Counter(base + 4, base + 5),  # line
+        Counter(base + 6, base + 7),  # complexity
+        Counter(base + 8, base + 9),  # method
+        Counter(base + 10, base + 11),  # class
+    )
+
+
+def test_from_coverages_lays_out_rows_of_six_metrics():
+    matrix = MetricMatrix.from_coverages([_coverage(0), _coverage(100)])
+
+    assert matrix.rows == 2
+    assert len(matrix.data) == 2 * len(METRIC_COLUMNS) * 2
+    assert matrix.data.typecode == "q"
+
+
+def test_column_matches_coverage_values_for_every_metric():
+    coverages = [_coverage(0), _coverage(100), _coverage(7)]
+    matrix = MetricMatrix.from_coverages(coverages)
+
+    for metric in METRIC_COLUMNS:
+        missed, covered = matrix.column(metric)
+        assert list(zip(missed, covered)) == [c.get_values_by_metric(metric) for c in coverages]
+
+
+def test_column_of_unknown_metric_is_zero(caplog):
+    missed, covered = MetricMatrix.from_coverages([_coverage(1)]).column("unknown")
+
+    assert list(missed) == [0] and list(covered) == [0]
+    assert "Unknown metric type: unknown" in caplog.text
+
+
+def test_totals_and_segment_sums():
+    matrix = MetricMatrix.from_coverages([_coverage(0), _coverage(10), _coverage(20)])
+
+    assert matrix.totals("instruction") == (30, 33)
+    assert matrix.segment_sums("instruction", [0, 2, 2, 3]) == [(10, 12), (0, 0), (20, 21)]
+
+
+def test_coverage_percentages_match_counter_rounding():
+    missed, covered = array("q", [1, 0, 2, 0]), array("q", [2, 0, 1, 5])
+
+    assert coverage_percentages(missed, covered) == [
+        Counter(1, 2).coverage(),
+        0.0,
+        Counter(2, 1).coverage(),
+        100.0,
+    ]
+    assert has_weight(missed, covered) == [True, False, True, True]
+
+
+def test_thresholds_expand_per_segment_and_compare():
+    thresholds = expand_per_segment([50.0, 80.0], [0, 2, 3])
+
+    assert thresholds == [50.0, 50.0, 80.0]
+    assert reached_thresholds([50.0, 49.99, 79.0], thresholds) == [True, False, False]
+
+
+def test_evaluate_returns_per_row_values():
+    zero = Coverage(*(Counter(0, 0) for _ in range(6)))
+    column = MetricMatrix.from_coverages([_coverage(1), zero]).evaluate("instruction")
+
+    assert list(column.missed) == [1, 0]
+    assert list(column.covered) == [2, 0]
+    assert column.reached == [Counter(1, 2).coverage(), 0.0]
+    assert column.weighted == [True, False]
@@ -0,0 +1,94 @@
+from jacoco_report.generator.check_run_sink import CheckRunSink
+from jacoco_report.generator.output_sinks import RenderedReport
+from jacoco_report.utils.api_stats import ApiCallStats
+
+
+def _report(failing: int, passing: int = 1, violations: bool = True) -> RenderedReport:
+    files_passed = {f"com/example/Fail{i}.java": False for i in range(failing)}
+    files_passed.update({f"com/example/Pass{i}.java": True for i in range(passing)})
+    coverage = {name: (90.0 if passed else float(i % 80)) for i, (name, passed) in enumerate(files_passed.items())}
+    return RenderedReport(
+        title="JaCoCo Coverage Report",
+        markdown="**JaCoCo Coverage Report**",
+        data={
+            "reports": {
+                "module/jacoco.xml": {
+                    "name": "Module",
+                    "changed_files_passed": files_passed,
+                    "changed_files_coverage_reached": coverage,
+                    "per_changed_file_threshold": 80.0,
+                }
+            },
+            "violations": ["violation"] if violations else [],
+        },
+    )
+
+
+def _gh(mocker, remaining=None):
+    gh = mocker.Mock()
+    gh.api_stats = ApiCallStats()
+    gh.api_stats.rate_limit_remaining = remaining
+    gh.create_check_run.return_value = 7
+    gh.update_check_run.return_value = True
+    return gh
+
+
+def test_annotations_point_at_pr_paths_and_skip_passing_files(mocker):
+    sink = CheckRunSink(_gh(mocker), "abc", ["src/main/java/com/example/Fail0.java"])
+
+    annotations = sink.build_annotations(_report(failing=2).data["reports"])
+
+    assert [a["path"] for a in annotations] == ["src/main/java/com/example/Fail0.java", "com/example/Fail1.java"]
+    assert annotations[0]["annotation_level"] == "failure"
+    assert "Coverage 0.00% is below the threshold of 80.00% (report: Module)." == annotations[0]["message"]
+
+
+def test_write_sends_annotations_in_batches_of_50(mocker):
+    gh = _gh(mocker)
+
+    assert CheckRunSink(gh, "abc", []).write(_report(failing=120)) is True
+
+    name, head_sha, conclusion, output = gh.create_check_run.call_args.args
+    assert (name, head_sha, conclusion) == ("JaCoCo Coverage Report", "abc", "failure")
+    assert len(output["annotations"]) == 50
+    assert [len(call.args[1]["annotations"]) for call in gh.update_check_run.call_args_list] == [50, 20]
+
+
+def test_write_without_failures_creates_successful_check_run(mocker):
+    gh = _gh(mocker)
+
+    assert CheckRunSink(gh, "abc", []).write(_report(failing=0, violations=False)) is True
+
+    assert gh.create_check_run.call_args.args[2] == "success"
+    assert gh.create_check_run.call_args.args[3]["annotations"] == []
+    gh.update_check_run.assert_not_called()
+
+
+def test_write_caps_annotations(mocker):
+    gh = _gh(mocker)
+
+    CheckRunSink(gh, "abc", []).write(_report(failing=510))
+
+    assert gh.update_check_run.call_count == 9
+    assert "10 annotation(s) omitted" in gh.create_check_run.call_args.args[3]["summary"]
+
+
+def test_write_stops_batches_when_rate_limit_is_low(mocker, caplog):
+    gh = _gh(mocker, remaining=20)
+
+    CheckRunSink(gh, "abc", []).write(_report(failing=120))
+
+    # Only the summary correction follows the creation.
+    assert gh.update_check_run.call_count == 1
+    final_output = gh.update_check_run.call_args.args[1]
+    assert final_output["annotations"] == []
+    assert "70 annotation(s) omitted" in final_output["summary"]
+    assert "rate limit is low" in caplog.text
+
+
+def test_write_reports_failed_creation(mocker):
+    gh = _gh(mocker)
+    gh.create_check_run.return_value = None
+
+    assert CheckRunSink(gh, "abc", []).write(_report(failing=1)) is False
+    gh.update_check_run.assert_not_called()
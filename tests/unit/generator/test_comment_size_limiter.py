@@ -0,0 +1,62 @@
+from jacoco_report.generator.comment_size_limiter import (
+    STAGE_SUMMARY,
+    STAGE_WORST_FILES,
+    ChangedFileRow,
+    CommentElision,
+    CommentSizeLimiter,
+)
+
+_HEADER = "| File | Coverage |\n|---|---|"
+
+
+def _rows(count):
+    return [ChangedFileRow(f"\n| File{i:03d} | {i}% |", i >= 50, float(i)) for i in range(count)]
+
+
+def test_elision_note_lists_what_was_left_out():
+    elision = CommentElision(65536, total_files=10)
+    elision.shown_files = 4
+    elision.collapsed_rows = 3
+
+    note = elision.note()
+
+    assert "65,536 characters" in note
+    assert "showing 4 of 10 changed files" in note
+    assert "3 passing rows collapsed" in note
+
+
+def test_fit_keeps_lowest_coverage_rows():
+    limiter = CommentSizeLimiter(600)
+
+    body = limiter.fit("**Title**", [], _rows(100), _HEADER, lambda stage, elision: [])
+
+    assert len(body) <= 600
+    assert "File000" in body
+    assert "File099" not in body
+    assert "changed files (failing and lowest coverage first)" in body
+
+
+def test_fit_moves_to_next_stage_when_row_sections_do_not_fit():
+    seen_stages = []
+
+    def render(stage, elision):
+        seen_stages.append(stage)
+        if stage == STAGE_SUMMARY:
+            elision.summarized_rows = 5
+            return ["**Reports:** 5 passing"]
+        return ["x" * 1000]
+
+    body = CommentSizeLimiter(400).fit("**Title**", ["footer"], [], None, render)
+
+    assert seen_stages[0] == STAGE_WORST_FILES
+    assert seen_stages[-1] == STAGE_SUMMARY
+    assert "**Reports:** 5 passing" in body
+    assert body.endswith("footer")
+
+
+def test_fit_truncates_when_nothing_fits():
+    body = CommentSizeLimiter(300).fit("**Title**\n\n" + "y" * 1000, [], [], None, lambda stage, elision: [])
+
+    assert len(body) <= 300
+    assert body.startswith("**Title**")
+    assert "characters truncated." in body
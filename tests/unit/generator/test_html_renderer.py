@@ -0,0 +1,33 @@
+from jacoco_report.generator.html_renderer import markdown_to_html
+
+
+def test_markdown_to_html_renders_tables_and_inline_markup():
+    markdown = (
+        "**Title**\n\n"
+        "| File Path | Coverage | Status |\n"
+        "|-----------|----------|--------|\n"
+        "| [Foo\\[1\\].java](https://github.com/o/r/pull/1/files#diff-abc) | 50.0% | ❌ |\n"
+        "| `core` | 90.0% | ✅ |"
+    )
+
+    page = markdown_to_html(markdown, "Report")
+
+    assert "<p><strong>Title</strong></p>" in page
+    assert "<thead><tr><th>File Path</th><th>Coverage</th><th>Status</th></tr></thead>" in page
+    assert '<td><a href="https://github.com/o/r/pull/1/files#diff-abc">Foo[1].java</a></td>' in page
+    assert "<td><code>core</code></td>" in page
+    assert "-----" not in page
+
+
+def test_markdown_to_html_escapes_html_but_keeps_details():
+    markdown = "<details><summary>⚠️ 2 reports</summary>\n\n- `a<b>`\n- `c`\n\n</details>\n\n---\n*Run `1`*\n\n> note"
+
+    page = markdown_to_html(markdown, "<Report>")
+
+    assert "<title>&lt;Report&gt;</title>" in page
+    assert "<details><summary>⚠️ 2 reports</summary>" in page
+    assert "</details>" in page
+    assert "<li><code>a&lt;b&gt;</code></li>" in page
+    assert "<hr>" in page
+    assert "<p><em>Run <code>1</code></em></p>" in page
+    assert "<blockquote><p>note</p></blockquote>" in page
@@ -0,0 +1,48 @@
+import json
+
+from jacoco_report.generator.output_sinks import HtmlReportSink, JsonReportSink, RenderedReport, StepSummarySink
+
+_REPORT = RenderedReport(
+    title="JaCoCo Coverage Report",
+    markdown="**JaCoCo Coverage Report**\n\n| Metric | Coverage |\n|---|---|\n| **Overall** | 85.0% |",
+    data={"coverage_overall": 85.0, "reports": {}},
+)
+
+
+def test_step_summary_sink_appends(tmp_path):
+    summary = tmp_path / "summary.md"
+    summary.write_text("previous step\n", encoding="utf-8")
+
+    assert StepSummarySink(str(summary)).write(_REPORT) is True
+    assert StepSummarySink(str(summary)).write(_REPORT) is True
+
+    content = summary.read_text(encoding="utf-8")
+    assert content.startswith("previous step\n")
+    assert content.count("**JaCoCo Coverage Report**") == 2
+
+
+def test_step_summary_sink_reports_failure(tmp_path, caplog):
+    sink = StepSummarySink(str(tmp_path / "missing-dir" / "summary.md"))
+
+    assert sink.write(_REPORT) is False
+    assert "Failed to append the report to the step summary" in caplog.text
+
+
+def test_json_report_sink_creates_directory(tmp_path):
+    sink = JsonReportSink(str(tmp_path / "out" / "coverage"))
+
+    assert sink.write(_REPORT) is True
+
+    written = json.loads((tmp_path / "out" / "coverage" / "coverage-report.json").read_text(encoding="utf-8"))
+    assert written == _REPORT.data
+
+
+def test_html_report_sink_writes_table(tmp_path):
+    sink = HtmlReportSink(str(tmp_path))
+
+    assert sink.write(_REPORT) is True
+
+    page = (tmp_path / "coverage-report.html").read_text(encoding="utf-8")
+    assert page.startswith("<!DOCTYPE html>")
+    assert "<title>JaCoCo Coverage Report</title>" in page
+    assert "<td><strong>Overall</strong></td><td>85.0%</td>" in page
@@ -1,10 +1,12 @@
 import logging
+from dataclasses import replace
 
 import pytest
 
+from jacoco_report.action_config import ActionConfig
 from jacoco_report.action_inputs import ActionInputs
 from jacoco_report.evaluator.coverage_evaluator import CoverageEvaluator
-from jacoco_report.generator.pr_comment_generator import PRCommentGenerator
+from jacoco_report.generator.pr_comment_generator import PRCommentGenerator, sparkline
 from jacoco_report.model.counter import Counter
 from jacoco_report.model.coverage import Coverage
 from jacoco_report.model.evaluated_report_coverage import EvaluatedReportCoverage
@@ -31,7 +33,7 @@ def test_evaluator(mocker):
 
 @pytest.fixture
 def pr_comment_generator(mock_github, test_evaluator):
-    return PRCommentGenerator(mock_github, test_evaluator, None, 1)
+    return PRCommentGenerator(mock_github, test_evaluator, None, 1, config=ActionConfig.from_inputs())
 
 
 def _make_evaluated_coverage(
@@ -73,6 +75,7 @@ def _configure_generator_for_comment_tests(generator, mocker, *, comment_level):
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_global_changed_files_average_threshold", return_value=80.0)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=False)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_repository", return_value="owner/repo")
+    generator.config = ActionConfig.from_inputs()
     generator.gh.get_comments.return_value = []
 
 
@@ -104,6 +107,64 @@ def test_get_basic_table(pr_comment_generator, mocker):
     assert "| **Overall**       | 85.2% | 80.0% | ✅ |" in table
     assert "| **Changed Files** | 78.4% | 80.0% | ❌ |" in table
 
+def test_get_metrics_table(mock_github, test_evaluator):
+    branch_evaluator = CoverageEvaluator(
+        report_files_coverage=[],
+        global_min_coverage_overall=60.0,
+        global_min_coverage_changed_files=50.0,
+        metric="branch",
+    )
+    branch_evaluator.total_coverage_overall = 61.0
+    branch_evaluator.total_coverage_changed_files = 48.0
+    branch_evaluator.violations = ["Global changed files coverage is below the threshold."]
+    generator = PRCommentGenerator(
+        mock_github, test_evaluator, None, 1,
+        metric_evaluators={"instruction": test_evaluator, "branch": branch_evaluator},
+        config=ActionConfig.from_inputs(),
+    )
+
+    table = generator.get_metrics_table("✅", "❌")
+
+    assert "| **instruction** | 85.2% | 80.0% | 78.4% | 80.0% | ✅ |" in table
+    assert "| **branch** | 61.0% | 60.0% | 48.0% | 50.0% | ❌ |" in table
+
+
+def test_metrics_table_is_omitted_for_single_metric(mock_github, test_evaluator, mocker):
+    generator = PRCommentGenerator(mock_github, test_evaluator, None, 1, metric_evaluators={"instruction": test_evaluator}, config=ActionConfig.from_inputs())
+    _configure_generator_for_comment_tests(generator, mocker, comment_level="full")
+
+    generator.generate()
+
+    assert "| Metric | Overall |" not in generator.gh.add_comment.call_args[0][1]
+
+
+def test_sparkline_scales_between_minimum_and_maximum():
+    assert sparkline([70.0, 75.0, 80.0]) == "▁▅█"
+    assert sparkline([80.0, 80.0]) == "▅▅"
+    assert sparkline([]) == ""
+
+
+def test_trend_line_is_shown_below_the_global_table(mock_github, test_evaluator, mocker):
+    from jacoco_report.model.coverage_history import TrendPoint
+
+    trend = [TrendPoint(1, "a", 80.0, 0.0), TrendPoint(2, "b", 90.0, 0.0)]
+    generator = PRCommentGenerator(mock_github, test_evaluator, None, 1, trend=trend, config=ActionConfig.from_inputs())
+    _configure_generator_for_comment_tests(generator, mocker, comment_level="minimal")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_base_ref", return_value="master")
+    generator.config = ActionConfig.from_inputs()
+
+    body = generator.render_body("minimal")
+
+    assert "**Trend** (instruction, last 2 `master` runs, then this one): ▁█▅ 80.0% → 85.2%" in body
+    assert body.index("| **Changed Files**") < body.index("**Trend**")
+
+
+def test_trend_line_is_omitted_without_history(pr_comment_generator, mocker):
+    _configure_generator_for_comment_tests(pr_comment_generator, mocker, comment_level="minimal")
+
+    assert "**Trend**" not in pr_comment_generator.render_body("minimal")
+
+
 def test_get_changed_files_table_without_baseline(pr_comment_generator):
     table = pr_comment_generator.generate_changed_files_table_without_baseline("✅", "❌")
     assert "| File Path | Coverage | Threshold | Status |\n|-----------|----------|-----------|--------|\n\nNo changed file in reports." in table
@@ -163,7 +224,7 @@ def test_generate_changed_files_table_with_baseline(pr_comment_generator, mocker
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_skip_unchanged", return_value=False)
     mocker.patch("hashlib.sha256", return_value=mocker.Mock(hexdigest=lambda: "fakehash"))
 
-    pr_comment_generator.github_repository = "fake_repo"
+    pr_comment_generator.config = replace(pr_comment_generator.config, github=replace(pr_comment_generator.config.github, repository="fake_repo"))
     pr_comment_generator.pr_number = 1
 
     # Mock the evaluator with some values
@@ -203,7 +264,7 @@ def test_generate_changed_files_table_with_baseline_no_evaluated_report_coverage
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_skip_unchanged", return_value=False)
     mocker.patch("hashlib.sha256", return_value=mocker.Mock(hexdigest=lambda: "fakehash"))
 
-    pr_comment_generator.github_repository = "fake_repo"
+    pr_comment_generator.config = replace(pr_comment_generator.config, github=replace(pr_comment_generator.config.github, repository="fake_repo"))
     pr_comment_generator.pr_number = 1
 
     # Mock the evaluator with some values
@@ -230,10 +291,10 @@ def test_generate_changed_files_table_with_baseline_no_evaluated_report_coverage
     # Generate the table
     table = pr_comment_generator.generate_changed_files_table_with_baseline("✅", "❌")
 
-    # Assert the table content
+    # No baseline report matches 'report1'; the file still joins by its source path: 80.0 - 70.0
     expected_table = """| File Path | Coverage | Threshold | Δ Coverage | Status |
 |-----------|----------|-----------|------------|--------|
-| [file1.java](https://github.com/fake_repo/pull/1/files#diff-fakehash) | 80.0% | 0.0% | 0.0% | ✅ |"""
+| [file1.java](https://github.com/fake_repo/pull/1/files#diff-fakehash) | 80.0% | 0.0% | +10.0% | ✅ |"""
     assert table == expected_table
 
 def test_generate_changed_files_table_with_baseline_no_changed_file(pr_comment_generator, mocker):
@@ -243,7 +304,7 @@ def test_generate_changed_files_table_with_baseline_no_changed_file(pr_comment_g
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_skip_unchanged", return_value=False)
     mocker.patch("hashlib.sha256", return_value=mocker.Mock(hexdigest=lambda: "fakehash"))
 
-    pr_comment_generator.github_repository = "fake_repo"
+    pr_comment_generator.config = replace(pr_comment_generator.config, github=replace(pr_comment_generator.config.github, repository="fake_repo"))
     pr_comment_generator.pr_number = 1
 
     # Mock the evaluator with some values
@@ -630,6 +691,7 @@ def test_none_deletes_existing_comment_when_update_comment_enabled(pr_comment_ge
     _configure_generator_for_comment_tests(pr_comment_generator, mocker, comment_level="none")
     pr_comment_generator.gh.get_comments.return_value = [{"id": 123, "body": "**JaCoCo**\n\nold body"}]
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
+    pr_comment_generator.config = ActionConfig.from_inputs()
 
     pr_comment_generator.generate()
 
@@ -643,6 +705,7 @@ def test_none_leaves_existing_comment_when_update_comment_disabled(pr_comment_ge
     _configure_generator_for_comment_tests(pr_comment_generator, mocker, comment_level="none")
     pr_comment_generator.gh.get_comments.return_value = [{"id": 123, "body": "**JaCoCo**\n\nold body"}]
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=False)
+    pr_comment_generator.config = ActionConfig.from_inputs()
 
     pr_comment_generator.generate()
 
@@ -953,7 +1016,8 @@ def test_metadata_footer_all_fields(pr_comment_generator, mocker):
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="pull_request")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_started_at", return_value="2025-01-01T00:00:00Z")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_action_ref", return_value="v3.0.0")
-    pr_comment_generator.github_repository = "owner/repo"
+    pr_comment_generator.config = ActionConfig.from_inputs()
+    pr_comment_generator.config = replace(pr_comment_generator.config, github=replace(pr_comment_generator.config.github, repository="owner/repo"))
 
     pr_comment_generator.generate()
 
@@ -972,6 +1036,7 @@ def test_metadata_footer_no_run_id(pr_comment_generator, mocker):
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="pull_request")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_started_at", return_value="2025-01-01T00:00:00Z")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_action_ref", return_value="v3.0.0")
+    pr_comment_generator.config = ActionConfig.from_inputs()
 
     pr_comment_generator.generate()
 
@@ -989,6 +1054,7 @@ def test_metadata_footer_all_empty_returns_empty_string(pr_comment_generator, mo
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_started_at", return_value="")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_action_ref", return_value="")
+    pr_comment_generator.config = ActionConfig.from_inputs()
 
     pr_comment_generator.generate()
 
@@ -1003,7 +1069,8 @@ def test_metadata_footer_run_id_without_repository(pr_comment_generator, mocker)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_started_at", return_value="")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_action_ref", return_value="")
-    pr_comment_generator.github_repository = ""
+    pr_comment_generator.config = ActionConfig.from_inputs()
+    pr_comment_generator.config = replace(pr_comment_generator.config, github=replace(pr_comment_generator.config.github, repository=""))
 
     pr_comment_generator.generate()
 
@@ -1015,11 +1082,12 @@ def test_metadata_footer_run_id_without_repository(pr_comment_generator, mocker)
 
 def test_metadata_footer_appended_to_comment_body(pr_comment_generator, mocker):
     _configure_generator_for_comment_tests(pr_comment_generator, mocker, comment_level="minimal")
-    pr_comment_generator.github_repository = "owner/repo"
+    pr_comment_generator.config = replace(pr_comment_generator.config, github=replace(pr_comment_generator.config.github, repository="owner/repo"))
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_id", return_value="9876543210")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="pull_request")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_started_at", return_value="2025-01-01T00:00:00Z")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_action_ref", return_value="v3.0.0")
+    pr_comment_generator.config = ActionConfig.from_inputs()
 
     pr_comment_generator.generate()
 
@@ -1037,6 +1105,7 @@ def test_metadata_footer_not_appended_for_none_level(pr_comment_generator, mocke
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="pull_request")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_started_at", return_value="2025-01-01T00:00:00Z")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_action_ref", return_value="v3.0.0")
+    pr_comment_generator.config = ActionConfig.from_inputs()
 
     pr_comment_generator.generate()
 
@@ -1259,10 +1328,11 @@ def test_baseline_mismatched_name_yields_zero_delta(make_report_file_coverage, m
 def test_title_change_creates_new_comment_orphans_old(mocker, mock_github, test_evaluator):
     """Changing title creates a new comment; the old comment with the previous title is not touched."""
     empty_bs = _make_empty_evaluator()
-    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1)
+    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1, config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.MINIMAL)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_title", return_value="New Title")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
+    gen.config = ActionConfig.from_inputs()
     mock_github.get_comments.return_value = [{"id": 99, "body": "**Old Title**\n\nold coverage content"}]
 
     gen.generate()
@@ -1286,10 +1356,11 @@ def test_two_generators_with_different_titles_post_independently(mocker, mock_gi
     ev_a.total_coverage_changed_files_passed = True
 
     bs_ev = _make_empty_evaluator()
-    gen_a = PRCommentGenerator(mock_github, ev_a, bs_ev, pr_number=1)
+    gen_a = PRCommentGenerator(mock_github, ev_a, bs_ev, pr_number=1, config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen_a, mocker, comment_level=CommentLevelEnum.MINIMAL)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_title", return_value="Team A Coverage")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
+    gen_a.config = ActionConfig.from_inputs()
     gen_a.generate()
 
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_title", return_value="Team B Coverage")
@@ -1301,7 +1372,7 @@ def test_two_generators_with_different_titles_post_independently(mocker, mock_gi
     ev_b.total_coverage_overall_passed = True
     ev_b.total_coverage_changed_files = 85.0
     ev_b.total_coverage_changed_files_passed = True
-    gen_b = PRCommentGenerator(mock_github, ev_b, bs_ev, pr_number=1)
+    gen_b = PRCommentGenerator(mock_github, ev_b, bs_ev, pr_number=1, config=ActionConfig.from_inputs())
     gen_b.generate()
 
     assert mock_github.add_comment.call_count == 2
@@ -1321,7 +1392,7 @@ def test_debug_flag_does_not_change_comment_body(mocker, mock_github, test_evalu
         mock_github.get_comments.return_value = []
         mocker.patch("jacoco_report.action_inputs.ActionInputs.get_debug", return_value=debug_val)
         mocker.patch("jacoco_report.action_inputs.ActionInputs.get_repository", return_value="owner/repo")
-        gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1)
+        gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1, config=ActionConfig.from_inputs())
         _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.MINIMAL)
         gen.generate()
         return mock_github.add_comment.call_args[0][1]
@@ -1334,7 +1405,7 @@ def test_debug_flag_does_not_change_comment_body(mocker, mock_github, test_evalu
 def test_debug_flag_not_consulted_during_generate(mocker, mock_github, test_evaluator):
     """PRCommentGenerator.generate() never reads the debug flag."""
     empty_bs = _make_empty_evaluator()
-    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1)
+    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1, config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.MINIMAL)
     debug_spy = mocker.spy(ActionInputs, "get_debug")
     gen.generate()
@@ -1348,7 +1419,7 @@ def test_debug_flag_not_consulted_during_generate(mocker, mock_github, test_eval
 def test_update_comment_false_appends_despite_matching_title(mocker, mock_github, test_evaluator):
     """update-comment=false causes add_comment to be called even when an existing comment matches the title."""
     empty_bs = _make_empty_evaluator()
-    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1)
+    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1, config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.MINIMAL)
     mock_github.get_comments.return_value = [{"id": 99, "body": "**JaCoCo**\n\nold content"}]
 
@@ -1362,7 +1433,7 @@ def test_update_comment_false_appends_despite_matching_title(mocker, mock_github
 def test_update_comment_false_appends_across_comment_levels(mocker, mock_github, test_evaluator, level):
     """update-comment=false appends a new comment for every comment level that posts content."""
     empty_bs = _make_empty_evaluator()
-    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1)
+    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1, config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=level)
     mock_github.get_comments.return_value = [{"id": 99, "body": "**JaCoCo**\n\nprevious content"}]
 
@@ -1379,10 +1450,11 @@ def test_update_comment_false_appends_across_comment_levels(mocker, mock_github,
 def test_title_identity_key_does_not_match_different_title(mocker, mock_github, test_evaluator):
     """Generator with 'New JaCoCo' title does not update a comment that starts with 'Old JaCoCo'."""
     empty_bs = _make_empty_evaluator()
-    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1)
+    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1, config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.MINIMAL)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_title", return_value="New JaCoCo")
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
+    gen.config = ActionConfig.from_inputs()
     mock_github.get_comments.return_value = [{"id": 99, "body": "**Old JaCoCo**\n\nold coverage content"}]
 
     gen.generate()
@@ -1394,9 +1466,10 @@ def test_title_identity_key_does_not_match_different_title(mocker, mock_github,
 def test_title_identity_key_matches_correct_comment(mocker, mock_github, test_evaluator):
     """Generator with 'JaCoCo' title DOES update the comment that starts with '**JaCoCo**'."""
     empty_bs = _make_empty_evaluator()
-    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1)
+    gen = PRCommentGenerator(mock_github, test_evaluator, empty_bs, pr_number=1, config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.MINIMAL)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
+    gen.config = ActionConfig.from_inputs()
     mock_github.get_comments.return_value = [{"id": 42, "body": "**JaCoCo**\n\nexisting coverage content"}]
 
     gen.generate()
@@ -1410,7 +1483,7 @@ def test_title_identity_key_matches_correct_comment(mocker, mock_github, test_ev
 
 def test_no_warning_all_reports_grouped(mocker, mock_github, test_evaluator):
     """No warning when all reports are matched to groups."""
-    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=[])
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=[], config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.FULL)
     _set_mixed_comment_level_fixture(gen)
 
@@ -1422,7 +1495,7 @@ def test_no_warning_all_reports_grouped(mocker, mock_github, test_evaluator):
 
 def test_warning_one_ungrouped_report(mocker, mock_github, test_evaluator):
     """Warning section appears when 1 report is unmatched."""
-    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=["infra/target/jacoco.xml"])
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=["infra/target/jacoco.xml"], config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.FULL)
     _set_mixed_comment_level_fixture(gen)
 
@@ -1436,7 +1509,7 @@ def test_warning_one_ungrouped_report(mocker, mock_github, test_evaluator):
 def test_warning_multiple_ungrouped(mocker, mock_github, test_evaluator):
     """Warning section lists all ungrouped reports."""
     ungrouped = ["infra/target/jacoco.xml", "tests/target/jacoco.xml"]
-    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=ungrouped)
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=ungrouped, config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.FULL)
     _set_mixed_comment_level_fixture(gen)
 
@@ -1448,11 +1521,104 @@ def test_warning_multiple_ungrouped(mocker, mock_github, test_evaluator):
 
 def test_no_warning_empty_ungrouped_list(mocker, mock_github, test_evaluator):
     """No warning when ungrouped_reports list is empty."""
-    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=[])
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=[], config=ActionConfig.from_inputs())
     _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.FULL)
     _set_mixed_comment_level_fixture(gen)
 
     title, body = gen._get_comment_content(CommentLevelEnum.FULL)
 
     assert "not assigned to any group" not in body
-    mock_github.add_comment.assert_not_called()
\ No newline at end of file
+    mock_github.add_comment.assert_not_called()
+
+# ---------------------------------------------------------------------------
+# Comment size limit
+# ---------------------------------------------------------------------------
+
+def _set_large_comment_fixture(gen, *, reports=40, files_per_report=50):
+    gen.evaluator.evaluated_groups_coverage = {}
+    gen.evaluator.evaluated_reports_coverage = {
+        f"report-{r:03d}": _make_evaluated_coverage(
+            f"report-{r:03d}",
+            overall_passed=r % 10 != 0,
+            changed_files={
+                f"src/com/example/module{r:03d}/VeryLongClassNameNumber{i:04d}.java": 70.0 + (i % 30)
+                for i in range(files_per_report)
+            },
+        )
+        for r in range(reports)
+    }
+
+
+def test_comment_within_limit_is_not_shortened(mocker, mock_github, test_evaluator):
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, config=ActionConfig.from_inputs())
+    _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.FULL)
+    _set_mixed_comment_level_fixture(gen)
+
+    _, body = gen._get_comment_content(CommentLevelEnum.FULL)
+
+    assert "Comment shortened" not in body
+
+
+def test_oversized_comment_keeps_worst_changed_files(mocker, mock_github, test_evaluator):
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, config=ActionConfig.from_inputs())
+    _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.FULL)
+    _set_large_comment_fixture(gen)
+    _, full_body = gen._get_comment_content(CommentLevelEnum.FULL)
+    gen.max_comment_length = len(full_body) // 3
+
+    _, body = gen._get_comment_content(CommentLevelEnum.FULL)
+
+    assert len(body) <= gen.max_comment_length
+    assert "| `report-039` |" in body  # report table kept in full at the first stage
+    assert "of 2000 changed files (failing and lowest coverage first)" in body
+    file_coverages = [float(line.split(" | ")[1].rstrip("%")) for line in body.splitlines() if "VeryLongClassName" in line]
+    assert file_coverages
+    assert max(file_coverages) < 99.0  # best-covered files are dropped first
+
+
+def test_oversized_comment_collapses_passing_rows(mocker, mock_github, test_evaluator):
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, config=ActionConfig.from_inputs())
+    _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.FULL)
+    _set_large_comment_fixture(gen, reports=400, files_per_report=1)
+    gen.max_comment_length = 12_000
+
+    _, body = gen._get_comment_content(CommentLevelEnum.FULL)
+
+    assert len(body) <= gen.max_comment_length
+    assert "<details><summary>✅ 360 passing reports</summary>" in body
+    assert "| `report-010` |" in body  # failing rows stay in the table
+    assert "360 passing rows collapsed" in body
+
+
+def test_oversized_comment_summarizes_counts(mocker, mock_github, test_evaluator):
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, config=ActionConfig.from_inputs())
+    _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.FULL)
+    _set_large_comment_fixture(gen, reports=400, files_per_report=1)
+    gen.max_comment_length = 2_000
+
+    _, body = gen._get_comment_content(CommentLevelEnum.FULL)
+
+    assert len(body) <= gen.max_comment_length
+    assert "**Reports:** 360 passing ✅, 40 failing ❌" in body
+    assert "400 group/report rows summarized as counts" in body
+
+
+def test_oversized_comment_is_truncated_as_last_resort(mocker, mock_github, test_evaluator):
+    ungrouped = [f"very/long/path/to/module{i:04d}/target/site/jacoco/jacoco.xml" for i in range(200)]
+    gen = PRCommentGenerator(mock_github, test_evaluator, None, pr_number=1, ungrouped_reports=ungrouped, config=ActionConfig.from_inputs())
+    _configure_generator_for_comment_tests(gen, mocker, comment_level=CommentLevelEnum.MINIMAL)
+    gen.max_comment_length = 1_000
+
+    title, body = gen._get_comment_content(CommentLevelEnum.MINIMAL)
+
+    assert len(body) <= gen.max_comment_length
+    assert body.startswith(title)
+    assert "characters truncated." in body
+
+
+def test_baseline_join_is_built_once_and_reset_with_the_baseline(pr_comment_generator, mocker):
+    join = pr_comment_generator.baseline_join
+
+    assert pr_comment_generator.baseline_join is join
+    pr_comment_generator.bs_evaluator = mocker.Mock()
+    assert pr_comment_generator.baseline_join is not join
@@ -64,4 +64,26 @@ def test_str(coverage):
         "Line: Missed: 2, Covered: 8, Complexity: Missed: 1, Covered: 9, "
         "Method: Missed: 4, Covered: 6, Class: Missed: 0, Covered: 5"
     )
-    assert str(coverage) == expected_str
\ No newline at end of file
+    assert str(coverage) == expected_str
+
+def test_counters_are_stored_as_twelve_ints(coverage):
+    assert list(coverage.values) == [5, 10, 2, 8, 3, 7, 1, 9, 4, 6, 0, 5]
+    assert not hasattr(coverage, "__dict__")
+
+
+def test_assigning_counter_updates_values(coverage):
+    coverage.branch = Counter(missed=1, covered=1)
+
+    assert coverage.branch == Counter(1, 1)
+    assert coverage.get_values_by_metric(MetricTypeEnum.BRANCH) == (1, 1)
+
+
+def test_changing_a_counter_in_place_updates_values(coverage):
+    coverage.instruction.covered += 5
+    coverage.line.missed = 0
+    coverage.branch.append(1, 2)
+
+    assert coverage.instruction == Counter(5, 15)
+    assert coverage.get_values_by_metric(MetricTypeEnum.LINE) == (0, 8)
+    assert coverage.get_values_by_metric(MetricTypeEnum.BRANCH) == (4, 9)
+    assert list(coverage.values) == [5, 15, 0, 8, 4, 9, 1, 9, 4, 6, 0, 5]
@@ -0,0 +1,128 @@
+import sqlite3
+
+import pytest
+
+from jacoco_report.model.coverage_history import (
+    COMMIT_RUNS_QUERY,
+    KIND_GROUP,
+    KIND_REPORT,
+    LAST_RUNS_QUERY,
+    CoverageHistory,
+    HistoryRun,
+    RunCoverage,
+    TrendPoint,
+)
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = CoverageHistory(str(tmp_path / "cache" / "history.db"))
+    yield history
+    history.close()
+
+
+def _record(history, created_at, overall, branch="master", pr_number=None, metric="instruction", reports=None):
+    run = HistoryRun(f"sha{created_at}", branch, "push" if pr_number is None else "pull_request", pr_number, metric,
+                     created_at)
+    return history.record(run, (overall, 0.0), reports or {}, {"core": (overall + 1, 0.0)})
+
+
+def test_trend_lists_the_last_base_branch_runs_oldest_first(history):
+    for created_at, overall in ((10, 80.0), (20, 81.0), (30, 79.5), (40, 82.0)):
+        _record(history, created_at, overall)
+    _record(history, 35, 10.0, branch="feature/x", pr_number=7)
+    _record(history, 36, 10.0, pr_number=8)
+    _record(history, 37, 10.0, metric="line")
+
+    trend = history.trend("master", "instruction", 3)
+
+    assert trend == [
+        TrendPoint(20, "sha20", 81.0, 0.0),
+        TrendPoint(30, "sha30", 79.5, 0.0),
+        TrendPoint(40, "sha40", 82.0, 0.0),
+    ]
+    assert history.trend("develop", "instruction", 3) == []
+
+
+def test_trend_of_one_report_or_group(history):
+    _record(history, 10, 80.0, reports={"module-a": (70.0, 60.0), "module-b": (90.0, 0.0)})
+    _record(history, 20, 81.0, reports={"module-b": (91.0, 0.0)})
+    _record(history, 30, 82.0, reports={"module-a": (72.0, 65.0)})
+
+    assert history.trend("master", "instruction", 10, KIND_REPORT, "module-a") == [
+        TrendPoint(10, "sha10", 70.0, 60.0),
+        TrendPoint(30, "sha30", 72.0, 65.0),
+    ]
+    assert [p.overall for p in history.trend("master", "instruction", 2, KIND_GROUP, "core")] == [82.0, 83.0]
+    assert history.trend("master", "instruction", 10, KIND_REPORT, "missing") == []
+
+
+def test_regressions_are_drops_against_the_previous_run(history):
+    for created_at, overall in ((10, 80.0), (20, 78.0), (30, 78.5), (40, 78.1), (50, 70.0)):
+        _record(history, created_at, overall)
+
+    regressions = history.regressions("master", "instruction", 10, min_drop=0.5)
+
+    assert [(r.previous.sha, r.point.sha, r.drop) for r in regressions] == [
+        ("sha10", "sha20", 2.0),
+        ("sha40", "sha50", 8.1),
+    ]
+
+
+def test_runs_of_commit(history):
+    _record(history, 10, 80.0)
+
+    [(run, point)] = history.runs_of_commit("sha10")
+
+    assert run == HistoryRun("sha10", "master", "push", None, "instruction", 10)
+    assert point.overall == 80.0
+
+
+def test_history_is_kept_across_connections(tmp_path):
+    path = str(tmp_path / "history.db")
+    history = CoverageHistory(path)
+    _record(history, 10, 80.0, reports={"module-a": (70.0, 0.0)})
+    history.close()
+
+    history = CoverageHistory(path)
+    _record(history, 20, 81.0, reports={"module-a": (71.0, 0.0)})
+
+    assert [p.overall for p in history.trend("master", "instruction", 5, KIND_REPORT, "module-a")] == [70.0, 71.0]
+    history.close()
+
+
+def test_newer_schema_is_rejected(tmp_path):
+    path = str(tmp_path / "history.db")
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA user_version = 99")
+    connection.close()
+
+    with pytest.raises(sqlite3.DatabaseError, match="newer"):
+        CoverageHistory(path)
+
+
+def test_trend_queries_read_through_indexes(history):
+    # a SCAN of the run table would read every stored run instead of the last N of the branch
+    plans = [
+        history.query_plan(LAST_RUNS_QUERY, ("master", "instruction", 20)),
+        history.query_plan(COMMIT_RUNS_QUERY, ("sha10",)),
+    ]
+
+    assert "USING INDEX run_branch_trend" in plans[0]
+    assert "USING INDEX run_sha" in plans[1]
+    assert not [plan for plan in plans if "SCAN run" in plan]
+
+
+def test_record_many_adds_all_runs_in_one_transaction(history):
+    runs = [
+        RunCoverage(HistoryRun(f"sha{t}", "master", "push", None, "instruction", t), (80.0 + t, 0.0), {}, {})
+        for t in (1, 2)
+    ]
+
+    assert history.record_many(runs) == [1, 2]
+    assert [p.overall for p in history.trend("master", "instruction", 5)] == [81.0, 82.0]
+
+    broken = RunCoverage(HistoryRun("sha3", "master", "push", None, None, 3), (0.0, 0.0), {}, {})
+    with pytest.raises(sqlite3.IntegrityError):
+        history.record_many([runs[0]._replace(run=runs[0].run._replace(sha="sha4", created_at=4)), broken])
+    assert len(history.trend("master", "instruction", 5)) == 2
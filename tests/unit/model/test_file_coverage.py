@@ -1,3 +1,5 @@
+import tracemalloc
+
 import pytest
 
 from jacoco_report.model.file_coverage import FileCoverage
@@ -62,4 +64,21 @@ def test_str(file_coverage):
         "Line: Missed: 2, Covered: 8, Complexity: Missed: 1, Covered: 9, "
         "Method: Missed: 4, Covered: 6, Class: Missed: 0, Covered: 5"
     )
-    assert str(file_coverage) == expected_str
\ No newline at end of file
+    assert str(file_coverage) == expected_str
+
+def test_per_file_memory_footprint():
+    count = 2000
+    tracemalloc.start()
+    files = [
+        FileCoverage(
+            "F.java", "com/example",
+            *(Counter(missed=1000 + i, covered=2000 + i) for _ in range(6)),
+        )
+        for i in range(count)
+    ]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # seven dict-backed objects per file used ~950 bytes; one slotted object with an int64 array ~320
+    assert len(files) == count
+    assert allocated / count < 400
@@ -0,0 +1,57 @@
+import pytest
+
+from jacoco_report.model.counter import Counter
+from jacoco_report.model.file_coverage import FileCoverage
+from jacoco_report.model.file_coverage_store import FileCoverageStore, SpilledFileCoverage
+
+
+def _file_coverage(name, missed, covered):
+    counter = Counter(missed=missed, covered=covered)
+    return FileCoverage(name, "com/example", counter, counter, counter, counter, counter, counter)
+
+
+@pytest.fixture
+def store():
+    store = FileCoverageStore()
+    yield store
+    store.close()
+
+
+def test_spilled_report_reads_back_like_a_dict(store):
+    changed_files = {
+        "src/com/example/B.java": _file_coverage("B.java", 1, 9),
+        "src/com/example/A.java": _file_coverage("A.java", 3, 7),
+    }
+    spilled = store.new_report()
+
+    spilled.extend(changed_files.items())
+
+    assert isinstance(spilled, SpilledFileCoverage)
+    assert list(spilled) == ["src/com/example/B.java", "src/com/example/A.java"]
+    assert len(spilled) == 2 and spilled
+    assert "src/com/example/A.java" in spilled and "src/com/example/C.java" not in spilled
+    file_coverage = spilled["src/com/example/A.java"]
+    assert (file_coverage.file_name, file_coverage.file_path) == ("A.java", "com/example")
+    assert file_coverage.line == Counter(missed=3, covered=7)
+    assert [fc.file_name for fc in spilled.values()] == ["B.java", "A.java"]
+    assert {key: fc.values for key, fc in spilled.items()} == {key: fc.values for key, fc in changed_files.items()}
+
+
+def test_key_added_again_keeps_its_position(store):
+    spilled = store.new_report()
+    spilled.extend([("A.java", _file_coverage("A.java", 1, 1)), ("B.java", _file_coverage("B.java", 2, 2))])
+
+    spilled.extend([("A.java", _file_coverage("A.java", 0, 5))])
+
+    assert list(spilled) == ["A.java", "B.java"]
+    assert spilled["A.java"].line == Counter(missed=0, covered=5)
+
+
+def test_reports_are_kept_apart(store):
+    first, second = store.new_report(), store.new_report()
+    first.extend([("A.java", _file_coverage("A.java", 1, 1))])
+
+    assert len(first) == 1
+    assert len(second) == 0 and not second
+    with pytest.raises(KeyError):
+        second["A.java"]
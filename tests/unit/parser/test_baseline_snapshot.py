@@ -0,0 +1,89 @@
+import gzip
+import json
+
+import pytest
+
+from jacoco_report.parser.baseline_snapshot import BaselineSnapshot
+from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+@pytest.fixture
+def report_path(tmp_path):
+    sourcefiles = "".join(
+        f'<sourcefile name="Example{i}.java"><counter type="LINE" missed="{i}" covered="10"/></sourcefile>'
+        for i in range(3)
+    )
+    path = tmp_path / "jacoco.xml"
+    path.write_text(
+        f'<report name="r"><package name="com/example">{sourcefiles}</package>'
+        '<counter type="LINE" missed="3" covered="30"/></report>'
+    )
+    return str(path)
+
+
+def test_written_snapshot_loads_as_the_parsed_baseline(tmp_path, report_path):
+    changed_files = ["src/main/java/com/example/Example1.java"]
+    parsed = JaCoCoReportParser(changed_files).parse(report_path, group_name="core")
+    all_files = JaCoCoReportParser(None).parse(report_path, group_name="core")
+
+    path = BaselineSnapshot.from_reports(SHA, [all_files]).write(str(tmp_path / "snapshots"))
+    reports = BaselineSnapshot.load(str(tmp_path / "snapshots"), SHA.upper()).to_reports(changed_files)
+
+    assert path == str(tmp_path / "snapshots" / f"{SHA}.json.gz")
+    assert len(reports) == 1
+    report = reports[0]
+    assert (report.path, report.name, report.group_name) == (parsed.path, parsed.name, "core")
+    assert report.overall_coverage.values == parsed.overall_coverage.values
+    assert list(report.changed_files_coverage) == ["com/example/Example1.java"]
+    file_coverage = report.changed_files_coverage["com/example/Example1.java"]
+    expected = parsed.changed_files_coverage["com/example/Example1.java"]
+    assert (file_coverage.file_name, file_coverage.file_path) == (expected.file_name, expected.file_path)
+    assert file_coverage.values == expected.values
+
+
+def test_load_returns_none_without_a_snapshot(tmp_path):
+    assert BaselineSnapshot.load(str(tmp_path), SHA) is None
+
+
+@pytest.mark.parametrize("sha", ["", "main", "../../etc/passwd", "abc"])
+def test_only_commit_shas_name_snapshots(tmp_path, sha):
+    assert BaselineSnapshot.load(str(tmp_path), sha) is None
+    with pytest.raises(ValueError):
+        BaselineSnapshot(sha, []).write(str(tmp_path))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        {"version": 0, "sha": SHA, "reports": []},
+        {"version": 1, "sha": SHA},
+        {
+            "version": 1,
+            "sha": SHA,
+            "reports": [
+                {
+                    "path": "r.xml",
+                    "name": "r",
+                    "group_name": None,
+                    "overall": [0] * 12,
+                    "files": {"keys": ["A.java"], "file_paths": ["a"], "file_names": ["A.java"], "counters": [1]},
+                }
+            ],
+        },
+    ],
+    ids=["version", "missing-reports", "malformed-counters"],
+)
+def test_unusable_snapshot_is_ignored(tmp_path, caplog, content):
+    with gzip.open(tmp_path / f"{SHA}.json.gz", "wt", encoding="utf-8") as f:
+        json.dump(content, f)
+
+    assert BaselineSnapshot.load(str(tmp_path), SHA) is None
+    assert "ignored" in caplog.text
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    (tmp_path / f"{SHA}.json.gz").write_bytes(b"not gzip")
+
+    assert BaselineSnapshot.load(str(tmp_path), SHA) is None
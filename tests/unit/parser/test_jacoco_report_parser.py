@@ -1,9 +1,11 @@
 import logging
+import os
 
 import pytest
 
 from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
 from jacoco_report.model.counter import Counter
+from jacoco_report.model.file_coverage_store import SpilledFileCoverage
 from jacoco_report.model.report_file_coverage import ReportFileCoverage
 
 @pytest.fixture
@@ -148,3 +150,90 @@ def test_parse_counter_value_error_missing(parser, sample_jacoco_report, caplog)
         report_coverage = parser.parse(report_path)
 
     assert "Failed to find INSTRUCTION counter in JaCoCo report." in caplog.text
+
+
+def test_parse_walks_the_working_tree_once(tmp_path, monkeypatch, mocker):
+    sourcefiles = "".join(f'<sourcefile name="Example{i}.java"/>' for i in range(50))
+    report_path = tmp_path / "jacoco.xml"
+    report_path.write_text(f'<report name="r"><package name="com/example">{sourcefiles}</package></report>')
+    source_path = tmp_path / "src" / "com" / "example" / "Example7.java"
+    source_path.parent.mkdir(parents=True)
+    source_path.write_text("")
+    monkeypatch.chdir(tmp_path)
+    walk = mocker.patch("jacoco_report.parser.source_file_index.os.walk", wraps=os.walk)
+
+    parser = JaCoCoReportParser(changed_files=["src/com/example/Example7.java"])
+    parser.parse(str(report_path))
+    report_coverage = parser.parse(str(report_path))
+
+    assert walk.call_count == 1
+    assert list(report_coverage.changed_files_coverage) == ["src/com/example/Example7.java"]
+
+
+def test_parse_streams_top_level_packages_only(tmp_path):
+    # packages nested in a <group> were never evaluated; the streamed parse keeps ignoring them
+    counters = '<counter type="LINE" missed="1" covered="3"/>'
+    report_path = tmp_path / "jacoco.xml"
+    report_path.write_text(
+        '<report name="r"><sessioninfo id="s" start="1" dump="2"/>'
+        f'<group name="g"><package name="com/grouped"><sourcefile name="G.java">{counters}</sourcefile></package></group>'
+        f'<package name="com/example"><class name="com/example/A"><method name="m">{counters}</method>{counters}</class>'
+        f'<sourcefile name="A.java"><line nr="1" mi="0" ci="1"/>{counters}</sourcefile>{counters}</package>'
+        '<counter type="LINE" missed="5" covered="15"/></report>'
+    )
+
+    report_coverage = JaCoCoReportParser(changed_files=["com/example/A.java", "com/grouped/G.java"]).parse(
+        str(report_path)
+    )
+
+    assert report_coverage.name == "r"
+    assert report_coverage.overall_coverage.line == Counter(missed=5, covered=15)
+    assert list(report_coverage.changed_files_coverage) == ["com/example/A.java"]
+    assert report_coverage.changed_files_coverage["com/example/A.java"].line == Counter(missed=1, covered=3)
+
+
+def test_parse_spills_changed_files_beyond_the_memory_budget(tmp_path, monkeypatch):
+    sourcefiles = "".join(
+        f'<sourcefile name="Example{i}.java"><counter type="LINE" missed="{i}" covered="10"/></sourcefile>'
+        for i in range(5)
+    )
+    report_path = tmp_path / "jacoco.xml"
+    report_path.write_text(f'<report name="r"><package name="com/example">{sourcefiles}</package></report>')
+    changed_files = [f"com/example/Example{i}.java" for i in range(5)]
+    in_memory = JaCoCoReportParser(changed_files).parse(str(report_path))
+    # a budget of 1 MiB holding two changed files
+    monkeypatch.setattr("jacoco_report.parser.jacoco_report_parser.FILE_COVERAGE_BYTES", 1024 * 1024 // 4)
+    monkeypatch.setattr("jacoco_report.parser.jacoco_report_parser.SPILL_BATCH_SIZE", 2)
+    parser = JaCoCoReportParser(changed_files, max_memory_mb=1)
+
+    first = parser.parse(str(report_path))
+    second = parser.parse(str(report_path))
+
+    assert isinstance(first.changed_files_coverage, SpilledFileCoverage)
+    assert isinstance(second.changed_files_coverage, SpilledFileCoverage)
+    for report_coverage in (first, second):
+        assert list(report_coverage.changed_files_coverage) == list(in_memory.changed_files_coverage)
+        assert {k: v.values for k, v in report_coverage.changed_files_coverage.items()} == {
+            k: v.values for k, v in in_memory.changed_files_coverage.items()
+        }
+
+
+def test_parse_keeps_changed_files_in_memory_within_the_budget(parser, sample_jacoco_report):
+    report_coverage = JaCoCoReportParser(changed_files=["com/example/Example.java"], max_memory_mb=64).parse(
+        sample_jacoco_report
+    )
+
+    assert isinstance(report_coverage.changed_files_coverage, dict)
+
+
+def test_parse_without_changed_files_keeps_every_sourcefile(tmp_path):
+    sourcefiles = "".join(
+        f'<sourcefile name="Example{i}.java"><counter type="LINE" missed="{i}" covered="10"/></sourcefile>'
+        for i in range(3)
+    )
+    report_path = tmp_path / "jacoco.xml"
+    report_path.write_text(f'<report name="r"><package name="com/example">{sourcefiles}</package></report>')
+
+    report_coverage = JaCoCoReportParser(None).parse(str(report_path))
+
+    assert list(report_coverage.changed_files_coverage) == [f"com/example/Example{i}.java" for i in range(3)]
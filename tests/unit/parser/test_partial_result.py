@@ -0,0 +1,70 @@
+import os
+
+from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
+from jacoco_report.parser.partial_result import find_partials, merge_partials, write_partial
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+CHANGED_FILES = ["src/main/java/com/example/A.java", "src/main/java/com/example/B.java"]
+
+
+def _parse(tmp_path, name, sourcefiles):
+    """Parse a report of sourcefiles given as (file name, missed, covered) line counters."""
+    body = "".join(
+        f'<sourcefile name="{file_name}"><counter type="LINE" missed="{missed}" covered="{covered}"/></sourcefile>'
+        for file_name, missed, covered in sourcefiles
+    )
+    missed = sum(m for _, m, _ in sourcefiles)
+    covered = sum(c for _, _, c in sourcefiles)
+    path = tmp_path / name
+    path.write_text(
+        f'<report name="{name}"><package name="com/example">{body}</package>'
+        f'<counter type="LINE" missed="{missed}" covered="{covered}"/></report>'
+    )
+    return JaCoCoReportParser(None).parse(str(path), group_name="core")
+
+
+def _line(coverage):
+    return coverage.get_values_by_metric("line")
+
+
+def test_partials_of_shards_merge_into_one_report_list(tmp_path):
+    first = write_partial(str(tmp_path / "shard-1"), SHA, [_parse(tmp_path, "a.xml", [("A.java", 2, 8)])])
+    second = write_partial(str(tmp_path / "shard-2"), SHA, [_parse(tmp_path, "b.xml", [("B.java", 5, 5)])])
+
+    paths = find_partials(str(tmp_path))
+    reports = merge_partials(paths, SHA, CHANGED_FILES[:1])
+
+    assert paths == sorted([first, second])
+    assert os.path.basename(first) != os.path.basename(second)
+    assert sorted((r.path, r.group_name, _line(r.overall_coverage)) for r in reports) == [
+        (str(tmp_path / "a.xml"), "core", (2, 8)),
+        (str(tmp_path / "b.xml"), "core", (5, 5)),
+    ]
+    assert {r.path: list(r.changed_files_coverage) for r in reports}[str(tmp_path / "a.xml")] == ["com/example/A.java"]
+    assert {r.path: list(r.changed_files_coverage) for r in reports}[str(tmp_path / "b.xml")] == []
+
+
+def test_report_of_several_shards_keeps_the_highest_covered_counts(tmp_path, caplog):
+    shard_1 = _parse(tmp_path, "a.xml", [("A.java", 2, 8), ("B.java", 10, 0)])
+    write_partial(str(tmp_path), SHA, [shard_1])
+    shard_2 = _parse(tmp_path, "a.xml", [("A.java", 6, 4), ("B.java", 3, 7)])
+    write_partial(str(tmp_path), SHA, [shard_2])
+
+    reports = merge_partials(find_partials(str(tmp_path)), SHA, CHANGED_FILES)
+
+    assert len(reports) == 1
+    # the report counters follow the merged sourcefiles: 8 + 7 of 20 lines covered
+    assert _line(reports[0].overall_coverage) == (5, 15)
+    assert {key: _line(fc) for key, fc in reports[0].changed_files_coverage.items()} == {
+        "com/example/A.java": (2, 8),
+        "com/example/B.java": (3, 7),
+    }
+    assert "lower bound" in caplog.text
+
+
+def test_partials_of_another_commit_are_ignored(tmp_path, caplog):
+    write_partial(str(tmp_path), "f" * 40, [_parse(tmp_path, "a.xml", [("A.java", 2, 8)])])
+    (tmp_path / "partial-corrupt.json.gz").write_bytes(b"not gzip")
+
+    assert merge_partials(find_partials(str(tmp_path)), SHA, CHANGED_FILES) == []
+    assert "not 0123456789abcdef0123456789abcdef01234567" in caplog.text
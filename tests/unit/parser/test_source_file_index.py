@@ -0,0 +1,51 @@
+import os
+
+from jacoco_report.parser.source_file_index import SourceFileIndex
+
+
+def _touch(root, path):
+    full_path = root / path
+    full_path.parent.mkdir(parents=True, exist_ok=True)
+    full_path.write_text("", encoding="utf-8")
+
+
+def _walk_find(root_dir, relative_path):
+    # the per-lookup os.walk the index replaces
+    paths = []
+    for dirpath, *_ in os.walk(root_dir):
+        full_path = os.path.join(dirpath, relative_path)
+        if os.path.isfile(full_path):
+            paths.append(os.path.relpath(full_path, root_dir))
+    return paths
+
+
+def test_find_returns_every_directory_holding_the_path(tmp_path):
+    _touch(tmp_path, "module_a/src/main/java/com/example/Foo.java")
+    _touch(tmp_path, "module_b/src/main/java/com/example/Foo.java")
+    _touch(tmp_path, "module_b/src/main/java/com/other/Foo.java")
+    _touch(tmp_path, "com/example/Foo.java")
+
+    index = SourceFileIndex(str(tmp_path))
+
+    assert index.find("com/example/Foo.java") == _walk_find(str(tmp_path), "com/example/Foo.java")
+    assert sorted(index.find("com/example/Foo.java")) == [
+        "com/example/Foo.java",
+        "module_a/src/main/java/com/example/Foo.java",
+        "module_b/src/main/java/com/example/Foo.java",
+    ]
+
+
+def test_find_matches_whole_path_components_only(tmp_path):
+    _touch(tmp_path, "src/xcom/example/Foo.java")
+    _touch(tmp_path, "src/com/example/MyFoo.java")
+
+    index = SourceFileIndex(str(tmp_path))
+
+    assert index.find("com/example/Foo.java") == []
+    assert index.find("example/MyFoo.java") == ["src/com/example/MyFoo.java"]
+
+
+def test_find_unknown_file(tmp_path):
+    _touch(tmp_path, "src/Foo.java")
+
+    assert SourceFileIndex(str(tmp_path)).find("com/example/Bar.java") == []
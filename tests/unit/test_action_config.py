@@ -0,0 +1,59 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from jacoco_report.action_config import ActionConfig
+from jacoco_report.action_inputs import ActionInputs
+from jacoco_report.jacoco_report import JaCoCoReport
+
+
+@pytest.fixture
+def config(monkeypatch):
+    monkeypatch.setenv("INPUT_TOKEN", "ghp_secret")
+    monkeypatch.setenv("INPUT_PATHS", "a/**/jacoco.xml\nb/**/jacoco.xml")
+    monkeypatch.setenv("INPUT_METRIC", "line,branch")
+    monkeypatch.setenv("INPUT_GLOBAL_THRESHOLDS", "80*70\nbranch:60*50")
+    monkeypatch.setenv("INPUT_FAIL_ON_THRESHOLD", "overall,fail-unchanged")
+    monkeypatch.setenv("INPUT_REPORT_GROUPS", "- name: core\n  paths: ['core/**/jacoco.xml']\n")
+    return ActionConfig.from_inputs()
+
+
+def test_from_inputs_parses_every_input_once(config):
+    assert config.sources.paths == ("a/**/jacoco.xml", "b/**/jacoco.xml")
+    assert config.metric == "line"
+    assert config.metrics == ("line", "branch")
+    assert config.thresholds.global_overall == 80.0
+    assert config.thresholds.global_for("branch") == (60.0, 50.0)
+    assert config.thresholds.global_for("line") == (80.0, 70.0)
+    assert config.fail_on_threshold == frozenset({"overall", "fail-unchanged"})
+    assert [group.name for group in config.report_groups] == ["core"]
+
+
+def test_attributes_do_not_read_the_environment(config, mocker):
+    get_metric = mocker.patch.object(ActionInputs, "get_metric", side_effect=AssertionError("re-read"))
+
+    assert config.metric == "line"
+    get_metric.assert_not_called()
+
+
+def test_config_is_frozen_and_picklable(config):
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.metric = "branch"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.thresholds.global_overall = 0.0
+
+    restored = pickle.loads(pickle.dumps(config))
+    assert restored.metrics == config.metrics
+    assert restored.report_groups[0].paths == ["core/**/jacoco.xml"]
+    assert "ghp_secret" not in repr(config)
+
+
+def test_report_uses_given_config_without_reading_inputs(config, mocker):
+    get_event_name = mocker.patch.object(ActionInputs, "get_event_name")
+    jr = JaCoCoReport(dataclasses.replace(config, github=dataclasses.replace(config.github, event_name="push")))
+
+    jr.run()
+
+    get_event_name.assert_not_called()
+    assert jr.violations == ["Not a pull request event."]
@@ -17,6 +17,7 @@ success_case = {
     "get_report_thresholds_default": "0.0*0.0*0.0",
     "get_title": "Custom Title",
     "get_metric": "instruction",
+    "get_metrics": ["instruction"],
     "get_comment_level": "full",
     "get_report_groups": "",
     "get_skip_unchanged": True,
@@ -26,6 +27,17 @@ success_case = {
     "get_fail_symbol": "❗",
     "get_fail_on_threshold": ["overall", "changed-files-average", "per-changed-file"],
     "get_debug": True,
+    "get_api_stats": False,
+    "get_timings": False,
+    "get_profile": "all",
+    "get_max_memory_mb": 2048,
+    "get_baseline_snapshot_dir": "",
+    "get_history_db": "",
+    "get_mode": "single",
+    "get_partial_dir": "",
+    "get_step_summary": False,
+    "get_report_path": "",
+    "get_check_run": False,
 }
 
 
@@ -54,8 +66,9 @@ failure_cases = [
     ("get_report_thresholds_default", "0*x*0", "'report-thresholds-default' changed-files-average value must be a float between 0 and 100."),
     ("get_report_thresholds_default", "0*0*x", "'report-thresholds-default' per-changed-file value must be a float between 0 and 100."),
     ("get_report_thresholds_default", True, "'report-thresholds-default' must be a string or not defined."),
-    ("get_metric", "", "'metric' must be a string from these options: 'instruction', 'line', 'branch', 'complexity', 'method', 'class'."),
-    ("get_metric", 1, "'metric' must be a string from these options: 'instruction', 'line', 'branch', 'complexity', 'method', 'class'."),
+    ("get_metrics", [""], "'metric' must be a string from these options: 'instruction', 'line', 'branch', 'complexity', 'method', 'class'."),
+    ("get_metrics", [1], "'metric' must be a string from these options: 'instruction', 'line', 'branch', 'complexity', 'method', 'class'."),
+    ("get_metrics", ["line", "lines"], "'metric' must be a string from these options: 'instruction', 'line', 'branch', 'complexity', 'method', 'class'."),
     (
         "get_comment_level",
         "",
@@ -78,6 +91,10 @@ failure_cases = [
     ("get_pass_symbol", 1, "'pass-symbol' must be a non-empty string and have a length from 1."),
     ("get_fail_symbol", "", "'fail-symbol' must be a non-empty string and have a length from 1."),
     ("get_fail_symbol", 1, "'fail-symbol' must be a non-empty string and have a length from 1."),
+    ("get_api_transport", "soap", "'api-transport' must be 'rest' or 'graphql'."),
+    ("get_profile", "gpu", "'profile' must be 'none', 'cpu', 'memory' or 'all'."),
+    ("get_mode", "shard", "'mode' must be 'single', 'partial' or 'merge'."),
+    ("get_mode", "merge", "'partial-dir' is required with mode 'partial' or 'merge'."),
 ]
 
 
@@ -308,7 +325,7 @@ def test_get_global_thresholds_two_components_parsed(mocker):
 
 
 def test_get_global_thresholds_invalid_component_logs_warning_without_warning_prefix(mocker):
-    mock_warning = mocker.patch("jacoco_report.action_inputs.logger.warning")
+    mock_warning = mocker.patch("jacoco_report.utils.thresholds.logger.warning")
     mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="x*1")
 
     result = ActionInputs.get_global_thresholds()
@@ -323,7 +340,7 @@ def test_get_global_thresholds_invalid_component_logs_warning_without_warning_pr
 
 
 def test_get_report_thresholds_default_invalid_third_component_logs_per_changed_file_label(mocker):
-    mock_warning = mocker.patch("jacoco_report.action_inputs.logger.warning")
+    mock_warning = mocker.patch("jacoco_report.utils.thresholds.logger.warning")
     mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="1*2*x")
 
     result = ActionInputs.get_report_thresholds_default()
@@ -556,6 +573,92 @@ def test_get_update_comment_invalid_literal_raises_value_error(mocker):
     assert "'update-comment' must be a boolean ('true' or 'false')." in str(exc_info.value)
 
 
+def test_get_api_stats_true(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="true")
+    assert True == ActionInputs.get_api_stats()
+
+
+def test_get_timings_true(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="true")
+    assert True == ActionInputs.get_timings()
+
+
+def test_get_report_path_strips_whitespace(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value=" build/coverage ")
+    assert ActionInputs.get_report_path() == "build/coverage"
+
+
+def test_get_sha(mocker):
+    mocker.patch.dict("os.environ", {"GITHUB_SHA": "abc123"})
+    assert ActionInputs.get_sha() == "abc123"
+
+
+def test_get_branch_prefers_pull_request_head_ref(mocker):
+    mocker.patch.dict("os.environ", {"GITHUB_HEAD_REF": "feature/x", "GITHUB_REF_NAME": "12/merge"})
+    assert ActionInputs.get_branch() == "feature/x"
+    mocker.patch.dict("os.environ", {"GITHUB_HEAD_REF": "", "GITHUB_REF_NAME": "master"})
+    assert ActionInputs.get_branch() == "master"
+
+
+def test_get_base_ref(mocker):
+    mocker.patch.dict("os.environ", {"GITHUB_BASE_REF": "master"})
+    assert ActionInputs.get_base_ref() == "master"
+
+
+def test_get_check_run_true(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="true")
+    assert True == ActionInputs.get_check_run()
+
+
+def test_get_api_transport_defaults_to_rest(mocker):
+    mocker.patch("os.getenv", side_effect=lambda key, default="": default)
+    assert ActionInputs.get_api_transport() == "rest"
+
+
+def test_get_api_transport_normalizes_case(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value=" GraphQL ")
+    assert ActionInputs.get_api_transport() == "graphql"
+
+
+def test_get_profile_defaults_to_none(mocker):
+    mocker.patch("os.getenv", side_effect=lambda key, default="": default)
+    assert ActionInputs.get_profile() == "none"
+
+
+def test_get_profile_normalizes_case_and_empty_value(mocker):
+    mock_input = mocker.patch("jacoco_report.action_inputs.get_action_input", return_value=" CPU ")
+    assert ActionInputs.get_profile() == "cpu"
+    mock_input.return_value = ""
+    assert ActionInputs.get_profile() == "none"
+
+
+def test_validate_inputs_rejects_invalid_max_memory_mb(mocker):
+    case = success_case.copy()
+    case.pop("get_max_memory_mb")
+    patchers = apply_mocks(case, mocker)
+    try:
+        mocker.patch.dict("os.environ", {"INPUT_MAX_MEMORY_MB": "lots"})
+        mock_error = mocker.patch("jacoco_report.action_inputs.logger.error")
+        mock_exit = mocker.patch("sys.exit")
+
+        ActionInputs.validate_inputs()
+
+        mock_error.assert_any_call("%s", "'max-memory-mb' must be a whole number of megabytes, 0 for no limit.")
+        mock_exit.assert_called_once_with(1)
+    finally:
+        stop_mocks(patchers)
+
+
+def test_get_api_url_defaults_to_public_api(mocker):
+    mocker.patch("os.getenv", side_effect=lambda key, default="": default)
+    assert ActionInputs.get_api_url() == "https://api.github.com"
+
+
+def test_get_api_url_from_runner_env(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="http://127.0.0.1:8080")
+    assert ActionInputs.get_api_url() == "http://127.0.0.1:8080"
+
+
 def test_get_pass_symbol(mocker):
     mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="P")
     assert "P" == ActionInputs.get_pass_symbol()
@@ -691,6 +794,81 @@ def test_validate_inputs_rejects_invalid_update_comment_literal(mocker):
         stop_mocks(patchers)
 
 
+def test_validate_inputs_rejects_invalid_api_stats_literal(mocker):
+    case = success_case.copy()
+    patchers = apply_mocks(case, mocker)
+    try:
+        mocker.patch(
+            "jacoco_report.action_inputs.ActionInputs.get_api_stats",
+            side_effect=ValueError("'api-stats' must be a boolean ('true' or 'false')."),
+        )
+        mock_error = mocker.patch("jacoco_report.action_inputs.logger.error")
+        mock_exit = mocker.patch("sys.exit")
+
+        ActionInputs.validate_inputs()
+
+        mock_error.assert_any_call("%s", "'api-stats' must be a boolean ('true' or 'false').")
+        mock_exit.assert_called_once_with(1)
+    finally:
+        stop_mocks(patchers)
+
+
+def test_validate_inputs_rejects_invalid_timings_literal(mocker):
+    case = success_case.copy()
+    patchers = apply_mocks(case, mocker)
+    try:
+        mocker.patch(
+            "jacoco_report.action_inputs.ActionInputs.get_timings",
+            side_effect=ValueError("'timings' must be a boolean ('true' or 'false')."),
+        )
+        mock_error = mocker.patch("jacoco_report.action_inputs.logger.error")
+        mock_exit = mocker.patch("sys.exit")
+
+        ActionInputs.validate_inputs()
+
+        mock_error.assert_any_call("%s", "'timings' must be a boolean ('true' or 'false').")
+        mock_exit.assert_called_once_with(1)
+    finally:
+        stop_mocks(patchers)
+
+
+def test_validate_inputs_rejects_invalid_check_run_literal(mocker):
+    case = success_case.copy()
+    patchers = apply_mocks(case, mocker)
+    try:
+        mocker.patch(
+            "jacoco_report.action_inputs.ActionInputs.get_check_run",
+            side_effect=ValueError("'check-run' must be a boolean ('true' or 'false')."),
+        )
+        mock_error = mocker.patch("jacoco_report.action_inputs.logger.error")
+        mock_exit = mocker.patch("sys.exit")
+
+        ActionInputs.validate_inputs()
+
+        mock_error.assert_any_call("%s", "'check-run' must be a boolean ('true' or 'false').")
+        mock_exit.assert_called_once_with(1)
+    finally:
+        stop_mocks(patchers)
+
+
+def test_validate_inputs_rejects_report_path_pointing_to_file(mocker, tmp_path):
+    existing_file = tmp_path / "coverage-report.json"
+    existing_file.write_text("{}", encoding="utf-8")
+    case = success_case.copy()
+    case["get_report_path"] = str(existing_file)
+    patchers = apply_mocks(case, mocker)
+    try:
+        mock_error = mocker.patch("jacoco_report.action_inputs.logger.error")
+        mock_exit = mocker.patch("sys.exit")
+
+        ActionInputs.validate_inputs()
+
+        mock_error.assert_any_call("%s", "'report-path' must be a directory, not a file.")
+        mock_exit.assert_called_once_with(1)
+    finally:
+        stop_mocks(patchers)
+
+
 def test_validate_inputs_rejects_invalid_debug_literal(mocker):
     case = success_case.copy()
     patchers = apply_mocks(case, mocker)
@@ -784,6 +962,37 @@ def test_get_metric(mocker):
     mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="branch")
     assert ActionInputs.get_metric() == "branch"
 
+def test_get_metrics_parses_list_and_drops_duplicates(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="line, branch\nline")
+    assert ActionInputs.get_metrics() == ["line", "branch"]
+    assert ActionInputs.get_metric() == "line"
+
+
+def test_get_global_thresholds_for_metric(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="80*70,branch:60*50")
+    assert ActionInputs.get_global_thresholds_for_metric("branch") == (60.0, 50.0)
+    assert ActionInputs.get_global_thresholds_for_metric("line") == (80.0, 70.0)
+
+
+def test_get_report_thresholds_default_for_metric_without_entry_uses_zeros(mocker):
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="line:80*70*60")
+    assert ActionInputs.get_report_thresholds_default_for_metric("line") == (80.0, 70.0, 60.0)
+    assert ActionInputs.get_report_thresholds_default_for_metric("branch") == (0.0, 0.0, 0.0)
+
+
+def test_get_report_groups_per_metric_thresholds(mocker):
+    yaml_input = "- name: g\n  paths: ['**']\n  thresholds: '80*70*60, branch:50*40*30'"
+    mocker.patch("jacoco_report.action_inputs.get_action_input", return_value=yaml_input)
+    group = ActionInputs.get_report_groups()[0]
+    assert group.thresholds_for("branch") == (50.0, 40.0, 30.0)
+    assert group.thresholds_for("line") == (80.0, 70.0, 60.0)
+
+
+def test_validate_report_groups_per_metric_threshold_value(mocker):
+    errors = ActionInputs.validate_report_groups("- name: g\n  paths: ['**']\n  thresholds: 'branch:x*70*60'")
+    assert any("overall value" in e for e in errors)
+
+
 def test_get_event_name(mocker):
     mocker.patch("jacoco_report.action_inputs.get_action_input", return_value="push")
     assert ActionInputs.get_event_name() == "push"
@@ -929,6 +1138,7 @@ failure_cases_defaults = [
     ("get_exclude_paths", []),
     ("get_title", "JaCoCo Coverage Report"),
     ("get_metric", MetricTypeEnum.INSTRUCTION),
+    ("get_metrics", [MetricTypeEnum.INSTRUCTION]),
     ("get_comment_level", CommentLevelEnum.FULL),
     ("get_report_groups", []),
     ("get_skip_unchanged", False),
@@ -938,6 +1148,17 @@ failure_cases_defaults = [
     ("get_fail_symbol", "❌"),
     ("get_fail_on_threshold", [FailOnThresholdEnum.OVERALL, FailOnThresholdEnum.CHANGED_FILES_AVERAGE, FailOnThresholdEnum.PER_CHANGED_FILE]),
     ("get_debug", False),
+    ("get_api_stats", False),
+    ("get_timings", False),
+    ("get_profile", "none"),
+    ("get_max_memory_mb", 0),
+    ("get_baseline_snapshot_dir", ""),
+    ("get_history_db", ""),
+    ("get_mode", "single"),
+    ("get_partial_dir", ""),
+    ("get_step_summary", False),
+    ("get_report_path", ""),
+    ("get_check_run", False),
     ("get_global_thresholds", (0.0, 0.0)),
     ("get_global_overall_threshold", 0.0),
     ("get_global_changed_files_average_threshold", 0.0),
@@ -1058,3 +1279,56 @@ def test_validate_inputs_rejects_invalid_global_overall_scope(mocker):
         mock_exit.assert_called_once_with(1)
     finally:
         stop_mocks(patchers)
+
+
+def test_validate_inputs_rejects_baseline_snapshot_dir_pointing_to_file(mocker, tmp_path):
+    existing_file = tmp_path / "snapshot.json.gz"
+    existing_file.write_text("{}", encoding="utf-8")
+    case = success_case.copy()
+    case["get_baseline_snapshot_dir"] = str(existing_file)
+    patchers = apply_mocks(case, mocker)
+    try:
+        mock_error = mocker.patch("jacoco_report.action_inputs.logger.error")
+        mock_exit = mocker.patch("sys.exit")
+
+        ActionInputs.validate_inputs()
+
+        mock_error.assert_any_call("%s", "'baseline-snapshot-dir' must be a directory, not a file.")
+        mock_exit.assert_called_once_with(1)
+    finally:
+        stop_mocks(patchers)
+
+
+def test_validate_inputs_rejects_history_db_pointing_to_directory(mocker, tmp_path):
+    case = success_case.copy()
+    case["get_history_db"] = str(tmp_path)
+    patchers = apply_mocks(case, mocker)
+    try:
+        mock_error = mocker.patch("jacoco_report.action_inputs.logger.error")
+        mock_exit = mocker.patch("sys.exit")
+
+        ActionInputs.validate_inputs()
+
+        mock_error.assert_any_call("%s", "'history-db' must be a file, not a directory.")
+        mock_exit.assert_called_once_with(1)
+    finally:
+        stop_mocks(patchers)
+
+
+def test_validate_inputs_rejects_partial_dir_pointing_to_file(mocker, tmp_path):
+    existing_file = tmp_path / "partial.json.gz"
+    existing_file.write_text("{}", encoding="utf-8")
+    case = success_case.copy()
+    case["get_mode"] = "partial"
+    case["get_partial_dir"] = str(existing_file)
+    patchers = apply_mocks(case, mocker)
+    try:
+        mock_error = mocker.patch("jacoco_report.action_inputs.logger.error")
+        mock_exit = mocker.patch("sys.exit")
+
+        ActionInputs.validate_inputs()
+
+        mock_error.assert_any_call("%s", "'partial-dir' must be a directory, not a file.")
+        mock_exit.assert_called_once_with(1)
+    finally:
+        stop_mocks(patchers)
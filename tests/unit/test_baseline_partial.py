@@ -17,6 +17,7 @@ Scenario (used in the integration test below)
 
 import pytest
 
+from jacoco_report.action_config import ActionConfig
 from jacoco_report.evaluator.coverage_evaluator import CoverageEvaluator
 from jacoco_report.generator.pr_comment_generator import PRCommentGenerator
 from jacoco_report.jacoco_report import JaCoCoReport
@@ -274,7 +275,7 @@ def test_group_table_diff_wrong_with_partial_group_baseline(mocker):
     bs_evaluator.evaluated_groups_coverage = {"group-alpha": bs_erc_alpha}
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     # Global diff: (80−50)/400×100 = 7.5% (weighted to all 4 reports' 400 instructions)
     global_table = generator.get_basic_table_for_all("✅", "❌")
@@ -351,7 +352,7 @@ def test_per_report_diffs_correct_despite_wrong_global_diff(mocker):
     bs_evaluator.evaluated_groups_coverage = {}
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     # Module A: name found → diff_o = 80.0 − 50.0 = 30.0
     diff_o, diff_ch = generator._calculate_baseline_report_diffs(erc_a)
@@ -434,7 +435,7 @@ def test_global_diff_correct_when_all_reports_have_baseline(mocker):
     bs_evaluator.evaluated_groups_coverage = {}
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     # Global diff: round(325/400*100,2) − round(305/400*100,2) = 81.25 − 76.25 = +5.0%
     global_table = generator.get_basic_table_for_all("✅", "❌")
@@ -490,7 +491,7 @@ def test_no_delta_column_when_baseline_evaluator_has_no_data(mocker):
     )
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     global_table = generator.get_basic_table_for_all("✅", "❌")
 
@@ -579,7 +580,7 @@ def test_group_table_diff_correct_when_all_group_reports_have_baseline(mocker):
     bs_evaluator.evaluated_groups_coverage = {"group-alpha": bs_erc_alpha, "group-beta": bs_erc_beta}
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     # group-alpha (A+B): round(170/200*100,2) − round(160/200*100,2) = 85.0 − 80.0 = +5.0%
     diff_o, diff_ch = generator.calculate_baseline_group_diffs(erc_alpha)
@@ -663,7 +664,7 @@ def test_per_file_diff_correct_and_zero_for_unmatched_reports(mocker):
     bs_evaluator.evaluated_groups_coverage = {}
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     table = generator.generate_changed_files_table_with_baseline("✅", "❌", {"Module A": erc_a, "Module B": erc_b})
 
@@ -735,7 +736,7 @@ def test_global_diff_misleading_when_no_report_names_match_baseline(mocker):
     bs_evaluator.evaluated_groups_coverage = {}
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     # bs_evaluator has 1 entry → _has_baseline_data() is True even with zero name matches
     assert generator._has_baseline_data() is True
@@ -797,7 +798,7 @@ def test_global_diff_correct_single_report_single_baseline_match(mocker):
     bs_evaluator.evaluated_groups_coverage = {}
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     # Global diff: round(80/100*100,2) − round(50/100*100,2) = 80.0 − 50.0 = +30.0%
     global_table = generator.get_basic_table_for_all("✅", "❌")
@@ -977,7 +978,7 @@ def test_per_file_diff_zero_when_changed_file_absent_from_baseline(mocker):
     bs_evaluator.evaluated_groups_coverage = {}
 
     mock_gh = mocker.Mock()
-    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35)
+    generator = PRCommentGenerator(mock_gh, evaluator, bs_evaluator, 35, config=ActionConfig.from_inputs())
 
     table = generator.generate_changed_files_table_with_baseline("✅", "❌", {"Module A": erc_a})
 
@@ -0,0 +1,154 @@
+import json
+import os
+import subprocess
+
+import pytest
+
+from jacoco_report.cli import build_parser, inputs_from_args, main, read_changed_files
+
+REPORT = """<report name="Example Report">
+    <package name="com/example">
+        <sourcefile name="Example.java">
+            <counter type="INSTRUCTION" missed="2" covered="8"/>
+            <counter type="LINE" missed="1" covered="4"/>
+        </sourcefile>
+    </package>
+    <counter type="INSTRUCTION" missed="5" covered="15"/>
+    <counter type="LINE" missed="2" covered="8"/>
+</report>
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch, mocker):
+    # the CLI maps its flags onto INPUT_* variables of the process; restore them after each test
+    mocker.patch.dict(os.environ, {}, clear=False)
+    for name in [key for key in os.environ if key.startswith("INPUT_")]:
+        monkeypatch.delenv(name)
+    (tmp_path / "module" / "target").mkdir(parents=True)
+    (tmp_path / "module" / "target" / "jacoco.xml").write_text(REPORT)
+    (tmp_path / "changed.txt").write_text("src/main/java/com/example/Example.java\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_inputs_from_args_maps_given_flags_only():
+    args = build_parser().parse_args(["--paths", "a/*.xml", "b/*.xml", "--metric", "line,branch"])
+
+    inputs = inputs_from_args(args)
+
+    assert inputs["paths"] == "a/*.xml\nb/*.xml"
+    assert inputs["metric"] == "line,branch"
+    assert "global-thresholds" not in inputs
+    assert "skip-unchanged" not in inputs
+
+
+def test_markdown_to_stdout(workspace, capsys):
+    exit_code = main(["--paths", "**/jacoco.xml", "--changed-files", "changed.txt", "--title", "Local run"])
+
+    out = capsys.readouterr().out
+    assert exit_code == 0
+    assert out.startswith("**Local run**")
+    assert "`Example Report`" in out
+    assert "Example.java" in out
+
+
+def test_json_to_file_with_failed_threshold(workspace):
+    exit_code = main(
+        [
+            "--changed-files",
+            "changed.txt",
+            "--metric",
+            "line",
+            "--global-thresholds",
+            "90*0",
+            "--format",
+            "json",
+            "--output",
+            "result.json",
+        ]
+    )
+
+    data = json.loads((workspace / "result.json").read_text())
+    assert exit_code == 1
+    assert data["metric"] == "line"
+    assert data["coverage_overall"] == 80.0
+    assert data["coverage_overall_passed"] is False
+
+
+def test_partial_results_of_a_matrix_build_are_merged(workspace, capsys):
+    from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
+    from jacoco_report.parser.partial_result import write_partial
+
+    report = JaCoCoReportParser(None).parse("module/target/jacoco.xml")
+    write_partial("partials/shard-1", "", [report])
+
+    exit_code = main(["--partial-dir", "partials", "--paths", "missing/**/jacoco.xml", "--changed-files", "changed.txt"])
+
+    out = capsys.readouterr().out
+    assert exit_code == 0
+    assert "`Example Report`" in out
+    assert "Example.java" in out
+
+
+def test_no_reports_is_an_operational_failure(workspace, capsys):
+    assert main(["--paths", "missing/**/jacoco.xml"]) == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_read_changed_files_from_git(mocker):
+    run = mocker.patch(
+        "jacoco_report.cli.subprocess.run", return_value=mocker.Mock(stdout="a/Foo.java\n\nb/Bar.java\n")
+    )
+
+    changed = read_changed_files(build_parser().parse_args(["--git-base", "origin/main"]))
+
+    assert changed == ["a/Foo.java", "b/Bar.java"]
+    assert run.call_args.args[0] == ["git", "diff", "--name-only", "origin/main...HEAD"]
+
+
+def test_read_changed_files_git_failure(mocker):
+    mocker.patch("jacoco_report.cli.subprocess.run", side_effect=subprocess.CalledProcessError(128, "git"))
+
+    assert read_changed_files(build_parser().parse_args(["--git-base", "nope"])) is None
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    from jacoco_report.model.coverage_history import CoverageHistory, HistoryRun
+
+    path = tmp_path / "history.db"
+    history = CoverageHistory(str(path))
+    for created_at, overall in ((0, 80.0), (60, 78.0), (120, 79.0)):
+        run = HistoryRun(f"{created_at:040x}", "master", "push", None, "instruction", created_at)
+        history.record(run, (overall, 0.0), {"Example Report": (overall - 5, 0.0)}, {})
+    history.close()
+    return str(path)
+
+
+def test_history_shows_the_trend_of_a_branch(history_db, capsys):
+    assert main(["history", "--db", history_db, "--branch", "master"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "█▁▅"
+    assert lines[1] == "1970-01-01 00:00  000000000000   80.00%    0.00%"
+    assert len(lines) == 4
+
+
+def test_history_of_one_report_as_json(history_db, capsys):
+    assert main(["history", "--db", history_db, "--branch", "master", "--report", "Example Report", "--last", "2",
+                 "--format", "json"]) == 0
+
+    assert [point["overall"] for point in json.loads(capsys.readouterr().out)] == [73.0, 74.0]
+
+
+def test_history_regressions_fail_the_command(history_db, capsys):
+    assert main(["history", "--db", history_db, "--branch", "master", "--regressions"]) == 1
+    assert "80.00% ->  78.00%  (-2.0 pp after 000000000000)" in capsys.readouterr().out
+
+    assert main(["history", "--db", history_db, "--branch", "master", "--regressions", "--min-drop", "2"]) == 0
+    assert capsys.readouterr().out == "No regressions.\n"
+
+
+def test_history_without_database(tmp_path):
+    assert main(["history", "--db", str(tmp_path / "missing.db"), "--branch", "master"]) == 1
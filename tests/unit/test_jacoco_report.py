@@ -5,7 +5,9 @@ import os
 import pytest
 # TODO - remove this dependency
 
+from jacoco_report.action_config import ActionConfig
 from jacoco_report.action_inputs import ActionInputs
+from jacoco_report.jacoco_report import JaCoCoReport
 from jacoco_report.utils.enums import CommentLevelEnum, MetricTypeEnum
 
 comment_no_data_no_baseline = """**JaCoCo Coverage Report**
@@ -2860,3 +2862,268 @@ def test_empty_paths_falls_back_to_default_when_no_groups(jacoco_report, mocker)
     scan_mock.assert_called_once()
     called_paths = scan_mock.call_args.kwargs.get("paths") or scan_mock.call_args.args[0]
     assert called_paths == ["**/jacoco.xml"]
+
+
+def test_graphql_transport_uses_prefetched_pr_context(jacoco_report, mocker, make_report_file_coverage):
+    """With api-transport=graphql, changed files and existing comments come from one batched query."""
+    from jacoco_report.utils.github import PullRequestContext
+
+    report = make_report_file_coverage(name="mod")
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_api_transport", return_value="graphql")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
+    mocker.patch("jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files", return_value=["dummy.xml"])
+    parser_mock = mocker.patch("jacoco_report.jacoco_report.JaCoCoReportParser")
+    parser_mock.return_value.parse.return_value = report
+    context = PullRequestContext(["src/A.java"], [{"id": 5, "body": "**JaCoCo** old"}], "base", "head")
+    get_context = mocker.patch("jacoco_report.utils.github.GitHub.get_pr_context", return_value=context)
+    rest_files = mocker.patch("jacoco_report.utils.github.GitHub.get_pr_changed_files")
+    rest_comments = mocker.patch("jacoco_report.utils.github.GitHub.get_comments")
+    update_comment = mocker.patch("jacoco_report.utils.github.GitHub.update_comment", return_value=True)
+
+    jacoco_report.run()
+
+    get_context.assert_called_once_with(1, "**JaCoCo**")
+    parser_mock.assert_called_once_with(["src/A.java"], max_memory_mb=0)
+    rest_files.assert_not_called()
+    rest_comments.assert_not_called()
+    assert update_comment.call_args[0][0] == 5
+
+
+def test_graphql_transport_falls_back_to_rest_on_failure(jacoco_report, mocker, make_report_file_coverage):
+    """A failed GraphQL query falls back to the REST changed-files and comments endpoints."""
+    report = make_report_file_coverage(name="mod")
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_api_transport", return_value="graphql")
+    mocker.patch("jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files", return_value=["dummy.xml"])
+    parser_mock = mocker.patch("jacoco_report.jacoco_report.JaCoCoReportParser")
+    parser_mock.return_value.parse.return_value = report
+    mocker.patch("jacoco_report.utils.github.GitHub.get_pr_context", return_value=None)
+    rest_files = mocker.patch("jacoco_report.utils.github.GitHub.get_pr_changed_files", return_value=["src/B.java"])
+
+    jacoco_report.run()
+
+    rest_files.assert_called_once()
+    parser_mock.assert_called_once_with(["src/B.java"], max_memory_mb=0)
+
+
+def test_run_records_stage_timings(jacoco_report, mocker):
+    report_path = f'{os.getcwd()}/tests/data/module_b/target/jacoco_no_data.xml'
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value='pull_request')
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_id", return_value='')
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_action_ref", return_value='')
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_run_started_at", return_value='')
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_token", return_value='fake_token')
+    mocker.patch("jacoco_report.utils.github.GitHub.get_pr_number", return_value=35)
+    mocker.patch("jacoco_report.scanner.jacoco_report_input_scanner.JaCoCoReportInputScanner.scan", return_value=[report_path])
+    mocker.patch("jacoco_report.utils.github.GitHub.get_pr_changed_files", return_value=["a.java", "b.java"])
+    mocker.patch('jacoco_report.utils.github.GitHub.get_comments', return_value=[])
+    mocker.patch('jacoco_report.utils.github.GitHub.add_comment', return_value=None)
+
+    jacoco_report.run()
+
+    stages = jacoco_report.run_state.timings.to_dict()["stages"]
+    assert list(stages) == ["scan", "changed-files", "parse", "evaluate", "render", "api-write", "output-sinks"]
+    assert stages["scan"]["reports"] == 1
+    assert stages["changed-files"]["files"] == 2
+    assert stages["parse"]["reports"] == 1
+    assert stages["parse"]["bytes_read"] == os.path.getsize(report_path)
+
+
+BASELINE_SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+def _write_report(tmp_path, covered):
+    report_path = tmp_path / f"jacoco_{covered}.xml"
+    report_path.write_text(
+        '<report name="mod"><package name="com/example"><sourcefile name="A.java">'
+        f'<counter type="INSTRUCTION" missed="2" covered="{covered}"/></sourcefile></package>'
+        f'<counter type="INSTRUCTION" missed="2" covered="{covered}"/></report>'
+    )
+    return str(report_path)
+
+
+def test_push_run_writes_baseline_snapshot(jacoco_report, mocker, tmp_path):
+    from jacoco_report.parser.baseline_snapshot import BaselineSnapshot
+
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="push")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_sha", return_value=BASELINE_SHA)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_baseline_snapshot_dir", return_value=str(tmp_path / "snap"))
+    mocker.patch("jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files", return_value=[_write_report(tmp_path, 8)])
+    add_comment = mocker.patch("jacoco_report.utils.github.GitHub.add_comment")
+
+    jacoco_report.run()
+
+    assert jacoco_report.violations == []
+    assert jacoco_report.has_operational_failure is False
+    add_comment.assert_not_called()
+    reports = BaselineSnapshot.load(str(tmp_path / "snap"), BASELINE_SHA).to_reports(["src/main/java/com/example/A.java"])
+    assert list(reports[0].changed_files_coverage) == ["com/example/A.java"]
+    assert jacoco_report.run_state.timings.to_dict()["stages"]["baseline-snapshot"]["reports"] == 1
+
+
+def test_push_run_without_sha_fails_to_write_baseline_snapshot(jacoco_report, mocker, tmp_path):
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="push")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_sha", return_value="")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_baseline_snapshot_dir", return_value=str(tmp_path))
+
+    jacoco_report.run()
+
+    assert jacoco_report.violations == ["No commit SHA found."]
+    assert jacoco_report.has_operational_failure is True
+
+
+@pytest.mark.parametrize("has_snapshot", [True, False])
+def test_pull_request_run_uses_baseline_snapshot_of_base_commit(jacoco_report, mocker, tmp_path, has_snapshot):
+    from jacoco_report.parser.baseline_snapshot import BaselineSnapshot
+    from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
+
+    baseline_path = _write_report(tmp_path, 4)
+    if has_snapshot:
+        baseline = JaCoCoReportParser(None).parse(baseline_path)
+        BaselineSnapshot.from_reports(BASELINE_SHA, [baseline]).write(str(tmp_path / "snap"))
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_baseline_paths", return_value=["baseline/**/jacoco.xml"])
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_baseline_snapshot_dir", return_value=str(tmp_path / "snap"))
+    mocker.patch("jacoco_report.utils.github.GitHub.get_pr_base_sha", return_value=BASELINE_SHA)
+    mocker.patch("jacoco_report.utils.github.GitHub.get_pr_changed_files", return_value=["src/main/java/com/example/A.java"])
+    mocker.patch(
+        "jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files",
+        side_effect=lambda paths, exclude_paths: [baseline_path] if paths[0].startswith("baseline") else [_write_report(tmp_path, 8)],
+    )
+    generator = mocker.patch("jacoco_report.jacoco_report.PRCommentGenerator")
+
+    jacoco_report.run()
+
+    bs_evaluator = generator.call_args.args[2]
+    assert bs_evaluator.total_coverage_overall == 66.67
+    stages = jacoco_report.run_state.timings.to_dict()["stages"]
+    assert stages["baseline-snapshot"].get("reports") == (1 if has_snapshot else None)
+    assert ("baseline-parse" in stages) is not has_snapshot
+
+
+def test_push_run_records_coverage_history(jacoco_report, mocker, tmp_path):
+    from jacoco_report.model.coverage_history import KIND_REPORT, CoverageHistory
+
+    db = str(tmp_path / "history.db")
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="push")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_sha", return_value=BASELINE_SHA)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_branch", return_value="master")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_history_db", return_value=db)
+    mocker.patch("jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files", return_value=[_write_report(tmp_path, 8)])
+    add_comment = mocker.patch("jacoco_report.utils.github.GitHub.add_comment")
+
+    jacoco_report.run()
+
+    assert jacoco_report.violations == []
+    assert jacoco_report.total_overall_coverage == 80.0
+    add_comment.assert_not_called()
+    history = CoverageHistory(db)
+    assert [(p.sha, p.overall) for p in history.trend("master", "instruction", 5)] == [(BASELINE_SHA, 80.0)]
+    assert [p.overall for p in history.trend("master", "instruction", 5, KIND_REPORT, "mod")] == [80.0]
+    history.close()
+
+
+def test_pull_request_run_shows_history_trend_and_records_the_run(jacoco_report, mocker, tmp_path):
+    from jacoco_report.model.coverage_history import CoverageHistory, HistoryRun
+
+    db = str(tmp_path / "history.db")
+    history = CoverageHistory(db)
+    for created_at, overall in ((10, 70.0), (20, 75.0)):
+        history.record(HistoryRun(f"sha{created_at}", "master", "push", None, "instruction", created_at), (overall, 0.0), {}, {})
+    history.close()
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_history_db", return_value=db)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_base_ref", return_value="master")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_branch", return_value="feature/x")
+    mocker.patch("jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files", return_value=[_write_report(tmp_path, 8)])
+    add_comment = mocker.patch("jacoco_report.utils.github.GitHub.add_comment")
+
+    jacoco_report.run()
+
+    assert "**Trend** (instruction, last 2 `master` runs, then this one): ▁▅█ 70.0% → 80.0%" in add_comment.call_args[0][1]
+    history = CoverageHistory(db)
+    assert [(r.branch, r.pr_number) for r, _ in history.runs_of_commit("")] == [("feature/x", 1)]
+    history.close()
+
+
+def test_unusable_history_does_not_fail_pull_request_run(jacoco_report, mocker, tmp_path, caplog):
+    db = tmp_path / "history.db"
+    db.write_text("not a database")
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_history_db", return_value=str(db))
+    mocker.patch("jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files", return_value=[_write_report(tmp_path, 8)])
+    add_comment = mocker.patch("jacoco_report.utils.github.GitHub.add_comment")
+
+    jacoco_report.run()
+
+    assert jacoco_report.has_operational_failure is False
+    assert "Failed to use the coverage history" in caplog.text
+    assert "**Trend**" not in add_comment.call_args[0][1]
+
+
+def _patch_shard_inputs(mocker, mode, partial_dir):
+    _patch_jr_run_inputs(mocker)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_sha", return_value=BASELINE_SHA)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_mode", return_value=mode)
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_partial_dir", return_value=partial_dir)
+
+
+def test_partial_runs_of_shards_are_merged_into_one_comment(mocker, tmp_path):
+    partial_dir = str(tmp_path / "partials")
+    _patch_shard_inputs(mocker, "partial", partial_dir)
+    get_pr_number = mocker.patch("jacoco_report.utils.github.GitHub.get_pr_number")
+    for covered in (8, 4):
+        mocker.patch("jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files", return_value=[_write_report(tmp_path, covered)])
+        shard = JaCoCoReport(ActionConfig.from_inputs())
+        shard.run()
+        assert shard.violations == []
+        assert shard.run_state.timings.to_dict()["stages"]["partial"]["reports"] == 1
+    get_pr_number.assert_not_called()
+
+    _patch_shard_inputs(mocker, "merge", partial_dir)
+    mocker.patch("jacoco_report.utils.github.GitHub.get_pr_changed_files", return_value=["src/main/java/com/example/A.java"])
+    scan = mocker.patch("jacoco_report.jacoco_report.JaCoCoReport.scan_jacoco_xml_files")
+    add_comment = mocker.patch("jacoco_report.utils.github.GitHub.add_comment")
+    merge = JaCoCoReport(ActionConfig.from_inputs())
+    merge.run()
+
+    scan.assert_not_called()
+    add_comment.assert_called_once()
+    # 12 of 16 instructions covered over both shards' reports
+    assert merge.total_overall_coverage == 75.0
+    assert merge.total_changed_files_coverage == 75.0
+    assert merge.run_state.timings.to_dict()["stages"]["merge"]["files"] == 2
+
+
+def test_merge_run_without_partial_results_fails(jacoco_report, mocker, tmp_path, caplog):
+    _patch_shard_inputs(mocker, "merge", str(tmp_path))
+    add_comment = mocker.patch("jacoco_report.utils.github.GitHub.add_comment")
+
+    jacoco_report.run()
+
+    assert jacoco_report.has_operational_failure is True
+    assert "No partial result found" in caplog.text
+    add_comment.assert_not_called()
+
+
+def test_merge_run_on_push_writes_baseline_snapshot_of_all_shards(jacoco_report, mocker, tmp_path):
+    from jacoco_report.parser.baseline_snapshot import BaselineSnapshot
+    from jacoco_report.parser.jacoco_report_parser import JaCoCoReportParser
+    from jacoco_report.parser.partial_result import write_partial
+
+    for covered in (8, 4):
+        report = JaCoCoReportParser(None).parse(_write_report(tmp_path, covered))
+        write_partial(str(tmp_path / "partials"), BASELINE_SHA, [report])
+    _patch_shard_inputs(mocker, "merge", str(tmp_path / "partials"))
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_event_name", return_value="push")
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_baseline_snapshot_dir", return_value=str(tmp_path / "snap"))
+
+    jacoco_report.run()
+
+    assert jacoco_report.violations == []
+    reports = BaselineSnapshot.load(str(tmp_path / "snap"), BASELINE_SHA).to_reports(["src/main/java/com/example/A.java"])
+    assert sorted(len(r.changed_files_coverage) for r in reports) == [1, 1]
@@ -1,3 +1,5 @@
+import os
+
 from jacoco_report.action_inputs import ActionInputs
 from jacoco_report.utils.enums import FailOnThresholdEnum
 from main import run
@@ -18,6 +20,7 @@ def test_run_no_violations(mocker):
     mock_jr.total_changed_files_coverage = 75.0
     mock_jr.evaluated_coverage_reports = "Report Coverage"
     mock_jr.evaluated_coverage_groups = "Group Coverage"
+    mock_jr.run_state.metrics_coverage = "Metrics Coverage"
     mock_jr.violations = []
 
     # Run the main function
@@ -31,10 +34,86 @@ def test_run_no_violations(mocker):
     mock_set_action_output.assert_any_call("coverage-changed-files", "75.0")
     mock_set_action_output_text.assert_any_call("reports-coverage", "Report Coverage")
     mock_set_action_output_text.assert_any_call("groups-coverage", "Group Coverage")
+    mock_set_action_output_text.assert_any_call("metrics-coverage", "Metrics Coverage")
     mock_set_action_failed.assert_not_called()
     mock_sys_exit.assert_called_once_with(0)
 
 
+def test_run_sets_api_stats_output_when_enabled(mocker):
+    mocker.patch("main.setup_logging")
+    mocker.patch.object(ActionInputs, "validate_inputs")
+    mocker.patch.object(ActionInputs, "get_api_stats", return_value=True)
+    mock_jacoco_report = mocker.patch("main.JaCoCoReport")
+    mocker.patch("main.set_action_output")
+    mock_set_action_output_text = mocker.patch("main.set_action_output_text")
+    mocker.patch("sys.exit")
+
+    mock_jr = mock_jacoco_report.return_value
+    mock_jr.violations = []
+    mock_jr.run_state.api_stats.to_json.return_value = '{"total_calls": 3}'
+
+    run()
+
+    mock_set_action_output_text.assert_any_call("api-stats", '{"total_calls": 3}')
+
+
+def test_run_skips_api_stats_output_by_default(mocker):
+    mocker.patch("main.setup_logging")
+    mocker.patch.object(ActionInputs, "validate_inputs")
+    mocker.patch.object(ActionInputs, "get_api_stats", return_value=False)
+    mock_jacoco_report = mocker.patch("main.JaCoCoReport")
+    mocker.patch("main.set_action_output")
+    mock_set_action_output_text = mocker.patch("main.set_action_output_text")
+    mocker.patch("sys.exit")
+
+    mock_jr = mock_jacoco_report.return_value
+    mock_jr.violations = []
+    mock_jr.run_state.api_stats.to_json.return_value = "{}"
+
+    run()
+
+    assert "api-stats" not in [call.args[0] for call in mock_set_action_output_text.call_args_list]
+
+
+def test_run_sets_timings_output_when_enabled(mocker):
+    mocker.patch("main.setup_logging")
+    mocker.patch.object(ActionInputs, "validate_inputs")
+    mocker.patch.object(ActionInputs, "get_timings", return_value=True)
+    mocker.patch.object(ActionInputs, "get_report_path", return_value="")
+    mock_jacoco_report = mocker.patch("main.JaCoCoReport")
+    mocker.patch("main.set_action_output")
+    mock_set_action_output_text = mocker.patch("main.set_action_output_text")
+    mocker.patch("sys.exit")
+
+    mock_jr = mock_jacoco_report.return_value
+    mock_jr.violations = []
+    mock_jr.run_state.timings.to_json.return_value = '{"total_ms": 1.0, "stages": {}}'
+
+    run()
+
+    mock_set_action_output_text.assert_any_call("timings", '{"total_ms": 1.0, "stages": {}}')
+    mock_jr.run_state.timings.write.assert_not_called()
+
+
+def test_run_writes_run_profile_into_report_path(mocker):
+    mocker.patch("main.setup_logging")
+    mocker.patch.object(ActionInputs, "validate_inputs")
+    mocker.patch.object(ActionInputs, "get_timings", return_value=False)
+    mocker.patch.object(ActionInputs, "get_report_path", return_value="build/coverage")
+    mock_jacoco_report = mocker.patch("main.JaCoCoReport")
+    mocker.patch("main.set_action_output")
+    mock_set_action_output_text = mocker.patch("main.set_action_output_text")
+    mocker.patch("sys.exit")
+
+    mock_jr = mock_jacoco_report.return_value
+    mock_jr.violations = []
+
+    run()
+
+    mock_jr.run_state.timings.write.assert_called_once_with(os.path.join("build/coverage", "run-profile.json"))
+    assert "timings" not in [call.args[0] for call in mock_set_action_output_text.call_args_list]
+
+
 def test_run_fail_overall_level(mocker):
     # Mock dependencies
     mocker.patch("main.setup_logging")
@@ -315,3 +394,22 @@ def test_main_sets_coverage_changed_files_passed_false_when_failing(mocker):
     mock_set_failed.assert_called_once_with(
         messages=["Changed files coverage below threshold."], fail=True
     )
+
+
+def test_run_profiles_into_report_path(mocker):
+    mocker.patch("main.setup_logging")
+    mocker.patch.object(ActionInputs, "validate_inputs")
+    mocker.patch.object(ActionInputs, "get_profile", return_value="cpu")
+    mocker.patch.object(ActionInputs, "get_report_path", return_value="build/coverage")
+    mock_profiler = mocker.patch("main.RunProfiler")
+    mock_jacoco_report = mocker.patch("main.JaCoCoReport")
+    mocker.patch("main.set_action_output")
+    mocker.patch("main.set_action_output_text")
+    mocker.patch("sys.exit")
+    mock_jacoco_report.return_value.violations = []
+
+    run()
+
+    mock_profiler.assert_called_once_with("cpu", "build/coverage")
+    mock_profiler.return_value.__enter__.assert_called_once()
+    mock_jacoco_report.return_value.run.assert_called_once()
@@ -13,6 +13,7 @@ import logging
 import pytest
 from pytest_mock import MockerFixture
 
+from jacoco_report.action_config import ActionConfig
 from jacoco_report.action_inputs import ActionInputs
 from jacoco_report.evaluator.coverage_evaluator import CoverageEvaluator
 from jacoco_report.generator.pr_comment_generator import PRCommentGenerator
@@ -95,7 +96,7 @@ def test_skip_unchanged_filters_report_with_no_changed_files(
     _make_run_mocks(mocker, skip_unchanged=True, evaluate_unchanged=False, reports=[unchanged, changed])
 
     with caplog.at_level(logging.INFO, logger="jacoco_report.jacoco_report"):
-        JaCoCoReport().run()
+        JaCoCoReport(ActionConfig.from_inputs()).run()
 
     assert "Filtering report 'Report A' from evaluation and comment rows: no changed files." in caplog.text
     assert "Filtering report 'Report B'" not in caplog.text
@@ -109,7 +110,7 @@ def test_skip_unchanged_logs_each_filtered_report(mocker: MockerFixture, make_re
     _make_run_mocks(mocker, skip_unchanged=True, evaluate_unchanged=False, reports=[unchanged_a, unchanged_b, changed])
 
     with caplog.at_level(logging.INFO, logger="jacoco_report.jacoco_report"):
-        JaCoCoReport().run()
+        JaCoCoReport(ActionConfig.from_inputs()).run()
 
     messages = caplog.text
     assert "Filtering report 'Alpha Report' from evaluation and comment rows: no changed files." in messages
@@ -124,7 +125,7 @@ def test_skip_unchanged_evaluate_unchanged_true_logs_threshold_result_clarificat
     _make_run_mocks(mocker, skip_unchanged=True, evaluate_unchanged=True, reports=[unchanged])
 
     with caplog.at_level(logging.INFO, logger="jacoco_report.jacoco_report"):
-        JaCoCoReport().run()
+        JaCoCoReport(ActionConfig.from_inputs()).run()
 
     assert (
         "Filtering report 'Report A' from comment rows and changed-files evaluation: no changed files "
@@ -139,7 +140,7 @@ def test_skip_unchanged_all_filtered_exits_cleanly(mocker: MockerFixture, make_r
     mocks = _make_run_mocks(mocker, skip_unchanged=True, evaluate_unchanged=False, reports=[unchanged_a, unchanged_b])
 
     with caplog.at_level(logging.INFO, logger="jacoco_report.jacoco_report"):
-        jr = JaCoCoReport()
+        jr = JaCoCoReport(ActionConfig.from_inputs())
         jr.run()
 
     assert "All reports filtered out by skip-unchanged" in caplog.text
@@ -159,12 +160,31 @@ def test_skip_unchanged_all_filtered_deletes_stale_comment(mocker: MockerFixture
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
 
     with caplog.at_level(logging.INFO, logger="jacoco_report.jacoco_report"):
-        JaCoCoReport().run()
+        JaCoCoReport(ActionConfig.from_inputs()).run()
 
     mocks["gh"].delete_comment.assert_called_once_with(99)
     assert "Deleted stale comment" in caplog.text
 
 
+def test_skip_unchanged_all_filtered_deletes_only_the_action_comment(
+    mocker: MockerFixture, make_report_file_coverage
+):
+    unchanged = _report_without_changes("Report A", make_report_file_coverage)
+    mocks = _make_run_mocks(mocker, skip_unchanged=True, evaluate_unchanged=False, reports=[unchanged])
+
+    # a comment without a body (deleted content) is skipped by the shared rule instead of failing the run
+    mocks["gh"].get_comments.return_value = [
+        {"id": 97, "body": None},
+        {"id": 98, "body": "LGTM **JaCoCo**"},
+        {"id": 99, "body": "**JaCoCo**\n\nsome old content"},
+    ]
+    mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
+
+    JaCoCoReport(ActionConfig.from_inputs()).run()
+
+    mocks["gh"].delete_comment.assert_called_once_with(99)
+
+
 def test_skip_unchanged_all_filtered_no_delete_when_update_comment_false(
     mocker: MockerFixture, make_report_file_coverage
 ):
@@ -173,7 +193,7 @@ def test_skip_unchanged_all_filtered_no_delete_when_update_comment_false(
 
     mocks["gh"].get_comments.return_value = [{"id": 99, "body": "**JaCoCo**\n\nsome old content"}]
 
-    JaCoCoReport().run()
+    JaCoCoReport(ActionConfig.from_inputs()).run()
 
     mocks["gh"].delete_comment.assert_not_called()
 
@@ -182,7 +202,7 @@ def test_skip_unchanged_false_does_not_filter(mocker: MockerFixture, make_report
     unchanged = _report_without_changes("Report A", make_report_file_coverage)
     _make_run_mocks(mocker, skip_unchanged=False, evaluate_unchanged=False, reports=[unchanged])
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     # run completed without early exit; unchanged report was evaluated (no violations at 0% thresholds)
@@ -208,7 +228,7 @@ def test_skip_unchanged_all_filtered_evaluate_unchanged_true_checks_overall_thre
     )
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_thresholds_default", return_value=(50.0, 0.0, 0.0))
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert any("Report 'Low Report' overall coverage 0.0 is below the threshold 50.0." in v for v in jr.violations)
@@ -235,7 +255,7 @@ def test_skip_unchanged_all_filtered_evaluate_unchanged_true_uses_unchanged_repo
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_global_overall_threshold", return_value=50.0)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_thresholds_default", return_value=(0.0, 0.0, 0.0))
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert jr.total_overall_coverage == 100.0
@@ -263,7 +283,7 @@ def test_skip_unchanged_all_filtered_evaluate_unchanged_true_still_fails_global_
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_global_overall_threshold", return_value=50.0)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_thresholds_default", return_value=(0.0, 0.0, 0.0))
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert jr.total_overall_coverage == 0.0
@@ -283,7 +303,7 @@ def test_skip_unchanged_all_filtered_evaluate_unchanged_true_deletes_stale_comme
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_update_comment", return_value=True)
     mocks["gh"].get_comments.return_value = [{"id": 100, "body": "**JaCoCo**\n\nsome old content"}]
 
-    JaCoCoReport().run()
+    JaCoCoReport(ActionConfig.from_inputs()).run()
 
     mocks["gh"].delete_comment.assert_called_once_with(100)
 
@@ -308,7 +328,7 @@ def test_skip_unchanged_evaluate_unchanged_true_checks_filtered_report_in_mixed_
     )
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_thresholds_default", return_value=(50.0, 0.0, 0.0))
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert any("Report 'Low Report' overall coverage 0.0 is below the threshold 50.0." in v for v in jr.violations)
@@ -353,7 +373,7 @@ def test_skip_unchanged_evaluate_unchanged_true_mixed_input_uses_all_reports_for
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_global_overall_threshold", return_value=80.0)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_thresholds_default", return_value=(0.0, 0.0, 0.0))
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert jr.total_overall_coverage == 50.0
@@ -377,7 +397,7 @@ def test_skip_unchanged_false_no_regression_when_toggling_evaluate_unchanged(
         reports=[unchanged],
     )
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert jr.violations == []
@@ -403,7 +423,7 @@ def test_skip_unchanged_all_filtered_evaluate_unchanged_true_serializes_reports_
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_global_overall_threshold", return_value=0.0)
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_thresholds_default", return_value=(0.0, 0.0, 0.0))
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert "Unchanged Report" in jr.evaluated_coverage_reports
@@ -430,7 +450,7 @@ def test_skip_unchanged_true_fail_unchanged_enabled_evaluates_filtered_reports(
     )
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_thresholds_default", return_value=(50.0, 0.0, 0.0))
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert any("Report 'Low Report' overall coverage 0.0 is below the threshold 50.0." in v for v in jr.violations)
@@ -457,7 +477,7 @@ def test_skip_unchanged_true_fail_unchanged_disabled_excludes_filtered_reports(
     )
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_thresholds_default", return_value=(50.0, 0.0, 0.0))
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert not any("Report 'Low Report' overall coverage 0.0 is below the threshold 50.0." in v for v in jr.violations)
@@ -478,7 +498,7 @@ def test_operational_failure_marks_fail_unchanged_flag_false(mocker: MockerFixtu
     mocker.patch("jacoco_report.jacoco_report.GitHub", return_value=gh_mock)
     mocker.patch.object(JaCoCoReport, "scan_jacoco_xml_files", return_value=["dummy.xml"])
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert jr.has_operational_failure is True
@@ -503,13 +523,48 @@ def test_skip_unchanged_fail_unchanged_mixed_flow_uses_single_evaluator_pass(
 
     evaluate_spy = mocker.spy(CoverageEvaluator, "evaluate")
 
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
+    jr.run()
+
+    assert evaluate_spy.call_count == 1
+    assert jr.reached_threshold_fail_unchanged is True
+
+
+def test_skip_unchanged_all_filtered_flow_uses_single_evaluator_pass(
+    mocker: MockerFixture,
+    make_report_file_coverage,
+):
+    unchanged = _report_without_changes("Unchanged Report", make_report_file_coverage)
+
+    _make_run_mocks(
+        mocker,
+        skip_unchanged=True,
+        evaluate_unchanged=True,
+        fail_on_threshold=["fail-unchanged"],
+        reports=[unchanged],
+    )
+
+    evaluate_spy = mocker.spy(CoverageEvaluator, "evaluate")
+    generator_mock = mocker.patch("jacoco_report.jacoco_report.PRCommentGenerator")
+
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
 
     assert evaluate_spy.call_count == 1
+    generator_mock.assert_not_called()
     assert jr.reached_threshold_fail_unchanged is True
 
 
+def test_no_baseline_evaluator_without_baseline_reports(mocker: MockerFixture, make_report_file_coverage):
+    changed = _report_with_changes("Changed Report", make_report_file_coverage)
+    _make_run_mocks(mocker, skip_unchanged=False, evaluate_unchanged=True, reports=[changed])
+    generator_mock = mocker.patch("jacoco_report.jacoco_report.PRCommentGenerator")
+
+    JaCoCoReport(ActionConfig.from_inputs()).run()
+
+    assert generator_mock.call_args.args[2] is None
+
+
 # --- comment-level × skip-unchanged combinations ---
 #
 # 2 (skip-unchanged: true / false) × 6 comment levels = 12 cases.
@@ -571,7 +626,7 @@ def test_comment_level_x_skip_unchanged_comment_posted(
 
     bs_evaluator = CoverageEvaluator(report_files_coverage=[], global_min_coverage_overall=0.0,
                                       global_min_coverage_changed_files=0.0)
-    generator = PRCommentGenerator(gh_mock, evaluator_with_changed, bs_evaluator, pr_number=1)
+    generator = PRCommentGenerator(gh_mock, evaluator_with_changed, bs_evaluator, pr_number=1, config=ActionConfig.from_inputs())
     generator.generate()
 
     if comment_level == "none":
@@ -604,7 +659,7 @@ def test_comment_level_none_still_suppresses_comment(
 
     bs_evaluator = CoverageEvaluator(report_files_coverage=[], global_min_coverage_overall=0.0,
                                       global_min_coverage_changed_files=0.0)
-    generator = PRCommentGenerator(gh_mock, evaluator_with_changed, bs_evaluator, pr_number=1)
+    generator = PRCommentGenerator(gh_mock, evaluator_with_changed, bs_evaluator, pr_number=1, config=ActionConfig.from_inputs())
     generator.generate()
 
     gh_mock.add_comment.assert_not_called()
@@ -633,7 +688,7 @@ def test_minimal_comment_contains_only_global_table(
 
     bs_evaluator = CoverageEvaluator(report_files_coverage=[], global_min_coverage_overall=0.0,
                                       global_min_coverage_changed_files=0.0)
-    generator = PRCommentGenerator(gh_mock, evaluator_with_changed, bs_evaluator, pr_number=1)
+    generator = PRCommentGenerator(gh_mock, evaluator_with_changed, bs_evaluator, pr_number=1, config=ActionConfig.from_inputs())
     generator.generate()
 
     body = gh_mock.add_comment.call_args[0][1]
@@ -682,7 +737,7 @@ def test_skip_unchanged_with_report_groups_filters_groupless_unchanged_report(
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_groups", return_value=[group])
 
     with caplog.at_level(logging.INFO, logger="jacoco_report.jacoco_report"):
-        jr = JaCoCoReport()
+        jr = JaCoCoReport(ActionConfig.from_inputs())
         jr.run()
 
     assert "Filtering report 'Unchanged Report' from evaluation and comment rows: no changed files." in caplog.text
@@ -767,7 +822,7 @@ def test_skip_unchanged_with_multiple_groups_overall_coverage_includes_all_repor
     )
     mocker.patch("jacoco_report.action_inputs.ActionInputs.get_report_groups", return_value=groups)
     
-    jr = JaCoCoReport()
+    jr = JaCoCoReport(ActionConfig.from_inputs())
     jr.run()
     
     # Overall coverage should be: (80 + 90 + 70 + 60) / (100 + 100 + 100 + 100) = 300 / 400 = 75%
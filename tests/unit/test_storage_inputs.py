@@ -0,0 +1,38 @@
+import pytest
+
+from jacoco_report.storage_inputs import StorageInputs
+
+
+def test_get_baseline_snapshot_dir_strips_whitespace(mocker):
+    mocker.patch("jacoco_report.storage_inputs.get_action_input", return_value=" .jacoco-baseline ")
+    assert StorageInputs.get_baseline_snapshot_dir() == ".jacoco-baseline"
+
+
+def test_get_history_db_strips_whitespace(mocker):
+    mocker.patch("jacoco_report.storage_inputs.get_action_input", return_value=" .coverage/history.db ")
+    assert StorageInputs.get_history_db() == ".coverage/history.db"
+
+
+@pytest.mark.parametrize("value, expected", [(" Partial ", "partial"), ("", "single")])
+def test_get_mode(mocker, value, expected):
+    mocker.patch("jacoco_report.storage_inputs.get_action_input", return_value=value)
+    assert StorageInputs.get_mode() == expected
+
+
+def test_get_partial_dir_strips_whitespace(mocker):
+    mocker.patch("jacoco_report.storage_inputs.get_action_input", return_value=" jacoco-partials ")
+    assert StorageInputs.get_partial_dir() == "jacoco-partials"
+
+
+def test_get_max_memory_mb_parses_whole_megabytes(mocker):
+    mock_input = mocker.patch("jacoco_report.storage_inputs.get_action_input", return_value=" 4096 ")
+    assert StorageInputs.get_max_memory_mb() == 4096
+    mock_input.return_value = ""
+    assert StorageInputs.get_max_memory_mb() == 0
+
+
+@pytest.mark.parametrize("value", ["-1", "1.5", "2GB"])
+def test_get_max_memory_mb_rejects_invalid_values(value, mocker):
+    mocker.patch("jacoco_report.storage_inputs.get_action_input", return_value=value)
+    with pytest.raises(ValueError, match="'max-memory-mb' must be a whole number of megabytes, 0 for no limit."):
+        StorageInputs.get_max_memory_mb()
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from jacoco_report.utils.api_stats import ApiCallStats, endpoint_template
+
+
+@pytest.mark.parametrize(
+    "method, url, expected",
+    [
+        ("GET", "https://api.github.com/repos/o/r/pulls/12/files?page=2", "GET /repos/{owner}/{repo}/pulls/{n}/files"),
+        ("patch", "https://api.github.com/repos/o/r/issues/comments/99", "PATCH /repos/{owner}/{repo}/issues/comments/{n}"),
+        ("POST", "https://ghe.example.com/api/v3/graphql", "POST /api/v3/graphql"),
+    ],
+)
+def test_endpoint_template(method, url, expected):
+    assert endpoint_template(method, url) == expected
+
+
+def test_record_accumulates_per_endpoint():
+    stats = ApiCallStats()
+
+    stats.record("GET", "https://api.github.com/repos/o/r/pulls/1/files?page=1", 200, 100, 40.0, 10, 5000)
+    stats.record("GET", "https://api.github.com/repos/o/r/pulls/1/files?page=2", 200, 50, 300.0, 9, 5000)
+    stats.record("GET", "https://api.github.com/repos/o/r/pulls/1/files?page=3", 502, 20, 6000.0)
+    stats.record("POST", "https://api.github.com/repos/o/r/issues/1/comments", None, 0, 10.0)
+
+    summary = stats.to_dict()
+    files = summary["endpoints"]["GET /repos/{owner}/{repo}/pulls/{n}/files"]
+    assert summary["total_calls"] == 4
+    assert summary["total_bytes_received"] == 170
+    assert summary["rate_limit_remaining"] == 9
+    assert files["calls"] == 3
+    assert files["statuses"] == {"200": 2, "502": 1}
+    assert files["max_latency_ms"] == 6000.0
+    assert files["latency_histogram"]["<=50ms"] == 1
+    assert files["latency_histogram"]["<=500ms"] == 1
+    assert files["latency_histogram"][">5000ms"] == 1
+    assert summary["endpoints"]["POST /repos/{owner}/{repo}/issues/{n}/comments"]["statuses"] == {"error": 1}
+
+
+def test_to_json_of_empty_stats():
+    assert json.loads(ApiCallStats().to_json()) == {
+        "total_calls": 0,
+        "total_bytes_received": 0,
+        "total_latency_ms": 0.0,
+        "rate_limit_remaining": None,
+        "rate_limit_limit": None,
+        "endpoints": {},
+    }
@@ -1,6 +1,6 @@
 import requests
 
-from jacoco_report.utils.github import GitHub
+from jacoco_report.utils.github import GitHub, find_action_comment
 
 
 # get_pr_changed_files
@@ -125,6 +125,39 @@ def testsend_request_post_request_exception(mocker):
     mock_session.post.assert_called_once_with("https://api.github.com/test", json={"key": "value"}, params=None)
     assert response is None
 
+
+def testsend_request_records_api_stats(mocker):
+    mock_session = mocker.Mock()
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'[{"filename": "a.py"}]'
+    mock_response.headers = {"X-RateLimit-Remaining": "4998", "X-RateLimit-Limit": "5000"}
+    mock_session.get.return_value = mock_response
+    mocker.patch("requests.Session", return_value=mock_session)
+    github = GitHub("fake_token")
+
+    github.send_request("GET", "https://api.github.com/repos/owner/repo/pulls/7/files", params={"page": 1})
+
+    stats = github.api_stats.to_dict()
+    endpoint = stats["endpoints"]["GET /repos/{owner}/{repo}/pulls/{n}/files"]
+    assert endpoint["calls"] == 1
+    assert endpoint["statuses"] == {"200": 1}
+    assert endpoint["bytes_received"] == len(mock_response.content)
+    assert stats["rate_limit_remaining"] == 4998
+    assert stats["rate_limit_limit"] == 5000
+
+
+def testsend_request_records_failed_request_as_error(mocker):
+    mock_session = mocker.Mock()
+    mock_session.post.side_effect = requests.RequestException("Request Exception")
+    mocker.patch("requests.Session", return_value=mock_session)
+    github = GitHub("fake_token")
+
+    github.send_request("POST", "https://api.github.com/repos/owner/repo/issues/7/comments", data={"body": "x"})
+
+    endpoint = github.api_stats.endpoints["POST /repos/{owner}/{repo}/issues/{n}/comments"]
+    assert endpoint.statuses == {"error": 1}
+
 # get_pr_number
 
 def test_get_pr_number(mocker):
@@ -161,6 +194,16 @@ def test_add_comment(mocker):
     mock_send_req.assert_called_once_with("POST", "https://api.github.com/repos/fake_repo/issues/1/comments", data={"body": "Test comment"})
 
 
+def test_add_comment_uses_custom_api_url(mocker):
+    mocker.patch("os.getenv", return_value="fake_repo")
+    mock_send_req = mocker.patch.object(GitHub, "send_request", return_value=mocker.Mock())
+    github = GitHub("fake_token", api_url="http://127.0.0.1:8080/")
+
+    github.add_comment(1, "Test comment")
+
+    mock_send_req.assert_called_once_with("POST", "http://127.0.0.1:8080/repos/fake_repo/issues/1/comments", data={"body": "Test comment"})
+
+
 def test_add_comment_failed_request(mocker):
     mocker.patch("os.getenv", return_value="fake_repo")
     mock_send_req = mocker.patch.object(GitHub, "send_request", return_value=None)
@@ -299,3 +342,202 @@ def test_delete_pr_comment_unexpected_response(mocker, github):
 
     github.send_request.assert_called_once_with("DELETE", "https://api.github.com/repos/fake_repo/issues/comments/123")
     assert result is False
+
+
+# get_pr_context
+
+def _graphql_response(mocker, pull_request, errors=None):
+    response = mocker.Mock()
+    payload = {"data": {"repository": {"pullRequest": pull_request}}}
+    if errors is not None:
+        payload["errors"] = errors
+    response.json.return_value = payload
+    return response
+
+
+def _connection(nodes, has_next=False, cursor=None):
+    return {"pageInfo": {"hasNextPage": has_next, "endCursor": cursor}, "nodes": nodes}
+
+
+def test_get_pr_context_single_page(mocker):
+    mocker.patch("os.getenv", return_value="owner/repo")
+    response = _graphql_response(
+        mocker,
+        {
+            "baseRefOid": "base123",
+            "headRefOid": "head456",
+            "files": _connection([{"path": "src/A.java"}, {"path": "src/B.java"}]),
+            "comments": _connection(
+                [
+                    {"databaseId": 1, "body": "**JaCoCo** old"},
+                    {"databaseId": 2, "body": "unrelated"},
+                    {"databaseId": 3, "body": "**JaCoCo** newer"},
+                ]
+            ),
+        },
+    )
+    mock_send_req = mocker.patch.object(GitHub, "send_request", return_value=response)
+
+    context = GitHub("fake_token").get_pr_context(7, "**JaCoCo**")
+
+    assert context.changed_files == ["src/A.java", "src/B.java"]
+    assert context.comments == [{"id": 1, "body": "**JaCoCo** old"}, {"id": 3, "body": "**JaCoCo** newer"}]
+    assert context.base_sha == "base123"
+    assert context.head_sha == "head456"
+    mock_send_req.assert_called_once()
+    method, url = mock_send_req.call_args[0]
+    variables = mock_send_req.call_args[1]["data"]["variables"]
+    assert (method, url) == ("POST", "https://api.github.com/graphql")
+    assert variables["owner"] == "owner" and variables["name"] == "repo" and variables["number"] == 7
+
+
+def test_rest_and_graphql_transports_find_the_same_action_comment(mocker):
+    fixture_comments = [
+        {"id": 11, "body": "Looks good"},
+        {"id": 12, "body": "> **JaCoCo** quoted in a reply"},
+        {"id": 13, "body": "**JaCoCo** first run"},
+        {"id": 14, "body": "**JaCoCo** second run"},
+    ]
+    mocker.patch("os.getenv", return_value="owner/repo")
+    rest_response = mocker.Mock()
+    rest_response.json.return_value = fixture_comments
+    graphql_response = _graphql_response(
+        mocker,
+        {
+            "baseRefOid": "base123",
+            "headRefOid": "head456",
+            "files": _connection([]),
+            "comments": _connection([{"databaseId": c["id"], "body": c["body"]} for c in fixture_comments]),
+        },
+    )
+    mocker.patch.object(GitHub, "send_request", side_effect=[rest_response, graphql_response])
+    github = GitHub("fake_token")
+
+    via_rest = find_action_comment(github.get_comments(7), "**JaCoCo**")
+    via_graphql = find_action_comment(github.get_pr_context(7, "**JaCoCo**").comments, "**JaCoCo**")
+
+    assert via_rest == via_graphql == {"id": 13, "body": "**JaCoCo** first run"}
+
+
+def test_get_pr_context_paginates_only_unfinished_connections(mocker):
+    mocker.patch("os.getenv", return_value="owner/repo")
+    first = _graphql_response(
+        mocker,
+        {
+            "baseRefOid": "b",
+            "headRefOid": "h",
+            "files": _connection([{"path": "A.java"}], has_next=True, cursor="f1"),
+            "comments": _connection([], has_next=False, cursor=None),
+        },
+    )
+    second = _graphql_response(mocker, {"baseRefOid": "b", "headRefOid": "h", "files": _connection([{"path": "B.java"}])})
+    sent_variables = []
+    mocker.patch.object(
+        GitHub,
+        "send_request",
+        side_effect=lambda method, url, data: sent_variables.append(dict(data["variables"])) or [first, second][len(sent_variables) - 1],
+    )
+
+    context = GitHub("fake_token").get_pr_context(1, "**JaCoCo**")
+
+    assert context.changed_files == ["A.java", "B.java"]
+    assert len(sent_variables) == 2
+    assert sent_variables[1]["filesCursor"] == "f1"
+    assert sent_variables[1]["withFiles"] is True
+    assert sent_variables[1]["withComments"] is False
+
+
+def test_get_pr_context_returns_none_on_graphql_errors(mocker):
+    mocker.patch("os.getenv", return_value="owner/repo")
+    response = _graphql_response(mocker, None, errors=[{"message": "Could not resolve to a PullRequest"}])
+    mocker.patch.object(GitHub, "send_request", return_value=response)
+
+    assert GitHub("fake_token").get_pr_context(1, "**JaCoCo**") is None
+
+
+def test_get_pr_context_returns_none_on_failed_request(mocker):
+    mocker.patch("os.getenv", return_value="owner/repo")
+    mocker.patch.object(GitHub, "send_request", return_value=None)
+
+    assert GitHub("fake_token").get_pr_context(1, "**JaCoCo**") is None
+
+
+def test_get_pr_context_invalid_repository(mocker):
+    mocker.patch("os.getenv", return_value="")
+    mock_send_req = mocker.patch.object(GitHub, "send_request")
+
+    assert GitHub("fake_token").get_pr_context(1, "**JaCoCo**") is None
+    mock_send_req.assert_not_called()
+
+
+# check runs
+
+def test_get_pr_head_sha(mocker):
+    mocker.patch("os.getenv", return_value="fake_event_path")
+    mocker.patch("builtins.open", mocker.mock_open(read_data='{"pull_request": {"head": {"sha": "abc123"}}}'))
+
+    assert GitHub("fake_token").get_pr_head_sha() == "abc123"
+
+
+def test_get_pr_head_sha_not_a_pull_request(mocker):
+    mocker.patch("os.getenv", return_value="fake_event_path")
+    mocker.patch("builtins.open", mocker.mock_open(read_data='{"push": {}}'))
+
+    assert GitHub("fake_token").get_pr_head_sha() is None
+
+
+def test_get_pr_head_sha_unreadable_payload(mocker):
+    mocker.patch("os.getenv", return_value="fake_event_path")
+    mocker.patch("builtins.open", side_effect=OSError("missing"))
+
+    assert GitHub("fake_token").get_pr_head_sha() is None
+
+
+def test_get_pr_base_sha(mocker):
+    mocker.patch("os.getenv", return_value="fake_event_path")
+    payload = '{"pull_request": {"base": {"sha": "def456"}, "head": {"sha": "abc123"}}}'
+    mocker.patch("builtins.open", mocker.mock_open(read_data=payload))
+
+    assert GitHub("fake_token").get_pr_base_sha() == "def456"
+
+
+def test_create_check_run(mocker):
+    mocker.patch("os.getenv", return_value="fake_repo")
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = {"id": 42}
+    mock_send_req = mocker.patch.object(GitHub, "send_request", return_value=mock_response)
+    output = {"title": "t", "summary": "s", "annotations": []}
+
+    result = GitHub("fake_token").create_check_run("JaCoCo", "abc123", "success", output)
+
+    mock_send_req.assert_called_once_with(
+        "POST",
+        "https://api.github.com/repos/fake_repo/check-runs",
+        data={"name": "JaCoCo", "head_sha": "abc123", "status": "completed", "conclusion": "success", "output": output},
+    )
+    assert result == 42
+
+
+def test_create_check_run_failed_request(mocker):
+    mocker.patch("os.getenv", return_value="fake_repo")
+    mocker.patch.object(GitHub, "send_request", return_value=None)
+
+    assert GitHub("fake_token").create_check_run("JaCoCo", "abc123", "success", {}) is None
+
+
+def test_update_check_run(mocker):
+    mocker.patch("os.getenv", return_value="fake_repo")
+    mock_send_req = mocker.patch.object(GitHub, "send_request", return_value=mocker.Mock())
+    output = {"title": "t", "summary": "s", "annotations": [{"path": "A.java"}]}
+
+    assert GitHub("fake_token").update_check_run(42, output) is True
+    mock_send_req.assert_called_once_with(
+        "PATCH", "https://api.github.com/repos/fake_repo/check-runs/42", data={"output": output}
+    )
+
+
+def test_update_check_run_failed_request(mocker):
+    mocker.patch("os.getenv", return_value="fake_repo")
+    mocker.patch.object(GitHub, "send_request", return_value=None)
+
+    assert GitHub("fake_token").update_check_run(42, {}) is False
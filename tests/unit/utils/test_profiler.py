@@ -0,0 +1,61 @@
+import os
+import pstats
+import tracemalloc
+
+from jacoco_report.utils.profiler import CPU_PROFILE_FILE_NAME, MEMORY_PROFILE_FILE_NAME, RunProfiler
+
+
+def _work() -> list[str]:
+    return [str(i) for i in range(10_000)]
+
+
+def test_none_mode_writes_nothing(tmp_path):
+    with RunProfiler("none", str(tmp_path / "profile")) as profiler:
+        _work()
+
+    assert profiler.written_paths == []
+    assert not (tmp_path / "profile").exists()
+    assert not tracemalloc.is_tracing()
+
+
+def test_cpu_mode_writes_pstats_dump(tmp_path):
+    with RunProfiler("cpu", str(tmp_path / "profile")) as profiler:
+        _work()
+
+    path = str(tmp_path / "profile" / CPU_PROFILE_FILE_NAME)
+    assert profiler.written_paths == [path]
+    assert pstats.Stats(path).total_calls > 0
+
+
+def test_memory_mode_writes_top_allocations(tmp_path):
+    with RunProfiler("memory", str(tmp_path)) as profiler:
+        _work()
+
+    path = tmp_path / MEMORY_PROFILE_FILE_NAME
+    assert profiler.written_paths == [str(path)]
+    content = path.read_text(encoding="utf-8")
+    assert content.startswith("Traced memory: current ")
+    assert "Allocations by jacoco_report module:" in content
+    assert not tracemalloc.is_tracing()
+
+
+def test_all_mode_writes_both_files(tmp_path):
+    with RunProfiler("all", str(tmp_path)) as profiler:
+        _work()
+
+    assert sorted(os.path.basename(path) for path in profiler.written_paths) == sorted(
+        [CPU_PROFILE_FILE_NAME, MEMORY_PROFILE_FILE_NAME]
+    )
+
+
+def test_write_failure_is_logged(tmp_path, mocker):
+    blocker = tmp_path / "file"
+    blocker.write_text("x", encoding="utf-8")
+    mock_warning = mocker.patch("jacoco_report.utils.profiler.logger.warning")
+
+    with RunProfiler("all", str(blocker)) as profiler:
+        _work()
+
+    assert profiler.written_paths == []
+    assert mock_warning.call_count == 2
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,46 @@
+from jacoco_report.utils.thresholds import (
+    parse_group_thresholds,
+    split_metric_thresholds,
+    thresholds_for_metric,
+    to_threshold_float,
+    validate_global_thresholds,
+    validate_report_thresholds_default,
+)
+
+
+def test_split_metric_thresholds():
+    assert split_metric_thresholds("80*70") == {"": "80*70"}
+    assert split_metric_thresholds("80*70, branch:60*50\nLine:90*0") == {
+        "": "80*70",
+        "branch": "60*50",
+        "line": "90*0",
+    }
+
+
+def test_thresholds_for_metric_falls_back_to_unprefixed_then_default():
+    assert thresholds_for_metric("80*70,branch:60*50", "branch", "0*0") == "60*50"
+    assert thresholds_for_metric("80*70,branch:60*50", "line", "0*0") == "80*70"
+    assert thresholds_for_metric("branch:60*50", "line", "0*0") == "0*0"
+
+
+def test_to_threshold_float_defaults_invalid_component_to_zero(caplog):
+    assert to_threshold_float("", "overall") == 0.0
+    assert to_threshold_float("x", "overall") == 0.0
+    assert "Cannot convert 'overall' part ('x') to float" in caplog.text
+
+
+def test_parse_group_thresholds_keeps_empty_components_unset():
+    assert parse_group_thresholds("80**60") == (80.0, None, 60.0)
+
+
+def test_validate_global_thresholds_rejects_unknown_metric_prefix():
+    errors = validate_global_thresholds("80*70,lines:60*50")
+    assert errors == [
+        "'global-thresholds' for 'lines' uses unknown metric 'lines'; use one of: 'instruction', "
+        "'line', 'branch', 'complexity', 'method', 'class'."
+    ]
+
+
+def test_validate_report_thresholds_default_labels_metric_entry():
+    errors = validate_report_thresholds_default("80*70*60,branch:x*0*0")
+    assert any(e.startswith("'report-thresholds-default' for 'branch' overall") for e in errors)
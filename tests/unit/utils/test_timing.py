@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from jacoco_report.utils.timing import StageTimings
+
+
+def test_span_accumulates_calls_and_durations(mocker):
+    mocker.patch("jacoco_report.utils.timing.time.perf_counter", side_effect=[0.0, 0.010, 1.0, 1.030])
+    timings = StageTimings()
+
+    with timings.span("parse"):
+        pass
+    with timings.span("parse"):
+        pass
+
+    parse = timings.to_dict()["stages"]["parse"]
+    assert parse["calls"] == 2
+    assert parse["total_ms"] == pytest.approx(40.0)
+    assert parse["max_ms"] == pytest.approx(30.0)
+
+
+def test_span_records_duration_when_stage_raises():
+    timings = StageTimings()
+
+    with pytest.raises(RuntimeError):
+        with timings.span("api-write"):
+            raise RuntimeError("boom")
+
+    assert timings.stages["api-write"].calls == 1
+
+
+def test_add_sums_counters_and_keeps_stage_order():
+    timings = StageTimings()
+
+    timings.add("scan", reports=2)
+    with timings.span("parse"):
+        pass
+    timings.add("parse", reports=1, bytes_read=100)
+    timings.add("parse", reports=1, bytes_read=50)
+
+    profile = json.loads(timings.to_json())
+    assert list(profile["stages"]) == ["scan", "parse"]
+    assert profile["stages"]["scan"] == {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "reports": 2}
+    assert profile["stages"]["parse"]["bytes_read"] == 150
+    assert profile["stages"]["parse"]["reports"] == 2
+
+
+def test_to_json_of_empty_timings():
+    assert json.loads(StageTimings().to_json()) == {"total_ms": 0.0, "stages": {}}
+
+
+def test_summary_lists_every_stage():
+    timings = StageTimings()
+    with timings.span("scan"):
+        pass
+    timings.add("scan", reports=3)
+
+    summary = timings.summary()
+
+    assert summary.startswith("Run profile: ")
+    assert "scan" in summary
+    assert "calls=1" in summary
+    assert "reports=3" in summary
+
+
+def test_write_creates_the_directory(tmp_path):
+    timings = StageTimings()
+    timings.add("parse", bytes_read=10)
+    path = tmp_path / "out" / "run-profile.json"
+
+    assert timings.write(str(path))
+    assert json.loads(path.read_text(encoding="utf-8"))["stages"]["parse"]["bytes_read"] == 10
+
+
+def test_write_failure_is_logged(tmp_path, mocker):
+    blocker = tmp_path / "file"
+    blocker.write_text("x", encoding="utf-8")
+    mock_warning = mocker.patch("jacoco_report.utils.timing.logger.warning")
+
+    assert not StageTimings().write(str(blocker / "run-profile.json"))
+    mock_warning.assert_called_once()